@@ -0,0 +1,58 @@
+"""unique values in zip_code and tax_taxonomy
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-17 13:00:00.000000
+
+The reference data imports now upsert with INSERT … ON CONFLICT, which
+needs a unique key: the value for zip codes, (taxonomy_name, value) for
+taxonomies. Both were already assumed unique by the row-at-a-time
+update helpers. Taxonomy entries created by hand may have no value, so
+theirs is a partial index. Any duplicate is collapsed first, keeping
+the oldest row.
+
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "b8c9d0e1f2a3"
+down_revision = "a7b8c9d0e1f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        """
+        DELETE FROM zip_code a
+        USING zip_code b
+        WHERE a.id > b.id
+          AND a.value = b.value
+        """
+    )
+    op.create_unique_constraint("uq_zip_code_value", "zip_code", ["value"])
+
+    op.execute(
+        """
+        DELETE FROM tax_taxonomy a
+        USING tax_taxonomy b
+        WHERE a.id > b.id
+          AND a.taxonomy_name = b.taxonomy_name
+          AND a.value = b.value
+          AND a.value <> ''
+        """
+    )
+    op.create_index(
+        "uq_tax_taxonomy_value",
+        "tax_taxonomy",
+        ["taxonomy_name", "value"],
+        unique=True,
+        postgresql_where=sa.text("value <> ''"),
+    )
+
+
+def downgrade():
+    op.drop_index("uq_tax_taxonomy_value", table_name="tax_taxonomy")
+    op.drop_constraint("uq_zip_code_value", "zip_code", type_="unique")
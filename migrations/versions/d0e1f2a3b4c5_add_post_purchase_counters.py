@@ -0,0 +1,103 @@
+"""purchase counters on wire posts
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-17 15:00:00.000000
+
+The « vues » and « ventes » sorts of the wall read denormalized
+counters instead of correlated subqueries over wire_article_purchase,
+and the wall is paginated by keyset on (sort column, id). The counters
+are backfilled from the PAID purchases, with the same rules as
+`refresh_purchase_counters`.
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d0e1f2a3b4c5"
+down_revision = "c9d0e1f2a3b4"
+branch_labels = None
+depends_on = None
+
+# Keep in sync with ARTICLE_CONSULTATION_DURATION (days).
+CONSULTATION_DURATION = 365
+
+
+def upgrade():
+    with op.batch_alter_table("frt_content", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "paid_consultation_count",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "sales_amount_cents",
+                sa.BigInteger(),
+                server_default="0",
+                nullable=False,
+            )
+        )
+        batch_op.create_index("ix_frt_content_published_at_id", ["published_at", "id"])
+        batch_op.create_index(
+            "ix_frt_content_paid_consultation_count_id",
+            ["paid_consultation_count", "id"],
+        )
+        batch_op.create_index(
+            "ix_frt_content_sales_amount_cents_id", ["sales_amount_cents", "id"]
+        )
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        """
+        UPDATE frt_content c
+        SET sales_amount_cents = s.total
+        FROM (
+            SELECT post_id, SUM(amount_cents) AS total
+            FROM wire_article_purchase
+            WHERE status = 'PAID'
+            GROUP BY post_id
+        ) s
+        WHERE c.id = s.post_id AND s.total IS NOT NULL
+        """
+    )
+    op.execute(
+        f"""
+        UPDATE frt_content c
+        SET paid_consultation_count = v.total
+        FROM (
+            SELECT p.post_id, COUNT(*) AS total
+            FROM wire_article_purchase p
+            LEFT JOIN wire_article_purchase_gift g
+              ON g.purchase_id = p.id
+             AND p.product_type = 'CONSULTATION_GIFT'
+            WHERE p.status = 'PAID'
+              AND COALESCE(p.paid_at, p.timestamp)
+                  >= now() - interval '{CONSULTATION_DURATION} days'
+              AND (
+                p.product_type = 'CONSULTATION'
+                OR (p.product_type = 'CONSULTATION_GIFT' AND g.id IS NOT NULL)
+              )
+            GROUP BY p.post_id
+        ) v
+        WHERE c.id = v.post_id
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("frt_content", schema=None) as batch_op:
+        batch_op.drop_index("ix_frt_content_sales_amount_cents_id")
+        batch_op.drop_index("ix_frt_content_paid_consultation_count_id")
+        batch_op.drop_index("ix_frt_content_published_at_id")
+        batch_op.drop_column("sales_amount_cents")
+        batch_op.drop_column("paid_consultation_count")
@@ -0,0 +1,40 @@
+"""add search_pending (coalesced search indexing)
+
+Revision ID: d4e5f6a7b8c9
+Revises: c2d3e4f5a6b7
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d4e5f6a7b8c9"
+down_revision = "c2d3e4f5a6b7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "search_pending",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("source_type", sa.String(), nullable=False),
+        sa.Column("source_id", sa.BigInteger(), nullable=False),
+        sa.Column("queued_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    with op.batch_alter_table("search_pending", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_search_pending_queued_at"),
+            ["queued_at"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("search_pending", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_search_pending_queued_at"))
+
+    op.drop_table("search_pending")
@@ -0,0 +1,38 @@
+"""permissions version on users
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-17 16:00:00.000000
+
+Key of the per-user capability cache (`app.services.capabilities`),
+bumped whenever the roles or BW role assignments of a user change.
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e1f2a3b4c5d6"
+down_revision = "d0e1f2a3b4c5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("aut_user", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "permissions_version",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+            )
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("aut_user", schema=None) as batch_op:
+        batch_op.drop_column("permissions_version")
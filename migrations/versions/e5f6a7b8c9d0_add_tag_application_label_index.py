@@ -0,0 +1,29 @@
+"""add (label, object_id) index on tag_application
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "e5f6a7b8c9d0"
+down_revision = "d4e5f6a7b8c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("tag_application", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_tag_application_label_object_id",
+            ["label", "object_id"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("tag_application", schema=None) as batch_op:
+        batch_op.drop_index("ix_tag_application_label_object_id")
@@ -0,0 +1,21 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Cron actor: mail outbox safety net.
+
+Queued mails are normally sent by the delayed ``flush_email_outbox``
+message scheduled when they are queued. Every 5 minutes, flush again
+in case that message was lost or ran before the queueing transaction
+committed.
+"""
+
+from __future__ import annotations
+
+from app.dramatiq.scheduler import crontab
+from app.services.emails.outbox import flush_email_outbox
+
+
+@crontab("*/5 * * * *")
+def flush_mail_outbox() -> None:
+    flush_email_outbox()
@@ -1,34 +1,58 @@
-"""Cron actor: catch-up search-index rebuild.
+"""Cron actors: search-index upkeep.
 
 Live indexing happens via domain signals (see
-``app.modules.search.receivers``). This hourly job is a safety net —
-it re-walks the database and rebuilds the index from scratch in case
-a signal was dropped (worker crash, transient broker error, race
-between request commit and worker pickup).
-
-Runs at HH:15 to avoid colliding with the reputation actor at HH:00.
+``app.modules.search.receivers``), queued and applied in batches by
+``flush_pending_reindex``. The jobs here are safety nets and
+housekeeping:
+
+* every 5 minutes, flush pending updates whose delayed flush message
+  was lost or ran before the change was committed;
+* hourly, reconcile the index with the database in case a signal was
+  dropped (worker crash, transient broker error): only drifted docs
+  are rewritten, the live index is never emptied. Runs at HH:15 to
+  avoid colliding with the reputation actor at HH:00;
+* nightly, merge the small segments left by incremental commits.
 """
 
 from __future__ import annotations
 
 import time
 
+import svcs.flask
 from loguru import logger
 
 from app.dramatiq.scheduler import crontab
-from app.modules.search.cli import rebuild_index
+from app.modules.search.cli import reconcile_index
+from app.modules.search.engine import SearchEngine
+from app.modules.search.jobs import flush_pending_reindex
+
+
+@crontab("*/5 * * * *")
+def flush_search_queue() -> None:
+    flush_pending_reindex()
 
 
 @crontab("15 * * * *")
-def rebuild_search_index() -> None:
-    logger.info("cron: search rebuild starting")
+def reconcile_search_index() -> None:
+    logger.info("cron: search reconcile starting")
     started = time.monotonic()
-    counts = rebuild_index(show_progress=False)
+    stats = reconcile_index()
     elapsed = time.monotonic() - started
-    total = sum(counts.values())
+    upserted = sum(s.upserted for s in stats.values())
+    deleted = sum(s.deleted for s in stats.values())
     logger.info(
-        "cron: search rebuild done in {:.1f}s — {} docs ({})",
+        "cron: search reconcile done in {:.1f}s — {} upserted, {} deleted",
         elapsed,
-        total,
-        counts,
+        upserted,
+        deleted,
+    )
+
+
+@crontab("45 3 * * *")
+def optimize_search_index() -> None:
+    logger.info("cron: search index optimize starting")
+    started = time.monotonic()
+    svcs.flask.container.get(SearchEngine).optimize()
+    logger.info(
+        "cron: search index optimize done in {:.1f}s", time.monotonic() - started
     )
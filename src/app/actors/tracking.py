@@ -0,0 +1,23 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Cron actor: engagement counters of contents.
+
+`view_count` and `like_count` are maintained by increments, and views
+buffered by a worker killed outright never make it to the database.
+Once a day, realign both counters with the unique views and the likes
+(same as ``flask job engagement-counters``).
+"""
+
+from __future__ import annotations
+
+from app.dramatiq.scheduler import crontab
+from app.flask.extensions import db
+from app.services import tracking
+
+
+@crontab("0 5 * * *")
+def recount_engagement_counters() -> None:
+    tracking.recount_engagement_counters()
+    db.session.commit()
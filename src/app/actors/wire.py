@@ -0,0 +1,22 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Cron actor: purchase counters of wire posts.
+
+Purchases update `Post.paid_consultation_count` and
+`Post.sales_amount_cents` as they are flushed. Once a day, recompute
+them so that consultations leaving their duration window stop counting.
+"""
+
+from __future__ import annotations
+
+from app.dramatiq.scheduler import crontab
+from app.flask.extensions import db
+from app.modules.wire.services.purchase_aggregates import refresh_purchase_counters
+
+
+@crontab("30 4 * * *")
+def refresh_wire_purchase_counters() -> None:
+    refresh_purchase_counters()
+    db.session.commit()
@@ -10,6 +10,7 @@ from flask_wtf import FlaskForm
 from sqlalchemy import select
 
 from app.flask.extensions import db
+from app.services.reference_data import TAXONOMIES, bump_reference_data_version
 from app.services.taxonomies import (
     TaxonomyEntry,
     check_taxonomy_exists,
@@ -89,6 +90,7 @@ def create():
             value=form.value.data or "",
             seq=form.seq.data or 0,
         )
+        bump_reference_data_version(TAXONOMIES)
         db.session.commit()
         flash(f"Entry '{form.name.data}' created successfully.", "success")
         return redirect(url_for(".list_entries", taxonomy_name=taxonomy_name))
@@ -119,6 +121,7 @@ def edit(entry_id: int):
             value=form.value.data or "",
             seq=form.seq.data or 0,
         )
+        bump_reference_data_version(TAXONOMIES)
         db.session.commit()
         flash(f"Entry '{form.name.data}' updated successfully.", "success")
         return redirect(url_for(".list_entries", taxonomy_name=entry.taxonomy_name))
@@ -152,6 +155,7 @@ def delete(entry_id: int):
     if entry:
         taxonomy_name = entry.taxonomy_name
         db.session.delete(entry)
+        bump_reference_data_version(TAXONOMIES)
         db.session.commit()
         flash(f"Entry '{entry.name}' has been deleted.", "success")
         return redirect(url_for(".list_entries", taxonomy_name=taxonomy_name))
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from copy import deepcopy
 from operator import itemgetter
 from pathlib import Path
@@ -15,11 +16,11 @@ from slugify import slugify
 from sqlalchemy import delete
 
 from app.flask.extensions import db
+from app.services.reference_data import TAXONOMIES, bump_reference_data_version
 from app.services.taxonomies import (
     TaxonomyEntry,
     check_taxonomy_exists,
-    create_entry,
-    update_entry,
+    import_taxonomy_entries,
 )
 
 # format for HTML selects
@@ -98,8 +99,12 @@ CIVILITE_ONTOLOGY = [
 
 # Main function
 def import_taxonomies() -> None:
-    db.session.execute(delete(TaxonomyEntry))
-    db.session.commit()
+    # Taxonomies not (or no longer) imported from the source go away;
+    # the imported ones are upserted in place.
+    known = [taxonomy_name for taxonomy_name, _slug in TAXO_NAME_ONTOLOGIE_SLUG]
+    db.session.execute(
+        delete(TaxonomyEntry).where(TaxonomyEntry.taxonomy_name.not_in(known))
+    )
 
     raw_ontologies = _parse_source_ontologies()
     _check_tables_found(raw_ontologies)
@@ -114,6 +119,7 @@ def import_taxonomies() -> None:
         except KeyError as e:
             print("************** Probable missing ontology for", taxonomy_name)
             print(e)
+    bump_reference_data_version(TAXONOMIES)
 
 
 def upgrade_taxonomies() -> None:
@@ -132,6 +138,7 @@ def upgrade_taxonomies() -> None:
         except KeyError as e:
             print("************** Probable missing ontology for", taxonomy_name)
             print(e)
+    bump_reference_data_version(TAXONOMIES)
 
 
 # Used for debug
@@ -191,13 +198,8 @@ def _category_from_value(value: str) -> str:
 
 
 def _update_or_create_taxonomy(taxonomy_name, values) -> None:
-    # Check that the taxonomy_name is present in DB
-    if check_taxonomy_exists(taxonomy_name):
-        updated = _update_taxonomy_entries(taxonomy_name, values)
-        print(f"    - updated values: {updated}")
-    else:
-        print("    - create taxonomy")
-        _create_taxonomy_entries(taxonomy_name, values)
+    counts = import_taxonomy_entries(taxonomy_name, _taxonomy_entries(values))
+    print(f"    - {counts}")
 
 
 def _upgrade_only_new_taxonomy(taxonomy_name, values) -> None:
@@ -205,38 +207,20 @@ def _upgrade_only_new_taxonomy(taxonomy_name, values) -> None:
     if check_taxonomy_exists(taxonomy_name):
         print("    - taxony already present")
     else:
-        print("    - create taxonomy")
-        _create_taxonomy_entries(taxonomy_name, values)
+        counts = import_taxonomy_entries(taxonomy_name, _taxonomy_entries(values))
+        print(f"    - create taxonomy: {counts}")
 
 
-def _update_taxonomy_entries(taxonomy_name, values) -> int:
+def _taxonomy_entries(values) -> Iterator[dict[str, Any]]:
     seq: int = 0
-    updated: int = 0
     for value, name in values:
         seq += 10
-        if update_entry(
-            taxonomy_name=taxonomy_name,
-            name=name,
-            category=_category_from_value(value),
-            value=value,
-            seq=seq,
-        ):
-            updated += 1
-    return updated
-
-
-def _create_taxonomy_entries(taxonomy_name, values) -> None:
-    seq: int = 0
-    for value, name in values:
-        seq += 10
-        create_entry(
-            taxonomy_name=taxonomy_name,
-            name=name,
-            category=_category_from_value(value),
-            value=value,
-            seq=seq,
-        )
-        # print(taxonomy_name, "|", category, "|", value, "|", name)
+        yield {
+            "name": name,
+            "category": _category_from_value(value),
+            "value": value,
+            "seq": seq,
+        }
 
 
 def get_converter(ontology_slug: str) -> type[BaseConvert]:
@@ -12,7 +12,16 @@ import ijson
 from sqlalchemy import delete
 
 from app.flask.extensions import db
-from app.services.zip_codes import CountryEntry, ZipCodeEntry, ZipCodeRepository
+from app.services.reference_data import (
+    COUNTRIES,
+    ZIP_CODES,
+    bump_reference_data_version,
+)
+from app.services.zip_codes import (
+    CountryEntry,
+    ZipCodeEntry,
+    import_zip_code_entries,
+)
 
 COUNTRY_SRC = Path("bootstrap_data/country_zip_code/pays.json")
 ZIP_CODE_SRC = Path("bootstrap_data/country_zip_code/towns")
@@ -43,42 +52,31 @@ def import_countries() -> None:
         )
         db.session.add(country_entry)
 
+    bump_reference_data_version(COUNTRIES)
     db.session.flush()
 
 
 def import_zip_codes() -> None:
-    db.session.execute(delete(ZipCodeEntry))
-    db.session.commit()
-
     print("importing zip codes")
-    for path in sorted(ZIP_CODE_SRC.glob("*.json")):
+    paths = sorted(ZIP_CODE_SRC.glob("*.json"))
+    db.session.execute(
+        delete(ZipCodeEntry).where(ZipCodeEntry.iso3.not_in([p.stem for p in paths]))
+    )
+    for path in paths:
         print(f"importing {path}")
         import_zip_codes_for_country(path)
 
+    bump_reference_data_version(ZIP_CODES)
+    db.session.commit()
+
 
 def import_zip_codes_for_country(path: Path) -> None:
-    iso3 = path.stem
-    zip_codes = []
-    count = 0
-    repo = ZipCodeRepository(session=db.session)  # type: ignore[arg-type]
+    """Upsert the zip codes of one country, streaming its source file."""
     with path.open() as file:
-        parser = ijson.items(file, "item")
-
-        for item in parser:
-            zip_code = item["zip_code"]
-            name = item["name"]
-            value = f"{iso3} / {zip_code} {name}"
-            label = f"{zip_code} {name}"
-            zip_code_entry = ZipCodeEntry(
-                iso3=iso3, zip_code=zip_code, name=name, value=value, label=label
-            )
-            zip_codes.append(zip_code_entry)
-            count += 1
-            if len(zip_codes) >= 1000:
-                repo.add_many(zip_codes, auto_commit=True, auto_expunge=True)
-                zip_codes = []
-
-        repo.add_many(zip_codes, auto_commit=True, auto_expunge=True)
+        items = ((item["zip_code"], item["name"]) for item in ijson.items(file, "item"))
+        counts = import_zip_code_entries(path.stem, items)
+    db.session.commit()
+    print(f"    - {counts}")
 
 
 # #
@@ -63,6 +63,16 @@ def upgrade_ontologies_cmd() -> None:
     print(f"Elapsed time: {time.time() - t0:.2f} seconds")
 
 
+@data.command("compile-kyc-survey", short_help="Compile the KYC survey workbook")
+def compile_kyc_survey_cmd() -> None:
+    """Parse the KYC survey workbook into its compiled JSON file (to
+    commit along with the workbook)."""
+    from app.modules.kyc.survey_model import compile_survey_model
+
+    path = compile_survey_model()
+    print(f"Compiled KYC survey written to {path}")
+
+
 @data.command("load-db", short_help="Load DB from a dump")
 @with_appcontext
 def load_db_cmd() -> None:
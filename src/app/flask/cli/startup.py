@@ -0,0 +1,118 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Startup profiling command."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import click
+from flask_super.cli import command
+from rich.console import Console
+from rich.table import Table
+
+from app.flask import startup
+
+# Run in a fresh interpreter: the current process has already imported
+# and initialized everything.
+PROFILE_SCRIPT = (
+    "import sys; from app.flask import startup; startup.profile_create_app(sys.argv[1])"
+)
+
+
+@command("startup-profile", short_help="Profile application startup")
+@click.option("--limit", default=25, help="Number of modules to show.")
+@click.option(
+    "--manifest",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the scan manifest (see SCAN_MANIFEST) to this file.",
+)
+def startup_profile(limit: int, manifest: str | None) -> None:
+    """Time a cold `create_app()`: module imports of the scan and
+    registration phases."""
+    from app.flask.main import SCAN_PACKAGES
+
+    # The profile (and the manifest) must come from a full scan.
+    start = time.perf_counter()
+    data = _run_profile(scan_manifest="")
+    total = time.perf_counter() - start
+    profile = startup.StartupProfile.from_dict(data["profile"])
+
+    console = Console()
+    _print_phases(console, profile, total)
+    _print_modules(console, profile, limit)
+
+    if manifest:
+        modules = profile.registering_modules()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            candidate = Path(tmp_dir) / "manifest.json"
+            startup.write_manifest(candidate, SCAN_PACKAGES, modules)
+            check = _run_profile(scan_manifest=str(candidate))
+        _check_fingerprints(data["fingerprint"], check["fingerprint"])
+        startup.write_manifest(manifest, SCAN_PACKAGES, modules)
+        console.print(
+            f"Manifest written to {manifest}: {len(modules)} of "
+            f"{len(profile.modules)} scanned modules."
+        )
+
+
+def _run_profile(scan_manifest: str) -> dict:
+    env = dict(os.environ)
+    env["FLASK_SCAN_MANIFEST"] = scan_manifest
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output = Path(tmp_dir) / "profile.json"
+        result = subprocess.run(
+            [sys.executable, "-c", PROFILE_SCRIPT, str(output)],
+            env=env,
+            check=False,
+        )
+        if result.returncode != 0:
+            msg = f"Profiled startup failed (exit code {result.returncode})"
+            raise click.ClickException(msg)
+        return json.loads(output.read_text())
+
+
+def _check_fingerprints(full: dict, partial: dict) -> None:
+    """Refuse a manifest that would not build the same app as a full
+    scan (a module with side effects `count_registrations` misses)."""
+    missing = [
+        f"{key}: {', '.join(sorted(set(full[key]) - set(partial[key]))[:10])}"
+        for key in full
+        if full[key] != partial[key]
+    ]
+    if missing:
+        msg = "The manifest does not build the same app:\n" + "\n".join(missing)
+        raise click.ClickException(msg)
+
+
+def _print_phases(console: Console, profile: startup.StartupProfile, total: float):
+    table = Table(title=f"Startup phases (process: {total:.2f}s)")
+    table.add_column("Phase")
+    table.add_column("Time (s)", justify="right")
+    for phase in profile.phases:
+        table.add_row("  " * phase.depth + phase.name, f"{phase.duration:.3f}")
+    console.print(table)
+
+
+def _print_modules(console: Console, profile: startup.StartupProfile, limit: int):
+    modules = sorted(profile.modules, key=lambda m: m.duration, reverse=True)
+    table = Table(
+        title=f"Slowest scanned modules ({len(profile.modules)} scanned, "
+        "times include first imports of their dependencies)"
+    )
+    table.add_column("Module")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Registrations", justify="right")
+    for module in modules[:limit]:
+        table.add_row(
+            module.name, f"{module.duration:.3f}", str(module.registrations or "")
+        )
+    console.print(table)
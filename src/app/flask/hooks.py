@@ -4,8 +4,6 @@
 
 from __future__ import annotations
 
-import importlib.metadata
-
 from flask import Flask, current_app, g, redirect, request, session
 from flask_login import current_user
 from flask_security.core import AnonymousUser
@@ -14,6 +12,7 @@ from svcs.flask import container
 from werkzeug.exceptions import NotFound, Unauthorized
 
 from app.flask.doorman import doorman
+from app.flask.jinja import get_app_version
 from app.flask.lib.proxies import unproxy
 from app.flask.routing import url_for
 from app.flask.sqla import get_obj
@@ -104,24 +103,21 @@ def inject_extra_context():
     notification_service = container.get(NotificationService)
     promotion_service = container.get(PromotionService)
 
-    try:
-        version = importlib.metadata.version("aipress24-flask")
-    except importlib.metadata.PackageNotFoundError:
-        version = "???"
-
-    def get_notifications() -> list:
-        return notification_service.get_notifications(g.user)
+    # Only the templates that show the bell call these, so partials
+    # don't query; full pages mostly hit the per-user digest cache.
+    def get_notifications() -> tuple:
+        return notification_service.get_digest(g.user).latest
 
     def get_unread_notification_count() -> int:
         if not getattr(g, "user", None) or g.user.is_anonymous:
             return 0
-        return notification_service.get_unread_count(g.user)
+        return notification_service.get_digest(g.user).unread_count
 
     return {
         "get_promotion": promotion_service.get_promotion,
         "url_for": url_for,
         "json_data": {},
-        "app_version": version,
+        "app_version": get_app_version(),
         "menus": menu_service,
         "get_notifications": get_notifications,
         "get_unread_notification_count": get_unread_notification_count,
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import importlib.metadata
+from functools import cache
 
 from flask.app import Flask
 
@@ -14,12 +15,17 @@ from app.flask.lib.pywire import markup_component
 def register_context_processors(app: Flask) -> None:
     @app.context_processor
     def inject_context():
-        try:
-            version = importlib.metadata.version("aipress24-flask")
-        except importlib.metadata.PackageNotFoundError:
-            version = "???"
         return {
             "json_data": {},
             "component": markup_component,
-            "app_version": version,
+            "app_version": get_app_version(),
         }
+
+
+@cache
+def get_app_version() -> str:
+    """The installed package version (read once per process)."""
+    try:
+        return importlib.metadata.version("aipress24-flask")
+    except importlib.metadata.PackageNotFoundError:
+        return "???"
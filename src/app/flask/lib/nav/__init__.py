@@ -39,11 +39,12 @@ Usage:
 from __future__ import annotations
 
 from .decorator import nav
-from .registration import register_nav
+from .registration import LazyMenu, register_nav
 from .registry import NavConfig, configure_nav, get_nav_config
 from .tree import NavTree, get_nav_tree
 
 __all__ = [
+    "LazyMenu",
     "NavConfig",
     "NavTree",
     "configure_nav",
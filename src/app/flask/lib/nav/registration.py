@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from flask import g, request
@@ -15,11 +17,11 @@ from .request import NavRequest
 from .tree import NavTree
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
     from flask import Flask
 
-    from .tree import BreadCrumb
+    from .tree import BreadCrumb, MenuItem
 
 
 def nav_crumbs_to_legacy(crumbs: Iterable[BreadCrumb]) -> list[dict[str, Any]]:
@@ -36,6 +38,27 @@ def nav_crumbs_to_legacy(crumbs: Iterable[BreadCrumb]) -> list[dict[str, Any]]:
     ]
 
 
+class LazyMenu(Sequence):
+    """A menu built the first time a template reads it.
+
+    Partials (htmx fragments) are rendered with the same context as full
+    pages but seldom show the menus; they should not pay for them.
+    """
+
+    def __init__(self, build: Callable[[], list[MenuItem]]) -> None:
+        self._build = build
+
+    @cached_property
+    def _items(self) -> list[MenuItem]:
+        return self._build()
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 def register_nav(app: Flask) -> None:
     """Register navigation system with Flask app.
 
@@ -76,13 +99,14 @@ def register_nav(app: Flask) -> None:
         # so dynamic labels from g.nav.label are picked up
         _inject_breadcrumbs_to_context()
 
+        nav = g.nav
         return {
             # New nav_* variables (preferred)
-            "nav_breadcrumbs": g.nav.breadcrumbs(),
-            "nav_main_menu": g.nav.menu("main"),
-            "nav_secondary_menu": g.nav.menu(),
-            "nav_user_menu": g.nav.menu("user"),
-            "nav_create_menu": g.nav.menu("create"),
+            "nav_breadcrumbs": nav.breadcrumbs(),
+            "nav_main_menu": LazyMenu(lambda: nav.menu("main")),
+            "nav_secondary_menu": LazyMenu(nav.menu),
+            "nav_user_menu": LazyMenu(lambda: nav.menu("user")),
+            "nav_create_menu": LazyMenu(lambda: nav.menu("create")),
         }
 
 
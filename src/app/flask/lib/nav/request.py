@@ -30,6 +30,7 @@ class NavRequest:
         self._view_args = view_args
         self._label_override: str | None = None
         self._parent_override: str | None = None
+        self._breadcrumbs: list[BreadCrumb] | None = None
 
     @property
     def endpoint(self) -> str:
@@ -45,6 +46,7 @@ class NavRequest:
     def label(self, value: str) -> None:
         """Set dynamic breadcrumb label for current page."""
         self._label_override = value
+        self._breadcrumbs = None
 
     @property
     def parent(self) -> str | None:
@@ -55,6 +57,7 @@ class NavRequest:
     def parent(self, value: str) -> None:
         """Override inferred parent (rare)."""
         self._parent_override = value
+        self._breadcrumbs = None
 
     @property
     def current_section(self) -> str:
@@ -64,13 +67,19 @@ class NavRequest:
         return self._endpoint
 
     def breadcrumbs(self) -> list[BreadCrumb]:
-        """Build breadcrumb trail from current endpoint to root."""
-        return get_nav_tree().build_breadcrumbs(
-            endpoint=self._endpoint,
-            view_args=self._view_args,
-            label_override=self._label_override,
-            parent_override=self._parent_override,
-        )
+        """Build breadcrumb trail from current endpoint to root.
+
+        Built once per request (every template render asks for it), and
+        again only if the view changes `label` or `parent`.
+        """
+        if self._breadcrumbs is None:
+            self._breadcrumbs = get_nav_tree().build_breadcrumbs(
+                endpoint=self._endpoint,
+                view_args=self._view_args,
+                label_override=self._label_override,
+                parent_override=self._parent_override,
+            )
+        return self._breadcrumbs
 
     def menu(self, section: str | None = None) -> list[MenuItem]:
         """Get menu for a section.
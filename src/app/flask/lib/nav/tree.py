@@ -9,9 +9,10 @@ from __future__ import annotations
 import re
 import warnings
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
-from flask import g, url_for
+from flask import g, has_request_context, url_for
 from loguru import logger
 
 if TYPE_CHECKING:
@@ -118,6 +119,8 @@ class NavTree:
         self._sections: dict[str, NavNode] = {}
         self._url_to_endpoint: dict[str, str] = {}
         self._built = False
+        # (section, current endpoint, user key) -> resolved menu
+        self._menu_cache: dict[tuple, tuple[MenuItem, ...]] = {}
 
     def build(self, app: Flask) -> None:
         """Scan blueprints and routes, build navigation tree."""
@@ -129,6 +132,8 @@ class NavTree:
         self._build_url_index()
         self._propagate_acl()
         self._validate()
+        self._menu_cache.clear()
+        self.__dict__.pop("_menu_roles", None)
         self._built = True
 
         logger.debug("Nav tree built with {} nodes", len(self._nodes))
@@ -424,9 +429,60 @@ class NavTree:
 
         Returns:
             List of MenuItem objects
+
+        Menus only depend on the section, the endpoint and the roles the
+        menus check, so they are resolved once per combination and then
+        served from memory. Outside a request, URLs cannot be built and
+        nothing is cached.
         """
         user = getattr(g, "user", None)
+        if not has_request_context():
+            return self._build_menu(section, current_endpoint, user)
+
+        key = (section, current_endpoint, self._user_key(user))
+        items = self._menu_cache.get(key)
+        if items is None:
+            items = tuple(self._build_menu(section, current_endpoint, user))
+            self._menu_cache[key] = items
+        return list(items)
+
+    def _user_key(self, user: User | None) -> tuple | None:
+        """What menus can tell apart about ``user``: anonymous or not,
+        and which of the roles checked by menus it has."""
+        if user is None:
+            return None
+        if getattr(user, "is_anonymous", True):
+            return (True, frozenset())
+
+        from app.services.capabilities import Capabilities, can_use_capabilities
+        from app.services.roles import has_role
 
+        if can_use_capabilities(user):
+            # Menus only check roles: skip the Business Wall queries of
+            # `get_capabilities`.
+            checker = Capabilities(roles=frozenset(r.name for r in user.roles))
+            roles = frozenset(r for r in self._menu_roles if checker.has_role(r))
+        else:
+            roles = frozenset(r for r in self._menu_roles if has_role(user, r))
+        return (False, roles)
+
+    @cached_property
+    def _menu_roles(self) -> frozenset:
+        """Every role an ACL or a static menu entry checks."""
+        from app.enums import RoleEnum
+        from app.settings.menus import ADMIN_MENU, CREATE_MENU, USER_MENU
+
+        roles = set()
+        for node in self._nodes.values():
+            roles.update(role for _directive, role, _action in node.effective_acl)
+        for entry in (*USER_MENU, *CREATE_MENU, *ADMIN_MENU):
+            roles.update(entry.get("roles", ()))
+        roles.discard(RoleEnum.SELF)
+        return frozenset(roles)
+
+    def _build_menu(
+        self, section: str, current_endpoint: str, user: User | None
+    ) -> list[MenuItem]:
         # Main menu = list of sections
         if section == "main":
             return self._build_main_menu(current_endpoint, user)
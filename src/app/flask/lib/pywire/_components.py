@@ -4,14 +4,12 @@
 
 from __future__ import annotations
 
-import inspect
 import json
 import uuid
-from pathlib import Path
 from typing import ClassVar
 
-from flask import current_app, render_template
-from jinja2 import Environment, Template
+from flask import render_template
+from jinja2 import Template
 
 from app.lib.names import to_kebab_case
 
@@ -64,10 +62,7 @@ class StaticComponent:
         return to_kebab_case(cls.__name__)
 
     def _get_template(self) -> Template:
-        template_name = self._name.replace("-", "_") + ".j2"
-        template_file = Path(inspect.getfile(self.__class__)).parent / template_name
-        jinja_env: Environment = current_app.jinja_env
-        return jinja_env.from_string(template_file.read_text())
+        return get_template(self.__class__)
 
     def _initial_render(self) -> str:
         return self.render()
@@ -5,16 +5,67 @@
 from __future__ import annotations
 
 import inspect
+from functools import cache
 from pathlib import Path
 
-from flask import current_app
-from jinja2 import Environment, Template
+from flask import Flask, current_app
+from jinja2 import BaseLoader, ChoiceLoader, Environment, Template, TemplateNotFound
 
 from app.lib.names import to_snake_case
 
 
+class ComponentLoader(BaseLoader):
+    """Load component templates by absolute path.
+
+    Going through a loader (rather than ``from_string``) lets Jinja's
+    template cache, and its bytecode cache when one is configured, keep
+    the compiled template. The ``uptodate`` callback is only consulted
+    when ``auto_reload`` is on, i.e. in debug mode.
+    """
+
+    def get_source(self, environment: Environment, template: str):
+        path = Path(template)
+        if not path.is_absolute():
+            raise TemplateNotFound(template)
+        try:
+            source = path.read_text()
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            raise TemplateNotFound(template) from None
+
+        def uptodate() -> bool:
+            try:
+                return path.stat().st_mtime == mtime
+            except OSError:
+                return False
+
+        return source, str(path), uptodate
+
+
 def get_template(cls: type) -> Template:
+    """Return the compiled template colocated with component ``cls``.
+
+    Compiled once per process; re-read when the file changes only if
+    the app's Jinja environment auto-reloads (debug mode).
+    """
+    return _component_env(current_app).get_template(str(_template_path(cls)))
+
+
+@cache
+def _template_path(cls: type) -> Path:
     template_name = to_snake_case(cls.__name__) + ".j2"
-    template_file = Path(inspect.getfile(cls)).parent / template_name
-    jinja_env: Environment = current_app.jinja_env
-    return jinja_env.from_string(template_file.read_text())
+    return Path(inspect.getfile(cls)).parent / template_name
+
+
+def _component_env(app: Flask) -> Environment:
+    """An overlay of the app's Jinja environment (same globals, filters
+    and ``auto_reload``) that loads components through
+    :class:`ComponentLoader`, and the templates they import or include
+    through the app's own loader.
+    """
+    env = app.extensions.get("pywire.jinja_env")
+    if env is None:
+        loader = ChoiceLoader([ComponentLoader(), app.jinja_env.loader])
+        env = app.jinja_env.overlay(loader=loader)
+        app.extensions["pywire.jinja_env"] = env
+    return env
@@ -6,7 +6,6 @@
 
 from __future__ import annotations
 
-import importlib
 import os
 import pkgutil
 import time
@@ -23,7 +22,7 @@ from svcs.flask import container
 from werkzeug.utils import find_modules, import_string
 
 from app.blueprints.ontology import ontology_bp
-from app.flask import services
+from app.flask import services, startup
 from app.flask.cli.bootstrap import bootstrap
 from app.flask.cli.roles import register_roles_commands, register_users_commands
 from app.flask.config import setup_config
@@ -77,14 +76,32 @@ def _scan_packages_filtered(packages: Iterable[str]) -> None:
     for package_name in packages:
         if _is_excluded(package_name):
             continue
-        root = importlib.import_module(package_name)
+        root = startup.import_module(package_name)
         if not hasattr(root, "__path__"):
             continue
         prefix = root.__name__ + "."
         for _, module_name, _ in pkgutil.walk_packages(root.__path__, prefix):
             if _is_excluded(module_name):
                 continue
-            importlib.import_module(module_name)
+            startup.import_module(module_name)
+
+
+def _scan(app: Flask) -> None:
+    """Import the modules listed in the `SCAN_MANIFEST` file if set (see
+    `app.flask.startup`), otherwise scan `SCAN_PACKAGES`."""
+    manifest = app.config.get("SCAN_MANIFEST")
+    if not manifest:
+        _scan_packages_filtered(SCAN_PACKAGES)
+        return
+
+    modules = startup.read_manifest(manifest, SCAN_PACKAGES)
+    if modules is None:
+        logger.warning("Invalid scan manifest {}, scanning all packages", manifest)
+        _scan_packages_filtered(SCAN_PACKAGES)
+        return
+
+    for module_name in modules:
+        startup.import_module(module_name)
 
 
 def _is_excluded(module_name: str) -> bool:
@@ -139,10 +156,12 @@ def create_app(config=None) -> Flask:
     app.config["MAX_FORM_MEMORY_SIZE"] = MAX_FORM_MEMORY_SIZE
 
     # 2: Scan to pre-register callbacks, services, etc.
-    _scan_packages_filtered(SCAN_PACKAGES)
+    with startup.phase("scan"):
+        _scan(app)
 
     # 3. Perform registrations on app
-    register_all(app)
+    with startup.phase("register_all"):
+        register_all(app)
 
     return app
 
@@ -154,40 +173,47 @@ def register_all(app: Flask) -> None:
         app: Flask application instance.
     """
     # Extensions
-    register_extensions(app)
-    register_coverage(app)
-    register_mail_debug(app)
-    register_stripe(app)
-    register_stripe_debug(app)
+    with startup.phase("extensions"):
+        register_extensions(app)
+        register_coverage(app)
+        register_mail_debug(app)
+        register_stripe(app)
+        register_stripe_debug(app)
 
     # Register CLI commands
-    register_commands(app)
-    register_roles_commands(app)
-    register_users_commands(app)
+    with startup.phase("commands"):
+        register_commands(app)
+        register_roles_commands(app)
+        register_users_commands(app)
 
     # Register services on the svcs container
-    services.register_services(app)
+    with startup.phase("services"):
+        services.register_services(app)
 
     # Register Jinja, etc.
-    register_filters(app)
-    register_macros(app)
-    register_perf_watcher(app)
-    register_context_processors(app)
-    register_components(app)
-    register_wired_components(app)
+    with startup.phase("jinja and components"):
+        register_filters(app)
+        register_macros(app)
+        register_perf_watcher(app)
+        register_context_processors(app)
+        register_components(app)
+        register_wired_components(app)
 
     # Request lifecycle
-    register_hooks(app)
-    register_debug_hooks(app)
+    with startup.phase("hooks"):
+        register_hooks(app)
+        register_debug_hooks(app)
 
     # Register blueprints
-    register_blueprints(app)
+    with startup.phase("blueprints"):
+        register_blueprints(app)
 
     # Register new navigation system (after blueprints)
-    register_nav(app)
-    register_extra_apps(app)
-    register_pywire(app)
-    register_everything_else(app)
+    with startup.phase("nav and callbacks"):
+        register_nav(app)
+        register_extra_apps(app)
+        register_pywire(app)
+        register_everything_else(app)
 
     # Not used (yet?)
     # register_oauth_providers(app)
@@ -195,7 +221,8 @@ def register_all(app: Flask) -> None:
     # Local imports bc import cycles
     from app.dramatiq.setup import init_dramatiq
 
-    init_dramatiq(app)
+    with startup.phase("dramatiq"):
+        init_dramatiq(app)
 
     # Check completeness of Stripe configuration
     _check_stripe_configuration(app)
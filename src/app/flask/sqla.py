@@ -4,7 +4,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, scoped_session
 from werkzeug.exceptions import NotFound
 
 from app.flask.extensions import db
@@ -62,3 +66,16 @@ def get_multi(cls: type, stmt=None, options=None, limit: int | None = None) -> l
 
     result = db.session.execute(stmt)
     return list(result.scalars())
+
+
+def dialect_insert(
+    session: Session | scoped_session | None = None,
+) -> Callable[..., postgresql.Insert | sqlite.Insert]:
+    """The ``insert`` of the dialect `session` (default: `db.session`)
+    is bound to, for ``ON CONFLICT`` clauses. Only PostgreSQL and SQLite
+    (in the tests) are supported."""
+    if session is None:
+        session = db.session
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite.insert
+    return postgresql.insert
@@ -0,0 +1,293 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Startup profiling and the scan manifest.
+
+`create_app` imports every module under `SCAN_PACKAGES` for its
+side effects: services and CLI commands (flask_super registry), wired
+components, Dramatiq actors, signal receivers, SQLAlchemy models and
+event listeners, blueprint routes and hooks, `singledispatch`
+implementations (`url_for.register`...) and Jinja macros. This module
+times those imports and the registration phases that follow (``flask
+startup-profile``).
+
+The profile also tells which scanned modules registered something. They
+are written to a manifest (``flask startup-profile --manifest PATH``),
+and when the ``SCAN_MANIFEST`` setting points to that file, `create_app`
+imports the listed modules only instead of walking the whole tree.
+Before writing the manifest, the command builds the app a second time
+from it and checks that the result is the same (`fingerprint`). The
+manifest must be regenerated whenever a registering module is added or
+moved, e.g. at image build time.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import FunctionType, ModuleType
+from typing import TYPE_CHECKING, Any
+
+from attr import define, field
+from flask import Blueprint
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+MANIFEST_VERSION = 1
+
+
+@define
+class ModuleTiming:
+    name: str
+    # Seconds, including the modules first imported from this one
+    duration: float
+    # New entries in the tracked registries (see `count_registrations`)
+    registrations: int
+
+
+@define
+class PhaseTiming:
+    name: str
+    depth: int
+    duration: float = 0.0
+
+
+@define
+class StartupProfile:
+    modules: list[ModuleTiming] = field(factory=list)
+    phases: list[PhaseTiming] = field(factory=list)
+    depth: int = 0
+
+    def registering_modules(self) -> list[str]:
+        """Scanned modules whose import registered something, in scan order."""
+        return [m.name for m in self.modules if m.registrations]
+
+    def to_dict(self) -> dict:
+        return {
+            "modules": [[m.name, m.duration, m.registrations] for m in self.modules],
+            "phases": [[p.name, p.depth, p.duration] for p in self.phases],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StartupProfile:
+        return cls(
+            modules=[ModuleTiming(*m) for m in data["modules"]],
+            phases=[PhaseTiming(*p) for p in data["phases"]],
+        )
+
+
+# Non-empty while profiling only: `phase` and `import_module` are then timed.
+_profiles: list[StartupProfile] = []
+
+
+def start_profile() -> StartupProfile:
+    profile = StartupProfile()
+    _profiles.append(profile)
+    return profile
+
+
+def stop_profile() -> StartupProfile:
+    return _profiles.pop()
+
+
+def _current_profile() -> StartupProfile | None:
+    return _profiles[-1] if _profiles else None
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a startup phase (no-op unless profiling)."""
+    profile = _current_profile()
+    if profile is None:
+        yield
+        return
+
+    timing = PhaseTiming(name, profile.depth)
+    profile.phases.append(timing)
+    profile.depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.duration = time.perf_counter() - start
+        profile.depth -= 1
+
+
+def import_module(module_name: str) -> ModuleType:
+    """`importlib.import_module`, timed and checked for registrations
+    when profiling."""
+    profile = _current_profile()
+    if profile is None:
+        return importlib.import_module(module_name)
+
+    before = count_registrations()
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    duration = time.perf_counter() - start
+    registrations = count_registrations() - before
+    profile.modules.append(ModuleTiming(module_name, duration, registrations))
+    return module
+
+
+def count_registrations() -> int:
+    """Total size of the registries that modules fill at import time."""
+    from blinker import default_namespace
+    from flask_super.registry import registry
+    from sqlalchemy.event import registry as event_registry
+
+    from app.dramatiq.job import _actor_registry as jobs
+    from app.dramatiq.scheduler import _actor_registry as crontabs
+    from app.flask.lib.macros import MACROS
+    from app.flask.lib.pywire import _components, _registry
+    from app.models.base import Base
+
+    _collect_scaffolds()
+    return sum(
+        [
+            len(registry.registered),
+            len(_registry.COMPONENTS),
+            len(_components.component_registry),
+            len(jobs),
+            len(crontabs),
+            len(MACROS),
+            sum(len(s.receivers) for s in default_namespace.values()),
+            len(Base.registry.mappers),
+            len(event_registry._key_to_collection),
+            sum(_blueprint_size(bp) for bp in _blueprints.values()),
+            sum(len(f.registry) for f in _dispatchers.values()),
+        ]
+    )
+
+
+# Blueprints and `singledispatch` functions defined in the modules seen
+# so far, by id. Routes, hooks and implementations are added to them by
+# other modules (the ``views`` and ``routing`` ones).
+_blueprints: dict[int, Blueprint] = {}
+_dispatchers: dict[int, Any] = {}
+_seen_modules: set[str] = set()
+
+
+def _collect_scaffolds() -> None:
+    for name, module in list(sys.modules.items()):
+        if name in _seen_modules or not (name == "app" or name.startswith("app.")):
+            continue
+        _seen_modules.add(name)
+        for value in list(vars(module).values()):
+            # `type()` rather than `isinstance()`: the latter would
+            # resolve the proxies (`current_app`...) outside of any app.
+            kind = type(value)
+            if issubclass(kind, Blueprint):
+                _blueprints[id(value)] = value
+            elif kind is FunctionType and "dispatch" in value.__dict__:
+                # A `functools.singledispatch` function
+                _dispatchers[id(value)] = value
+
+
+def _blueprint_size(bp: Blueprint) -> int:
+    hooks = [
+        bp.before_request_funcs,
+        bp.after_request_funcs,
+        bp.teardown_request_funcs,
+        bp.template_context_processors,
+        bp.url_value_preprocessors,
+        bp.url_default_functions,
+    ]
+    handlers = sum(
+        len(by_class)
+        for by_code in bp.error_handler_spec.values()
+        for by_class in by_code.values()
+    )
+    return (
+        len(bp.deferred_functions)
+        + sum(len(funcs) for hook in hooks for funcs in hook.values())
+        + handlers
+    )
+
+
+def fingerprint(app: Flask) -> dict[str, list[str]]:
+    """What the scan contributed to ``app``, to compare a startup from
+    the manifest with a full one."""
+    import dramatiq
+    from blinker import default_namespace
+
+    from app.flask.routing import url_for
+    from app.models.base import Base
+
+    def names(hooks: dict) -> list[str]:
+        return sorted(
+            f"{key}:{func.__module__}.{func.__qualname__}"
+            for key, funcs in hooks.items()
+            for func in funcs
+        )
+
+    return {
+        "routes": sorted(
+            f"{rule.rule} {rule.endpoint}" for rule in app.url_map.iter_rules()
+        ),
+        "before_request": names(app.before_request_funcs),
+        "after_request": names(app.after_request_funcs),
+        "teardown_request": names(app.teardown_request_funcs),
+        "context_processors": names(app.template_context_processors),
+        "error_handlers": sorted(
+            f"{key}:{code}:{cls.__name__}"
+            for key, by_code in app.error_handler_spec.items()
+            for code, by_class in by_code.items()
+            for cls in by_class
+        ),
+        "jinja": sorted(
+            [*app.jinja_env.globals, *app.jinja_env.filters, *app.jinja_env.tests]
+        ),
+        "url_for": sorted(cls.__qualname__ for cls in url_for.registry),
+        "commands": sorted(app.cli.commands),
+        "actors": sorted(dramatiq.get_broker().actors),
+        "models": sorted(m.class_.__name__ for m in Base.registry.mappers),
+        "signals": sorted(
+            f"{name}:{len(signal.receivers)}"
+            for name, signal in default_namespace.items()
+        ),
+    }
+
+
+#
+# Manifest
+#
+def write_manifest(path: str | Path, packages: list[str], modules: list[str]) -> None:
+    data = {"version": MANIFEST_VERSION, "packages": packages, "modules": modules}
+    Path(path).write_text(json.dumps(data, indent=1) + "\n")
+
+
+def read_manifest(path: str | Path, packages: list[str]) -> list[str] | None:
+    """Modules listed in the manifest, or None if it is missing or was
+    generated for other packages (the caller then scans everything)."""
+    try:
+        data = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != MANIFEST_VERSION or data.get("packages") != packages:
+        return None
+    return list(data["modules"])
+
+
+#
+# Entry point of the profiled subprocess (see `flask startup-profile`)
+#
+def profile_create_app(output: str) -> None:
+    """Profile a cold `create_app()` and dump the profile and the
+    `fingerprint` of the app to `output`."""
+    start_profile()
+    with phase("import app.flask.main"):
+        from app.flask.main import create_app
+
+    with phase("create_app"):
+        app = create_app()
+
+    profile = stop_profile()
+    data = {"profile": profile.to_dict(), "fingerprint": fingerprint(app)}
+    Path(output).write_text(json.dumps(data))
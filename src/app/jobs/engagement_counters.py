@@ -0,0 +1,31 @@
+"""Recount job for the engagement counters of contents."""
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+from __future__ import annotations
+
+from flask_super.registry import register
+
+from app.flask.extensions import db
+from app.flask.lib.jobs import Job
+from app.services.tracking import recount_engagement_counters
+
+
+@register
+class EngagementCountersJob(Job):
+    """Job recomputing `view_count` and `like_count` of every content.
+
+    Both counters are maintained by increments; this job realigns them
+    with the unique views and the likes, e.g. after a manual fix in the
+    database. Also run daily by the `recount_engagement_counters` actor.
+    Views still buffered by the web workers are not seen: they are
+    counted when the workers write them.
+    """
+
+    name = "engagement-counters"
+    description = "Recount the views and likes of every content"
+
+    def run(self, *args) -> None:
+        recount_engagement_counters()
+        db.session.commit()
@@ -0,0 +1,30 @@
+"""Refresh job for the denormalized purchase counters of wire posts."""
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+from __future__ import annotations
+
+from flask_super.registry import register
+
+from app.flask.extensions import db
+from app.flask.lib.jobs import Job
+from app.modules.wire.services.purchase_aggregates import refresh_purchase_counters
+
+
+@register
+class PurchaseCountersJob(Job):
+    """Job recomputing `Post.paid_consultation_count` and
+    `Post.sales_amount_cents`.
+
+    Purchases update the counters as they are flushed; this job catches
+    what no flush sees: consultations leaving their duration window.
+    The `refresh_wire_purchase_counters` cron actor runs it daily.
+    """
+
+    name = "purchase-counters"
+    description = "Refresh the « vues » / « ventes » counters of wire posts"
+
+    def run(self, *args) -> None:
+        refresh_purchase_counters()
+        db.session.commit()
@@ -0,0 +1,96 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""In-process cache for data derived from a whole table.
+
+Building the filter bar of a directory, or the expert index used for
+ciblage, means scanning the whole population (every active member and
+their KYC profile). A :class:`FacetCache` keeps the result of that scan
+between renders and drops it when one of the watched models is
+flushed, so a page render only pays for the rows it actually lists.
+
+Other worker processes learn about a change when their copy expires
+(``ttl`` seconds); the process that wrote sees it right away.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+_caches: list[FacetCache] = []
+
+
+class FacetCache(Generic[T]):
+    """Memoise ``build()`` until a watched model changes or ``ttl``
+    seconds have passed."""
+
+    def __init__(
+        self, build: Callable[[], T], *, watch: tuple[type, ...], ttl: float
+    ) -> None:
+        self.build = build
+        self.watch = watch
+        self.ttl = ttl
+        self._value: T | None = None
+        self._expires_at = 0.0
+        # Bumped by ``invalidate`` so a build that raced with a change
+        # is returned to its caller but not kept.
+        self._generation = 0
+        self._lock = threading.Lock()
+        _caches.append(self)
+
+    def get(self) -> T:
+        with self._lock:
+            if self._value is not None and time.monotonic() < self._expires_at:
+                return self._value
+            generation = self._generation
+        value = self.build()
+        with self._lock:
+            if generation == self._generation:
+                self._value = value
+                self._expires_at = time.monotonic() + self.ttl
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._value = None
+            self._generation += 1
+
+    def watches(self, objects) -> bool:
+        return any(isinstance(obj, self.watch) for obj in objects)
+
+
+# Drop the cached facets as soon as a watched row is flushed, and again
+# when the outermost transaction ends: a facet built from uncommitted
+# rows must not outlive a rollback.
+
+_DIRTY_KEY = "facets.dirty"
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session: Session, _flush_context) -> None:
+    changed = [*session.new, *session.dirty, *session.deleted]
+    for cache in _caches:
+        if cache.watches(changed):
+            cache.invalidate()
+            session.info.setdefault(_DIRTY_KEY, set()).add(id(cache))
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _after_transaction_end(session: Session, transaction) -> None:
+    if transaction.parent is not None:
+        return
+    dirty = session.info.pop(_DIRTY_KEY, None)
+    if not dirty:
+        return
+    for cache in _caches:
+        if id(cache) in dirty:
+            cache.invalidate()
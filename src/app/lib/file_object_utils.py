@@ -7,18 +7,51 @@
 This module provides helpers for working with Advanced Alchemy's FileObject,
 including content-addressable storage using SHA256 hashes to avoid filename
 collisions.
+
+Content-addressed files are saved with `save_file_object`, which skips
+the upload when storage already holds the same content. `save_stream`
+does the same for uploads of any size: it hashes the stream while it
+spools it to a temporary file, so memory use does not depend on the file
+size, and the file is uploaded from disk (s3fs switches to a multipart
+upload for large files).
 """
 
 from __future__ import annotations
 
 import hashlib
+import re
+import tempfile
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from advanced_alchemy.types import FileObject
+from advanced_alchemy.types.file_object.backends.fsspec import FSSpecBackend
 
 _PLACEHOLDER_IMAGE_URL = "/static/img/gray-texture.png"
 
+# Storage names produced by create_file_object() — 64 hex chars (sha256)
+# plus optional extension.
+STORAGE_NAME_RE = re.compile(r"^[0-9a-f]{64}(?:\.[A-Za-z0-9]{1,10})?$")
+
+# Size of the chunks `save_stream` reads, hashes and spools.
+SPOOL_CHUNK_SIZE = 64 * 1024
+
+# Sizes (width, height) /media renders image variants at, by name. Any
+# other size is refused, so the set of stored variants stays bounded.
+# Avatars are shown at up to 96 CSS px (`h-24`): rendered at twice that
+# so they stay sharp on high-density screens.
+VARIANT_SIZES: dict[str, tuple[int, int]] = {
+    "avatar": (192, 192),
+    "card": (640, 360),
+}
+
+# URL extension -> Pillow format of the variants /media renders.
+VARIANT_FORMATS: dict[str, str] = {
+    "webp": "WEBP",
+    "jpg": "JPEG",
+    "png": "PNG",
+}
+
 
 def media_url(file_object: FileObject | None) -> str:
     """Return the /media URL for a content-addressed FileObject.
@@ -36,6 +69,27 @@ def media_url(file_object: FileObject | None) -> str:
     return _PLACEHOLDER_IMAGE_URL
 
 
+def is_content_addressed(file_object: FileObject | None) -> bool:
+    """Whether ``file_object`` is stored under a sha256-based name."""
+    return bool(file_object and STORAGE_NAME_RE.match(file_object.path or ""))
+
+
+def media_variant_url(
+    file_object: FileObject | None, size: str, fmt: str = "webp"
+) -> str:
+    """Return the /media URL of a resized variant of an image FileObject.
+
+    ``size`` is a key of `VARIANT_SIZES`. The variant is rendered on first
+    request and stored next to the original, so list pages fetch small
+    thumbnails instead of full-resolution uploads. Falls back to
+    `media_url` for files that are not content-addressed.
+    """
+    if file_object is None or not is_content_addressed(file_object):
+        return media_url(file_object)
+    width, height = VARIANT_SIZES[size]
+    return f"/media/{file_object.path}/{width}x{height}.{fmt}"
+
+
 def create_file_object(
     content: bytes,
     original_filename: str,
@@ -74,9 +128,85 @@ def create_file_object(
         to_filename=storage_name,  # Hash-based storage path
         content=content,
         content_type=content_type,
+        size=len(content),
     )
 
 
+def save_file_object(file_object: FileObject) -> FileObject:
+    """Save a FileObject made by `create_file_object` (or `save_stream`).
+
+    Content-addressed files already in storage are not uploaded again:
+    same name, same content.
+    """
+    if is_content_addressed(file_object) and _is_stored(file_object):
+        return file_object
+    return file_object.save()
+
+
+def save_stream(
+    stream: IO[bytes],
+    original_filename: str,
+    backend: str = "s3",
+    content_type: str | None = None,
+) -> FileObject:
+    """Save the content of `stream` under its sha256, like
+    `create_file_object` + `save_file_object`, without loading it in
+    memory.
+
+    Args:
+        stream: Binary stream, read to its end (e.g. ``FileStorage.stream``).
+        original_filename: Original filename (kept for display, used for extension).
+        backend: Storage backend name (default: "s3").
+        content_type: Optional MIME type.
+
+    Returns:
+        The saved FileObject.
+    """
+    ext = Path(original_filename).suffix.lower()
+    with tempfile.NamedTemporaryFile(suffix=ext) as spool:
+        digest = hashlib.sha256()
+        size = 0
+        while chunk := stream.read(SPOOL_CHUNK_SIZE):
+            digest.update(chunk)
+            spool.write(chunk)
+            size += len(chunk)
+        spool.flush()
+
+        file_object = FileObject(
+            backend=backend,
+            filename=original_filename,
+            to_filename=f"{digest.hexdigest()}{ext}",
+            content_type=content_type,
+            size=size,
+        )
+        if not _is_stored(file_object):
+            _upload(file_object, spool.name)
+        return file_object
+
+
+def _is_stored(file_object: FileObject) -> bool:
+    backend = file_object.backend
+    if not isinstance(backend, FSSpecBackend):
+        return False
+    return backend.fs.exists(_storage_path(backend, file_object.path))
+
+
+def _upload(file_object: FileObject, local_path: str) -> None:
+    backend = file_object.backend
+    if not isinstance(backend, FSSpecBackend):
+        file_object.save(Path(local_path))
+        return
+    # Not `file_object.save(path)`: FSSpecBackend swaps the arguments of
+    # `fs.put()` for paths. `put_file` streams from the file.
+    backend.fs.put_file(local_path, _storage_path(backend, file_object.path))
+
+
+def _storage_path(backend: FSSpecBackend, path: str) -> str:
+    if backend.prefix:
+        return f"{backend.prefix.rstrip('/')}/{path}"
+    return path
+
+
 def deserialize_file_object(file_data: dict[str, Any] | None) -> FileObject | None:
     """Deserialize a FileObject from a dictionary.
 
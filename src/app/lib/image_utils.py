@@ -15,17 +15,23 @@ if TYPE_CHECKING:
 
 
 class UploadedImageData(NamedTuple):
-    """Extracted image data."""
+    """Extracted image data.
+
+    ``bytes`` is empty when the image is too large to be loaded (``size``
+    is then at least the ``max_size`` asked for).
+    """
 
     bytes: bytes
     filename: str
     content_type: str
+    size: int
 
 
 def extract_image_from_request(
     file_storage: FileStorage | None = None,
     data_url: str | None = None,
     orig_filename: str | None = None,
+    max_size: int | None = None,
 ) -> UploadedImageData | None:
     """Extract image bytes, filename and content type from request data.
 
@@ -42,10 +48,15 @@ def extract_image_from_request(
     pre-crop original) — ref bug #0121. If the cropper wasn't
     used (data_url empty), we fall back to the file_storage as-is.
 
+    With ``max_size``, images of that size or more are neither decoded
+    nor read: the size of a data-URL is known from its length, and at
+    most ``max_size`` bytes of a file are read.
+
     Args:
         file_storage: FileStorage from request.files
         data_url: Base64 data URL from request.form
         orig_filename: Filename of orig image (for cropped images)
+        max_size: Optional size limit, in bytes
 
     Returns:
         UploadedImageData or None if no image found
@@ -57,7 +68,12 @@ def extract_image_from_request(
     if data_url and data_url.startswith("data:image/"):
         try:
             header, base64_data = data_url.split(",", 1)
-            image_bytes = base64.b64decode(base64_data)
+            size = _decoded_size(base64_data)
+            if max_size is not None and size >= max_size:
+                image_bytes = b""
+            else:
+                image_bytes = base64.b64decode(base64_data)
+                size = len(image_bytes)
             content_type = header.split(";")[0].split(":")[1]
             suffix = content_type.split("/")[-1]
 
@@ -77,6 +93,7 @@ def extract_image_from_request(
                 bytes=image_bytes,
                 filename=filename,
                 content_type=content_type,
+                size=size,
             )
         except (ValueError, binascii.Error):
             # Malformed data-URL : fall through to the file
@@ -86,17 +103,30 @@ def extract_image_from_request(
     # 2) Plain file upload (cropper not used, or its data-URL was
     # malformed).
     if file_storage is not None:
-        image_bytes = file_storage.read()
+        if max_size is None:
+            image_bytes = file_storage.read()
+        else:
+            image_bytes = file_storage.read(max_size)
         if image_bytes:
+            size = len(image_bytes)
+            if max_size is not None and size >= max_size:
+                image_bytes = b""
             return UploadedImageData(
                 bytes=image_bytes,
                 filename=file_storage.filename or "image.jpg",
                 content_type=file_storage.content_type or "application/octet-stream",
+                size=size,
             )
 
     return None
 
 
+def _decoded_size(base64_data: str) -> int:
+    """Size of the data encoded by `base64_data`, without decoding it."""
+    data = base64_data.strip()
+    return len(data) * 3 // 4 - data[-2:].count("=")
+
+
 def resized(src: bytes, max_size: int = 800) -> bytes:
     """Return a JPEG image content resized to larger side limit."""
     try:
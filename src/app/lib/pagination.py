@@ -0,0 +1,42 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Keyset pagination helpers.
+
+A cursor is an opaque, URL-safe token carrying the sort key values of
+the last item of a page; the next page is the rows after those values.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Page:
+    """One page of a list, and the cursor of the next one if any."""
+
+    items: list[Any]
+    next_cursor: str = ""
+
+
+def encode_cursor(values: tuple) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Raise ``ValueError`` on a malformed cursor."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(cursor) from e
+    if not isinstance(values, list) or not values:
+        raise ValueError(cursor)
+    return tuple(values)
@@ -154,6 +154,10 @@ class User(LifeCycleMixin, Addressable, UserMixin, Base):
     #: Reputation points
     karma: Mapped[float] = mapped_column(default=0.0)
 
+    #: Bumped whenever the roles or BW role assignments of the user change
+    #: (see `app.services.capabilities`).
+    permissions_version: Mapped[int] = mapped_column(default=0, server_default="0")
+
     # Relationships
     organisation: Mapped[Organisation] = relationship(
         "Organisation",
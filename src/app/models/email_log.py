@@ -5,8 +5,10 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+
 import arrow
-from sqlalchemy import String
+from sqlalchemy import Boolean, DateTime, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy_utils import ArrowType
 
@@ -27,3 +29,29 @@ class EmailLog(IdMixin, LifeCycleMixin, Base):
 
     def __repr__(self) -> str:
         return f"<EmailLog({self.recipient_email!r}, {self.sent_at!r})>"
+
+
+class OutboxEmail(IdMixin, Base):
+    """A rendered email waiting to be sent by the outbox worker.
+
+    Rows are appended in the request transaction and drained in batches
+    by `app.services.emails.outbox.flush_email_outbox`. Snowflake ids
+    are time-ordered, so draining by id sends in queueing order.
+    """
+
+    __tablename__ = "email_outbox"
+
+    mail_class: Mapped[str] = mapped_column(String, default="")
+    sender: Mapped[str] = mapped_column(String, nullable=False)
+    recipient: Mapped[str] = mapped_column(String, nullable=False)
+    subject: Mapped[str] = mapped_column(String, default="")
+    body: Mapped[str] = mapped_column(Text, default="")
+    bypass_quota: Mapped[bool] = mapped_column(Boolean, default=False)
+    queued_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboxEmail({self.recipient!r}, {self.subject!r})>"
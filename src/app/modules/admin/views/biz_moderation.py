@@ -44,8 +44,8 @@ def biz_moderation():
 def biz_moderation_approve(id: int):
     offer = _load_pending_or_404(id)
     offer.status = PublicationStatus.PUBLIC
-    db.session.commit()
     marketplace_published.send(offer)
+    db.session.commit()
     flash(f"Offre « {_title(offer)} » publiée.", "success")
     return redirect(url_for(".biz_moderation"))
 
@@ -9,7 +9,7 @@ from flask import g
 from app.flask.extensions import db
 from app.flask.sqla import get_obj
 from app.modules.swork.models import ShortPost as Post
-from app.services.social_graph import SocialUser, adapt
+from app.services import tracking
 
 from . import blueprint
 
@@ -30,11 +30,5 @@ def toggle_like(obj: Post) -> str:
 
     Note: Does NOT commit - caller is responsible for committing.
     """
-    user: SocialUser = adapt(g.user)
-    if user.is_liking(obj):
-        user.unlike(obj)
-    else:
-        user.like(obj)
-    db.session.flush()
-    obj.like_count = adapt(obj).num_likes()
+    tracking.toggle_like(g.user, obj)
     return str(obj.like_count)
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from flask import request
 
-from app.lib.file_object_utils import create_file_object
+from app.lib.file_object_utils import save_stream
 
 from . import blueprint
 
@@ -23,12 +23,11 @@ def upload_blob() -> tuple[dict, int]:
         return {"error": "Empty filename"}, 400
     filename = file.filename
 
-    file_obj = create_file_object(
-        content=file.read(),
+    saved_file_obj = save_stream(
+        file.stream,
         original_filename=filename,
         content_type=file.content_type or "application/octet-stream",
     )
-    saved_file_obj = file_obj.save()
 
     expires_in = 300000000  # ~10years
     url = saved_file_obj.sign(expires_in=expires_in, for_upload=False)
@@ -154,9 +154,9 @@ def jobs_new():
             emitter_org_id=emitter_org_id,
         )
         db.session.add(job)
-        db.session.commit()
         if job.status == PublicationStatus.PUBLIC:
             marketplace_published.send(job)
+        db.session.commit()
         msg = (
             "Offre d'emploi envoyée pour modération."
             if job.status.value == "pending"
@@ -359,9 +359,9 @@ def missions_new():
             emitter_org_id=emitter_org_id,
         )
         db.session.add(mission)
-        db.session.commit()
         if mission.status == PublicationStatus.PUBLIC:
             marketplace_published.send(mission)
+        db.session.commit()
         msg = (
             "Mission envoyée pour modération."
             if mission.status.value == "pending"
@@ -224,9 +224,9 @@ def projects_new():
             emitter_org_id=emitter_org_id,
         )
         db.session.add(project)
-        db.session.commit()
         if project.status == PublicationStatus.PUBLIC:
             marketplace_published.send(project)
+        db.session.commit()
         msg = (
             "Projet envoyé pour modération."
             if project.status.value == "pending"
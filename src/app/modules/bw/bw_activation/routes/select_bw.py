@@ -28,6 +28,7 @@ from app.modules.bw.bw_activation.utils import (
     ERR_NOT_MANAGER,
     fill_session,
 )
+from app.services.capabilities import get_capabilities
 from app.ui.labels import LABELS_BW_TYPE_V2
 
 if TYPE_CHECKING:
@@ -60,22 +61,17 @@ def select_bw():
     # Prepare data for the template
     bw_data = []
 
+    # One capability lookup for all the BWs, instead of loading the
+    # role assignments of each.
+    capabilities = get_capabilities(user)
     for bw in active_bws:
-        rights = get_user_rights_on_bw(user, bw)
+        rights = get_user_rights_on_bw(user, bw, capabilities)
 
         # Check if user has at least one role from `_MANAGEMENT_ROLES`
-        has_management_rights = False
-        if bw.owner_id == user.id:
-            has_management_rights = True
-        elif bw.role_assignments:
-            for assignment in bw.role_assignments:
-                if (
-                    assignment.user_id == user.id
-                    and assignment.invitation_status == InvitationStatus.ACCEPTED.value
-                    and assignment.role_type in _MANAGEMENT_ROLES
-                ):
-                    has_management_rights = True
-                    break
+        has_management_rights = bw.id in capabilities.owned_bws or any(
+            capabilities.has_bw_role(bw.id, role_type)
+            for role_type in _MANAGEMENT_ROLES
+        )
 
         bw_data.append(
             {
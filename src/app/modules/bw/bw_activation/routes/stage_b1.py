@@ -22,7 +22,7 @@ from flask import (
 )
 
 from app.flask.extensions import db
-from app.lib.file_object_utils import create_file_object
+from app.lib.file_object_utils import create_file_object, save_file_object
 from app.lib.image_utils import extract_image_from_request
 from app.logging import warn
 from app.modules.bw.bw_activation import bp
@@ -232,18 +232,19 @@ def configure_content():
             file_storage=request.files.get("logo_image"),
             data_url=request.form.get("logo_image"),
             orig_filename=request.form.get("logo_image_filename") or None,
+            max_size=MAX_IMAGE_SIZE,
         )
         if logo_result:
             try:
                 content = logo_result.bytes
-                if len(content) < MAX_IMAGE_SIZE:
+                if logo_result.size < MAX_IMAGE_SIZE:
                     file_obj = create_file_object(
                         content=content,
                         original_filename=logo_result.filename,
                         content_type=logo_result.content_type,
                     )
                     # Save the file to S3 storage (required before assigning to model)
-                    saved_file_obj = file_obj.save()
+                    saved_file_obj = save_file_object(file_obj)
                     business_wall.logo_image = saved_file_obj
                     db.session.flush()
                     modified = True
@@ -262,18 +263,19 @@ def configure_content():
             file_storage=request.files.get("bandeau_image"),
             data_url=request.form.get("bandeau_image"),
             orig_filename=request.form.get("bandeau_image_filename") or None,
+            max_size=MAX_IMAGE_SIZE,
         )
         if bandeau_result:
             try:
                 content = bandeau_result.bytes
-                if len(content) < MAX_IMAGE_SIZE:
+                if bandeau_result.size < MAX_IMAGE_SIZE:
                     file_obj = create_file_object(
                         content=content,
                         original_filename=bandeau_result.filename,
                         content_type=bandeau_result.content_type,
                     )
                     # Save the file to S3 storage (required before assigning to model)
-                    saved_file_obj = file_obj.save()
+                    saved_file_obj = save_file_object(file_obj)
                     business_wall.cover_image = saved_file_obj
                     db.session.flush()
                     modified = True
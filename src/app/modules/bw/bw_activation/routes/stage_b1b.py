@@ -13,7 +13,7 @@ from uuid import UUID
 from flask import flash, g, redirect, render_template, request, session, url_for
 
 from app.flask.extensions import db
-from app.lib.file_object_utils import create_file_object
+from app.lib.file_object_utils import create_file_object, save_file_object
 from app.lib.image_utils import extract_image_from_request
 from app.logging import warn
 from app.models.auth import User
@@ -126,13 +126,14 @@ def configure_gallery():
             file_storage=request.files.get("image_file"),
             data_url=request.form.get("image"),
             orig_filename=request.form.get("image_filename"),
+            max_size=MAX_IMAGE_SIZE,
         )
 
         if image_data:
             image_bytes = image_data.bytes
             image_filename = image_data.filename
             image_content_type = image_data.content_type
-            if len(image_bytes) >= MAX_IMAGE_SIZE:
+            if image_data.size >= MAX_IMAGE_SIZE:
                 flash("L'image est trop volumineuse")
                 return redirect(url_for("bw_activation.configure_gallery"))
             caption = request.form.get("caption", "").strip()
@@ -147,7 +148,7 @@ def configure_gallery():
                 # S3 backend (Hetzner Object Storage in prod) — must
                 # match stage_b1's defensive pattern : a transient
                 # network hoquet shouldn't surface as a 500.
-                saved_file_object = image_file_object.save()
+                saved_file_object = save_file_object(image_file_object)
 
                 # Add to business wall gallery
                 bw_image = BWImage(
@@ -38,6 +38,7 @@ StdDict = dict[str, str | int | float | bool | None | list[str]]
 
 if TYPE_CHECKING:
     from app.models.auth import User
+    from app.services.capabilities import Capabilities
 
 PROFILE_CODE_TO_BW2_TYPE: dict[ProfileEnum, BWType] = {
     ProfileEnum.PM_DIR: BWType.MEDIA,
@@ -421,61 +422,76 @@ def find_finalizable_bw_for_user(user: User) -> BusinessWall | None:
     return get_business_wall_for_user(user)
 
 
-def get_user_rights_on_bw(user: User, bw: BusinessWall) -> list[str]:
-    """Return a list of human-readable rights/actions for the user on this BW."""
+MISSION_LABELS = {
+    "press_release": "Publier des communiqués de presse",
+    "events": "Publier des événements",
+    "missions": "Publier des Missions",
+    "projects": "Publier des Projets",
+    "internships": "Publier des offres de stage",
+    "apprenticeships": "Publier des offres d'alternance",
+    "doctoral": "Publier des offres de convention doctorale",
+}
 
-    MISSION_LABELS = {
-        "press_release": "Publier des communiqués de presse",
-        "events": "Publier des événements",
-        "missions": "Publier des Missions",
-        "projects": "Publier des Projets",
-        "internships": "Publier des offres de stage",
-        "apprenticeships": "Publier des offres d'alternance",
-        "doctoral": "Publier des offres de convention doctorale",
-    }
 
-    rights = []
-    seen_roles = set()
-    seen_missions = set()
+def get_user_rights_on_bw(
+    user: User, bw: BusinessWall, capabilities: Capabilities | None = None
+) -> list[str]:
+    """Return a list of human-readable rights/actions for the user on this BW.
+
+    Read from the user's `capabilities` when given (no need to load
+    `bw.role_assignments`), otherwise from the assignments of the BW.
+    """
+    if capabilities is not None:
+        is_owner = bw.id in capabilities.owned_bws
+        role_types = capabilities.bw_role_types(bw.id)
+        missions = capabilities.bw_mission_types(bw.id)
+    else:
+        is_owner = bw.owner_id == user.id
+        role_types, missions = _rights_from_assignments(user, bw)
 
-    # 1. Check if owner
-    if bw.owner_id == user.id:
+    rights = []
+    if is_owner:
         rights.append(f"Propriétaire ({BW_ROLE_TYPE_LABEL['BW_OWNER']})")
-        seen_roles.add(BWRoleType.BW_OWNER.value)
-
-    # 2. Check RoleAssignments
-    if bw.role_assignments:
-        for assignment in bw.role_assignments:
-            if (
-                assignment.user_id == user.id
-                and assignment.invitation_status == InvitationStatus.ACCEPTED.value
-            ):
-                if assignment.role_type not in seen_roles:
-                    role_label = BW_ROLE_TYPE_LABEL.get(
-                        assignment.role_type, assignment.role_type
-                    )
-                    rights.append(f"Rôle : {role_label}")
-                    seen_roles.add(assignment.role_type)
-
-                # Granular permissions for PR Managers
-                if assignment.role_type in (
-                    BWRoleType.BWPRI.value,
-                    BWRoleType.BWPRE.value,
-                ):
-                    for perm in assignment.permissions:
-                        if (
-                            perm.is_granted
-                            and perm.permission_type not in seen_missions
-                        ):
-                            mission_label = MISSION_LABELS.get(
-                                perm.permission_type, perm.permission_type
-                            )
-                            rights.append(f"Mission : {mission_label}")
-                            seen_missions.add(perm.permission_type)
+        role_types.discard(BWRoleType.BW_OWNER.value)
+
+    for role_type in _ordered(role_types, BW_ROLE_TYPE_LABEL):
+        role_label = BW_ROLE_TYPE_LABEL.get(role_type, role_type)
+        rights.append(f"Rôle : {role_label}")
+
+    for mission in _ordered(missions, MISSION_LABELS):
+        mission_label = MISSION_LABELS.get(mission, mission)
+        rights.append(f"Mission : {mission_label}")
 
     return rights
 
 
+def _rights_from_assignments(user: User, bw: BusinessWall) -> tuple[set[str], set[str]]:
+    """Accepted role types and granted PR missions of `user` on `bw`."""
+    role_types: set[str] = set()
+    missions: set[str] = set()
+    for assignment in bw.role_assignments or []:
+        if (
+            assignment.user_id != user.id
+            or assignment.invitation_status != InvitationStatus.ACCEPTED.value
+        ):
+            continue
+        role_types.add(assignment.role_type)
+        # Granular permissions for PR Managers
+        if assignment.role_type in (BWRoleType.BWPRI.value, BWRoleType.BWPRE.value):
+            missions.update(
+                perm.permission_type
+                for perm in assignment.permissions
+                if perm.is_granted
+            )
+    return role_types, missions
+
+
+def _ordered(values: set[str], labels: dict[str, str]) -> list[str]:
+    """`values` in the order of `labels`, then the unknown ones."""
+    known = [value for value in labels if value in values]
+    return known + sorted(values - labels.keys())
+
+
 def get_manageable_business_walls_for_user(user: User) -> list[BusinessWall]:
     """Return all BusinessWalls the user can manage *or publish for*.
 
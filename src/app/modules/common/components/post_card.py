@@ -8,6 +8,7 @@ from typing import cast
 
 import sqlalchemy as sa
 from attr import field, frozen
+from markupsafe import Markup
 
 from app.flask.extensions import db
 from app.flask.lib.pywire import Component, component
@@ -17,7 +18,10 @@ from app.lib.html import remove_markup
 from app.models.auth import User
 from app.models.organisation import Organisation
 from app.modules.wip.models.comroom import Communique
-from app.modules.wire.models import ArticlePost, PressReleasePost
+from app.modules.wire.models import ArticlePost, Post, PressReleasePost
+from app.services.fragments import fragment_cache, version_of
+
+POST_CARD = "post-card"
 
 
 @component
@@ -40,6 +44,30 @@ class PostCard(Component):
                 raise ValueError(msg)
 
 
+def render_post_cards(posts: list[Post]) -> list[Markup]:
+    """``post_card(post)`` for each of the wire ``posts``, through the
+    fragment cache."""
+    return fragment_cache.render_many(
+        POST_CARD,
+        posts,
+        version=post_card_version,
+        render=lambda post: PostCard(post)(),
+    )
+
+
+def post_card_version(post: Post) -> str:
+    # `modified_at` moves on every update of the row (counters
+    # included); the counters also cover bulk UPDATEs, and the paid
+    # consultations are counted elsewhere (see `_annotate_paid_consultations`).
+    return version_of(
+        post.modified_at,
+        post.like_count,
+        post.comment_count,
+        post.view_count,
+        getattr(post, "_paid_consultations_count", None),
+    )
+
+
 @frozen
 class ArticleVM(Wrapper):
     _model: ArticlePost
@@ -99,6 +127,7 @@ class ArticleVM(Wrapper):
                 "ArticlesWipView:image",
                 article_id=post.newsroom_id,
                 image_id=post.image_id,
+                size="card",
             )
         return "/static/img/gray-texture.png"
 
@@ -148,6 +177,7 @@ class PressReleaseVM(Wrapper):
                 "CommuniquesWipView:image",
                 communique_id=post.newsroom_id,
                 image_id=post.image_id,
+                size="card",
             )
         return "/static/img/gray-texture.png"
 
@@ -212,6 +242,7 @@ class CommuniqueVM(Wrapper):
                 "CommuniquesWipView:image",
                 communique_id=post.id,
                 image_id=first_image.id,
+                size="card",
             )
         return "/static/img/gray-texture.png"
 
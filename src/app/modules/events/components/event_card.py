@@ -8,16 +8,20 @@ from typing import cast
 
 from arrow import Arrow
 from attr import define
+from markupsafe import Markup
 
 from app.flask.lib.pywire import Component, component
-from app.flask.lib.view_model import ViewModel
+from app.flask.lib.view_model import ViewModel, unwrap
 from app.models.meta import get_meta_attr
 from app.modules.bw.bw_activation.user_utils import get_organisation_logo_url
 from app.modules.events.components.opening_hours import opening_hours
 from app.modules.events.models import EventPost
+from app.services.fragments import fragment_cache, version_of
 
 DEFAULT_LOGO_URL = "/static/img/transparent-square.png"
 
+EVENT_CARD = "event-card"
+
 
 @define
 class EventCardVM(ViewModel):
@@ -70,3 +74,35 @@ class EventCard(Component):
     def __attrs_post_init__(self) -> None:
         # Wrap event in ViewModel for clean computed property access
         self.event = EventCardVM(self.event)
+
+
+def render_event_cards(events: list[EventPost | ViewModel]) -> list[Markup]:
+    """``event_card(event=event)`` for each of ``events``, through the
+    fragment cache."""
+    # View models proxy `id` to the post they wrap.
+    return fragment_cache.render_many(
+        EVENT_CARD,
+        cast("list[EventPost]", events),
+        version=event_card_version,
+        render=lambda event: EventCard(event=event)(),
+    )
+
+
+def event_card_version(event: EventPost | ViewModel) -> str:
+    # Event posts have no modification timestamp: the version covers
+    # the columns the card displays.
+    post = cast("EventPost", unwrap(event))
+    return version_of(
+        post.type,
+        post.title,
+        post.summary,
+        post.start_datetime,
+        post.end_datetime,
+        post.category,
+        post.sector,
+        post.owner_id,
+        post.publisher_id,
+        post.like_count,
+        post.comment_count,
+        post.view_count,
+    )
@@ -4,13 +4,16 @@
 
 from __future__ import annotations
 
+from arrow import Arrow
 from attr import define
+from markupsafe import Markup
 
 from app.flask.lib.pywire import Component, component
-from app.modules.events.models import EventPost
 
 
 @component
 @define
 class EventList(Component):
-    grouped_events: list[tuple[str, list[EventPost]]]
+    # Day -> the event cards of that day, already rendered (see
+    # `render_event_cards`).
+    grouped_events: list[tuple[Arrow, list[Markup]]]
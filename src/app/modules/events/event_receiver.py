@@ -11,8 +11,10 @@ from sqlalchemy import select
 from app.constants import LOCAL_TZ
 from app.flask.extensions import db
 from app.models.lifecycle import PublicationStatus
+from app.modules.events.components.event_card import EVENT_CARD
 from app.modules.events.models import EventPost
 from app.modules.wip.models.eventroom import Event
+from app.services.fragments import fragment_cache
 from app.signals import (
     event_published,
     event_unpublished,
@@ -48,6 +50,7 @@ def on_unpublish_event(event: Event) -> None:
 
     db.session.add(post)
     db.session.flush()
+    fragment_cache.invalidate(EVENT_CARD, post.id)
 
 
 @event_updated.connect
@@ -64,6 +67,7 @@ def on_update_event(event: Event) -> None:
 
     db.session.add(post)
     db.session.flush()
+    fragment_cache.invalidate(EVENT_CARD, post.id)
 
 
 def event_type_to_category(event_type: str) -> str:
@@ -29,7 +29,7 @@ from app.modules.events.services import (
 from app.modules.events.views._common import EventDetailVM
 from app.modules.kyc.field_label import country_code_to_label, country_zip_code_to_city
 from app.modules.swork.models import Comment
-from app.services.tracking import record_view
+from app.services.tracking import record_view, toggle_like
 
 
 class EventDetailView(MethodView):
@@ -84,22 +84,12 @@ class EventDetailView(MethodView):
 
         Note: Does NOT commit - caller is responsible for committing.
         """
-        from app.services.social_graph import adapt
-
-        social_user = adapt(user)
-        social_content = adapt(event_obj)
-
-        if social_user.is_liking(event_obj):
-            social_user.unlike(event_obj)
+        if toggle_like(user, event_obj):
+            message = f"Vous avez 'liké' l'événement {event_obj.title!r}"
+        else:
             message = (
                 f"Vous avez retiré votre 'like' de l'événement {event_obj.title!r}"
             )
-        else:
-            social_user.like(event_obj)
-            message = f"Vous avez 'liké' l'événement {event_obj.title!r}"
-
-        db.session.flush()
-        event_obj.like_count = social_content.num_likes()
 
         response = make_response(str(event_obj.like_count))
         response.headers["HX-Trigger"] = json.dumps({"showToast": message})
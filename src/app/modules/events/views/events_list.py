@@ -24,6 +24,7 @@ from app.flask.extensions import db, htmx
 from app.flask.sqla import get_multi
 from app.models.lifecycle import PublicationStatus
 from app.modules.events import blueprint
+from app.modules.events.components.event_card import render_event_cards
 from app.modules.events.models import EventPost, participation_table
 
 from ._common import TABS, Calendar, DateFilter, EventListVM
@@ -90,11 +91,11 @@ class EventsListView(MethodView):
 
         events_list = self._get_events(date_filter, filter_bar, search)
 
-        # Group events by day
+        # Group the event cards by day
+        vms = [EventListVM(event) for event in events_list]
         grouper = defaultdict(list)
-        for event in events_list:
-            vm = EventListVM(event)
-            grouper[vm.date].append(vm)
+        for vm, card in zip(vms, render_event_cards(vms), strict=True):
+            grouper[vm.date].append(card)
 
         month = date_filter.month
         active_tab_ids = self._get_active_tab_ids()
@@ -4,9 +4,13 @@
 
 from __future__ import annotations
 
-import functools
+from collections.abc import Mapping
 
-from .ontology_loader import get_ontology_content, zip_code_city_list
+from .ontology_loader import (
+    get_ontology_content,
+    ontology_label_index,
+    zip_code_label_index,
+)
 
 
 def find_label(content: list, val: str) -> str:
@@ -31,29 +35,28 @@ def labels_string(data: str | list, onto_list: list) -> str:
     return ", ".join(labels)
 
 
+def indexed_labels_string(data: str | list, index: Mapping[str, str]) -> str:
+    """`labels_string` with a value -> label index instead of a list."""
+    if isinstance(data, str):
+        data = [data]
+    labels = [index.get(val, val) for val in data]
+    labels = [val for val in labels if val]
+    return ", ".join(labels)
+
+
 def label_from_values_simple(data: str | list, key: str, ontology: str) -> str:
     """The ontology is a list."""
-    onto_list = get_ontology_content(ontology)
-    return labels_string(data, onto_list)
+    return indexed_labels_string(data, ontology_label_index(ontology))
 
 
 def label_from_values_dual_first(data: str | list, key: str, ontology: str) -> str:
     """The ontology is a dict."""
-    onto_dict = get_ontology_content(ontology)
-    assert isinstance(onto_dict, dict)
-    onto_list = onto_dict["field1"]
-    return labels_string(data, onto_list)
+    return indexed_labels_string(data, ontology_label_index(ontology, "field1"))
 
 
 def label_from_values_dual_second(data: str | list, key: str, ontology: str) -> str:
     """The ontology is a dict."""
-    onto_dict = get_ontology_content(ontology)
-    assert isinstance(onto_dict, dict)
-    field2 = onto_dict["field2"]
-    onto_list = []
-    for values in field2.values():
-        onto_list.extend(values)
-    return labels_string(data, onto_list)
+    return indexed_labels_string(data, ontology_label_index(ontology, "field2"))
 
 
 def label_from_values_cities_as_list(data: str | list) -> list[str]:
@@ -68,8 +71,8 @@ def label_from_values_cities_as_list(data: str | list) -> list[str]:
             country_code, _ = value.split(" / ")
         except ValueError:
             continue
-        cities = zip_code_city_list(country_code)
-        results.append(find_label_city(cities, value))
+        cities = zip_code_label_index(country_code)
+        results.append(cities.get(value, value))
     return results
 
 
@@ -79,14 +82,11 @@ def label_from_values_cities(data: str | list, _key: str, _ontology: str) -> str
 
 
 def country_code_to_label(code: str) -> str:
-    onto_list = get_ontology_content("pays")
-    return labels_string(code, onto_list)
+    return indexed_labels_string(code, ontology_label_index("pays"))
 
 
-@functools.cache
 def country_code_to_country_name(code: str) -> str:
-    onto_list = get_ontology_content("pays")
-    return find_label(onto_list, code)
+    return ontology_label_index("pays").get(code, code)
 
 
 def country_zip_code_to_city(code: str) -> str:
@@ -94,11 +94,9 @@ def country_zip_code_to_city(code: str) -> str:
         country_code, _ = code.split(" / ")
     except ValueError:
         return ""
-    cities = zip_code_city_list(country_code)
-    return find_label_city(cities, code)
+    return zip_code_label_index(country_code).get(code, code)
 
 
-@functools.cache
 def taille_orga_code_to_label(code: str | int) -> str:
     onto_list = get_ontology_content("taille_organisation")
     try:
@@ -6,9 +6,14 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
-from cachetools import TTLCache, cached
-
 from app.enums import OrganisationTypeEnum
+from app.services.reference_data import (
+    COUNTRIES,
+    TAXONOMIES,
+    ZIP_CODES,
+    label_index,
+    reference_data,
+)
 from app.services.taxonomies import (
     get_full_taxonomy,
     get_taxonomy,
@@ -149,13 +154,38 @@ def nom_orga_choices() -> list[str]:
     return get_taxonomy("groupes_cotes") + get_organisation_for_noms_orgas()
 
 
-# maxsize must comfortably exceed the number of DISTINCT ontologies in use
-# (ONTOLOGY_MAP + the KYC label map together reference ~40). At 25 the cache
-# thrashed : a member-profile render touches ~19 ontologies, which got evicted
-# by other pages and reloaded on every view (19 redundant tax_taxonomy
-# queries). Taxonomies are small static reference lists, so cache them all.
-@cached(cache=TTLCache(maxsize=256, ttl=3600))
 def get_ontology_content(ontology: str) -> list | dict:
+    """Content of an ontology, loaded once per process (see
+    `app.services.reference_data`)."""
+    return reference_data.get(
+        _dataset(ontology), ontology, lambda: _load_ontology(ontology)
+    )
+
+
+def ontology_label_index(ontology: str, field: str = "") -> dict[str, str]:
+    """Value -> label of a list ontology, or of one field ("field1" or
+    "field2") of a dual select ontology."""
+
+    def build() -> dict[str, str]:
+        content = get_ontology_content(ontology)
+        if isinstance(content, list):
+            return label_index(content)
+        if field == "field1":
+            return label_index(content["field1"])
+        return label_index(
+            (value, label)
+            for values in content["field2"].values()
+            for value, label in values
+        )
+
+    return reference_data.get(_dataset(ontology), f"{ontology}#{field}", build)
+
+
+def _dataset(ontology: str) -> str:
+    return COUNTRIES if ontology == "pays" else TAXONOMIES
+
+
+def _load_ontology(ontology: str) -> list | dict:
     if ontology == "pays":
         return get_full_countries()
     if ontology in ONTOLOGY_DB_LIST:
@@ -178,9 +208,21 @@ def get_choices(field_type: str) -> list | dict:
     return choices_map[field_type]()
 
 
-@cached(cache=TTLCache(maxsize=100, ttl=3600))
 def zip_code_city_list(country_code: str) -> list[dict[str, str]]:
-    return get_zip_code_country(country_code)
+    return reference_data.get(
+        ZIP_CODES, country_code, lambda: get_zip_code_country(country_code)
+    )
+
+
+def zip_code_label_index(country_code: str) -> dict[str, str]:
+    """Value ("FRA / 75001 Paris") -> label of a country's zip codes."""
+    return reference_data.get(
+        ZIP_CODES,
+        f"{country_code}#",
+        lambda: label_index(
+            (item["value"], item["label"]) for item in zip_code_city_list(country_code)
+        ),
+    )
 
 
 # def label_from_value_list(ontology: str, value: str) -> str:
@@ -2,21 +2,42 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-only
 
+"""The KYC survey: profiles, fields and communities.
+
+The survey is defined by an Excel workbook (`MODEL_FILENAME`). Parsing
+it takes ~0.5 s, so the parsed model is compiled to a JSON file next to
+it (`COMPILED_FILENAME`), stamped with the SHA-256 of the workbook.
+The model is loaded on first use, from the compiled file when its stamp
+matches the workbook, otherwise from the workbook (with a warning: the
+package files are never written at runtime).
+
+After editing the workbook, run ``flask data compile-kyc-survey`` and
+commit the compiled file.
+"""
+
 from __future__ import annotations
 
+import hashlib
+import json
 from functools import cache
 from importlib import resources as rso
+from pathlib import Path
 from typing import Any
 
+import attr
+from loguru import logger
+
+from app.enums import CommunityEnum, ContactTypeEnum, ProfileEnum
+
 from . import kyc_models
-from .survey_dataclass import SurveyField, SurveyProfile
-from .xls_parser import XLSParser
+from .survey_dataclass import Group, SurveyCommunities, SurveyField, SurveyProfile
 
 MODEL_FILENAME = "MVP-2-KYC-Commons-45.xlsx"
+COMPILED_FILENAME = "MVP-2-KYC-Commons-45.json"
 
 
 def load_survey_model() -> dict[str, Any]:
-    """Content of the XLS survey.
+    """Content of the XLS survey, parsed from the workbook.
 
     Format:
     {
@@ -25,19 +46,105 @@ def load_survey_model() -> dict[str, Any]:
         "profiles": self.profiles,
     }
     """
+    from .xls_parser import XLSParser
+
     parser = XLSParser()
     xls_file = rso.files(kyc_models) / MODEL_FILENAME
     parser.parse(xls_file)
     return parser.model
 
 
+@cache
 def get_survey_model() -> dict[str, Any]:
-    return survey
+    """The survey (same format as `load_survey_model`), loaded once."""
+    source_hash = _source_hash()
+    compiled = _read_compiled()
+    if compiled is not None and compiled.get("source_sha256") == source_hash:
+        return survey_model_from_dict(compiled["model"])
+
+    logger.warning(
+        f"The compiled KYC survey ({COMPILED_FILENAME}) is stale or missing: "
+        "parsing the workbook. Run `flask data compile-kyc-survey`."
+    )
+    return load_survey_model()
+
+
+def compile_survey_model() -> Path:
+    """Parse the workbook and (re)write the compiled survey."""
+    return write_compiled_survey_model(load_survey_model(), _source_hash())
+
+
+def write_compiled_survey_model(model: dict[str, Any], source_hash: str) -> Path:
+    path = _compiled_path()
+    data = {"source_sha256": source_hash, "model": survey_model_to_dict(model)}
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=1) + "\n")
+    return path
+
+
+def survey_model_to_dict(model: dict[str, Any]) -> dict[str, Any]:
+    """JSON-compatible form of the survey. Communities are derived from
+    the profiles, so they are not stored."""
+    return {
+        "survey_fields": [attr.asdict(f) for f in model["survey_fields"].values()],
+        "profiles": [
+            {
+                "id": profile.id,
+                "description": profile.description,
+                "code": _enum_name(profile.code),
+                "community": _enum_name(profile.community),
+                "contact_type": _enum_name(profile.contact_type),
+                "groups": [
+                    {
+                        "label": group.label,
+                        "survey_fields": [
+                            [field.id, code] for field, code in group.survey_fields
+                        ],
+                    }
+                    for group in profile.groups
+                ],
+            }
+            for profile in model["profiles"]
+        ],
+    }
+
+
+def survey_model_from_dict(data: dict[str, Any]) -> dict[str, Any]:
+    """Inverse of `survey_model_to_dict`."""
+    survey_fields = {f["id"]: SurveyField(**f) for f in data["survey_fields"]}
+    profiles = []
+    communities = SurveyCommunities()
+    for p in data["profiles"]:
+        profile = SurveyProfile(
+            id=p["id"],
+            description=p["description"],
+            code=ProfileEnum[p["code"]] if p["code"] else "",
+            community=CommunityEnum[p["community"]] if p["community"] else "",
+            contact_type=(
+                ContactTypeEnum[p["contact_type"]] if p["contact_type"] else ""
+            ),
+            groups=[
+                Group(
+                    label=g["label"],
+                    survey_fields=[
+                        (survey_fields[field_id], code)
+                        for field_id, code in g["survey_fields"]
+                    ],
+                )
+                for g in p["groups"]
+            ],
+        )
+        profiles.append(profile)
+        communities.add_profile(profile)
+    return {
+        "communities": communities,
+        "survey_fields": survey_fields,
+        "profiles": profiles,
+    }
 
 
 @cache
 def get_survey_profile(profile_id: str) -> SurveyProfile:
-    for profile in survey["profiles"]:
+    for profile in get_survey_model()["profiles"]:
         if profile.id == profile_id:
             return profile
     msg = f"Unknown profile: {profile_id}"
@@ -46,12 +153,29 @@ def get_survey_profile(profile_id: str) -> SurveyProfile:
 
 @cache
 def get_survey_profile_ids() -> list[str]:
-    return [p.id for p in survey["profiles"]]
+    return [p.id for p in get_survey_model()["profiles"]]
 
 
 @cache
 def get_survey_fields() -> list[SurveyField]:
-    return list(survey["survey_fields"].values())
+    return list(get_survey_model()["survey_fields"].values())
+
+
+def _enum_name(value) -> str:
+    return value.name if value else ""
+
+
+def _source_hash() -> str:
+    source = rso.files(kyc_models) / MODEL_FILENAME
+    return hashlib.sha256(source.read_bytes()).hexdigest()
+
+
+def _compiled_path() -> Path:
+    return Path(kyc_models.__file__).parent / COMPILED_FILENAME
 
 
-survey = load_survey_model()
+def _read_compiled() -> dict[str, Any] | None:
+    try:
+        return json.loads(_compiled_path().read_text())
+    except (OSError, ValueError):
+        return None
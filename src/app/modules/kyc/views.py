@@ -43,7 +43,12 @@ from app.constants import (
 )
 from app.enums import CommunityEnum
 from app.flask.extensions import db
-from app.lib.file_object_utils import create_file_object, deserialize_file_object
+from app.lib.file_object_utils import (
+    create_file_object,
+    deserialize_file_object,
+    save_file_object,
+    save_stream,
+)
 from app.models.auth import (
     KYCProfile,
     Role,
@@ -227,7 +232,7 @@ def _process_photo_field(field: Field, form_raw_results: dict, key: str) -> str:
                 original_filename=filename,
                 content_type=content_type,
             )
-            file_object.save()
+            save_file_object(file_object)
             form_raw_results[key] = file_object.to_dict()
             return f"fichier {filename!r}"
         except Exception as e:
@@ -236,13 +241,11 @@ def _process_photo_field(field: Field, form_raw_results: dict, key: str) -> str:
 
     # Standard FileStorage upload
     if field.data and isinstance(field.data, FileStorage) and field.data.filename:
-        file_content = field.data.read()
-        file_object = create_file_object(
-            content=file_content,
+        file_object = save_stream(
+            field.data.stream,
             original_filename=field.data.filename,
             content_type=field.data.content_type,
         )
-        file_object.save()
         form_raw_results[key] = file_object.to_dict()
         return f"fichier {field.data.filename!r}"
 
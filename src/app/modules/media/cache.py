@@ -0,0 +1,137 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Local read-through disk cache for content-addressed media.
+
+Blobs behind `/media/<sha256>.<ext>` never change, so a copy on local
+disk never goes stale: the only question is how much room it takes.
+`MediaCache` keeps at most ``max_bytes`` of them and, when over,
+evicts the least recently served (a hit bumps the file's mtime).
+
+Writes go to a temporary file in the cache directory and are renamed
+into place, so a concurrent reader (another thread or worker process
+sharing the directory) sees either nothing or the whole blob.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from flask import Flask
+
+# Evict down to this fraction of the cap, so a full cache does not
+# rescan the directory on every miss.
+_LOW_WATER = 0.9
+
+_TMP_PREFIX = ".tmp-"
+
+
+class MediaCache:
+    """Bounded LRU of blobs on local disk, keyed by storage name."""
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # Running estimate of the directory size, resynced on eviction
+        # (other processes may share the directory).
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Path | None:
+        """Path of the cached blob, or None on a miss."""
+        path = self.directory / name
+        try:
+            # Bump mtime: eviction order is least recently served.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, name: str, content: bytes) -> Path:
+        """Store ``content`` atomically under ``name``; return its path."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=_TMP_PREFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(content)
+            path = self.directory / name
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(content)
+            if self._size > self.max_bytes:
+                self._evict()
+        return path
+
+    def fetch(self, name: str, load: Callable[[], bytes]) -> Path:
+        """Cached path of ``name``, calling ``load()`` on a miss."""
+        path = self.get(name)
+        if path is not None:
+            return path
+        return self.put(name, load())
+
+    def _entries(self) -> list[os.DirEntry]:
+        try:
+            with os.scandir(self.directory) as it:
+                return [
+                    entry
+                    for entry in it
+                    if entry.is_file() and not entry.name.startswith(_TMP_PREFIX)
+                ]
+        except FileNotFoundError:
+            return []
+
+    def _scan_size(self) -> int:
+        return sum(_stat_size(entry) for entry in self._entries())
+
+    def _evict(self) -> None:
+        """Drop the least recently served blobs down to the low-water mark."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        target = int(self.max_bytes * _LOW_WATER)
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            Path(path).unlink(missing_ok=True)
+            size -= entry_size
+        self._size = size
+
+
+def get_media_cache(app: Flask) -> MediaCache:
+    """The app's media cache, configured by `MEDIA_CACHE_DIR` and
+    `MEDIA_CACHE_MAX_BYTES`."""
+    directory = Path(
+        app.config.get("MEDIA_CACHE_DIR") or Path(app.instance_path) / "media-cache"
+    )
+    max_bytes = int(app.config.get("MEDIA_CACHE_MAX_BYTES", 1024**3))
+    cache = app.extensions.get("media.cache")
+    if cache is None or cache.directory != directory or cache.max_bytes != max_bytes:
+        cache = MediaCache(directory, max_bytes)
+        app.extensions["media.cache"] = cache
+    return cache
+
+
+def _stat_size(entry: os.DirEntry) -> int:
+    try:
+        return entry.stat().st_size
+    except FileNotFoundError:
+        return 0
@@ -4,47 +4,152 @@
 
 from __future__ import annotations
 
+import io
 import mimetypes
-import re
-from io import BytesIO
+from collections.abc import Callable
+from pathlib import Path
 
+from advanced_alchemy.types import FileObject
 from advanced_alchemy.types.file_object import storages
-from flask import send_file
+from flask import current_app, request, send_file
+from PIL import Image
+from svcs.flask import container
 from werkzeug.exceptions import NotFound
 from werkzeug.wrappers import Response
 
-from . import blueprint
+from app.lib.file_object_utils import STORAGE_NAME_RE, VARIANT_FORMATS, VARIANT_SIZES
+from app.logging import warn
+from app.services.images import ImageService
 
-# Storage names produced by create_file_object() — 64 hex chars (sha256)
-# plus optional extension. Validated here to keep the endpoint from ever
-# forwarding arbitrary paths to the storage backend.
-_STORAGE_NAME_RE = re.compile(r"^[0-9a-f]{64}(?:\.[A-Za-z0-9]{1,10})?$")
+from . import blueprint
+from .cache import get_media_cache
 
 # One year; the content at a given hash is immutable by construction.
 _MAX_AGE = 31_536_000
 
 
+# Storage names are validated against STORAGE_NAME_RE to keep these
+# endpoints from ever forwarding arbitrary paths to the storage backend.
+
+
 @blueprint.route("/<string:storage_name>")
 def serve(storage_name: str) -> Response:
-    if not _STORAGE_NAME_RE.match(storage_name):
+    if not STORAGE_NAME_RE.match(storage_name):
         raise NotFound
 
+    sha256 = storage_name.split(".", 1)[0]
+
+    # The browser already holds these bytes: answer before touching the
+    # disk cache or the storage backend.
+    if request.if_none_match.contains(sha256):
+        return _not_modified(sha256)
+
     backend = storages.get_backend("s3")
+
+    def load() -> bytes:
+        return backend.get_content(storage_name)
+
     try:
-        content = backend.get_content(storage_name)
+        path = get_media_cache(current_app).fetch(storage_name, load)
     except (FileNotFoundError, OSError) as err:
         raise NotFound from err
 
-    mimetype, _ = mimetypes.guess_type(storage_name)
+    return _send(path, storage_name, etag=sha256, load=load)
+
+
+@blueprint.route("/<string:storage_name>/<int:width>x<int:height>.<string:fmt>")
+def serve_variant(storage_name: str, width: int, height: int, fmt: str) -> Response:
+    """A resized copy of image ``storage_name``, fitting in width x height.
+
+    Rendered once per (image, size, format): the result is stored on the
+    backend as ``<sha256>-<width>x<height>.<fmt>``, next to the original,
+    and then served like any other blob (disk cache, ETag, Range).
+    """
+    if (
+        not STORAGE_NAME_RE.match(storage_name)
+        or (width, height) not in VARIANT_SIZES.values()
+        or fmt not in VARIANT_FORMATS
+    ):
+        raise NotFound
+
     sha256 = storage_name.split(".", 1)[0]
-    response = send_file(
-        BytesIO(content),
-        mimetype=mimetype or "application/octet-stream",
-        download_name=storage_name,
-        etag=sha256,
-        max_age=_MAX_AGE,
-        conditional=True,
-    )
+    variant_name = f"{sha256}-{width}x{height}.{fmt}"
+    if request.if_none_match.contains(variant_name):
+        return _not_modified(variant_name)
+
+    backend = storages.get_backend("s3")
+    cache = get_media_cache(current_app)
+
+    def load() -> bytes:
+        try:
+            return backend.get_content(variant_name)
+        except FileNotFoundError:
+            pass
+        original = cache.fetch(storage_name, lambda: backend.get_content(storage_name))
+        content = container.get(ImageService).make_variant(
+            original.read_bytes(), (width, height), VARIANT_FORMATS[fmt]
+        )
+        mimetype, _ = mimetypes.guess_type(variant_name)
+        try:
+            FileObject(
+                backend="s3",
+                filename=variant_name,
+                content_type=mimetype,
+                content=content,
+            ).save()
+        except OSError as e:
+            # Still served from the local cache; rendered again elsewhere.
+            warn(f"Could not store media variant {variant_name}: {e}")
+        return content
+
+    try:
+        path = cache.fetch(variant_name, load)
+    except (FileNotFoundError, OSError, Image.DecompressionBombError) as err:
+        # Includes PIL.UnidentifiedImageError (an OSError): not an image.
+        raise NotFound from err
+
+    return _send(path, variant_name, etag=variant_name, load=load)
+
+
+def _send(path: Path, name: str, *, etag: str, load: Callable[[], bytes]) -> Response:
+    mimetype, _ = mimetypes.guess_type(name)
+    # Sending a path (not a buffer) lets the WSGI server use its file
+    # wrapper (sendfile), and lets `conditional` answer Range requests
+    # with a 206 of just the requested bytes.
+    try:
+        response = send_file(
+            path,
+            mimetype=mimetype or "application/octet-stream",
+            download_name=name,
+            etag=etag,
+            max_age=_MAX_AGE,
+            conditional=True,
+        )
+    except FileNotFoundError:
+        # Evicted by another request since `fetch`: serve the bytes from
+        # the backend instead (Range still works on a BytesIO).
+        try:
+            content = load()
+        except (FileNotFoundError, OSError) as err:
+            raise NotFound from err
+        response = send_file(
+            io.BytesIO(content),
+            mimetype=mimetype or "application/octet-stream",
+            download_name=name,
+            etag=etag,
+            max_age=_MAX_AGE,
+            conditional=True,
+        )
+    return _set_cache_control(response)
+
+
+def _not_modified(etag: str) -> Response:
+    response = Response(status=304)
+    response.set_etag(etag)
+    return _set_cache_control(response)
+
+
+def _set_cache_control(response: Response) -> Response:
     # Override send_file's default `public` with `private` (content is
     # session-gated) and add `immutable` (URL is content-addressed, bytes
     # never change). Flask-Security's global hook still flips `private`
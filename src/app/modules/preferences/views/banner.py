@@ -15,7 +15,7 @@ from werkzeug.utils import redirect
 
 from app.flask.extensions import db
 from app.flask.routing import url_for
-from app.lib.file_object_utils import create_file_object
+from app.lib.file_object_utils import create_file_object, save_file_object
 from app.models.auth import User
 from app.modules.preferences import blueprint
 from app.settings.constants import MAX_IMAGE_SIZE
@@ -47,14 +47,14 @@ class BannerView(MethodView):
 
         uploaded_image = request.files.get("image")
         if uploaded_image and uploaded_image.filename:
-            content = request.files["image"].read()
+            content = uploaded_image.read(MAX_IMAGE_SIZE)
             if len(content) < MAX_IMAGE_SIZE:
                 image_file_object = create_file_object(
                     content=content,
                     original_filename=uploaded_image.filename,
                     content_type=uploaded_image.content_type,
                 )
-                image_file_object.save()
+                save_file_object(image_file_object)
                 user.cover_image = image_file_object
             else:
                 flash("L'image est trop volumineuse")
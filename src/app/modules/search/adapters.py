@@ -7,7 +7,10 @@ Three singledispatch surfaces:
   ``type:pk`` prefix in the composite id and as the filter value at
   query time.
 
-* ``to_doc(obj)`` — produce the dict that ``SearchEngine.upsert`` expects.
+* ``to_doc(obj, tags=None)`` — produce the dict that
+  ``SearchEngine.upsert`` expects. ``tags`` takes the object's tag
+  applications when the caller already has them; ``to_docs`` uses it
+  to load the tags of a whole batch in one query.
 
 * ``is_public(obj)`` — decide whether an object should currently be in
   the index. The receiver in ``search/receivers.py`` calls this on
@@ -22,6 +25,7 @@ public status flips.
 
 from __future__ import annotations
 
+import hashlib
 from collections.abc import Callable, Iterable
 from datetime import UTC, datetime
 from functools import singledispatch
@@ -34,9 +38,10 @@ from app.models.organisation import Organisation
 from app.modules.biz.models import MarketplaceContent
 from app.modules.events.models import EventPost
 from app.modules.wire.models import ArticlePost, PressReleasePost
-from app.services.tagging import get_tags
+from app.services.tagging import get_tags, get_tags_for
 
-TagLoader = Callable[[Any], Iterable[dict[str, Any]]]
+Tags = Iterable[dict[str, Any]]
+TagLoader = Callable[[Any], Tags]
 
 
 @singledispatch
@@ -47,8 +52,13 @@ def doc_type(obj: Any) -> str:
 
 
 @singledispatch
-def to_doc(obj: Any) -> dict[str, Any]:
-    """Return the wesh document for ``obj``. Raises for unknown types."""
+def to_doc(obj: Any, *, tags: Tags | None = None) -> dict[str, Any]:
+    """Return the wesh document for ``obj``. Raises for unknown types.
+
+    ``tags`` are the object's tag applications, as returned by
+    :func:`app.services.tagging.get_tags`. When omitted they are loaded
+    from the DB, one query per call.
+    """
     msg = f"No to_doc adapter registered for {type(obj).__name__}"
     raise TypeError(msg)
 
@@ -71,6 +81,27 @@ def doc_id(obj: Any) -> str:
     return f"{doc_type(obj)}:{obj.id}"
 
 
+def version(obj: Any, tags: Tags = ()) -> str:
+    """The row version stored on the doc as ``modified``: ``modified_at``
+    (``created_at`` for rows never edited), ISO-formatted, followed by a
+    digest of the tag labels when there are any. Tagging doesn't touch
+    the row, so without the digest a tag-only change would never show
+    up. The hourly reconciliation re-indexes a row when its version
+    differs from the index's; it passes the tags ``to_docs`` would use.
+    """
+    return _version(obj, _format_tags(tags))
+
+
+def to_docs(objs: Iterable[Any]) -> list[dict[str, Any]]:
+    """``to_doc`` over a batch, with the tags of every object fetched
+    in a single query. Bulk indexing paths call this once per chunk of
+    rows instead of paying a tag query per row.
+    """
+    objs = list(objs)
+    tags_by_id = get_tags_for(objs)
+    return [to_doc(obj, tags=tags_by_id.get(obj.id, [])) for obj in objs]
+
+
 # ── Common helpers ──────────────────────────────────────────────────
 
 
@@ -85,6 +116,17 @@ def _to_datetime(value: Any) -> datetime | None:
     return value
 
 
+def _version(obj: Any, tag_labels: str) -> str:
+    value = _to_datetime(
+        getattr(obj, "modified_at", None) or getattr(obj, "created_at", None)
+    )
+    stamp = value.isoformat() if value is not None else ""
+    if not tag_labels:
+        return stamp
+    digest = hashlib.blake2b(tag_labels.encode(), digest_size=6).hexdigest()
+    return f"{stamp}#{digest}"
+
+
 def _format_tags(applications: Iterable[dict[str, Any]]) -> str:
     """Pure: render the comma-separated label list for the
     ``KEYWORD(commas=True)`` field. Empty / missing labels are skipped."""
@@ -117,7 +159,7 @@ def _is_publicly_visible(obj: Any, expiry_attr: str) -> bool:
     return expiry is None or expiry > datetime.now(tz=UTC)
 
 
-def _build_doc(obj: Any) -> dict[str, Any]:
+def _build_doc(obj: Any, tags: Tags | None = None) -> dict[str, Any]:
     """Shared shape for every indexable document. ``description`` is
     used where ``summary`` isn't a model attribute (marketplace).
     """
@@ -125,6 +167,7 @@ def _build_doc(obj: Any) -> dict[str, Any]:
     content = getattr(obj, "content", "") or ""
     summary = getattr(obj, "summary", None) or getattr(obj, "description", "") or ""
     type_name = doc_type(obj)
+    tag_labels = _tags(obj) if tags is None else _format_tags(tags)
     return {
         "type": type_name,
         "id": f"{type_name}:{obj.id}",
@@ -133,7 +176,8 @@ def _build_doc(obj: Any) -> dict[str, Any]:
         "summary": summary,
         "url": url_for(obj),
         "timestamp": _to_datetime(getattr(obj, "published_at", None)),
-        "tags": _tags(obj),
+        "tags": tag_labels,
+        "modified": _version(obj, tag_labels),
     }
 
 
@@ -146,8 +190,8 @@ def _(_: ArticlePost) -> str:
 
 
 @to_doc.register
-def _(obj: ArticlePost) -> dict[str, Any]:
-    return _build_doc(obj)
+def _(obj: ArticlePost, *, tags: Tags | None = None) -> dict[str, Any]:
+    return _build_doc(obj, tags)
 
 
 @is_public.register
@@ -164,8 +208,8 @@ def _(_: PressReleasePost) -> str:
 
 
 @to_doc.register
-def _(obj: PressReleasePost) -> dict[str, Any]:
-    return _build_doc(obj)
+def _(obj: PressReleasePost, *, tags: Tags | None = None) -> dict[str, Any]:
+    return _build_doc(obj, tags)
 
 
 @is_public.register
@@ -182,8 +226,8 @@ def _(_: EventPost) -> str:
 
 
 @to_doc.register
-def _(obj: EventPost) -> dict[str, Any]:
-    return _build_doc(obj)
+def _(obj: EventPost, *, tags: Tags | None = None) -> dict[str, Any]:
+    return _build_doc(obj, tags)
 
 
 @is_public.register
@@ -210,8 +254,8 @@ def _(obj: MarketplaceContent) -> str:
 
 
 @to_doc.register
-def _(obj: MarketplaceContent) -> dict[str, Any]:
-    return _build_doc(obj)
+def _(obj: MarketplaceContent, *, tags: Tags | None = None) -> dict[str, Any]:
+    return _build_doc(obj, tags)
 
 
 @is_public.register
@@ -237,7 +281,7 @@ def _(_: User) -> str:
 
 
 @to_doc.register
-def _(obj: User) -> dict[str, Any]:
+def _(obj: User, *, tags: Tags | None = None) -> dict[str, Any]:
     # See note on the Group adapter — ``str()`` coercion to satisfy
     # pyrefly's view of SQLAlchemy descriptor typing.
     first_name = str(obj.first_name or "")
@@ -263,6 +307,7 @@ def _(obj: User) -> dict[str, Any]:
             getattr(obj, "validated_at", None) or getattr(obj, "created_at", None)
         ),
         "tags": "",
+        "modified": version(obj),
     }
 
 
@@ -284,7 +329,7 @@ def _(_: Organisation) -> str:
 
 
 @to_doc.register
-def _(obj: Organisation) -> dict[str, Any]:
+def _(obj: Organisation, *, tags: Tags | None = None) -> dict[str, Any]:
     # See note on the Group adapter — ``str()`` coercion to satisfy
     # pyrefly's view of SQLAlchemy descriptor typing.
     name = str(obj.name or "")
@@ -298,6 +343,7 @@ def _(obj: Organisation) -> dict[str, Any]:
         "url": url_for(obj),
         "timestamp": _to_datetime(getattr(obj, "created_at", None)),
         "tags": "",
+        "modified": version(obj),
     }
 
 
@@ -1,11 +1,18 @@
 """``flask search …`` CLI for operating the wesh-backed search index.
 
-Three subcommands:
+Four subcommands:
 
 * ``rebuild`` — drop every indexed document, then re-walk the database
   and re-index every post for which ``is_public`` is True. Use after a
   schema change, when content drifted from the index, or to bootstrap
-  a fresh environment.
+  a fresh environment. With ``--shadow`` the live index is left alone
+  while a blue/green twin is built (optionally across ``--workers``
+  processes, resumable with ``--resume``) and swapped in at the end.
+
+* ``reconcile`` — diff the index against the database and fix only
+  what drifted: re-index rows whose ``modified_at`` or tags differ
+  from the stored version, drop docs whose row is gone or no longer public.
+  The live index stays complete throughout. Run hourly by the cron.
 
 * ``status`` — print the document count per indexed type. Useful to
   confirm the rebuild worked.
@@ -16,6 +23,9 @@ Three subcommands:
 
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import click
@@ -34,16 +44,22 @@ from rich.progress import (
 from sqlalchemy import func, select
 
 from app.flask.extensions import db
+from app.services.tagging import get_tags_for
 
-from .adapters import is_public, to_doc
+from .adapters import doc_id, is_public, to_docs, version
 from .engine import SearchEngine
-from .registry import REGISTRY
+from .registry import REGISTRY, lookup_by_source_type
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
     from .registry import IndexableType
 
+# ``--shadow`` rebuilds: rows per chunk, and the name of the checkpoint
+# document saved next to the index.
+_DEFAULT_CHUNK_SIZE = 2000
+_CHECKPOINT = "rebuild"
+
 
 @group(short_help="Manage the wesh-backed search index")
 def search() -> None:
@@ -57,9 +73,43 @@ def search() -> None:
     default=False,
     help="Suppress the progress bar (useful for cron / scripts).",
 )
+@click.option(
+    "--shadow",
+    is_flag=True,
+    default=False,
+    help="Build into a shadow index and swap it in when done (no downtime).",
+)
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Processes building documents in parallel (implies --shadow if > 1).",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Continue an interrupted --shadow rebuild (implies --shadow).",
+)
+@click.option(
+    "--chunk-size",
+    default=_DEFAULT_CHUNK_SIZE,
+    type=click.IntRange(min=1),
+    help="Rows handled per task in --shadow mode.",
+)
 @with_appcontext
-def rebuild(quiet: bool) -> None:
-    counts = rebuild_index(show_progress=not quiet)
+def rebuild(
+    quiet: bool, shadow: bool, workers: int, resume: bool, chunk_size: int
+) -> None:
+    if shadow or resume or workers > 1:
+        counts = rebuild_index_shadow(
+            show_progress=not quiet,
+            workers=workers,
+            resume=resume,
+            chunk_size=chunk_size,
+        )
+    else:
+        counts = rebuild_index(show_progress=not quiet)
     total = sum(counts.values())
     for type_name, count in counts.items():
         print(f"  [cyan]{type_name}[/cyan]: {count}")
@@ -92,6 +142,274 @@ def rebuild_index(*, show_progress: bool = True) -> dict[str, int]:
     return counts
 
 
+@search.command(short_help="Re-index only what drifted from the database")
+@with_appcontext
+def reconcile() -> None:
+    stats = reconcile_index()
+    for type_name, counts in stats.items():
+        print(
+            f"  [cyan]{type_name}[/cyan]: {counts.upserted} upserted, "
+            f"{counts.deleted} deleted"
+        )
+
+
+@dataclass
+class ReconcileStats:
+    """Writes done by :func:`reconcile_index` for one source type."""
+
+    upserted: int = 0
+    deleted: int = 0
+
+
+def reconcile_index() -> dict[str, ReconcileStats]:
+    """Bring the live index in line with the database, in place.
+
+    Compares ``(doc id, version)`` pairs: the versions stored in the
+    index (read in one pass) against ``adapters.version`` of every row,
+    with the tags of each batch of rows loaded in one query.
+    Public rows that are missing or stale are re-indexed, docs whose row
+    is no longer public are deleted, and so are docs left without a row
+    (deleted rows, retired types). Unlike :func:`rebuild_index`, the
+    index is never cleared, and the writer only sees the changes: an
+    index already in sync costs a database walk and no commit.
+
+    The index is read before the database, so a doc indexed by a live
+    update while we walk is never mistaken for an orphan.
+    """
+    engine = svcs.flask.container.get(SearchEngine)
+    indexed = engine.doc_versions()
+
+    stats: dict[str, ReconcileStats] = {}
+    for entry in REGISTRY:
+        upserts: list[dict] = []
+        deletes: list[str] = []
+        stmt = select(entry.model).execution_options(yield_per=500)
+        for rows in db.session.scalars(stmt).partitions():
+            tags_by_id = get_tags_for(rows)
+            stale = []
+            for obj in rows:
+                stored = indexed.pop(doc_id(obj), None)
+                if not is_public(obj):
+                    if stored is not None:
+                        deletes.append(doc_id(obj))
+                elif stored != version(obj, tags_by_id.get(obj.id, [])):
+                    stale.append(obj)
+            upserts.extend(to_docs(stale))
+        if upserts or deletes:
+            engine.bulk_apply(upserts, deletes)
+        stats[entry.source_type] = ReconcileStats(len(upserts), len(deletes))
+
+    # Whatever was not claimed by a row has no row any more.
+    if indexed:
+        engine.bulk_apply([], indexed)
+        for orphan_id in indexed:
+            source_type = _source_type_of(orphan_id)
+            stats.setdefault(source_type, ReconcileStats()).deleted += 1
+    return stats
+
+
+def _source_type_of(orphan_id: str) -> str:
+    type_name = orphan_id.partition(":")[0]
+    for entry in REGISTRY:
+        if type_name in entry.doc_types:
+            return entry.source_type
+    return type_name
+
+
+# ── Blue/green rebuild ─────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class _Chunk:
+    """A half-open primary-key range ``[start, stop)`` of one type. The
+    last chunk of a type has no ``stop``, so rows inserted after the
+    plan was made are still picked up.
+    """
+
+    source_type: str
+    start: int
+    stop: int | None
+
+    @property
+    def key(self) -> str:
+        return f"{self.source_type}:{self.start}-{self.stop or ''}"
+
+
+def rebuild_index_shadow(
+    *,
+    show_progress: bool = True,
+    workers: int = 1,
+    resume: bool = False,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> dict[str, int]:
+    """Rebuild into the shadow blue/green slot, then promote it.
+
+    The live index keeps serving queries until the final swap. Each
+    type is split into primary-key ranges of ``chunk_size`` rows; the
+    plan is stored in the checkpoint so a resumed run walks the very
+    same ranges. Documents
+    are built by ``workers`` processes (in-process when 1) and written
+    by this process, one writer commit per chunk. After each commit the
+    chunk is recorded in a checkpoint stored next to the index, so
+    ``resume=True`` picks up where an interrupted run stopped.
+
+    Content changed while the rebuild runs is indexed into the live
+    index only; rows already scanned won't carry those edits into the
+    shadow. The hourly safety net picks them up.
+
+    Returns the count indexed per source type (including chunks done
+    by a previous, interrupted run).
+    """
+    engine = svcs.flask.container.get(SearchEngine)
+    checkpoint = engine.load_checkpoint(_CHECKPOINT) if resume else None
+    if checkpoint is None:
+        checkpoint = _start_shadow_rebuild(engine, chunk_size)
+    elif show_progress:
+        print(
+            f"[yellow]Resuming into {checkpoint['target']} "
+            f"({len(checkpoint['done'])} chunk(s) done)[/yellow]"
+        )
+
+    shadow = engine.sibling(checkpoint["target"])
+    counts: dict[str, int] = checkpoint["counts"]
+    done = set(checkpoint["done"])
+    chunks = [
+        chunk
+        for chunk in (_Chunk(*fields) for fields in checkpoint["chunks"])
+        if chunk.key not in done
+    ]
+
+    progress = _chunk_progress_bar() if show_progress else None
+    task_id = None
+    if progress is not None:
+        progress.start()
+        task_id = progress.add_task("", total=len(chunks), type_name="chunks")
+    try:
+        for chunk, docs in _build_chunks(chunks, workers=workers):
+            shadow.bulk_upsert(docs)
+            counts[chunk.source_type] = counts.get(chunk.source_type, 0) + len(docs)
+            checkpoint["done"].append(chunk.key)
+            engine.save_checkpoint(_CHECKPOINT, checkpoint)
+            if progress is not None and task_id is not None:
+                progress.advance(task_id)
+    finally:
+        if progress is not None:
+            progress.stop()
+
+    engine.promote(checkpoint["target"])
+    engine.drop_checkpoint(_CHECKPOINT)
+    return {entry.source_type: counts.get(entry.source_type, 0) for entry in REGISTRY}
+
+
+def _start_shadow_rebuild(engine: SearchEngine, chunk_size: int) -> dict:
+    """Empty the shadow slot and record a fresh checkpoint for it.
+
+    Also clears the pre-blue/green index (the bare ``indexname``) once
+    it is no longer live: it was retired by a previous promotion and
+    nothing reads from it any more.
+    """
+    target = engine.shadow_indexname()
+    engine.sibling(target).reset()
+    legacy = engine.indexname
+    if engine.active_indexname() != legacy and engine.has_index(legacy):
+        engine.sibling(legacy).reset()
+    checkpoint = {
+        "target": target,
+        "chunk_size": chunk_size,
+        "chunks": [
+            [chunk.source_type, chunk.start, chunk.stop]
+            for chunk in _plan_chunks(chunk_size)
+        ],
+        "done": [],
+        "counts": {},
+    }
+    engine.save_checkpoint(_CHECKPOINT, checkpoint)
+    return checkpoint
+
+
+def _plan_chunks(chunk_size: int) -> list[_Chunk]:
+    """Split every registered type into ranges of ``chunk_size`` rows.
+
+    Boundaries come from the data, not from the id space: ids are
+    Snowflake ids (a millisecond timestamp shifted left), so fixed-width
+    ranges over ``[min(id), max(id)]`` would be astronomically many and
+    almost all empty. Every ``chunk_size``-th id, in id order, starts a
+    chunk; the database numbers the rows, only the boundaries come back.
+    """
+    chunks: list[_Chunk] = []
+    for entry in REGISTRY:
+        numbered = select(
+            entry.model.id.label("id"),
+            func.row_number().over(order_by=entry.model.id).label("rn"),
+        ).subquery()
+        starts = list(
+            db.session.scalars(
+                select(numbered.c.id)
+                .where((numbered.c.rn - 1) % chunk_size == 0)
+                .order_by(numbered.c.id)
+            )
+        )
+        if not starts:
+            continue
+        stops: list[int | None] = [*starts[1:], None]
+        chunks.extend(
+            _Chunk(entry.source_type, start, stop)
+            for start, stop in zip(starts, stops, strict=True)
+        )
+    return chunks
+
+
+def _build_chunks(
+    chunks: list[_Chunk], *, workers: int
+) -> Iterator[tuple[_Chunk, list[dict]]]:
+    """Yield ``(chunk, docs)`` pairs, in completion order when parallel."""
+    if workers <= 1:
+        for chunk in chunks:
+            yield chunk, _chunk_docs(chunk)
+        return
+
+    # ``spawn``: a forked child would inherit the parent's open DB
+    # connections. Each worker builds its own app instead.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_init_worker
+    ) as pool:
+        futures = {pool.submit(_chunk_docs, chunk): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _init_worker() -> None:
+    from app.flask.main import create_app
+
+    create_app().app_context().push()
+
+
+def _chunk_docs(chunk: _Chunk) -> list[dict]:
+    """Documents for the public rows of ``chunk``. Runs in the pool
+    workers, so only plain data crosses the process boundary.
+    """
+    model = lookup_by_source_type(chunk.source_type).model
+    stmt = select(model).where(model.id >= chunk.start)
+    if chunk.stop is not None:
+        stmt = stmt.where(model.id < chunk.stop)
+    stmt = stmt.execution_options(yield_per=500)
+    docs: list[dict] = []
+    for rows in db.session.scalars(stmt).partitions():
+        docs.extend(to_docs(obj for obj in rows if is_public(obj)))
+    return docs
+
+
+def _chunk_progress_bar() -> Progress:
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[cyan]{task.fields[type_name]:>18}[/cyan]"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+    )
+
+
 def _progress_bar() -> Progress:
     return Progress(
         SpinnerColumn(),
@@ -109,9 +427,10 @@ def _rebuild_one_type(
     progress: Progress | None,
 ) -> int:
     """Walk every row of ``entry.model``, keep the public ones, and
-    bulk-upsert them. The progress bar advances per *scanned* row
-    (not per indexed row), so the user sees forward motion even when
-    most rows fail ``is_public``.
+    bulk-upsert them. Rows arrive in ``yield_per`` batches, and each
+    batch loads its tags in one query. The progress bar advances per
+    *scanned* row (not per indexed row), so the user sees forward
+    motion even when most rows fail ``is_public``.
     """
     total = db.session.scalar(select(func.count()).select_from(entry.model)) or 0
     task_id = None
@@ -123,12 +442,12 @@ def _rebuild_one_type(
     def public_docs() -> Iterator[dict]:
         nonlocal indexed
         stmt = select(entry.model).execution_options(yield_per=500)
-        for obj in db.session.scalars(stmt):
+        for rows in db.session.scalars(stmt).partitions():
             if progress is not None and task_id is not None:
-                progress.advance(task_id)
-            if is_public(obj):
-                indexed += 1
-                yield to_doc(obj)
+                progress.advance(task_id, len(rows))
+            docs = to_docs(obj for obj in rows if is_public(obj))
+            indexed += len(docs)
+            yield from docs
 
     engine.bulk_upsert(public_docs())
     return indexed
@@ -8,11 +8,19 @@ don't need to track insert-vs-update; deletion is by primary id.
 The engine is decoupled from Flask: it takes a Storage instance, so
 tests can pass a ``RamStorage`` or a SQLite-backed ``SQLAlchemyStorage``
 without an app context. The ``svcs_factory`` classmethod is the bridge
-to the SVCS container at runtime.
+to the SVCS container at runtime; it hands out one engine per process
+(per database URL), so the opened segment readers and the connection
+pool survive from one request to the next.
 """
 
 from __future__ import annotations
 
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from flask_super.decorators import service
@@ -22,10 +30,163 @@ from wesh.query import And, Or, Term
 from .schema import SCHEMA
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator, Mapping
+
     from svcs import Container
     from wesh.backends.filedb.filestore import Storage
 
 
+@dataclass(frozen=True)
+class FacetedResults:
+    """Outcome of :meth:`SearchEngine.search_faceted`.
+
+    Both dicts are keyed by the bucket names the caller passed in.
+    ``counts`` has an entry for every bucket (``0`` when nothing
+    matched); ``hits`` only for the buckets whose hits were requested.
+    """
+
+    counts: dict[str, int] = field(default_factory=dict)
+    hits: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+# Process-wide engines, keyed by database URL. See ``svcs_factory``.
+_shared_engines: dict[str, SearchEngine] = {}
+_shared_engines_lock = threading.Lock()
+
+
+def _forget_shared_engines() -> None:
+    # A forked child must not reuse the parent's pooled connections nor
+    # its open readers: start from scratch on first lookup.
+    _shared_engines.clear()
+
+
+os.register_at_fork(after_in_child=_forget_shared_engines)
+
+
+def _make_storage(url: str, *, pool_size: int, max_overflow: int) -> Storage:
+    """SQL storage for the index, on a dedicated, bounded connection pool.
+
+    Each open segment reader holds its own connection for as long as
+    the searcher that owns it stays open, so the pool is kept apart
+    from Flask-SQLAlchemy's: search traffic can't starve ORM sessions,
+    and vice versa. Sizing: ``max_idle_searchers × segments`` are held
+    by idle cached searchers, plus one searcher per in-flight query.
+    ``pool_timeout`` turns an exhausted pool into a quick error rather
+    than a request stuck for the default 30 s; ``pool_pre_ping``
+    weeds out connections dropped by the server between queries.
+
+    SQLite (tests, local dev) has no server-side connection cost and
+    keeps ``NullPool``, as wesh itself does for file-backed SQLite.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import NullPool
+    from wesh.backends.sql.storage import SQLAlchemyStorage
+
+    if url.startswith("sqlite"):
+        engine = create_engine(url, poolclass=NullPool)
+    else:
+        engine = create_engine(
+            url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=10,
+            pool_pre_ping=True,
+        )
+    return SQLAlchemyStorage(engine).create()
+
+
+class _SearcherCache:
+    """Open searchers for the latest index generation, reused across calls.
+
+    Opening a searcher means opening every segment reader (and, on the
+    SQL storage, fetching segment metadata and checking out one
+    connection per segment). Here we keep up to ``max_idle`` of them
+    around, so concurrent threads each get their own searcher without
+    paying that cost on every query.
+
+    The cache is tied to one index generation (of one physical index:
+    a blue/green swap changes the index name, see
+    :meth:`SearchEngine.promote`). ``latest_generation()``
+    is polled at most once every ``refresh_interval`` seconds to pick up
+    commits from other processes (Dramatiq workers); writes through the
+    owning engine call ``invalidate()`` so they are visible immediately.
+    Idle searchers older than ``idle_timeout`` are closed rather than
+    reused, so we don't hand out readers sitting on connections the
+    database may have dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        refresh_interval: float = 0.0,
+        max_idle: int = 2,
+        idle_timeout: float = 60.0,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._idle: list[tuple[Any, float]] = []  # (searcher, returned_at)
+        self._key: tuple[str, int] | None = None  # (indexname, generation)
+        self._checked_at = 0.0
+        self._refresh_interval = refresh_interval
+        self._max_idle = max_idle
+        self._idle_timeout = idle_timeout
+
+    @contextmanager
+    def searcher(self, ix: Any) -> Iterator[Any]:
+        s, key = self._checkout(ix)
+        try:
+            yield s
+        finally:
+            self._checkin(s, key)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._key = None
+            stale, self._idle = self._idle, []
+        for s, _returned_at in stale:
+            s.close()
+
+    def _checkout(self, ix: Any) -> tuple[Any, tuple[str, int] | None]:
+        stale: list[tuple[Any, float]] = []
+        reused = None
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._key is None
+                or self._key[0] != ix.indexname
+                or now - self._checked_at >= self._refresh_interval
+            ):
+                key = (ix.indexname, ix.latest_generation())
+                self._checked_at = now
+                if key != self._key:
+                    self._key = key
+                    stale, self._idle = self._idle, []
+            key = self._key
+            while self._idle:
+                s, returned_at = self._idle.pop()
+                if now - returned_at < self._idle_timeout:
+                    reused = s
+                    break
+                stale.append((s, returned_at))
+        for s, _returned_at in stale:
+            s.close()
+        if reused is not None:
+            return reused, key
+        s = ix.searcher()
+        return s, (ix.indexname, s.ixreader.generation())
+
+    def _checkin(self, s: Any, key: tuple[str, int] | None) -> None:
+        with self._lock:
+            keep = key == self._key and len(self._idle) < self._max_idle
+            if keep:
+                self._idle.append((s, time.monotonic()))
+        if not keep:
+            s.close()
+
+
 @service
 class SearchEngine:
     """Thin wrapper around a wesh index.
@@ -36,7 +197,14 @@ class SearchEngine:
     responsibility; ``svcs_factory`` handles it for the Flask path).
     """
 
-    def __init__(self, storage: Storage, *, indexname: str = "MAIN") -> None:
+    def __init__(
+        self,
+        storage: Storage,
+        *,
+        indexname: str = "MAIN",
+        refresh_interval: float = 0.0,
+        max_idle_searchers: int = 2,
+    ) -> None:
         """`indexname` keys the on-disk segment files for the
         underlying wesh writer. The default is wesh's own default,
         which keeps production behaviour unchanged. Tests passing a
@@ -44,57 +212,176 @@ class SearchEngine:
         shared `/tmp/<indexname>.tmp/` directory when run in parallel
         (pytest-xdist) — wesh's `RamStorage.temp_storage` uses the
         OS-level tempdir for segment finalisation, and that tempdir
-        IS shared across processes."""
+        IS shared across processes.
+
+        `indexname` is also the alias under which blue/green rebuilds
+        publish their result: once a shadow index has been promoted,
+        reads and writes go to the physical index it names.
+
+        `refresh_interval` bounds how stale the cached searchers (and
+        the resolved alias) may be with respect to commits made by
+        *other* processes. The default (0) re-checks on every query."""
         self._storage = storage
         self._indexname = indexname
         self._index: Any = None  # wesh.index.Index, lazy
+        self._refresh_interval = refresh_interval
+        self._active: str | None = None  # physical index name, lazy
+        self._alias_checked_at = 0.0
+        self._pinned = False  # True for siblings: no alias lookup
+        self._searchers = _SearcherCache(
+            refresh_interval=refresh_interval, max_idle=max_idle_searchers
+        )
 
     @classmethod
     def svcs_factory(cls, container: Container) -> SearchEngine:
+        """Return the process-wide engine for the app's database.
+
+        Built once per process (and per URL) rather than on every
+        container lookup, so the segment readers cached by the engine
+        and its dedicated connection pool are shared by all requests.
+        """
         from flask import current_app
-        from sqlalchemy import create_engine
-        from sqlalchemy.pool import NullPool
-        from wesh.backends.sql.storage import SQLAlchemyStorage
-
-        url = current_app.config["SQLALCHEMY_DATABASE_URI"]
-        # wesh's `_make_engine` defaults to QueuePool(size=5, overflow=10)
-        # for non-SQLite URLs even though its own docstring warns this
-        # « exhausts quickly » under multi-segment indexes : every count /
-        # search opens several segment readers, each grabbing its own
-        # connection, and `/search/?qs=…` iterates over every collection
-        # in COLLECTIONS — easily blowing past 15 connections per request
-        # and producing a `QueuePool limit … timed out` 500. NullPool
-        # short-circuits the cap : every checkout opens a fresh
-        # connection and returns it to the OS as soon as wesh closes
-        # the reader, so a request can use as many concurrent readers
-        # as it needs without starving the pool.
-        engine = create_engine(url, poolclass=NullPool)
-        storage = SQLAlchemyStorage(engine).create()
-        return cls(storage)
+
+        config = current_app.config
+        url = config["SQLALCHEMY_DATABASE_URI"]
+        with _shared_engines_lock:
+            engine = _shared_engines.get(url)
+            if engine is None:
+                engine = cls(
+                    _make_storage(
+                        url,
+                        pool_size=config.get("SEARCH_DB_POOL_SIZE", 10),
+                        max_overflow=config.get("SEARCH_DB_MAX_OVERFLOW", 10),
+                    ),
+                    refresh_interval=config.get("SEARCH_REFRESH_INTERVAL", 1.0),
+                    max_idle_searchers=config.get("SEARCH_MAX_IDLE_SEARCHERS", 2),
+                )
+                _shared_engines[url] = engine
+        return engine
 
     # ── Index lifecycle ─────────────────────────────────────────────
 
-    def _get_index(self) -> Any:
-        if self._index is None:
-            if self._storage.index_exists(indexname=self._indexname):
-                self._index = self._storage.open_index(
-                    indexname=self._indexname, schema=SCHEMA
-                )
+    def _get_index(self, *, fresh: bool = False) -> Any:
+        """Open the physical index the alias currently points to.
+
+        ``fresh=True`` bypasses the ``refresh_interval`` throttle on the
+        alias lookup; writers use it so a document is never written to
+        the index a concurrent rebuild has just retired.
+        """
+        name = self.active_indexname(fresh=fresh)
+        if self._index is None or self._index.indexname != name:
+            if self._storage.index_exists(indexname=name):
+                self._index = self._storage.open_index(indexname=name, schema=SCHEMA)
             else:
-                self._index = self._storage.create_index(
-                    SCHEMA, indexname=self._indexname
-                )
+                self._index = self._storage.create_index(SCHEMA, indexname=name)
         return self._index
 
+    # ── Blue/green rebuilds ─────────────────────────────────────────
+    #
+    # A full rebuild writes into a *shadow* index — whichever of the two
+    # slots ``<indexname>_a`` / ``<indexname>_b`` is not live — then
+    # repoints the ``<indexname>.alias`` storage file at it. Readers keep
+    # using the old index until the swap, so the search page never sees
+    # a half-built index. The retired slot is cleared at the start of the
+    # next rebuild rather than at swap time: other processes may still
+    # be running a query against it for up to ``refresh_interval``.
+    #
+    # The slot suffixes contain an underscore so that wesh's
+    # ``clean_files`` patterns for one index never match another's files.
+
+    @property
+    def indexname(self) -> str:
+        return self._indexname
+
+    def active_indexname(self, *, fresh: bool = False) -> str:
+        """Physical index currently served under ``indexname``. Falls
+        back to ``indexname`` itself until a rebuild has been promoted.
+        """
+        if self._pinned:
+            return self._indexname
+        now = time.monotonic()
+        if (
+            fresh
+            or self._active is None
+            or now - self._alias_checked_at >= self._refresh_interval
+        ):
+            self._active = self._read_meta(f"{self._indexname}.alias") or (
+                self._indexname
+            )
+            self._alias_checked_at = now
+        return self._active
+
+    def shadow_indexname(self) -> str:
+        """The blue/green slot that is *not* currently live."""
+        blue, green = f"{self._indexname}_a", f"{self._indexname}_b"
+        return green if self.active_indexname(fresh=True) == blue else blue
+
+    def sibling(self, indexname: str) -> SearchEngine:
+        """An engine over the same storage, pinned to the physical index
+        ``indexname``. Used to fill a shadow index before promoting it.
+
+        The sibling never follows an alias, even when ``indexname`` is
+        the alias name itself (the pre-blue/green index): it must reach
+        that physical index, not the slot the alias now points to.
+        """
+        engine = SearchEngine(self._storage, indexname=indexname)
+        engine._pinned = True
+        return engine
+
+    def promote(self, indexname: str) -> None:
+        """Atomically make ``indexname`` the live index for this alias."""
+        self._write_meta(f"{self._indexname}.alias", indexname)
+        self._active = indexname
+        self._alias_checked_at = time.monotonic()
+        self._searchers.invalidate()
+
+    def has_index(self, indexname: str) -> bool:
+        return self._storage.index_exists(indexname=indexname)
+
+    def load_checkpoint(self, name: str) -> dict[str, Any] | None:
+        """Read a JSON document saved with :meth:`save_checkpoint`."""
+        raw = self._read_meta(f"{self._indexname}.{name}")
+        return json.loads(raw) if raw else None
+
+    def save_checkpoint(self, name: str, data: dict[str, Any]) -> None:
+        """Persist a small JSON document next to the index. Lives in the
+        index storage so any host can resume an interrupted rebuild.
+        """
+        self._write_meta(f"{self._indexname}.{name}", json.dumps(data))
+
+    def drop_checkpoint(self, name: str) -> None:
+        filename = f"{self._indexname}.{name}"
+        if self._storage.file_exists(filename):
+            self._storage.delete_file(filename)
+
+    def _read_meta(self, filename: str) -> str | None:
+        if not self._storage.file_exists(filename):
+            return None
+        f = self._storage.open_file(filename)
+        try:
+            return bytes(f.read()).decode("utf-8")
+        finally:
+            f.close()
+
+    def _write_meta(self, filename: str, value: str) -> None:
+        f = self._storage.create_file(filename)
+        f.write(value.encode("utf-8"))
+        f.close()
+        # The SQL storage buffers writes until the next commit.
+        commit_writes = getattr(self._storage, "commit_writes", None)
+        if commit_writes is not None:
+            commit_writes()
+
     # ── CRUD ────────────────────────────────────────────────────────
 
     def upsert(self, doc: dict[str, Any]) -> None:
         """Insert or update a document. The schema's ``id`` field is
         ``unique=True``, so wesh replaces an existing doc with the same id.
         """
-        ix = self._get_index()
+        ix = self._get_index(fresh=True)
         with ix.writer() as w:
             w.update_document(**doc)
+        self._searchers.invalidate()
 
     def bulk_upsert(self, docs) -> None:
         """Upsert many documents under a single writer transaction.
@@ -105,18 +392,45 @@ class SearchEngine:
         generator and we'll stream through it without loading the
         whole batch into memory.
         """
-        ix = self._get_index()
+        ix = self._get_index(fresh=True)
         with ix.writer() as w:
             for doc in docs:
                 w.update_document(**doc)
+        self._searchers.invalidate()
+
+    def bulk_apply(
+        self, upserts: Iterable[dict[str, Any]], deletes: Iterable[str]
+    ) -> None:
+        """Apply a batch of upserts and deletions in one writer commit.
+
+        Used by the coalesced indexing job: every pending change since
+        the last flush becomes one new segment instead of one per doc.
+        """
+        ix = self._get_index(fresh=True)
+        with ix.writer() as w:
+            for doc_id in deletes:
+                w.delete_by_term("id", doc_id)
+            for doc in upserts:
+                w.update_document(**doc)
+        self._searchers.invalidate()
+
+    def optimize(self) -> None:
+        """Merge every segment into one. Incremental commits only merge
+        small segments; run this off-peak to keep searchers cheap to
+        open (one reader, hence one connection, per segment).
+        """
+        ix = self._get_index(fresh=True)
+        ix.optimize()
+        self._searchers.invalidate()
 
     def delete(self, doc_id: str) -> None:
         """Remove a document by composite id (``"<type>:<pk>"``). No-op
         if the id is not in the index.
         """
-        ix = self._get_index()
+        ix = self._get_index(fresh=True)
         with ix.writer() as w:
             w.delete_by_term("id", doc_id)
+        self._searchers.invalidate()
 
     def reset(self) -> None:
         """Drop every document from the index, keeping the schema.
@@ -127,22 +441,37 @@ class SearchEngine:
         """
         from wesh.writing import CLEAR
 
-        ix = self._get_index()
+        ix = self._get_index(fresh=True)
         writer = ix.writer()
         writer.commit(mergetype=CLEAR)
+        self._searchers.invalidate()
 
     def doc_count(self, *, type: str | None = None) -> int:
         """Return the number of indexed documents, optionally filtered
         by ``type``. Used by the ``status`` CLI command.
         """
         ix = self._get_index()
-        with ix.searcher() as s:
+        with self._searchers.searcher(ix) as s:
             if type is None:
                 return s.doc_count()
             from wesh.query import Term
 
             return s.search(Term("type", type), limit=None).estimated_length()
 
+    def doc_versions(self) -> dict[str, str]:
+        """Map every indexed doc id to its stored ``modified`` version.
+
+        Read from the stored fields in one pass over the live index,
+        for the reconciliation to diff against the database. Documents
+        indexed before the field existed map to ``""``.
+        """
+        ix = self._get_index(fresh=True)
+        with ix.reader() as reader:
+            return {
+                fields["id"]: fields.get("modified", "")
+                for fields in reader.all_stored_fields()
+            }
+
     # ── Query ───────────────────────────────────────────────────────
 
     def search(
@@ -159,7 +488,7 @@ class SearchEngine:
         """
         ix = self._get_index()
         query = self._build_query(qs, type=type)
-        with ix.searcher() as s:
+        with self._searchers.searcher(ix) as s:
             results = s.search(query, limit=limit)
             return [dict(hit) for hit in results]
 
@@ -170,9 +499,65 @@ class SearchEngine:
         """
         ix = self._get_index()
         query = self._build_query(qs, type=type)
-        with ix.searcher() as s:
+        with self._searchers.searcher(ix) as s:
             return s.search(query, limit=None).estimated_length()
 
+    def search_faceted(
+        self,
+        qs: str,
+        types: Mapping[str, str | list[str]],
+        *,
+        limit_per_type: int = 20,
+        hits_for: Collection[str] | None = None,
+    ) -> FacetedResults:
+        """Count and fetch hits for several type buckets in one pass.
+
+        ``types`` maps a bucket name (e.g. the sidebar key
+        ``"marketplace"``) to its discriminator(s), with the same
+        str-or-list convention as ``search(type=…)``. The query is
+        parsed once and run once, grouped by ``type``, inside a single
+        searcher — instead of one ``count`` + one ``search`` per
+        bucket, each re-parsing the query and opening its own readers.
+
+        ``hits_for`` restricts which buckets get their top
+        ``limit_per_type`` hits materialised (``None`` = all of them);
+        counts are always computed for every bucket.
+        """
+        bucket_of: dict[str, str] = {}
+        for name, type_value in types.items():
+            discriminators = [type_value] if isinstance(type_value, str) else type_value
+            for discriminator in discriminators:
+                bucket_of[discriminator.lower()] = name
+
+        counts = dict.fromkeys(types, 0)
+        wanted = set(types) if hits_for is None else set(hits_for) & set(types)
+        hits: dict[str, list[dict[str, Any]]] = {name: [] for name in wanted}
+        if not bucket_of:
+            return FacetedResults(counts=counts, hits=hits)
+
+        ix = self._get_index()
+        query = self._build_query(qs, type=list(bucket_of))
+        with self._searchers.searcher(ix) as s:
+            results = s.search(query, limit=None, groupedby="type")
+            bucket_by_docnum: dict[int, str] = {}
+            for type_name, docnums in results.groups("type").items():
+                name = bucket_of.get(type_name)
+                if name is None:
+                    continue
+                counts[name] += len(docnums)
+                if name in wanted:
+                    bucket_by_docnum.update(dict.fromkeys(docnums, name))
+
+            # ``top_n`` is score-ordered, so filling each bucket in that
+            # order keeps the per-bucket ranking identical to ``search``.
+            for _score, docnum in results.top_n:
+                name = bucket_by_docnum.get(docnum)
+                if name is None or len(hits[name]) >= limit_per_type:
+                    continue
+                hits[name].append(dict(s.stored_fields(docnum)))
+
+        return FacetedResults(counts=counts, hits=hits)
+
     def _build_query(self, qs: str, *, type: str | list[str] | None) -> Any:
         parser = MultifieldParser(["title", "text"], schema=SCHEMA)
         query = parser.parse(qs)
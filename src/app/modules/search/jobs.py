@@ -1,11 +1,17 @@
 """Dramatiq jobs that keep the search index in sync.
 
-A receiver in ``search/receivers.py`` enqueues ``reindex_from_source``
-with the *source* object's type and id (e.g. the wip ``Article`` that
+A receiver in ``search/receivers.py`` calls ``enqueue_reindex`` with
+the *source* object's type and id (e.g. the wip ``Article`` that
 triggered the domain signal, not the public ``ArticlePost`` mirror).
-The job runs in a Dramatiq worker after the request transaction has
-committed, looks up the corresponding indexable Post, then either
-upserts it (if currently public) or deletes its index entry.
+That appends a :class:`PendingReindex` row in the request transaction
+and schedules ``flush_pending_reindex`` after a short debounce window
+(``SEARCH_INDEX_DEBOUNCE`` seconds). The flush drains the table,
+collapses duplicate pairs, looks up each indexable Post, and applies
+all the resulting upserts (if currently public) and deletions in one
+writer commit.
+
+``reindex_from_source`` is the single-item version of the same logic,
+for callers that want one object re-synced right away.
 
 Decoupling the signal payload from the indexable model avoids order-
 of-receiver issues: the wire/event mirror receiver and our enqueuing
@@ -18,14 +24,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import svcs.flask
+from flask import current_app
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import delete, select
 
 from app.dramatiq.job import job
 from app.flask.extensions import db
 
-from .adapters import doc_id, is_public, to_doc
+from .adapters import doc_id, is_public, to_doc, to_docs
 from .engine import SearchEngine
+from .models import PendingReindex
 from .registry import lookup_by_source_type
 
 if TYPE_CHECKING:
@@ -58,6 +66,70 @@ def reindex_from_source(source_type: str, source_id: int) -> None:
     _apply(engine, post)
 
 
+def enqueue_reindex(source_type: str, source_id: int) -> None:
+    """Queue ``(source_type, source_id)`` for the next coalesced flush.
+
+    The row joins the caller's transaction, so it only becomes visible
+    to the flush once the change that triggered it is committed:
+    signals must be sent *before* ``db.session.commit()``. A flush is
+    scheduled only when the queue was empty, i.e. for the first pending
+    row: later rows ride on the flush already scheduled. A row that
+    still slips past a flush (queued while that flush was committing)
+    is picked up by the ``flush_search_queue`` cron.
+    """
+    # An ORM select, so rows added earlier in this session are flushed
+    # and counted.
+    already_pending = db.session.scalar(select(PendingReindex.id).limit(1)) is not None
+    db.session.add(PendingReindex(source_type=source_type, source_id=source_id))
+    if not already_pending:
+        delay = current_app.config.get("SEARCH_INDEX_DEBOUNCE", 5)
+        flush_pending_reindex.send_with_options(delay=int(delay * 1000))
+
+
+@job()
+def flush_pending_reindex() -> None:
+    """Apply every pending index update in one writer commit.
+
+    The pending rows are claimed with ``DELETE … RETURNING`` and only
+    removed for good when the transaction commits, after the index
+    write succeeded: on error they stay queued for the retry. A
+    concurrent flush blocks on the same rows and then finds nothing.
+    """
+    stmt = delete(PendingReindex).returning(
+        PendingReindex.source_type, PendingReindex.source_id
+    )
+    pairs = dict.fromkeys(tuple(row) for row in db.session.execute(stmt))
+    if not pairs:
+        return
+
+    public: list[BaseContent] = []
+    deletes: list[str] = []
+    for source_type, source_id in pairs:
+        try:
+            entry = lookup_by_source_type(source_type)
+        except KeyError:
+            logger.warning("search: dropping unknown source_type {!r}", source_type)
+            continue
+        post = _find_post(entry, source_id)
+        if post is None:
+            continue
+        if is_public(post):
+            public.append(post)
+        else:
+            deletes.append(doc_id(post))
+    upserts = to_docs(public)
+
+    engine = svcs.flask.container.get(SearchEngine)
+    engine.bulk_apply(upserts, deletes)
+    db.session.commit()
+    logger.debug(
+        "search: flushed {} change(s) ({} upsert, {} delete)",
+        len(pairs),
+        len(upserts),
+        len(deletes),
+    )
+
+
 def _find_post(entry, source_id: int) -> BaseContent | None:
     if entry.fk_column is None:
         return db.session.get(entry.model, source_id)
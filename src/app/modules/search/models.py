@@ -0,0 +1,39 @@
+# Copyright (c) 2021-2024, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Outbox of pending search-index updates.
+
+Domain-signal receivers append one row per ``(source_type, source_id)``
+in the same transaction as the change that triggered them; the
+``flush_pending_reindex`` job drains the table after a short delay and
+applies every distinct pair in a single index writer commit. A burst of
+edits to the same article therefore costs one commit, not one per edit.
+
+The table is append-only on purpose: no unique constraint, so two
+requests touching the same object never wait on each other's row lock.
+Duplicates are collapsed at flush time.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.models.mixins import IdMixin
+
+
+class PendingReindex(IdMixin, Base):
+    __tablename__ = "search_pending"
+
+    source_type: Mapped[str] = mapped_column(sa.String, nullable=False)
+    source_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    queued_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+        index=True,
+    )
@@ -1,14 +1,15 @@
 """Domain-signal receivers that keep the search index up to date.
 
 We piggyback on the existing publish/unpublish/update signals for
-articles, press releases, and events. Each receiver enqueues a Dramatiq
-job that, after the request transaction commits, reads the mirror Post
-from a fresh session and syncs its state to the index.
+articles, press releases, and events. Each receiver queues the source
+object with ``jobs.enqueue_reindex``; after the request transaction
+commits and a short debounce window, a Dramatiq job reads the mirror
+Posts from a fresh session and syncs them to the index in one batch.
 
 The receivers are intentionally trivial — all the indexing logic lives
-in ``jobs.reindex_from_source``. Splitting publish/unpublish/update is
-kept for clarity (each signal has obvious semantics) even though the
-three paths feed the same job.
+in ``jobs``. Splitting publish/unpublish/update is kept for clarity
+(each signal has obvious semantics) even though the three paths feed
+the same queue.
 """
 
 from __future__ import annotations
@@ -33,7 +34,7 @@ from app.signals import (
     user_deactivated,
 )
 
-from .jobs import reindex_from_source
+from .jobs import enqueue_reindex
 
 if TYPE_CHECKING:
     from app.models.auth import User
@@ -48,17 +49,17 @@ if TYPE_CHECKING:
 
 @article_published.connect
 def _on_article_published(article: Article) -> None:
-    reindex_from_source.send("article", article.id)
+    enqueue_reindex("article", article.id)
 
 
 @article_unpublished.connect
 def _on_article_unpublished(article: Article) -> None:
-    reindex_from_source.send("article", article.id)
+    enqueue_reindex("article", article.id)
 
 
 @article_updated.connect
 def _on_article_updated(article: Article) -> None:
-    reindex_from_source.send("article", article.id)
+    enqueue_reindex("article", article.id)
 
 
 # ── Press release (communiqué) ─────────────────────────────────────
@@ -66,17 +67,17 @@ def _on_article_updated(article: Article) -> None:
 
 @communique_published.connect
 def _on_communique_published(communique: Communique) -> None:
-    reindex_from_source.send("press_release", communique.id)
+    enqueue_reindex("press_release", communique.id)
 
 
 @communique_unpublished.connect
 def _on_communique_unpublished(communique: Communique) -> None:
-    reindex_from_source.send("press_release", communique.id)
+    enqueue_reindex("press_release", communique.id)
 
 
 @communique_updated.connect
 def _on_communique_updated(communique: Communique) -> None:
-    reindex_from_source.send("press_release", communique.id)
+    enqueue_reindex("press_release", communique.id)
 
 
 # ── Event ──────────────────────────────────────────────────────────
@@ -84,17 +85,17 @@ def _on_communique_updated(communique: Communique) -> None:
 
 @event_published.connect
 def _on_event_published(event: Event) -> None:
-    reindex_from_source.send("event", event.id)
+    enqueue_reindex("event", event.id)
 
 
 @event_unpublished.connect
 def _on_event_unpublished(event: Event) -> None:
-    reindex_from_source.send("event", event.id)
+    enqueue_reindex("event", event.id)
 
 
 @event_updated.connect
 def _on_event_updated(event: Event) -> None:
-    reindex_from_source.send("event", event.id)
+    enqueue_reindex("event", event.id)
 
 
 # ── Marketplace (mission / project / job / editorial product) ──────
@@ -102,12 +103,12 @@ def _on_event_updated(event: Event) -> None:
 
 @marketplace_published.connect
 def _on_marketplace_published(offer: MarketplaceContent) -> None:
-    reindex_from_source.send("marketplace", offer.id)
+    enqueue_reindex("marketplace", offer.id)
 
 
 @marketplace_unpublished.connect
 def _on_marketplace_unpublished(offer: MarketplaceContent) -> None:
-    reindex_from_source.send("marketplace", offer.id)
+    enqueue_reindex("marketplace", offer.id)
 
 
 # Group: retiré de la recherche (2026-05-21) — plus de connect ici.
@@ -118,12 +119,12 @@ def _on_marketplace_unpublished(offer: MarketplaceContent) -> None:
 
 @user_activated.connect
 def _on_user_activated(user: User) -> None:
-    reindex_from_source.send("user", user.id)
+    enqueue_reindex("user", user.id)
 
 
 @user_deactivated.connect
 def _on_user_deactivated(user: User) -> None:
-    reindex_from_source.send("user", user.id)
+    enqueue_reindex("user", user.id)
 
 
 # ── Organisation ───────────────────────────────────────────────────
@@ -131,9 +132,9 @@ def _on_user_deactivated(user: User) -> None:
 
 @org_activated.connect
 def _on_org_activated(org: Organisation) -> None:
-    reindex_from_source.send("organisation", org.id)
+    enqueue_reindex("organisation", org.id)
 
 
 @org_deactivated.connect
 def _on_org_deactivated(org: Organisation) -> None:
-    reindex_from_source.send("organisation", org.id)
+    enqueue_reindex("organisation", org.id)
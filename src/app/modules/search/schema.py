@@ -21,4 +21,7 @@ SCHEMA = fields.Schema(
     url=fields.STORED,
     timestamp=fields.DATETIME(stored=True, sortable=True),
     tags=fields.KEYWORD(stored=True, commas=True, facet=True),
+    # Version of the row the doc was built from (see ``adapters.version``),
+    # diffed against the database by the hourly reconciliation.
+    modified=fields.STORED,
 )
@@ -7,7 +7,8 @@
 The route accepts ``qs`` (the query string) and ``filter`` (the
 collection name from :data:`COLLECTIONS`). Renders one section per
 type when ``filter=all``, or a single section otherwise. The sidebar
-shows per-type counts driven by ``engine.count(qs, type=…)``.
+counts and the displayed hits both come from one
+``engine.search_faceted(…)`` call, so a request opens a single searcher.
 
 Empty queries render the page with zero hits and a hint to type
 something — running BM25 on an empty query is wasteful and produces a
@@ -53,8 +54,7 @@ def search():
         )
 
     engine = svcs.flask.container.get(SearchEngine)
-    counts = _counts_by_name(engine, qs)
-    result_sets = _result_sets(engine, qs, filter_name, counts)
+    counts, result_sets = _search_collections(engine, qs, filter_name)
 
     return render_template(
         "pages/search.j2",
@@ -68,47 +68,42 @@ def search():
 # ── Helpers ─────────────────────────────────────────────────────────
 
 
-def _counts_by_name(engine: SearchEngine, qs: str) -> dict[str, int]:
-    """Per-collection-name hit counts. The ``all`` entry is the sum."""
-    counts: dict[str, int] = {}
-    for collection in COLLECTIONS:
-        type_name = collection["type"]
-        if type_name is None:
-            continue
-        counts[collection["name"]] = engine.count(qs, type=type_name)
-    counts["all"] = sum(counts.values())
-    return counts
-
-
-def _result_sets(
-    engine: SearchEngine,
-    qs: str,
-    filter_name: str,
-    counts: dict[str, int],
-) -> list[ResultSet]:
+def _search_collections(
+    engine: SearchEngine, qs: str, filter_name: str
+) -> tuple[dict[str, int], list[ResultSet]]:
+    """Per-collection counts (``all`` is the sum) and the result sets
+    to display, from a single faceted pass over the index.
+    """
+    named_types = {c["name"]: c["type"] for c in COLLECTIONS if c["type"] is not None}
     if filter_name == "all":
-        named_types = [c for c in COLLECTIONS if c["type"] is not None]
+        shown = list(named_types)
     else:
-        named_types = [c for c in COLLECTIONS if c["name"] == filter_name]
+        shown = [name for name in named_types if name == filter_name]
+
+    results = engine.search_faceted(
+        qs, named_types, limit_per_type=_DEFAULT_LIMIT, hits_for=shown
+    )
+    counts = dict(results.counts)
+    counts["all"] = results.total
 
     out: list[ResultSet] = []
-    for collection in named_types:
-        type_name = collection["type"]
-        if type_name is None:
+    for collection in COLLECTIONS:
+        name = collection["name"]
+        if name not in shown:
             continue
-        hits = engine.search(qs, type=type_name, limit=_DEFAULT_LIMIT)
+        hits = results.hits.get(name, [])
         if not hits:
             continue
         out.append(
             ResultSet(
-                name=collection["name"],
+                name=name,
                 label=collection["label"],
                 icon=collection["icon"],
-                count=counts.get(collection["name"], len(hits)),
+                count=counts.get(name, len(hits)),
                 hits=[Hit.from_doc(doc) for doc in hits],
             )
         )
-    return out
+    return counts, out
 
 
 def _make_menu(*, qs: str, counts: dict[str, int], current: str) -> list[dict]:
@@ -11,7 +11,7 @@ from flask import Blueprint
 from flask_login import current_user
 from werkzeug.exceptions import Unauthorized
 
-from app.flask.lib.nav import configure_nav
+from app.flask.lib.nav import LazyMenu, configure_nav
 from app.models.auth import User
 
 blueprint = Blueprint(
@@ -39,8 +39,7 @@ def inject_swork_menu() -> dict:
     from app.modules.swork.settings import SWORK_MENU
     from app.services.menus import make_menu
 
-    menu = make_menu(SWORK_MENU)
-    return {"nav_secondary_menu": menu}
+    return {"nav_secondary_menu": LazyMenu(lambda: make_menu(SWORK_MENU))}
 
 
 def register_views() -> None:
@@ -4,18 +4,26 @@
 
 from __future__ import annotations
 
+import json
 import re
 from abc import abstractmethod
+from collections import Counter
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from flask import url_for
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.sql import Select
 
 if TYPE_CHECKING:
     from sqlalchemy.sql.elements import ColumnElement
 
+from app.flask.extensions import db
 from app.flask.lib.pywire import WiredComponent
+from app.lib.pagination import Page, decode_cursor, encode_cursor
 from app.models.mixins import Addressable
+from app.modules.swork.settings import SWORK_LIST_LIMIT
 
 
 class BaseList(WiredComponent):
@@ -23,14 +31,29 @@ class BaseList(WiredComponent):
 
     Subclasses must implement:
     - get_base_statement(): Return the base SQLAlchemy select statement
+    - get_sort_keys(): Return the columns the list is ordered by, ending
+      with a unique one (keyset pagination; without sort keys only the
+      first page is shown)
+    - cursor_values(item): Return the values of those columns for an item
     - search_clause(search): Return a filter clause for search terms
     - context(): Return template context dict
+
+    Lists are paginated by keyset: each page holds ``page_size`` items
+    after the cursor (the sort key values of the previous page's last
+    item). The first page is rendered with the component; the next ones
+    are fetched by an HTMX sentinel from ``swork.list_page``.
     """
 
     search: str = ""
     filter_states: dict
 
     filters: ClassVar[list[Filter]] = []
+    page_size: ClassVar[int] = SWORK_LIST_LIMIT
+
+    # Set when rendering a follow-up page (see ``render_page``)
+    page_only: bool = False
+    page_cursor: str = ""
+    continued_letter: str = ""
 
     _attrs: ClassVar = ["search", "filter_states"]
 
@@ -48,7 +71,19 @@ class BaseList(WiredComponent):
                     str(i): False for i in range(len(filter.options))
                 }
 
-    def make_stmt(self) -> Select:
+    def make_stmt(self, cursor: str = "") -> Select:
+        """One page of the filtered list, plus one row to tell whether
+        another page follows."""
+        keys = self.get_sort_keys()
+        stmt = self.make_filtered_stmt()
+        if keys:
+            if cursor:
+                after = self.decode_page_cursor(cursor)
+                stmt = stmt.where(tuple_(*keys) > tuple_(*after))
+            stmt = stmt.order_by(*keys)
+        return stmt.limit(self.page_size + 1)
+
+    def make_filtered_stmt(self) -> Select:
         stmt = self.get_base_statement()
         stmt = self.apply_search(stmt)
         stmt = self.apply_filters(stmt)
@@ -57,6 +92,100 @@ class BaseList(WiredComponent):
     def get_base_statement(self) -> Select:
         raise NotImplementedError
 
+    def get_sort_keys(self) -> tuple[ColumnElement, ...]:
+        return ()
+
+    def cursor_values(self, item: Any) -> tuple:
+        raise NotImplementedError
+
+    def decode_page_cursor(self, cursor: str) -> tuple:
+        """Inverse of `cursor_values`. Raise ``ValueError`` on a cursor
+        that doesn't match the sort keys, in number or types."""
+        values = decode_cursor(cursor)
+        keys = self.get_sort_keys()
+        if len(values) != len(keys):
+            raise ValueError(cursor)
+        for key, value in zip(keys, values, strict=True):
+            if value is not None and not isinstance(value, key.type.python_type):
+                raise ValueError(cursor)
+        return values
+
+    def load_items(self, stmt: Select) -> list[Any]:
+        """Run a page statement. Override when rows aren't plain
+        entities."""
+        return list(db.session.scalars(stmt))
+
+    def fetch_page(self) -> Page:
+        items = self.load_items(self.make_stmt(self.page_cursor))
+        if len(items) <= self.page_size:
+            return Page(items)
+        items = items[: self.page_size]
+        if not self.get_sort_keys():
+            return Page(items)
+        return Page(items, encode_cursor(self.cursor_values(items[-1])))
+
+    def count_items(self) -> int:
+        """Total number of matching items, all pages included."""
+        subquery = self.make_filtered_stmt().order_by(None).subquery()
+        return db.session.scalar(select(func.count()).select_from(subquery)) or 0
+
+    def page_context(self, page: Page, directory: Any) -> dict[str, Any]:
+        """Template variables for the pagination sentinel."""
+        letters = list(directory.keys())
+        next_page_url = ""
+        if page.next_cursor:
+            next_page_url = url_for(
+                "swork.list_page",
+                name=self._name,
+                cursor=page.next_cursor,
+                letter=letters[-1] if letters else "",
+                **self.query_args(),
+            )
+        return {
+            "page_only": self.page_only,
+            "continued_letter": self.continued_letter,
+            "next_page_url": next_page_url,
+        }
+
+    def render_page(self, cursor: str, letter: str = "") -> str:
+        """Render only the items after ``cursor`` and the next sentinel.
+        ``letter`` is the last directory heading already on screen."""
+        self.page_only = True
+        self.page_cursor = cursor
+        self.continued_letter = letter
+        return self.render()
+
+    def query_args(self) -> dict[str, str]:
+        """Search and active filters, compact enough for a query string."""
+        args: dict[str, str] = {}
+        if self.search:
+            args["search"] = self.search
+        active = {
+            filter_id: [int(i) for i, on in state.items() if on]
+            for filter_id, state in self.filter_states.items()
+        }
+        active = {filter_id: idx for filter_id, idx in active.items() if idx}
+        if active:
+            args["filters"] = json.dumps(active, separators=(",", ":"))
+        return args
+
+    def restore_query_args(self, args: Mapping[str, str]) -> None:
+        """Inverse of :meth:`query_args`."""
+        self.search = args.get("search", "")
+        try:
+            active = json.loads(args.get("filters") or "{}")
+        except ValueError:
+            active = {}
+        if not isinstance(active, dict):
+            return
+        for filter_id, indexes in active.items():
+            state = self.filter_states.get(filter_id)
+            if state is None or not isinstance(indexes, list):
+                continue
+            for i in indexes:
+                if str(i) in state:
+                    state[str(i)] = True
+
     def apply_search(self, stmt: Select) -> Select:
         search = self.search.strip()
         if not search:
@@ -136,6 +265,15 @@ class FilterOption:
         return self.option
 
 
+@dataclass(frozen=True)
+class Facet:
+    """The options of one filter over a whole population, with the
+    number of objects carrying each option."""
+
+    options: tuple[str | FilterOption, ...]
+    counts: Mapping[str | FilterOption, int]
+
+
 class Filter:
     """Base class for list filters.
 
@@ -149,6 +287,8 @@ class Filter:
     id: str
     label: str
     options: list[str | FilterOption] = []  # noqa: RUF012 - intentionally mutable for subclass override
+    # Number of objects carrying each option, when built from a Facet.
+    counts: Mapping[str | FilterOption, int] = {}
 
     def __init__(self, objects: list[Any] | None = None) -> None:
         # Only initialize if no class-level options defined
@@ -170,6 +310,30 @@ class Filter:
             msg = f"Invalid selector: {selector}"
             raise TypeError(msg)
 
+    @classmethod
+    def facet(cls, objects: list[Any]) -> Facet:
+        """Compute the options of this filter over ``objects``, and how
+        many objects carry each option."""
+        options = tuple(cls(objects).options)
+        selector = getattr(cls(), "selector", None)
+        counts: Counter[Any] = Counter()
+        for obj in objects:
+            if callable(selector):
+                value = selector(obj)
+            else:
+                value = getattr(obj, selector) if selector else None
+            values = value if isinstance(value, list) else [value]
+            counts.update(set(values))
+        return Facet(options, {opt: counts[opt] for opt in options})
+
+    @classmethod
+    def from_facet(cls, facet: Facet) -> Filter:
+        """A filter whose options come from a precomputed facet."""
+        filter = cls()
+        filter.options = list(facet.options)
+        filter.counts = facet.counts
+        return filter
+
     def apply(self, stmt: Select, state: dict[str, bool]) -> Select:
         """Apply this filter to the statement. Override in subclasses."""
         raise NotImplementedError
@@ -8,13 +8,10 @@ from typing import ClassVar
 
 from flask_super.registry import register
 from sqlalchemy import select
-from sqlalchemy.sql.functions import count
 
-from app.flask.extensions import db
 from app.flask.sqla import get_multi
 from app.modules.swork.common import Directory
 from app.modules.swork.models import Group
-from app.modules.swork.settings import SWORK_LIST_LIMIT
 
 from .base import BaseList, Filter, FilterByCity, FilterByDept
 
@@ -24,18 +21,16 @@ class GroupsList(BaseList):
     """Filterable list of public groups."""
 
     def context(self):
-        stmt = select(count(Group.id))
-        item_count: int = db.session.scalar(stmt) or 0
-
-        stmt = self.make_stmt()
-        groups: list[Group] = list(db.session.scalars(stmt))
-
-        directory = Directory(groups)
+        page = self.fetch_page()
+        directory = Directory(page.items)
+        if self.page_only:
+            return {"directory": directory, **self.page_context(page, directory)}
 
         return {
             "directory": directory,
-            "count": item_count,
-            "filters": self.get_filters(),
+            "count": self.count_items(),
+            "filters": self.filters,
+            **self.page_context(page, directory),
         }
 
     def get_filters(self):
@@ -44,12 +39,13 @@ class GroupsList(BaseList):
         return make_filters(groups)
 
     def get_base_statement(self):
-        return (
-            select(Group)
-            .where(Group.privacy == "public")
-            .order_by(Group.name)
-            .limit(SWORK_LIST_LIMIT)
-        )
+        return select(Group).where(Group.privacy == "public")
+
+    def get_sort_keys(self):
+        return Group.name, Group.id
+
+    def cursor_values(self, item: Group) -> tuple:
+        return item.name, item.id
 
     def search_clause(self, search):
         return Group.name.ilike(f"%{search}%")
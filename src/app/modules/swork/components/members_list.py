@@ -14,15 +14,16 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import Select
 
 from app.flask.extensions import db
+from app.lib.facets import FacetCache
 
 # from app.logging import warn
 from app.models.auth import KYCProfile, User
 from app.models.organisation import Organisation
 from app.modules.kyc.field_label import country_code_to_country_name
 from app.modules.swork.common import Directory
-from app.modules.swork.settings import SWORK_LIST_LIMIT
+from app.modules.swork.settings import SWORK_FACETS_TTL
 
-from .base import BaseList, Filter, FilterOption
+from .base import BaseList, Facet, Filter, FilterOption
 
 
 @register
@@ -30,16 +31,17 @@ class MembersList(BaseList):
     """Filterable list of platform members."""
 
     def context(self) -> dict[str, Any]:
-        stmt = self.make_stmt()
-        users: list[User] = list(db.session.scalars(stmt))
-        items_count = len(users)
-        directory = MembersDirectory(users)
+        page = self.fetch_page()
+        directory = MembersDirectory(page.items)
+        if self.page_only:
+            return {"directory": directory, **self.page_context(page, directory)}
 
         return {
             "directory": directory,
-            "count": items_count,
-            "filters": self.get_filters(),
+            "count": self.count_items(),
+            "filters": self.filters,
             "active_filters": self.get_active_filters(),
+            **self.page_context(page, directory),
         }
 
     def get_base_statement(self) -> Select:
@@ -58,9 +60,14 @@ class MembersList(BaseList):
                 selectinload(User.profile),
                 selectinload(User.roles),
             )
-            .limit(SWORK_LIST_LIMIT)
         )
 
+    def get_sort_keys(self):
+        return User.last_name, User.first_name, User.id
+
+    def cursor_values(self, item: User) -> tuple:
+        return item.last_name, item.first_name, item.id
+
     def apply_search(self, stmt: Select) -> Select:
         search = self.search.strip()
         if not search:
@@ -97,28 +104,9 @@ class MembersList(BaseList):
 
         return stmt
 
-    def get_filters(self):
-        stmt = (
-            select(User)
-            .where(
-                User.active == true(),
-                User.is_clone == false(),
-                User.deleted_at.is_(None),
-            )
-            .options(
-                # Cards + filters read job_title (→ profile) and the
-                # community badge (→ roles) per member — eager-load them so a
-                # list of ~100 members doesn't issue a query per member.
-                selectinload(User.organisation),
-                selectinload(User.profile),
-                selectinload(User.roles),
-            )
-        )
-        users: list[User] = list(db.session.scalars(stmt))
-        # warn(
-        #     f"[MembersList.get_filters] fetched {len(users)} active users for filter building"
-        # )
-        return make_filters(users)
+    def get_filters(self) -> list[Filter]:
+        facets = member_facets.get()
+        return [cls.from_facet(facets[cls.id]) for cls in MEMBER_FILTERS]
 
 
 class FilterByJobTitle(Filter):
@@ -553,24 +541,50 @@ class FilterByCityOrm(Filter):
         return stmt
 
 
+MEMBER_FILTERS: list[type[Filter]] = [
+    FilterByTypeOrganisation,
+    FilterByTypeEntrepriseMedia,
+    FilterByTypePresseEtMedia,
+    FilterByTypeAgenceRP,
+    FilterByTailleOrganisation,
+    FilterBySecteurActivite,
+    FilterByCompetencesGenerales,
+    FilterByCompetencesJournalisme,
+    FilterByTransformationsMajeures,
+    FilterByJobTitle,
+    # FilterByCompetency,
+    # FilterBySector,
+    FilterByCountryOrm,
+    FilterByDeptOrm,
+    FilterByCityOrm,
+]
+
+
 def make_filters(users: list[User]):
-    return [
-        FilterByTypeOrganisation(users),
-        FilterByTypeEntrepriseMedia(users),
-        FilterByTypePresseEtMedia(users),
-        FilterByTypeAgenceRP(users),
-        FilterByTailleOrganisation(users),
-        FilterBySecteurActivite(users),
-        FilterByCompetencesGenerales(users),
-        FilterByCompetencesJournalisme(users),
-        FilterByTransformationsMajeures(users),
-        FilterByJobTitle(users),
-        # FilterByCompetency(users),
-        # FilterBySector(users),
-        FilterByCountryOrm(users),
-        FilterByDeptOrm(users),
-        FilterByCityOrm(users),
-    ]
+    return [cls(users) for cls in MEMBER_FILTERS]
+
+
+def compute_member_facets() -> dict[str, Facet]:
+    """Scan every active member once and compute the options of each
+    directory filter. Only the profile is needed by the selectors."""
+    stmt = (
+        select(User)
+        .where(
+            User.active == true(),
+            User.is_clone == false(),
+            User.deleted_at.is_(None),
+        )
+        .options(selectinload(User.profile))
+    )
+    users: list[User] = list(db.session.scalars(stmt))
+    return {cls.id: cls.facet(users) for cls in MEMBER_FILTERS}
+
+
+# Filter options for the members directory, shared by every render and
+# rebuilt after a user or KYC profile change.
+member_facets = FacetCache(
+    compute_member_facets, watch=(User, KYCProfile), ttl=SWORK_FACETS_TTL
+)
 
 
 class MembersDirectory(Directory):
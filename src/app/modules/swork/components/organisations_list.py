@@ -25,7 +25,6 @@ from app.modules.bw.bw_activation.user_utils import (
 )
 from app.modules.kyc.field_label import country_code_to_country_name
 from app.modules.swork.common import Directory
-from app.modules.swork.settings import SWORK_LIST_LIMIT
 
 from .base import BaseList, Filter, FilterOption
 
@@ -35,22 +34,27 @@ class OrganisationsList(BaseList):
     """Filterable list of organisations."""
 
     def context(self) -> dict[str, Any]:
-        orgs = self.get_orgs()
-        org_count = len(orgs)
-        directory = OrgsDirectory(orgs)
+        page = self.fetch_page()
+        directory = OrgsDirectory(page.items)
+        if self.page_only:
+            return {"directory": directory, **self.page_context(page, directory)}
 
         return {
             "search": self.search,
             "filter_states": self.filter_states,
             "filters": self.filters,
             "directory": directory,
-            "count": org_count,
+            "count": self.count_items(),
             "active_filters": self.get_active_filters(),
+            **self.page_context(page, directory),
         }
 
     def get_orgs(self) -> list[Organisation]:
+        """Fetch the current page of organisations."""
+        return self.fetch_page().items
+
+    def load_items(self, stmt: Select) -> list[Organisation]:
         """Fetch organisations and attach BusinessWall data if found."""
-        stmt = self.make_stmt()
         results = db.session.execute(stmt).all()
         orgs = []
         for row in results:
@@ -63,6 +67,12 @@ class OrganisationsList(BaseList):
         prefetch_active_business_walls(orgs)
         return orgs
 
+    def get_sort_keys(self):
+        return Organisation.name, Organisation.id
+
+    def cursor_values(self, item: Organisation) -> tuple:
+        return item.name, item.id
+
     def _get_latest_bw_subquery(self):
         """Get subquery for latest active BusinessWall per organisation."""
         return (
@@ -98,8 +108,6 @@ class OrganisationsList(BaseList):
                 & (BusinessWall.status == BWStatus.ACTIVE.value),
             )
             .where(Organisation.deleted_at.is_(None))
-            .order_by(Organisation.name)
-            .limit(SWORK_LIST_LIMIT)
         )
 
     def apply_search(self, stmt: Select) -> Select:
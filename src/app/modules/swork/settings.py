@@ -4,9 +4,13 @@
 
 from __future__ import annotations
 
-# Maximum number of items to display in list views
+# Number of items per page in list views (more are loaded on scroll)
 SWORK_LIST_LIMIT = 100
 
+# Seconds a worker keeps the directory filter options before rebuilding
+# them (changes made by the same worker apply right away)
+SWORK_FACETS_TTL = 300
+
 SWORK_MENU = [
     {
         "endpoint": "swork.swork",
@@ -11,6 +11,7 @@ from . import (
     group_new,
     groups,
     home,
+    lists,
     member,
     members,
     organisation,
@@ -23,6 +24,7 @@ __all__ = [
     "group_new",
     "groups",
     "home",
+    "lists",
     "member",
     "members",
     "organisation",
@@ -0,0 +1,33 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Follow-up pages of the directory lists (HTMX infinite scroll)."""
+
+from __future__ import annotations
+
+from flask import request
+from werkzeug.exceptions import BadRequest, NotFound
+
+from app.flask.lib.pywire import component_registry
+from app.modules.swork import blueprint
+from app.modules.swork.components.base import BaseList
+
+
+@blueprint.route("/lists/<name>/page")
+def list_page(name: str):
+    """Render the items after ``cursor`` for the ``name`` list
+    component, followed by the sentinel of the page after."""
+    component_class = component_registry.get(name)
+    if component_class is None or not issubclass(component_class, BaseList):
+        raise NotFound
+
+    component = component_class()
+    cursor = request.args.get("cursor", "")
+    try:
+        component.decode_page_cursor(cursor)
+    except ValueError:
+        raise BadRequest from None
+
+    component.restore_query_args(request.args)
+    return component.render_page(cursor, letter=request.args.get("letter", ""))
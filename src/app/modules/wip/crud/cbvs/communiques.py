@@ -23,7 +23,12 @@ from app.flask.extensions import db
 from app.flask.lib.templates import templated
 from app.flask.routing import url_for
 from app.flask.sqla import get_obj
-from app.lib.file_object_utils import create_file_object
+from app.lib.file_object_utils import (
+    VARIANT_SIZES,
+    create_file_object,
+    media_variant_url,
+    save_file_object,
+)
 from app.lib.image_utils import extract_image_from_request
 from app.logging import report_failure, warn
 from app.models.lifecycle import PublicationStatus
@@ -355,6 +360,7 @@ class CommuniquesWipView(BaseWipView):
             file_storage=request.files.get("image"),
             data_url=request.form.get("image"),
             orig_filename=request.form.get("image_filename") or None,
+            max_size=MAX_IMAGE_SIZE,
         )
 
         if result is None:
@@ -364,10 +370,10 @@ class CommuniquesWipView(BaseWipView):
         image_bytes = result.bytes
         image_filename = result.filename
         image_content_type = result.content_type
-        if len(image_bytes) >= MAX_IMAGE_SIZE:
+        if result.size >= MAX_IMAGE_SIZE:
             flash("L'image est trop volumineuse")
             return redirect(url_for("CommuniquesWipView:images", id=communique.id))
-        warn(image_filename, image_content_type, len(image_bytes))
+        warn(image_filename, image_content_type, result.size)
         caption = request.form.get("caption", "").strip()
         copyright = request.form.get("copyright", "").strip()
 
@@ -376,7 +382,7 @@ class CommuniquesWipView(BaseWipView):
             original_filename=image_filename,
             content_type=image_content_type,
         )
-        image_file_object.save()
+        save_file_object(image_file_object)
 
         position = len(communique.images)
 
@@ -403,6 +409,10 @@ class CommuniquesWipView(BaseWipView):
         image = next((im for im in communique.images if im.id == image_id), None)
         if image is None:
             raise NotFound
+        # `?size=card` etc.: a resized variant, for list pages.
+        size = request.args.get("size", "")
+        if size in VARIANT_SIZES:
+            return redirect(media_variant_url(image.content, size), code=301)
         return redirect(image.url, code=301)
 
     @route("/<int:communique_id>/images/<int:image_id>/delete", methods=["POST"])
@@ -23,7 +23,12 @@ from werkzeug.wrappers import Response
 from app.flask.extensions import db
 from app.flask.lib.templates import templated
 from app.flask.routing import url_for
-from app.lib.file_object_utils import create_file_object
+from app.lib.file_object_utils import (
+    VARIANT_SIZES,
+    create_file_object,
+    media_variant_url,
+    save_file_object,
+)
 from app.lib.image_utils import extract_image_from_request
 from app.logging import report_failure, warn
 from app.models.lifecycle import PublicationStatus
@@ -307,6 +312,7 @@ class EventsWipView(BaseWipView):
             file_storage=request.files.get("image"),
             data_url=request.form.get("image"),
             orig_filename=request.form.get("image_filename") or None,
+            max_size=MAX_IMAGE_SIZE,
         )
 
         if result is None:
@@ -316,7 +322,7 @@ class EventsWipView(BaseWipView):
         image_bytes = result.bytes
         image_filename = result.filename
         image_content_type = result.content_type
-        if len(image_bytes) >= MAX_IMAGE_SIZE:
+        if result.size >= MAX_IMAGE_SIZE:
             flash("L'image est trop volumineuse")
             return redirect(url_for("EventsWipView:images", id=event.id))
         caption = request.form.get("caption", "").strip()
@@ -327,7 +333,7 @@ class EventsWipView(BaseWipView):
             original_filename=image_filename,
             content_type=image_content_type,
         )
-        image_file_object.save()
+        save_file_object(image_file_object)
 
         position = len(event.images)
 
@@ -354,6 +360,10 @@ class EventsWipView(BaseWipView):
         image = next((im for im in event.images if im.id == image_id), None)
         if image is None:
             raise NotFound
+        # `?size=card` etc.: a resized variant, for list pages.
+        size = request.args.get("size", "")
+        if size in VARIANT_SIZES:
+            return redirect(media_variant_url(image.content, size), code=301)
         return redirect(image.url, code=301)
 
     @route("/<int:event_id>/images/<int:image_id>/delete", methods=["POST"])
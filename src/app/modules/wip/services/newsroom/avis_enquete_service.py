@@ -670,7 +670,7 @@ class AvisEnqueteService:
         suggested_by_name: str = "",
     ) -> None:
         """
-        Send notification emails to experts about an Avis d'Enquête.
+        Queue notification emails to experts about an Avis d'Enquête.
 
         Args:
             avis: The Avis d'Enquête
@@ -712,7 +712,9 @@ class AvisEnqueteService:
                 url=url,
                 suggested_by_name=suggested_by_name,
             )
-            notification_mail.send()
+            # Queued: the journalist's request doesn't wait on one SMTP
+            # round trip per expert.
+            notification_mail.queue()
 
     # ----------------------------------------------------------------
     # Suggestion (bug #0061): "Non, mais je vous suggère une personne de
@@ -9,7 +9,8 @@ Phase 0 MVP):
 
 1. `match_experts_to_avis(experts, avis)` — pre-scopes a candidate pool
    of experts to those with a thematic match and recent activity, with
-   a graceful fallback if the match is too narrow.
+   a graceful fallback if the match is too narrow. `match_avis_mask`
+   applies the same rules to an `ExpertIndex` bitset.
 
 2. `experts_over_notification_cap(session, experts, cap, days)` +
    `record_notifications(session, experts, avis)` — anti-spam layer
@@ -29,6 +30,8 @@ from app.modules.wip.models.newsroom.avis_notification_log import (
     AvisNotificationLog,
 )
 
+from .expert_selectors import SecteurSelector
+
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
@@ -36,6 +39,8 @@ if TYPE_CHECKING:
 
     from app.modules.wip.models.newsroom.avis_enquete import AvisEnquete
 
+    from .expert_index import ExpertIndex
+
 ACTIVITY_LOOKBACK_DAYS = 180
 MIN_CANDIDATES = 5
 NOTIFICATION_CAP = 10
@@ -74,6 +79,28 @@ def match_experts_to_avis(
     return matched
 
 
+def match_avis_mask(
+    index: ExpertIndex,
+    avis: AvisEnquete,
+    *,
+    lookback_days: int = ACTIVITY_LOOKBACK_DAYS,
+    min_candidates: int = MIN_CANDIDATES,
+) -> int:
+    """`match_experts_to_avis` over an `ExpertIndex`: same rules,
+    returns the bitset of the matching experts."""
+    cutoff = datetime.now(UTC) - timedelta(days=lookback_days)
+
+    active = index.logged_in_since(cutoff)
+    avis_sectors = _avis_sectors(avis)
+    if not avis_sectors:
+        return active
+
+    matched = active & index.union(SecteurSelector.id, avis_sectors)
+    if matched.bit_count() < min_candidates:
+        return active
+    return matched
+
+
 def experts_over_notification_cap(
     session: Session,
     experts: list[User],
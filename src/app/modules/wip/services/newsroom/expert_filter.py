@@ -11,8 +11,11 @@ from dataclasses import dataclass
 from typing import cast
 
 from flask import request
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 from svcs.flask import container
 
+from app.flask.extensions import db
 from app.models.auth import User
 from app.models.repositories import UserRepository
 from app.services.sessions import SessionService
@@ -20,26 +23,12 @@ from app.services.sessions import SessionService
 # FilterState : Type alias for filter state that can contain:
 # - Filter values (list[str]) for selectors like secteur, metier, etc.
 # - Expert IDs (list[int]) for selected_experts
+from .avis_matching import match_avis_mask
+from .expert_index import ExpertIndex, expert_index, filter_expert_ids
 from .expert_selectors import (
+    SELECTOR_CLASSES,
     BaseSelector,
-    CompetencesGeneralesSelector,
-    CompetencesJournalismeSelector,
-    DepartementSelector,
     FilterState,
-    FonctionAssociationsSyndicatsSelector,
-    FonctionJournalismeSelector,
-    FonctionOrganisationsPriveesSelector,
-    FonctionPolitiquesAdministrativesSelector,
-    FonctionSelector,
-    LanguesSelector,
-    MetierSelector,
-    PaysSelector,
-    SecteurSelector,
-    TailleOrganisationSelector,
-    TypeEntreprisePresseMediasSelector,
-    TypeOrganisationSelector,
-    TypePresseMediasSelector,
-    VilleSelector,
 )
 
 MAX_SELECTABLE_EXPERTS = 50
@@ -93,6 +82,9 @@ def apply_filter_pipeline(
     4. Sort by (last_name, first_name) so the table is alphabetical.
     5. Cap at ``max_count`` — the UI table has no pagination ;
        beyond 50 the journalist is told to refine.
+
+    `ExpertFilterService` runs the same rules on bitsets
+    (`expert_index.filter_expert_ids`).
     """
     if all(not state.get(s.id) for s in selectors):
         return experts[:max_count]
@@ -268,6 +260,9 @@ class ExpertFilterService:
     - Available filter options
     - Expert filtering and selection
 
+    Filtering and option counts run on an `ExpertIndex` (bitsets per
+    selector value); only the experts actually displayed are loaded.
+
     Usage:
         service = ExpertFilterService()
         service.initialize()
@@ -285,7 +280,9 @@ class ExpertFilterService:
         # `session` / `user_repo` are injectable — production leaves them
         # None and resolves the real services from the container ; tests
         # pass stubs (a dict for the session store, a fake repo) so they
-        # don't have to patch the DI container.
+        # don't have to patch the DI container. With a stub repo the
+        # index is built from it instead of the shared `expert_index`.
+        self._shared_index = user_repo is None
         self._session = (
             session if session is not None else container.get(SessionService)
         )
@@ -294,7 +291,9 @@ class ExpertFilterService:
             user_repo if user_repo is not None else container.get(UserRepository)
         )
         self._state: FilterState = {}
-        self._all_experts: list[User] | None = None
+        self._index: ExpertIndex | None = None
+        self._pool: int | None = None
+        self._experts_by_id: dict[int, User] = {}
         self._selectors: list[BaseSelector] | None = None
         self._avis_enquete = None
 
@@ -329,9 +328,14 @@ class ExpertFilterService:
         Returns:
             List of experts (limited to MAX_SELECTABLE_EXPERTS)
         """
-        return apply_filter_pipeline(
-            self._get_all_experts(), self._state, self._get_selectors()
+        ids = filter_expert_ids(
+            self._get_index(),
+            self._get_pool(),
+            self._state,
+            self._get_selectors(),
+            max_count=MAX_SELECTABLE_EXPERTS,
         )
+        return self._load_experts(ids)
 
     def get_selected_experts(self) -> list[User]:
         """
@@ -340,9 +344,9 @@ class ExpertFilterService:
         Returns:
             List of selected User entities
         """
-        selected_ids = set(self._state.get("selected_experts", []))
-        experts = self._get_all_experts()
-        return [e for e in experts if e.id in selected_ids]
+        index = self._get_index()
+        selected = index.mask(self._state.get("selected_experts", []))
+        return self._load_experts(index.ids_of(selected & self._get_pool()))
 
     def add_experts_from_request(self) -> None:
         """Add experts from form to current selection."""
@@ -427,45 +431,52 @@ class ExpertFilterService:
         """Extract expert IDs from form data."""
         yield from parse_expert_ids_from_form(request.form.to_dict())
 
-    def _get_all_experts(self) -> list[User]:
-        """Get all experts (cached).
+    def _get_index(self) -> ExpertIndex:
+        """Get the expert index (cached)."""
+        if self._index is None:
+            if self._shared_index:
+                self._index = expert_index.get()
+            else:
+                experts = list(self._user_repo.list(active=True))
+                self._experts_by_id = {e.id: e for e in experts}
+                self._index = ExpertIndex(
+                    experts, [cls({}, []) for cls in SELECTOR_CLASSES]
+                )
+        return self._index
+
+    def _get_pool(self) -> int:
+        """Bitset of the candidate experts (cached).
 
         When an `AvisEnquete` is set on the service (via `initialize`),
         the candidate pool is first pre-scoped with the MVP matchmaking
         pre-filter (thematic match + recent activity).
         """
-        if self._all_experts is None:
-            experts = self._user_repo.list(active=True)
+        if self._pool is None:
+            index = self._get_index()
             if self._avis_enquete is not None:
-                from app.modules.wip.services.newsroom.avis_matching import (
-                    match_experts_to_avis,
-                )
-
-                experts = match_experts_to_avis(experts, self._avis_enquete)
-            self._all_experts = experts
-        return self._all_experts
+                self._pool = match_avis_mask(index, self._avis_enquete)
+            else:
+                self._pool = index.all
+        return self._pool
+
+    def _load_experts(self, ids: list[int]) -> list[User]:
+        """Load the given experts with their profile, keeping ``ids`` order."""
+        missing = [id for id in ids if id not in self._experts_by_id]
+        if missing:
+            stmt = (
+                select(User.id, User)
+                .where(User.id.in_(missing))
+                .options(selectinload(User.profile))
+            )
+            self._experts_by_id.update(db.session.execute(stmt).tuples())
+        return [self._experts_by_id[id] for id in ids if id in self._experts_by_id]
 
     def _get_selectors(self) -> list[BaseSelector]:
         """Get all selectors (cached)."""
         if self._selectors is None:
-            experts = self._get_all_experts()
+            index = self._get_index()
+            pool = self._get_pool()
             self._selectors = [
-                SecteurSelector(self._state, experts),
-                MetierSelector(self._state, experts),
-                FonctionSelector(self._state, experts),
-                FonctionPolitiquesAdministrativesSelector(self._state, experts),
-                FonctionOrganisationsPriveesSelector(self._state, experts),
-                FonctionAssociationsSyndicatsSelector(self._state, experts),
-                FonctionJournalismeSelector(self._state, experts),
-                CompetencesGeneralesSelector(self._state, experts),
-                CompetencesJournalismeSelector(self._state, experts),
-                TypeEntreprisePresseMediasSelector(self._state, experts),
-                TypePresseMediasSelector(self._state, experts),
-                TypeOrganisationSelector(self._state, experts),
-                TailleOrganisationSelector(self._state, experts),
-                LanguesSelector(self._state, experts),
-                PaysSelector(self._state, experts),
-                DepartementSelector(self._state, experts),
-                VilleSelector(self._state, experts),
+                cls(self._state, [], index=index, pool=pool) for cls in SELECTOR_CLASSES
             ]
         return self._selectors
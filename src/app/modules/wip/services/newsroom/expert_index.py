@@ -0,0 +1,189 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Inverted index over the ciblage dimensions of every expert.
+
+The ciblage screen shows, for each option of the 17 selectors, how
+many experts of the candidate pool hold it, and ANDs the selected
+criteria across selectors. Done over `User` objects, that is a walk
+over every expert profile per selector and per HTMX re-render.
+
+`ExpertIndex` walks them once. Each expert gets a bit position (in
+alphabetical order, so the lowest bits are the first rows of the
+table) and each (selector id, value) pair a Python `int` used as a
+bitset of the experts holding it. Filtering is then `&` / `|`, and the
+`(N)` badges are `int.bit_count()`.
+
+The index only keeps ids and last-login dates, never ORM instances,
+so the process-wide copy (`expert_index`) can outlive the session that
+built it. It is dropped when a user or KYC profile is flushed, and
+after `EXPERT_INDEX_TTL` seconds in the other worker processes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+
+from sqlalchemy import select, true
+from sqlalchemy.orm import selectinload
+
+from app.flask.extensions import db
+from app.lib.facets import FacetCache
+from app.models.auth import KYCProfile, User
+
+from .expert_selectors import SELECTOR_CLASSES, BaseSelector, FilterState
+
+EXPERT_INDEX_TTL = 300
+
+
+class ExpertIndex:
+    """Bitsets of experts, per selector and per value."""
+
+    def __init__(
+        self, experts: Iterable[User], selectors: Iterable[BaseSelector]
+    ) -> None:
+        # Stable sort, same key as the result table.
+        ordered = sorted(experts, key=lambda e: (e.last_name, e.first_name))
+        selectors = list(selectors)
+
+        self.ids: list[int] = [e.id for e in ordered]
+        self.all: int = (1 << len(ordered)) - 1
+        self._positions = {id: pos for pos, id in enumerate(self.ids)}
+        self._last_logins = [_aware(e.last_login_at) for e in ordered]
+
+        held: dict[str, dict[str, list[int]]] = {s.id: {} for s in selectors}
+        for pos, expert in enumerate(ordered):
+            for selector in selectors:
+                by_value = held[selector.id]
+                for value in selector._expert_values(expert):
+                    by_value.setdefault(value, []).append(pos)
+
+        size = len(ordered)
+        self._bits: dict[str, dict[str, int]] = {
+            selector_id: {
+                value: _to_bits(positions, size)
+                for value, positions in by_value.items()
+            }
+            for selector_id, by_value in held.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def mask(self, ids: Iterable[int]) -> int:
+        """Bitset of the given expert ids (unknown ids are ignored)."""
+        bits = 0
+        for id in ids:
+            pos = self._positions.get(id)
+            if pos is not None:
+                bits |= 1 << pos
+        return bits
+
+    def union(self, selector_id: str, values: Iterable[str]) -> int:
+        """Experts holding at least one of ``values`` for this selector."""
+        by_value = self._bits.get(selector_id, {})
+        bits = 0
+        for value in values:
+            bits |= by_value.get(value, 0)
+        return bits
+
+    def counts(self, selector_id: str, within: int) -> dict[str, int]:
+        """Per-value count of the experts of ``within`` holding it.
+
+        Values no expert of ``within`` holds are left out, like the
+        `Counter` this replaces."""
+        result: dict[str, int] = {}
+        for value, bits in self._bits.get(selector_id, {}).items():
+            count = (bits & within).bit_count()
+            if count:
+                result[value] = count
+        return result
+
+    def logged_in_since(self, cutoff: datetime) -> int:
+        """Experts whose last login is at or after ``cutoff``."""
+        bits = 0
+        for pos, last in enumerate(self._last_logins):
+            if last is not None and last >= cutoff:
+                bits |= 1 << pos
+        return bits
+
+    def ids_of(self, bits: int, limit: int | None = None) -> list[int]:
+        """Expert ids of ``bits``, in alphabetical order."""
+        result: list[int] = []
+        for pos in _positions(bits):
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(self.ids[pos])
+        return result
+
+
+def filter_expert_ids(
+    index: ExpertIndex,
+    pool: int,
+    state: FilterState,
+    selectors: list[BaseSelector],
+    *,
+    max_count: int,
+) -> list[int]:
+    """`apply_filter_pipeline` over bitsets: same rules, on ids.
+
+    Every selector keeps the experts holding any of its criteria, so
+    a selector is the union of its values' bitsets and the pipeline is
+    the intersection of those. Positions follow alphabetical order,
+    hence no sort.
+    """
+    if all(not state.get(s.id) for s in selectors):
+        return index.ids_of(pool, max_count)
+
+    bits = pool
+    for selector in selectors:
+        selected_values = state.get(selector.id)
+        if not selected_values:
+            continue
+        criteria = (
+            {str(v) for v in selected_values}
+            if isinstance(selected_values, list)
+            else {str(selected_values)}
+        )
+        bits &= index.union(selector.id, criteria)
+
+    bits &= ~index.mask(state.get("selected_experts", []))
+    return index.ids_of(bits, max_count)
+
+
+def build_expert_index() -> ExpertIndex:
+    """Index every active user on every ciblage selector."""
+    stmt = select(User).where(User.active == true()).options(selectinload(User.profile))
+    selectors = [cls({}, []) for cls in SELECTOR_CLASSES]
+    return ExpertIndex(db.session.scalars(stmt), selectors)
+
+
+# Shared by every ciblage request, rebuilt after a user or KYC profile
+# change.
+expert_index = FacetCache(
+    build_expert_index, watch=(User, KYCProfile), ttl=EXPERT_INDEX_TTL
+)
+
+
+def _to_bits(positions: list[int], size: int) -> int:
+    # One `int.from_bytes` instead of one big-int OR per position.
+    buf = bytearray((size + 7) // 8)
+    for pos in positions:
+        buf[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _positions(bits: int) -> Iterator[int]:
+    # Formatting in base 2 is a single C pass, cheaper than peeling
+    # bits off a big int one at a time.
+    for pos, digit in enumerate(reversed(f"{bits:b}")):
+        if digit == "1":
+            yield pos
+
+
+def _aware(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
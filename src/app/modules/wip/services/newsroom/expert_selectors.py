@@ -36,7 +36,7 @@ from collections import Counter
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from app.models.auth import User
 from app.modules.kyc.field_label import (
@@ -46,6 +46,9 @@ from app.modules.kyc.field_label import (
 from app.modules.kyc.lib.dual_select_multi import convert_dual_choices_js
 from app.services.taxonomies import get_taxonomy, get_taxonomy_dual_select
 
+if TYPE_CHECKING:
+    from .expert_index import ExpertIndex
+
 # Type alias for filter state that can contain:
 # - Filter values (list[str]) for selectors like secteur, metier, etc.
 # - Expert IDs (list[int]) for selected_experts
@@ -91,6 +94,11 @@ class BaseSelector(abc.ABC):
     - `_expert_values(expert)` — extracts the values this expert has
       for this dimension. Used both to compute per-option counts and
       to filter the expert pool.
+
+    When an `ExpertIndex` is passed, the candidate pool is the
+    ``pool`` bitset of that index (all of it by default) and
+    ``experts`` is not read: counts and held values come from the
+    index instead of a walk over the profiles.
     """
 
     id: str
@@ -107,9 +115,15 @@ class BaseSelector(abc.ABC):
         *,
         taxonomy_loader: TaxonomyLoader | None = None,
         dual_taxonomy_loader: DualTaxonomyLoader | None = None,
+        index: ExpertIndex | None = None,
+        pool: int | None = None,
     ) -> None:
         self._state = state
         self._experts = experts
+        self._index = index
+        if pool is None:
+            pool = index.all if index is not None else 0
+        self._pool = pool
         # Default to the real DB-backed loaders; tests pass in stand-ins
         # so the unit boundary stays free of Flask app / SQL / KYC boot.
         self._taxonomy_loader: TaxonomyLoader = (
@@ -150,8 +164,7 @@ class BaseSelector(abc.ABC):
         result: set[str] = set(self.values)
         if self.taxonomy_name:
             result.update(self._taxonomy_loader(self.taxonomy_name))
-        for expert in self._experts:
-            result.update(self._expert_values(expert))
+        result.update(self._count_by_value)
         return result
 
     @abc.abstractmethod
@@ -179,6 +192,8 @@ class BaseSelector(abc.ABC):
         without intending to render options doesn't pay (or trip on)
         the expert profile iteration.
         """
+        if self._index is not None:
+            return self._index.counts(self.id, self._pool)
         counter: Counter[str] = Counter()
         for expert in self._experts:
             for value in self._expert_values(expert):
@@ -469,8 +484,7 @@ class FonctionSelector(BaseSelector):
             "profession_fonction_asso",
         ):
             result.update(self._taxonomy_loader(tx))
-        for expert in self._experts:
-            result.update(self._expert_values(expert))
+        result.update(self._count_by_value)
         return result
 
 
@@ -614,6 +628,9 @@ class DepartementSelector(BaseSelector):
             country_criteria: set[str] = {selected_countries}
         else:
             country_criteria = {str(v) for v in selected_countries}
+        if self._index is not None:
+            pool = self._pool & self._index.union(PaysSelector.id, country_criteria)
+            return set(self._index.counts(self.id, pool))
         return {
             u.profile.departement
             for u in self._experts
@@ -649,6 +666,11 @@ class VilleSelector(BaseSelector):
             departement_criteria: set[str] = {selected_departements}
         else:
             departement_criteria = {str(v) for v in selected_departements}
+        if self._index is not None:
+            pool = self._pool & self._index.union(
+                DepartementSelector.id, departement_criteria
+            )
+            return set(self._index.counts(self.id, pool))
         return {
             u.profile.ville
             for u in self._experts
@@ -663,3 +685,25 @@ class VilleSelector(BaseSelector):
         if not criteria:
             return experts
         return [e for e in experts if e.profile.ville in criteria]
+
+
+# Every ciblage selector, in the order of the form.
+SELECTOR_CLASSES: tuple[type[BaseSelector], ...] = (
+    SecteurSelector,
+    MetierSelector,
+    FonctionSelector,
+    FonctionPolitiquesAdministrativesSelector,
+    FonctionOrganisationsPriveesSelector,
+    FonctionAssociationsSyndicatsSelector,
+    FonctionJournalismeSelector,
+    CompetencesGeneralesSelector,
+    CompetencesJournalismeSelector,
+    TypeEntreprisePresseMediasSelector,
+    TypePresseMediasSelector,
+    TypeOrganisationSelector,
+    TailleOrganisationSelector,
+    LanguesSelector,
+    PaysSelector,
+    DepartementSelector,
+    VilleSelector,
+)
@@ -7,7 +7,8 @@
 Called by the Newsroom views (mode A — from an existing avis
 d'enquête — and mode B — free-form recipient targeting). Creates the
 `NotificationPublication` + per-contact rows, posts the in-app
-notifications and sends one transactional email per recipient.
+notifications and queues one transactional email per recipient (sent
+in batches by the mail outbox worker).
 
 Policy decisions frozen by SF (2026-04-24) :
 
@@ -378,7 +379,7 @@ class PublicationNotificationService:
                 message=message,
                 opportunities_url=target_url,
             )
-            PublicationNotificationMail(**kwargs).send()
+            PublicationNotificationMail(**kwargs).queue()
 
         return notif, skipped
 
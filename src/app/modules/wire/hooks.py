@@ -8,16 +8,20 @@
   cession-de-droits policy onto the Post the first time it reaches
   `PublicationStatus.PUBLIC`. Non-retroactive — subsequent updates
   never overwrite the snapshot.
+- `_refresh_purchase_counters`: keeps the popularity counters of the
+  Posts (« vues », « ventes ») in step with their `ArticlePurchase`
+  rows, whatever code path flushed them (Stripe webhook, gifts...).
 """
 
 from __future__ import annotations
 
 import sqlalchemy as sa
 import sqlalchemy.event
-from sqlalchemy.orm import attributes
+from sqlalchemy.orm import Session, attributes
+from sqlalchemy.orm.util import identity_key
 
 from app.models.lifecycle import PublicationStatus
-from app.modules.wire.models import Post
+from app.modules.wire.models import ArticlePurchase, ArticlePurchaseGift, Post
 
 
 def _status_transitions_to_public(target: Post) -> bool:
@@ -56,3 +60,37 @@ def _snapshot_rights_policy_on_update(_mapper, _connection, target: Post) -> Non
 def _snapshot_rights_policy_on_insert(_mapper, _connection, target: Post) -> None:
     if target.status == PublicationStatus.PUBLIC:
         _freeze_policy(target)
+
+
+@sa.event.listens_for(Session, "after_flush")
+def _refresh_purchase_counters(session: Session, _flush_context) -> None:
+    post_ids: set[int] = set()
+    gift_purchase_ids: set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, ArticlePurchase):
+            post_ids.add(obj.post_id)
+        elif isinstance(obj, ArticlePurchaseGift):
+            gift_purchase_ids.add(obj.purchase_id)
+    if not (post_ids or gift_purchase_ids):
+        return
+
+    from app.modules.wire.services.purchase_aggregates import (
+        refresh_purchase_counters,
+    )
+
+    connection = session.connection()
+    if gift_purchase_ids:
+        post_ids.update(
+            connection.scalars(
+                sa.select(ArticlePurchase.post_id).where(
+                    ArticlePurchase.id.in_(gift_purchase_ids)
+                )
+            )
+        )
+    refresh_purchase_counters(post_ids, connection=connection)
+
+    # The UPDATE bypassed the ORM: reload the counters on next access.
+    for post_id in post_ids:
+        post = session.identity_map.get(identity_key(Post, post_id))
+        if post is not None:
+            session.expire(post, ["paid_consultation_count", "sales_amount_cents"])
@@ -158,6 +158,18 @@ class Post(NewsMetadataMixin, BaseContent, LifeCycleMixin):
         JSON, nullable=True, default=None
     )
 
+    # Popularity counters for the « Trier » menu of the wall, kept up to
+    # date from the purchases by `refresh_purchase_counters` (see
+    # `app.modules.wire.services.purchase_aggregates`). Sorting on plain
+    # columns keeps deep pages of the wall cheap.
+    #: PAID consultations still within their duration, gifts included
+    #: (« vues »)
+    paid_consultation_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    #: cumul HT (cents) of every PAID purchase (« ventes »)
+    sales_amount_cents: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default="0"
+    )
+
     @orm.declared_attr
     def publisher(cls):
         return orm.relationship(
@@ -176,6 +188,18 @@ class Post(NewsMetadataMixin, BaseContent, LifeCycleMixin):
     # taille_contenu: Mapped[str] = mapped_column(default="")
 
 
+# Keyset pagination of the wall, by date and by the purchase counters
+# (see `SORT_KEYS` in `wire.views._tabs`). `Post` shares its table with
+# the other contents, hence no `__table_args__`.
+sa.Index("ix_frt_content_published_at_id", Post.published_at, Post.id)
+sa.Index(
+    "ix_frt_content_paid_consultation_count_id",
+    Post.paid_consultation_count,
+    Post.id,
+)
+sa.Index("ix_frt_content_sales_amount_cents_id", Post.sales_amount_cents, Post.id)
+
+
 class ArticlePost(Post, Taggable):
     __mapper_args__: ClassVar[dict] = {
         "polymorphic_identity": "article",
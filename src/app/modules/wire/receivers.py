@@ -14,8 +14,10 @@ from sqlalchemy import select
 from app.constants import LOCAL_TZ
 from app.flask.extensions import db
 from app.models.lifecycle import PublicationStatus
+from app.modules.common.components.post_card import POST_CARD
 from app.modules.wip.models import Article, Communique
 from app.modules.wire.models import ArticlePost, PressReleasePost
+from app.services.fragments import fragment_cache
 from app.signals import (
     article_published,
     article_unpublished,
@@ -61,6 +63,7 @@ def on_article_unpublished(article: Article) -> None:
 
     db.session.add(post)
     db.session.flush()
+    fragment_cache.invalidate(POST_CARD, post.id)
 
 
 @article_updated.connect
@@ -74,6 +77,7 @@ def on_article_updated(article: Article) -> None:
 
     db.session.add(post)
     db.session.flush()
+    fragment_cache.invalidate(POST_CARD, post.id)
 
 
 def get_article_post(article: Article) -> ArticlePost | None:
@@ -131,6 +135,7 @@ def on_communique_unpublished(communique: Communique) -> None:
 
     db.session.add(post)
     db.session.flush()
+    fragment_cache.invalidate(POST_CARD, post.id)
 
 
 @communique_updated.connect
@@ -144,6 +149,7 @@ def on_communique_updated(communique: Communique) -> None:
 
     db.session.add(post)
     db.session.flush()
+    fragment_cache.invalidate(POST_CARD, post.id)
 
 
 def get_communique_post(communique: Communique) -> PressReleasePost | None:
@@ -19,7 +19,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, NamedTuple
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.orm import aliased
 
 from app.flask.extensions import db
@@ -30,8 +30,11 @@ from app.modules.wire.services.consultation_helpers import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from datetime import datetime
 
+    from sqlalchemy.engine import Connection
+
 
 def get_user_purchase_total(user_id: int | None) -> int:
     """Return the cumul HT (cents) of `user`'s PAID article purchases.
@@ -301,6 +304,59 @@ def paid_consultation_count_subquery(post_id_col):
     return direct + gifted
 
 
+def sales_amount_subquery(post_id_col):
+    """Return a scalar SQLAlchemy expression that yields the cumul HT
+    (cents) of every PAID purchase on the row identified by
+    `post_id_col` — the « Ventes » counter, same rule as
+    `get_post_sales_amount`."""
+    return (
+        select(func.coalesce(func.sum(ArticlePurchase.amount_cents), 0))
+        .where(ArticlePurchase.post_id == post_id_col)
+        .where(ArticlePurchase.status == PurchaseStatus.PAID)
+        .scalar_subquery()
+    )
+
+
+def refresh_purchase_counters(
+    post_ids: Collection[int] | None = None,
+    *,
+    connection: Connection | None = None,
+) -> None:
+    """Recompute the denormalized `Post.paid_consultation_count` and
+    `Post.sales_amount_cents` from the purchases, in one UPDATE.
+
+    The wall sorts on these columns rather than on correlated
+    subqueries. `post_ids` limits the update to the posts whose
+    purchases just changed (see `wire.hooks`); `None` refreshes every
+    post that has, or had, a purchase — which is how consultations
+    leaving their duration window stop counting (daily, see
+    `app.actors.wire`).
+    """
+    from app.modules.wire.models import Post
+
+    content = Post.__table__
+    stmt = update(content).values(
+        paid_consultation_count=paid_consultation_count_subquery(content.c.id),
+        sales_amount_cents=sales_amount_subquery(content.c.id),
+    )
+    if post_ids is None:
+        stmt = stmt.where(
+            or_(
+                content.c.id.in_(select(ArticlePurchase.post_id)),
+                content.c.paid_consultation_count > 0,
+                content.c.sales_amount_cents > 0,
+            )
+        )
+    elif post_ids:
+        stmt = stmt.where(content.c.id.in_(post_ids))
+    else:
+        return
+    if connection is None:
+        db.session.execute(stmt)
+    else:
+        connection.execute(stmt)
+
+
 def get_paid_consultations_count(post_id: int | None) -> int:
     """Return the number of PAID CONSULTATION purchases on `post_id`.
 
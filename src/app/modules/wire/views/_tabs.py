@@ -9,27 +9,24 @@ from collections.abc import Iterable
 from operator import itemgetter
 from typing import ClassVar
 
+import arrow
 import sqlalchemy as sa
 from flask import g, session
 from pipe import groupby
-from sqlalchemy.orm import selectin_polymorphic, selectinload
+from sqlalchemy.orm import InstrumentedAttribute, selectin_polymorphic, selectinload
 
 from app.flask.extensions import db
 from app.flask.sqla import get_multi
+from app.lib.pagination import Page, decode_cursor, encode_cursor
 from app.models.auth import User
 from app.models.lifecycle import PublicationStatus
 from app.models.organisation import Organisation
 from app.modules.bw.bw_activation.user_utils import (
     filter_agency_org_ids,
 )
-from app.modules.wire.models import (
-    ArticlePost,
-    ArticlePurchase,
-    Post,
-    PressReleasePost,
-    PurchaseStatus,
-)
+from app.modules.wire.models import ArticlePost, Post, PressReleasePost
 from app.services.social_graph import adapt
+from app.services.tagging import tagged_with
 
 from ._filters import FilterBar
 
@@ -44,8 +41,18 @@ ALLOWED_FILTER_FIELDS = {
     "ville",
 }
 
+# Posts per page of the wall (the next ones are loaded on scroll)
 DEFAULT_POSTS_LIMIT = 30
 
+#: Sort column of each « Trier » option, by default `Post.published_at`
+#: (« Date »). Ties are broken by `Post.id`.
+SORT_KEYS: dict[str, InstrumentedAttribute] = {
+    "views": Post.paid_consultation_count,
+    "sales": Post.sales_amount_cents,
+    "likes": Post.like_count,
+    "comments": Post.comment_count,
+}
+
 
 def _members_of_orgs(org_ids: set[int]) -> set[User]:
     """All members of the given orgs in one query — batches what was a
@@ -57,6 +64,42 @@ def _members_of_orgs(org_ids: set[int]) -> set[User]:
     )
 
 
+def get_sort_key(sort_order: str) -> InstrumentedAttribute:
+    """The column the wall is sorted on for a « Trier » option.
+
+    Ticket #0193 — « Popularité (vues) » and « Ventes » feed off PAID
+    article purchases, not the raw `Post.view_count`. They read the
+    counters maintained from the purchases (see `wire.hooks`), so every
+    sort is on a plain column and deep pages stay cheap.
+    """
+    return SORT_KEYS.get(sort_order, Post.published_at)
+
+
+def _cursor_values(sort_key: InstrumentedAttribute, post: Post) -> tuple:
+    value = getattr(post, sort_key.key)
+    if sort_key.key == "published_at" and value is not None:
+        value = value.isoformat()
+    return value, post.id
+
+
+def _decode_cursor_values(sort_key: InstrumentedAttribute, cursor: str) -> tuple:
+    """Inverse of `_cursor_values`. Raise ``ValueError`` on a malformed
+    cursor."""
+    values = decode_cursor(cursor)
+    if len(values) != 2:
+        raise ValueError(cursor)
+    value, post_id = values
+    if sort_key.key == "published_at":
+        if not isinstance(value, str):
+            raise ValueError(cursor)
+        value = arrow.get(value)
+    elif not isinstance(value, int):
+        raise ValueError(cursor)
+    if not isinstance(post_id, int):
+        raise ValueError(cursor)
+    return value, post_id
+
+
 def get_tabs() -> list[Tab]:
     return [
         WallTab(),
@@ -78,7 +121,16 @@ class Tab(abc.ABC):
         return session["wire:tab"] == self.id
 
     def get_posts(self, filter_bar: FilterBar) -> list[Post]:
-        stmt = self.get_stmt(filter_bar)
+        """The first page of posts."""
+        return self.get_page(filter_bar).items
+
+    def get_page(self, filter_bar: FilterBar, cursor: str = "") -> Page:
+        """The posts after ``cursor`` (the first ones without it), and
+        the cursor of the next page if there is one.
+
+        Raise ``ValueError`` on a malformed cursor.
+        """
+        stmt = self.get_stmt(filter_bar, cursor)
 
         authors = self.get_authors()
         # Only filter by author if there are specific authors to filter by
@@ -88,56 +140,33 @@ class Tab(abc.ABC):
             stmt = stmt.where(Post.owner_id.in_(author_ids))
 
         posts = get_multi(Post, stmt)
-        return posts
+        if len(posts) <= DEFAULT_POSTS_LIMIT:
+            return Page(posts)
+        posts = posts[:DEFAULT_POSTS_LIMIT]
+        sort_key = get_sort_key(filter_bar.sort_order)
+        values = _cursor_values(sort_key, posts[-1])
+        if values[0] is None:
+            # Can't page past a post without sort value (no `published_at`)
+            return Page(posts)
+        return Page(posts, encode_cursor(values))
 
     def get_authors(self) -> Iterable[User]:
         """Override in subclasses to filter by certain authors."""
         return []
 
-    def get_stmt(self, filter_bar: FilterBar) -> sa.Select:
+    def get_stmt(self, filter_bar: FilterBar, cursor: str = "") -> sa.Select:
+        """One page of posts, plus one to tell whether another follows.
+
+        Posts are ordered by the sort key of `filter_bar` then by id,
+        both descending, and paginated by keyset on that pair.
+        """
         active_filters = filter_bar.active_filters
-        sort_order = filter_bar.sort_order
-
-        # Ticket #0193 — « Popularité (vues) » and « Ventes » in the
-        # Trier menu both feed off PAID article purchases now, not the
-        # raw `Post.view_count`. Each is a scalar subquery so the wall
-        # query stays a single SELECT.
-        match sort_order:
-            case "views":
-                # Reuse the same expression as
-                # `get_paid_consultations_count` (direct + gift
-                # beneficiaries). Otherwise the wall sort orders by a
-                # number different from the eye-icon counter displayed
-                # on the card — same article shows « 25 vues » but
-                # sits below an article showing « 10 vues ».
-                from app.modules.wire.services.purchase_aggregates import (
-                    paid_consultation_count_subquery,
-                )
-
-                order = paid_consultation_count_subquery(Post.id).desc()
-            case "sales":
-                sales_amount = (
-                    sa.select(
-                        sa.func.coalesce(sa.func.sum(ArticlePurchase.amount_cents), 0)
-                    )
-                    .select_from(ArticlePurchase)
-                    .where(ArticlePurchase.post_id == Post.id)
-                    .where(ArticlePurchase.status == PurchaseStatus.PAID)
-                    .correlate(Post)
-                    .scalar_subquery()
-                )
-                order = sales_amount.desc()
-            case "likes":
-                order = Post.like_count.desc()
-            case "comments":
-                order = Post.comment_count.desc()
-            case _:
-                order = Post.published_at.desc()
+        sort_key = get_sort_key(filter_bar.sort_order)
 
         stmt = (
             sa.select(Post)
             .where(Post.status == PublicationStatus.PUBLIC)
-            .order_by(order)
+            .order_by(sort_key.desc(), Post.id.desc())
             .options(
                 # Each card reads the author's org (name), profile (job
                 # title) and roles (community colour via profile_image) —
@@ -156,19 +185,25 @@ class Tab(abc.ABC):
                 # columns was a SELECT-per-card refresh (single-table poly).
                 selectin_polymorphic(Post, [ArticlePost, PressReleasePost]),
             )
-            .limit(DEFAULT_POSTS_LIMIT)
+            .limit(DEFAULT_POSTS_LIMIT + 1)
         )
+        if cursor:
+            after = _decode_cursor_values(sort_key, cursor)
+            stmt = stmt.where(sa.tuple_(sort_key, Post.id) < after)
 
         if self.post_type_allow:
             stmt = stmt.where(Post.type.in_(self.post_type_allow))
 
         for filter_id, filter_values in active_filters | groupby(itemgetter("id")):
+            values = {f["value"] for f in filter_values}
             if filter_id == "tag":
+                # In the query, not on the page: a tag filter applied
+                # after the LIMIT returned short pages.
+                stmt = stmt.where(tagged_with(Post.id, values))
                 continue
             # Use explicit allowlist instead of hasattr for security
             if filter_id not in ALLOWED_FILTER_FIELDS:
                 continue
-            values = {f["value"] for f in filter_values}
             where_clause = getattr(Post, filter_id).in_(values)
             stmt = stmt.where(where_clause)
 
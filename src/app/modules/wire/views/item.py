@@ -43,10 +43,9 @@ from app.modules.wire.models import (
     PurchaseProduct,
 )
 from app.modules.wire.views.purchase import _price_id_for
-from app.services.social_graph import SocialUser, adapt
 from app.services.stripe.utils import load_stripe_api_key
 from app.services.tagging import get_tags
-from app.services.tracking import record_view
+from app.services.tracking import record_view, toggle_like
 
 # Cache formatted Stripe price strings for the paywall button.
 _CONSULTATION_PRICE_CACHE: TTLCache[str, str] = TTLCache(maxsize=256, ttl=3600)
@@ -199,13 +198,7 @@ class ItemDetailView(MethodView):
 
     def _toggle_like(self, article) -> str:
         """Toggle like status for the current user on the given article."""
-        user: SocialUser = adapt(g.user)
-        if user.is_liking(article):
-            user.unlike(article)
-        else:
-            user.like(article)
-        db.session.flush()
-        article.like_count = adapt(article).num_likes()
+        toggle_like(g.user, article)
         db.session.commit()
         return str(article.like_count)
 
@@ -6,20 +6,22 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
 from typing import TYPE_CHECKING, ClassVar
 
 from attr import define
 from flask import redirect, render_template, request, session
 from flask.views import MethodView
 from werkzeug import Response
-from werkzeug.exceptions import NotFound
+from werkzeug.exceptions import BadRequest, NotFound
 
 from app.flask.lib.nav import nav
 from app.flask.routing import url_for
+from app.modules.common.components.post_card import render_post_cards
 from app.modules.wire import blueprint
 
 if TYPE_CHECKING:
+    from app.lib.pagination import Page
+
     from ._filters import FilterBar
     from ._tabs import Tab
 
@@ -77,6 +79,16 @@ class WireTabView(MethodView):
             filter_bar.set_tag(tag)
             return redirect(url_for(".wire_tab", tab="wall"))
 
+        if "after" in request.args:
+            # Infinite scroll: the cards after the cursor, requested by
+            # the sentinel at the end of the previous page.
+            page = self._get_page(tabs, filter_bar, request.args["after"])
+            return render_template(
+                "pages/wire/cards.j2",
+                cards=render_post_cards(page.items),
+                next_page_url=self._next_page_url(tab, page),
+            )
+
         return self._render_wire(tab, filter_bar, tabs)
 
     def post(self, tab: str):
@@ -92,10 +104,12 @@ class WireTabView(MethodView):
         filter_bar = FilterBar(tab)
         filter_bar.update_state()
 
-        posts = self._get_posts(tabs, filter_bar)
+        page = self._get_page(tabs, filter_bar)
         return render_template(
             "pages/wire/main.j2",
-            posts=posts,
+            posts=page.items,
+            cards=render_post_cards(page.items),
+            next_page_url=self._next_page_url(tab, page),
             tabs=self._build_tabs(tabs),
             tab=tab,
             filter_bar=filter_bar,
@@ -103,14 +117,16 @@ class WireTabView(MethodView):
 
     def _render_wire(self, tab: str, filter_bar: FilterBar, tabs: list[Tab]) -> str:
         """Render the wire page."""
-        posts = self._get_posts(tabs, filter_bar)
+        posts_page = self._get_page(tabs, filter_bar)
         page = WirePageContext()
 
         return render_template(
             "pages/wire.j2",
             title="News",
             page=page,
-            posts=posts,
+            posts=posts_page.items,
+            cards=render_post_cards(posts_page.items),
+            next_page_url=self._next_page_url(tab, posts_page),
             tabs=self._build_tabs(tabs),
             tab=tab,
             filter_bar=filter_bar,
@@ -131,10 +147,15 @@ class WireTabView(MethodView):
             )
         return result
 
-    def _get_posts(self, tabs: list[Tab], filter_bar: FilterBar) -> list:
-        """Get posts for the active tab."""
-        from app.services.tagging import get_tags
+    def _next_page_url(self, tab: str, page: Page) -> str:
+        if not page.next_cursor:
+            return ""
+        return url_for(".wire_tab", tab=tab, after=page.next_cursor)
 
+    def _get_page(
+        self, tabs: list[Tab], filter_bar: FilterBar, cursor: str = ""
+    ) -> Page:
+        """Get a page of posts for the active tab."""
         active_tab = None
         for tab in tabs:
             if tab.is_active:
@@ -145,24 +166,12 @@ class WireTabView(MethodView):
             msg = "No active tab found"
             raise RuntimeError(msg)
 
-        posts = active_tab.get_posts(filter_bar)
-        posts = self._filter_posts_by_tag(posts, filter_bar, get_tags)
-        _annotate_paid_consultations(posts)
-        return posts
-
-    def _filter_posts_by_tag(
-        self, posts: list, filter_bar: FilterBar, get_tags: Callable
-    ) -> list:
-        """Filter posts by tag if specified."""
-        if not (tag := filter_bar.tag):
-            return posts
-
-        filtered_posts = []
-        for post in posts:
-            tags = [t["label"] for t in get_tags(post)]
-            if tag in tags:
-                filtered_posts.append(post)
-        return filtered_posts
+        try:
+            page = active_tab.get_page(filter_bar, cursor)
+        except ValueError:
+            raise BadRequest from None
+        _annotate_paid_consultations(page.items)
+        return page
 
 
 def _annotate_paid_consultations(posts: list) -> None:
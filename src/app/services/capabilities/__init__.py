@@ -0,0 +1,26 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+from __future__ import annotations
+
+from ._cache import (
+    CapabilityCache,
+    can_use_capabilities,
+    capability_cache,
+    get_capabilities,
+)
+from ._hooks import bump_permissions_version
+from ._loader import load_capabilities
+from ._models import NO_CAPABILITIES, Capabilities
+
+__all__ = [
+    "NO_CAPABILITIES",
+    "Capabilities",
+    "CapabilityCache",
+    "bump_permissions_version",
+    "can_use_capabilities",
+    "capability_cache",
+    "get_capabilities",
+    "load_capabilities",
+]
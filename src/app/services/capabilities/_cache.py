@@ -0,0 +1,124 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Per-process cache of the user capabilities.
+
+Roles, menus, the nav tree and the BW selector check what a user may
+do on every request. The answers are compiled once into a
+`Capabilities` object, kept per process under the permissions version
+of the user (`User.permissions_version`), and memoized per request (in
+the WSGI environ: `g` lives as long as the app context, which several
+requests can share).
+
+The version is bumped by the flush that changes the roles or the BW
+role assignments of a user (see `_hooks`), so every worker sees a
+change on the next request of that user. Until their transaction is
+committed, the users it changed are not cached (a rollback would reuse
+the version for other permissions).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+
+from flask import current_app, has_app_context, has_request_context, request
+from sqlalchemy import inspect
+
+from app.models.auth import User
+
+from ._loader import load_capabilities
+from ._models import NO_CAPABILITIES, Capabilities
+
+# Above this many users, the cache starts over.
+MAX_ENTRIES = 10_000
+
+# `Session.info` key: ids of the users changed by the current transaction.
+PENDING_KEY = "capabilities:pending_users"
+
+# WSGI environ key of the per-request memo.
+MEMO_KEY = "app.capabilities"
+
+
+class CapabilityCache:
+    """`Capabilities` per user id, for one permissions version."""
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[int, Capabilities]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, user_id: int, version: int, load: Callable[[], Capabilities]
+    ) -> Capabilities:
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        capabilities = load()
+        with self._lock:
+            if len(self._entries) >= MAX_ENTRIES:
+                self._entries.clear()
+            self._entries[user_id] = (version, capabilities)
+        return capabilities
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+#: The cache of this process.
+capability_cache = CapabilityCache()
+
+
+def get_capabilities(user: User) -> Capabilities:
+    """The capabilities of `user`, built at most once per request and
+    permissions version."""
+    if user.is_anonymous:
+        return NO_CAPABILITIES
+
+    if _is_pending(user):
+        # Changed in this transaction: build from the current state.
+        return load_capabilities(user)
+
+    user_id: int = user.id
+    version: int = user.permissions_version
+    memo = _request_memo()
+    key = (user_id, version)
+    if key in memo:
+        return memo[key]
+
+    if current_app.config.get("CAPABILITY_CACHE", True):
+        capabilities = capability_cache.get(
+            user_id, version, lambda: load_capabilities(user)
+        )
+    else:
+        capabilities = load_capabilities(user)
+    memo[key] = capabilities
+    return capabilities
+
+
+def can_use_capabilities(user) -> bool:
+    """Whether `get_capabilities` applies to `user`: a `User` with an id,
+    in an app context (duck-typed users keep their own `has_role`)."""
+    return isinstance(user, User) and user.id is not None and has_app_context()
+
+
+def _request_memo() -> dict[tuple[int, int], Capabilities]:
+    """`Capabilities` by (user id, version) for the current request
+    (a throwaway dict outside of one)."""
+    if not has_request_context():
+        return {}
+    return request.environ.setdefault(MEMO_KEY, {})
+
+
+def _is_pending(user: User) -> bool:
+    state = inspect(user)
+    if state.attrs.roles.history.has_changes():
+        return True
+    session = state.session
+    return session is not None and user.id in session.info.get(PENDING_KEY, ())
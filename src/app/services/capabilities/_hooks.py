@@ -0,0 +1,92 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Bump `User.permissions_version` on every flush that changes what a
+user may do: their roles, their BW role assignments or mission
+permissions, or the Business Walls they own."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import sqlalchemy as sa
+import sqlalchemy.event
+from sqlalchemy.orm import Session, SessionTransaction, attributes
+from sqlalchemy.orm.util import identity_key
+
+from app.models.auth import User
+
+from ._cache import PENDING_KEY
+
+
+def bump_permissions_version(session: Session, user_ids: Iterable[int | None]) -> None:
+    """Bump the permissions version of `user_ids`, in the current
+    transaction of `session`."""
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return
+
+    users = User.__table__
+    session.connection().execute(
+        sa.update(users)
+        .where(users.c.id.in_(user_ids))
+        .values(permissions_version=users.c.permissions_version + 1)
+    )
+    session.info.setdefault(PENDING_KEY, set()).update(user_ids)
+
+    # The UPDATE bypassed the ORM: reload the version on next access.
+    for user_id in user_ids:
+        user = session.identity_map.get(identity_key(User, user_id))
+        if user is not None:
+            session.expire(user, ["permissions_version"])
+
+
+@sa.event.listens_for(Session, "after_flush")
+def _bump_permissions_versions(session: Session, _flush_context) -> None:
+    # Not at module level: the BW models import `app.services.roles`.
+    from app.modules.bw.bw_activation.models import (
+        BusinessWall,
+        RoleAssignment,
+        RolePermission,
+    )
+
+    user_ids: set[int | None] = set()
+    assignment_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        match obj:
+            case User() if obj in session.new:
+                # Not bumped, but not cached either until committed: its
+                # id could be reused if the transaction is rolled back.
+                session.info.setdefault(PENDING_KEY, set()).add(obj.id)
+            case User():
+                if attributes.get_history(obj, "roles").has_changes():
+                    user_ids.add(obj.id)
+            case RoleAssignment():
+                user_ids.update(_current_and_previous(obj, "user_id"))
+            case RolePermission():
+                assignment_ids.update(_current_and_previous(obj, "role_assignment_id"))
+            case BusinessWall():
+                user_ids.update(_current_and_previous(obj, "owner_id"))
+
+    assignment_ids.discard(None)
+    if assignment_ids:
+        user_ids.update(
+            session.connection().scalars(
+                sa.select(RoleAssignment.user_id).where(
+                    RoleAssignment.id.in_(assignment_ids)
+                )
+            )
+        )
+    bump_permissions_version(session, user_ids)
+
+
+@sa.event.listens_for(Session, "after_transaction_end")
+def _clear_pending_users(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(PENDING_KEY, None)
+
+
+def _current_and_previous(obj, key: str) -> set:
+    history = attributes.get_history(obj, key)
+    return {getattr(obj, key), *history.deleted}
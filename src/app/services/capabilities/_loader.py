@@ -0,0 +1,69 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import literal, select, union_all
+
+from app.flask.extensions import db
+
+from ._models import Capabilities
+
+if TYPE_CHECKING:
+    from app.models.auth import User
+
+
+def load_capabilities(user: User) -> Capabilities:
+    """Build the capabilities of `user` from the database.
+
+    The roles come with the user; the BW ownerships, role assignments
+    and missions are read in one query, as (kind, BW id, value) rows.
+    """
+    # Local import: the BW module imports `app.services.roles`.
+    from app.modules.bw.bw_activation.models import (
+        BusinessWall,
+        BWRoleType,
+        InvitationStatus,
+        RoleAssignment,
+        RolePermission,
+    )
+
+    accepted = (
+        RoleAssignment.user_id == user.id,
+        RoleAssignment.invitation_status == InvitationStatus.ACCEPTED.value,
+    )
+    owned_bws = select(
+        literal("owner").label("kind"), BusinessWall.id, literal("")
+    ).where(BusinessWall.owner_id == user.id)
+    bw_roles = select(
+        literal("role"), RoleAssignment.business_wall_id, RoleAssignment.role_type
+    ).where(*accepted)
+    bw_missions = (
+        select(
+            literal("mission"),
+            RoleAssignment.business_wall_id,
+            RolePermission.permission_type,
+        )
+        .join(RolePermission.role_assignment)
+        .where(
+            *accepted,
+            RoleAssignment.role_type.in_(
+                [BWRoleType.BWPRI.value, BWRoleType.BWPRE.value]
+            ),
+            RolePermission.is_granted.is_(True),
+        )
+    )
+    rows: dict[str, set] = {"owner": set(), "role": set(), "mission": set()}
+    stmt = union_all(owned_bws, bw_roles, bw_missions)
+    for kind, bw_id, value in db.session.execute(stmt):
+        rows[kind].add((bw_id, value))
+
+    return Capabilities(
+        roles=frozenset(role.name for role in user.roles),
+        owned_bws=frozenset(bw_id for bw_id, _ in rows["owner"]),
+        bw_roles=frozenset(rows["role"]),
+        bw_missions=frozenset(rows["mission"]),
+    )
@@ -0,0 +1,63 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from uuid import UUID
+
+from attr import Factory, field, frozen
+
+from app.enums import RoleEnum
+from app.models.auth import Role
+
+
+def _fold(roles: frozenset[str]) -> frozenset[str]:
+    return frozenset(role.lower() for role in roles)
+
+
+@frozen
+class Capabilities:
+    """The roles and Business Wall rights of a user, as sets."""
+
+    #: Names of the roles (`RoleEnum` names)
+    roles: frozenset[str] = frozenset()
+    #: Business Walls the user owns
+    owned_bws: frozenset[UUID] = frozenset()
+    #: (BW id, role type) of the accepted role assignments
+    bw_roles: frozenset[tuple[UUID, str]] = frozenset()
+    #: (BW id, permission type) granted to the user as PR manager
+    bw_missions: frozenset[tuple[UUID, str]] = frozenset()
+    #: Lowercased role names, for the static menus
+    folded_roles: frozenset[str] = field(
+        init=False, default=Factory(lambda self: _fold(self.roles), takes_self=True)
+    )
+
+    def has_role(self, role: str | RoleEnum | Role | Collection) -> bool:
+        """Same as `app.services.roles.has_role`, without the user."""
+        match role:
+            case Role() | RoleEnum():
+                return role.name in self.roles
+            case str():
+                return role in self.roles
+            case list() | set() | frozenset() | tuple():
+                return any(self.has_role(r) for r in role)
+            case _:
+                msg = f"Match failed on role {role}"
+                raise ValueError(msg)
+
+    def has_bw_role(self, bw_id: UUID, role_type: str) -> bool:
+        return (bw_id, role_type) in self.bw_roles
+
+    def has_bw_mission(self, bw_id: UUID, permission_type: str) -> bool:
+        return (bw_id, permission_type) in self.bw_missions
+
+    def bw_role_types(self, bw_id: UUID) -> set[str]:
+        return {role_type for id_, role_type in self.bw_roles if id_ == bw_id}
+
+    def bw_mission_types(self, bw_id: UUID) -> set[str]:
+        return {mission for id_, mission in self.bw_missions if id_ == bw_id}
+
+
+NO_CAPABILITIES = Capabilities()
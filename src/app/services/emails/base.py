@@ -8,8 +8,9 @@ from dataclasses import dataclass, fields
 from importlib import resources as rso
 from smtplib import SMTPException
 
-from flask import render_template_string
+from flask import Flask, current_app, render_template
 from flask_mailman import EmailMessage
+from jinja2 import Template
 from loguru import logger
 from markdown import markdown
 
@@ -31,13 +32,13 @@ class EmailTemplate:
         self.ctx = {f.name: getattr(self, f.name) for f in fields(self)}
 
     def _render_md(self) -> str:
-        body = rso.read_text(mail_templates, self.template_md)
-        content = render_template_string(body, **self.ctx)
+        template = _compiled_template(current_app, self.template_md)
+        content = render_template(template, **self.ctx)
         return markdown(content)
 
     def _render_html(self) -> str:
-        body = rso.read_text(mail_templates, self.template_html)
-        content = render_template_string(body, **self.ctx)
+        template = _compiled_template(current_app, self.template_html)
+        content = render_template(template, **self.ctx)
         return content
 
     @property
@@ -60,6 +61,26 @@ class EmailTemplate:
         msg = "No mail template"
         raise ValueError(msg)
 
+    def queue(self) -> None:
+        """Render the mail now and hand it to the outbox worker.
+
+        For fan-out flows (one mail per expert, per contact...): the
+        request only pays for rendering, the SMTP round trips happen in
+        batches over one connection in the worker. Quotas are checked
+        at send time, like `send`. Joins the caller's transaction, so
+        nothing is sent if it rolls back.
+        """
+        from .outbox import enqueue
+
+        enqueue(
+            mail_class=self.__class__.__name__,
+            sender=self.sender,
+            recipient=self.recipient,
+            subject=self.subject,
+            body=self.render(),
+            bypass_quota=self.bypass_quota,
+        )
+
     def send(self) -> bool:
         if self.bypass_quota or is_email_sending_allowed(self.recipient):
             result = self._send_mail()
@@ -99,3 +120,15 @@ class EmailTemplate:
             msg = f"Mail error: (SMTP error {e}), {self.logged_informations}"
             logger.error(msg)
             return False
+
+
+def _compiled_template(app: Flask, name: str) -> Template:
+    """The mail template ``name``, read and compiled once per process
+    (re-read on every call when templates auto-reload, in debug)."""
+    env = app.jinja_env
+    templates = app.extensions.setdefault("emails.templates", {})
+    template = templates.get(name)
+    if template is None or env.auto_reload:
+        template = env.from_string(rso.read_text(mail_templates, name))
+        templates[name] = template
+    return template
@@ -5,8 +5,10 @@
 # SPDX-License-Identifier: AGPL-3.0-only
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 import arrow
-from sqlalchemy import delete
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import scoped_session
 from svcs.flask import container
 
@@ -80,6 +82,62 @@ def count_recipient_mails(recipient_email: str) -> None:
     db_session.flush()
 
 
+def remaining_quotas(recipient_emails: Iterable[str]) -> dict[str, int]:
+    """Mails each recipient may still receive this period.
+
+    Bulk version of `is_email_sending_allowed`: one grouped query for a
+    whole batch. Keys are the normalised (lower-cased, stripped)
+    addresses.
+    """
+    recipients = {_normalise(email) for email in recipient_emails}
+    if not recipients:
+        return {}
+    if _mail_debug_active():
+        return dict.fromkeys(recipients, EMAILS_MAX_SENT_LAST_PERIOD)
+
+    db_session = container.get(scoped_session)
+    period_start = arrow.now("Europe/Paris").shift(days=-EMAILS_PERIOD_DAYS)
+    stmt = (
+        select(EmailLog.recipient_email, func.count())
+        .where(
+            EmailLog.recipient_email.in_(recipients),
+            EmailLog.sent_at >= period_start,
+        )
+        .group_by(EmailLog.recipient_email)
+    )
+    sent = dict(db_session.execute(stmt).tuples().all())
+    return {
+        email: max(EMAILS_MAX_SENT_LAST_PERIOD - sent.get(email, 0), 0)
+        for email in recipients
+    }
+
+
+def count_recipients_mails(recipient_emails: list[str]) -> None:
+    """Bulk version of `count_recipient_mails`: one log row per mail
+    sent, one back log cleanup for the whole batch."""
+    if not recipient_emails or _mail_debug_active():
+        return
+
+    recipients = [_normalise(email) for email in recipient_emails]
+    now = arrow.now("Europe/Paris")
+    cleanup_limit = now.shift(days=-EMAILS_LOG_STORAGE_CUTOFF)
+
+    db_session = container.get(scoped_session)
+    stmt = delete(EmailLog).where(
+        EmailLog.recipient_email.in_(set(recipients)),
+        EmailLog.sent_at < cleanup_limit,
+    )
+    db_session.execute(stmt)
+    db_session.add_all(
+        EmailLog(recipient_email=email, sent_at=now) for email in recipients
+    )
+    db_session.flush()
+
+
+def _normalise(email: str) -> str:
+    return email.lower().strip()
+
+
 def _mail_debug_active() -> bool:
     """Local import to avoid a circular dep at module load."""
     from app.flask.mail_debug import is_active
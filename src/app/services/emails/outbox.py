@@ -0,0 +1,184 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Outbox for fan-out mails, sent in batches by the Dramatiq worker.
+
+`EmailTemplate.queue` renders a mail and appends an `OutboxEmail` row
+in the request transaction, then schedules `flush_email_outbox` after
+a short delay (``MAIL_OUTBOX_DELAY`` seconds). The flush drains the
+table ``OUTBOX_BATCH_SIZE`` rows at a time: one grouped query checks
+the quotas of the whole batch, the mails go out over a single SMTP
+connection, and the sent ones are logged in one insert.
+
+Each batch is claimed with ``DELETE … RETURNING`` and committed once
+sent, so a crash loses at most the batch in flight and a concurrent
+flush never sends the same row twice. A mail refused by the server is
+logged and dropped. If the server cannot be reached at all, the batch
+is rolled back and the job retried; if the connection drops mid-batch,
+the mails not sent yet are put back in the outbox before the commit,
+so the retry sends only those.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from smtplib import SMTPConnectError, SMTPException, SMTPServerDisconnected
+
+from flask import current_app
+from flask_mailman import EmailMessage
+from loguru import logger
+from sqlalchemy import Row, delete, select
+
+from app.dramatiq.job import job
+from app.flask.extensions import db, mail
+from app.models.email_log import OutboxEmail
+
+from .email_limiter import count_recipients_mails, remaining_quotas
+
+OUTBOX_BATCH_SIZE = 100
+
+
+def enqueue(
+    *,
+    mail_class: str,
+    sender: str,
+    recipient: str,
+    subject: str,
+    body: str,
+    bypass_quota: bool = False,
+) -> None:
+    """Queue a rendered mail for the next outbox flush.
+
+    As with `app.modules.search.jobs.enqueue_reindex`, the row only
+    becomes visible to the flush once the caller commits, and a flush is
+    scheduled only when the outbox was empty: the other mails of a
+    fan-out ride on the flush already scheduled. The periodic flush
+    picks up anything a too-early delayed flush missed.
+    """
+    # An ORM select, so rows added earlier in this session are flushed
+    # and counted.
+    already_queued = db.session.scalar(select(OutboxEmail.id).limit(1)) is not None
+    db.session.add(
+        OutboxEmail(
+            mail_class=mail_class,
+            sender=sender,
+            recipient=recipient,
+            subject=subject,
+            body=body,
+            bypass_quota=bypass_quota,
+        )
+    )
+    if not already_queued:
+        delay = current_app.config.get("MAIL_OUTBOX_DELAY", 2)
+        flush_email_outbox.send_with_options(delay=int(delay * 1000))
+
+
+@job()
+def flush_email_outbox() -> None:
+    """Send every queued mail, batch by batch."""
+    while send_outbox_batch():
+        pass
+
+
+def send_outbox_batch(limit: int = OUTBOX_BATCH_SIZE) -> int:
+    """Claim, send and commit up to ``limit`` queued mails.
+
+    Returns the number of rows claimed (0 once the outbox is empty).
+    """
+    oldest = select(OutboxEmail.id).order_by(OutboxEmail.id).limit(limit)
+    stmt = (
+        delete(OutboxEmail)
+        .where(OutboxEmail.id.in_(oldest.scalar_subquery()))
+        .returning(
+            OutboxEmail.id,
+            OutboxEmail.mail_class,
+            OutboxEmail.sender,
+            OutboxEmail.recipient,
+            OutboxEmail.subject,
+            OutboxEmail.body,
+            OutboxEmail.bypass_quota,
+            OutboxEmail.queued_at,
+        )
+    )
+    rows = sorted(db.session.execute(stmt), key=lambda row: row.id)
+    if not rows:
+        db.session.commit()
+        return 0
+
+    quotas = remaining_quotas(row.recipient for row in rows if not row.bypass_quota)
+    sent: list[str] = []
+    unsent: list[Row] = []
+    error: OSError | None = None
+    with mail.get_connection() as connection:
+        for index, row in enumerate(rows):
+            key = row.recipient.lower().strip()
+            if not row.bypass_quota:
+                if quotas[key] <= 0:
+                    logger.error(
+                        f"Mail quota exceeded for recipient: {row.recipient!r}"
+                    )
+                    continue
+                quotas[key] -= 1
+            try:
+                if _send(connection, row):
+                    sent.append(row.recipient)
+            except OSError as e:
+                unsent, error = rows[index:], e
+                # Don't let a failing QUIT undo what was already sent.
+                with suppress(OSError):
+                    connection.close()
+                break
+
+    if unsent:
+        logger.error(f"Mail server lost ({error}): {len(unsent)} mail(s) requeued")
+        _requeue(unsent)
+    count_recipients_mails(sent)
+    db.session.commit()
+    logger.debug("mail outbox: {} sent, {} claimed", len(sent), len(rows))
+    if error is not None:
+        # Let Dramatiq retry the flush later, with its backoff.
+        raise error
+    return len(rows)
+
+
+def _requeue(rows: list[Row]) -> None:
+    db.session.add_all(
+        OutboxEmail(
+            id=row.id,
+            mail_class=row.mail_class,
+            sender=row.sender,
+            recipient=row.recipient,
+            subject=row.subject,
+            body=row.body,
+            bypass_quota=row.bypass_quota,
+            queued_at=row.queued_at,
+        )
+        for row in rows
+    )
+
+
+def _send(connection, row: Row) -> bool:
+    """Send one mail. Returns False when the server refused it; raises
+    `OSError` when the connection to the server is lost.
+    """
+    message = EmailMessage(
+        subject=row.subject,
+        body=row.body,
+        from_email=row.sender,
+        to=[row.recipient],
+        connection=connection,
+    )
+    message.content_subtype = "html"
+    info = f"sender: {row.sender!r}, recipient: {row.recipient!r}, subject: {row.subject!r}"
+    try:
+        message.send()
+    except (SMTPServerDisconnected, SMTPConnectError):
+        raise
+    except SMTPException as e:
+        logger.error(f"Mail error: (SMTP error {e}), {info}")
+        # The server may have dropped us: reconnect for the next one.
+        connection.close()
+        return False
+    logger.info(f"Mail success: {row.mail_class} {info}")
+    return True
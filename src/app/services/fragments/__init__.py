@@ -0,0 +1,20 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+from __future__ import annotations
+
+from ._backends import DatabaseBackend, Fragment, FragmentBackend, MemoryBackend
+from ._cache import FragmentCache, fragment_cache, version_of
+from ._models import FragmentEntry
+
+__all__ = [
+    "DatabaseBackend",
+    "Fragment",
+    "FragmentBackend",
+    "FragmentCache",
+    "FragmentEntry",
+    "MemoryBackend",
+    "fragment_cache",
+    "version_of",
+]
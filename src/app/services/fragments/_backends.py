@@ -0,0 +1,169 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Storage for rendered fragments.
+
+A fragment is stored under ``(kind, object id, variant)`` together with
+the version of the object it was rendered from; the caller compares
+versions, so a backend only has to store, expire and delete.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Collection, Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Protocol
+
+import sqlalchemy as sa
+from attr import frozen
+
+from app.flask.extensions import db
+from app.flask.sqla import dialect_insert
+
+from ._models import FragmentEntry
+
+# Above this many stored objects, the memory backend sweeps expired
+# fragments before adding more.
+MAX_MEMORY_ENTRIES = 20_000
+
+
+@frozen
+class Fragment:
+    version: str
+    html: str
+
+
+class FragmentBackend(Protocol):
+    def get_many(
+        self, kind: str, variant: str, ids: Collection[int]
+    ) -> dict[int, Fragment]: ...
+
+    def set_many(
+        self, kind: str, variant: str, fragments: Mapping[int, Fragment], ttl: float
+    ) -> None: ...
+
+    def delete(self, kind: str, ids: Collection[int]) -> None:
+        """Drop every variant of the fragments of ``ids``."""
+        ...
+
+    def clear(self) -> None:
+        """Drop every fragment."""
+        ...
+
+
+class MemoryBackend:
+    """Fragments kept by this process."""
+
+    def __init__(self) -> None:
+        # (kind, id) -> variant -> (deadline, fragment)
+        self._entries: dict[tuple[str, int], dict[str, tuple[float, Fragment]]] = {}
+        self._lock = threading.Lock()
+
+    def get_many(
+        self, kind: str, variant: str, ids: Collection[int]
+    ) -> dict[int, Fragment]:
+        now = time.monotonic()
+        result = {}
+        for obj_id in ids:
+            entry = self._entries.get((kind, obj_id), {}).get(variant)
+            if entry is not None and entry[0] > now:
+                result[obj_id] = entry[1]
+        return result
+
+    def set_many(
+        self, kind: str, variant: str, fragments: Mapping[int, Fragment], ttl: float
+    ) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) + len(fragments) > MAX_MEMORY_ENTRIES:
+                self._sweep(now)
+            for obj_id, fragment in fragments.items():
+                variants = self._entries.setdefault((kind, obj_id), {})
+                variants[variant] = (now + ttl, fragment)
+
+    def delete(self, kind: str, ids: Collection[int]) -> None:
+        with self._lock:
+            for obj_id in ids:
+                self._entries.pop((kind, obj_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _sweep(self, now: float) -> None:
+        for key, variants in list(self._entries.items()):
+            live = {v: e for v, e in variants.items() if e[0] > now}
+            if live:
+                self._entries[key] = live
+            else:
+                del self._entries[key]
+        if len(self._entries) > MAX_MEMORY_ENTRIES:
+            # Still full of live fragments: start over rather than grow.
+            self._entries.clear()
+
+
+class DatabaseBackend:
+    """Fragments in the ``frag_fragment`` table, shared by all workers.
+
+    Reads go through the request session (one query per list). Writes
+    use their own short transaction, so that caching a fragment on a GET
+    does not depend on the request committing.
+    """
+
+    def get_many(
+        self, kind: str, variant: str, ids: Collection[int]
+    ) -> dict[int, Fragment]:
+        stmt = sa.select(
+            FragmentEntry.object_id, FragmentEntry.version, FragmentEntry.html
+        ).where(
+            FragmentEntry.kind == kind,
+            FragmentEntry.variant == variant,
+            FragmentEntry.object_id.in_(ids),
+            FragmentEntry.expires_at > datetime.now(UTC),
+        )
+        return {
+            row.object_id: Fragment(version=row.version, html=row.html)
+            for row in db.session.execute(stmt)
+        }
+
+    def set_many(
+        self, kind: str, variant: str, fragments: Mapping[int, Fragment], ttl: float
+    ) -> None:
+        expires_at = datetime.now(UTC) + timedelta(seconds=ttl)
+        rows = [
+            {
+                "kind": kind,
+                "object_id": obj_id,
+                "variant": variant,
+                "version": fragment.version,
+                "html": fragment.html,
+                "expires_at": expires_at,
+            }
+            for obj_id, fragment in fragments.items()
+        ]
+        insert = dialect_insert()
+        stmt = insert(FragmentEntry).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["kind", "object_id", "variant"],
+            set_={
+                "version": stmt.excluded.version,
+                "html": stmt.excluded.html,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+        with db.engine.begin() as connection:
+            connection.execute(stmt)
+
+    def delete(self, kind: str, ids: Collection[int]) -> None:
+        stmt = sa.delete(FragmentEntry).where(
+            FragmentEntry.kind == kind, FragmentEntry.object_id.in_(ids)
+        )
+        with db.engine.begin() as connection:
+            connection.execute(stmt)
+
+    def clear(self) -> None:
+        with db.engine.begin() as connection:
+            connection.execute(sa.delete(FragmentEntry))
@@ -0,0 +1,115 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Cache of rendered HTML fragments (cards on the wire wall, the events
+list...).
+
+A fragment is stored per ``(kind, object id, variant)`` with the version
+of the object it was rendered from. The version is computed by the
+caller from the row it already loaded (`version_of` the displayed
+columns, counters included), so a fragment is re-rendered as soon as
+the object changes, whichever worker changed it. The publication
+signals also drop the fragments of the objects they touch.
+
+What the version does not cover (the author's name or photo, the
+publisher's name) is bounded by ``FRAGMENT_CACHE_TTL`` (seconds,
+default 600, well under the lifetime of the signed image URLs the
+cards contain).
+
+``FRAGMENT_CACHE_BACKEND`` selects where fragments are kept:
+``"memory"`` (default, per process), ``"database"`` (shared by all
+workers) or ``"none"``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Sequence
+from typing import Any, Protocol, TypeVar
+
+from flask import current_app
+from markupsafe import Markup
+
+from ._backends import DatabaseBackend, Fragment, FragmentBackend, MemoryBackend
+
+
+class Identified(Protocol):
+    @property
+    def id(self) -> Any: ...
+
+
+T = TypeVar("T", bound=Identified)
+
+BACKENDS: dict[str, Callable[[], FragmentBackend]] = {
+    "memory": MemoryBackend,
+    "database": DatabaseBackend,
+}
+
+
+def version_of(*values: Any) -> str:
+    """A short digest of ``values`` (the columns a fragment displays)."""
+    return hashlib.blake2b(repr(values).encode(), digest_size=8).hexdigest()
+
+
+class FragmentCache:
+    def __init__(self) -> None:
+        self._backends: dict[str, FragmentBackend] = {}
+
+    def render_many(
+        self,
+        kind: str,
+        objects: Sequence[T],
+        *,
+        version: Callable[[T], str],
+        render: Callable[[T], str],
+        variant: str = "",
+    ) -> list[Markup]:
+        """``render(obj)`` for each of ``objects`` (which have an ``id``),
+        reusing the fragments stored for their current ``version``.
+
+        One backend lookup for the whole list, one write for the misses.
+        """
+        backend = self._backend()
+        if backend is None or not objects:
+            return [Markup(render(obj)) for obj in objects]
+
+        stored = backend.get_many(kind, variant, [obj.id for obj in objects])
+        missed: dict[int, Fragment] = {}
+        result = []
+        for obj in objects:
+            obj_id = obj.id
+            obj_version = version(obj)
+            fragment = stored.get(obj_id)
+            if fragment is None or fragment.version != obj_version:
+                fragment = Fragment(version=obj_version, html=str(render(obj)))
+                missed[obj_id] = fragment
+            result.append(Markup(fragment.html))
+
+        if missed:
+            ttl = current_app.config.get("FRAGMENT_CACHE_TTL", 600)
+            backend.set_many(kind, variant, missed, ttl)
+        return result
+
+    def invalidate(self, kind: str, *ids: int) -> None:
+        """Drop the fragments of ``ids``, all variants."""
+        backend = self._backend()
+        if backend is not None and ids:
+            backend.delete(kind, ids)
+
+    def clear(self) -> None:
+        """Drop every fragment, from every backend used so far."""
+        for backend in self._backends.values():
+            backend.clear()
+
+    def _backend(self) -> FragmentBackend | None:
+        name = current_app.config.get("FRAGMENT_CACHE_BACKEND", "memory")
+        if name == "none":
+            return None
+        if name not in self._backends:
+            self._backends[name] = BACKENDS[name]()
+        return self._backends[name]
+
+
+#: The fragment cache of this process.
+fragment_cache = FragmentCache()
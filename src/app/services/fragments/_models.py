@@ -0,0 +1,31 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""
+Rendered fragments shared by all workers (``database`` backend).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class FragmentEntry(Base):
+    __tablename__ = "frag_fragment"
+
+    #: what was rendered ("post-card", "event-card")
+    kind: Mapped[str] = mapped_column(primary_key=True)
+    #: id of the rendered object
+    object_id: Mapped[int] = mapped_column(sa.BigInteger, primary_key=True)
+    #: render options that change the HTML ("" by default)
+    variant: Mapped[str] = mapped_column(primary_key=True, default="")
+    #: version of the object the HTML was rendered from
+    version: Mapped[str] = mapped_column()
+    html: Mapped[str] = mapped_column(sa.Text)
+    expires_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True))
@@ -4,11 +4,20 @@
 
 from __future__ import annotations
 
+from io import BytesIO
+
 from flask_super.decorators import service
-from PIL import Image
+from PIL import Image, ImageOps
 
 FILL_COLOR = (255, 255, 255, 0)
 
+# Encoder options per Pillow format, for variants.
+_SAVE_OPTIONS: dict[str, dict] = {
+    "WEBP": {"quality": 80, "method": 4},
+    "JPEG": {"quality": 82, "optimize": True, "progressive": True},
+    "PNG": {"optimize": True},
+}
+
 
 @service
 class ImageService:
@@ -21,6 +30,27 @@ class ImageService:
         new_img.paste(img, (int((s0 - x0) / 2), int((s0 - y0) / 2)))
         return new_img.resize((size, size))
 
+    def make_variant(self, content: bytes, size: tuple[int, int], fmt: str) -> bytes:
+        """Downscale image ``content`` to fit within ``size`` (never
+        upscaling, keeping the aspect ratio) and encode it as ``fmt``, a
+        Pillow format name."""
+        with Image.open(BytesIO(content)) as src:
+            # JPEG only: let the decoder skip to a reduced scale (1/2,
+            # 1/4, 1/8) close to the target, instead of decoding every
+            # pixel of a multi-megapixel upload.
+            src.draft("RGB", size)
+            img = ImageOps.exif_transpose(src)
+            img.thumbnail(size, Image.Resampling.LANCZOS)
+
+        if fmt == "JPEG" and img.mode not in {"RGB", "L"}:
+            img = img.convert("RGB")
+        elif img.mode not in {"RGB", "RGBA", "L", "LA"}:
+            img = img.convert("RGBA")
+
+        out = BytesIO()
+        img.save(out, fmt, **_SAVE_OPTIONS.get(fmt, {}))
+        return out.getvalue()
+
 
 # def make_square(img: Image.Image, size: int) -> Image.Image:
 #     frame = np.asarray(img)
@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any, cast
 
 from flask import g, request
@@ -12,6 +11,11 @@ from flask_super.decorators import service
 
 from app.flask.routing import url_for
 from app.models.auth import User
+from app.services.capabilities import (
+    Capabilities,
+    can_use_capabilities,
+    get_capabilities,
+)
 from app.settings.menus import CREATE_MENU, MAIN_MENU, USER_MENU
 
 MENUS = {
@@ -25,12 +29,17 @@ MENUS = {
 class MenuService:
     def __init__(self) -> None:
         self._extra_menus: dict[str, Any] = {}
+        # The service lives for one request: a built-in menu is resolved
+        # at most once, however many templates the request renders.
+        self._menus: dict[str, list[dict[str, Any]]] = {}
 
     def __getitem__(self, item):
         if item in self._extra_menus:
             return self._extra_menus[item]
 
-        return make_menu(MENUS[item])
+        if item not in self._menus:
+            self._menus[item] = make_menu(MENUS[item])
+        return self._menus[item]
 
     def update(self, menus: dict | None = None, **kwargs) -> None:
         if menus is not None:
@@ -67,8 +76,11 @@ def _user_has_role(user: Any, role: str) -> bool:
     """Return True iff ``user`` has a role whose name matches ``role``.
 
     Pure helper, isolated for testability. Comparison is case-insensitive on
-    the role name (matching the legacy behavior).
+    the role name (matching the legacy behavior). ``user`` may also be the
+    `Capabilities` of the user.
     """
+    if isinstance(user, Capabilities):
+        return role in user.folded_roles
     return any(r.name.lower() == role for r in user.roles)
 
 
@@ -100,7 +112,8 @@ def _resolve_entry(
     if not url:
         return None
 
-    entry = deepcopy(spec)
+    # Specs are flat dicts: a shallow copy keeps them untouched.
+    entry = dict(spec)
     entry["url"] = url
     entry["active"] = path.startswith(url)
     entry["tooltip"] = spec.get("tooltip", "")
@@ -109,9 +122,10 @@ def _resolve_entry(
 
 def _make_menu_entry(spec) -> dict[str, Any] | None:
     """Make a menu entry from a specification (Flask shell)."""
+    user = cast("User", g.user)
     return _resolve_entry(
         spec,
         path=request.path,
-        user=cast("User", g.user),
+        user=get_capabilities(user) if can_use_capabilities(user) else user,
         url_resolver=url_for,
     )
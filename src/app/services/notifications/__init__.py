@@ -4,7 +4,8 @@
 
 from __future__ import annotations
 
+from ._cache import notification_cache
 from ._models import Notification
 from ._service import NotificationService
 
-__all__ = ["Notification", "NotificationService"]
+__all__ = ["Notification", "NotificationService", "notification_cache"]
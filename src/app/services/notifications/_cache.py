@@ -0,0 +1,96 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Per-process cache of what the page header shows about notifications.
+
+Every authenticated page shows the unread count and the latest
+notifications of the user (bell badge and dropdown). Both are kept per
+user for ``NOTIFICATION_CACHE_TTL`` seconds (default 30), as plain
+records rather than ORM objects so they outlive the request session.
+`NotificationService` drops a user's entry as soon as it posts to them
+or marks their notifications as read; writes made by another worker
+show up when the entry expires.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+import arrow
+from attr import frozen
+from flask import current_app
+
+from ._models import abstract
+
+# Above this many users, expired entries are swept before adding one.
+MAX_ENTRIES = 10_000
+
+
+@frozen
+class NotificationSummary:
+    """The fields of a `Notification` the dropdown displays."""
+
+    id: int
+    message: str
+    url: str
+    is_read: bool
+    timestamp: arrow.Arrow
+
+    def get_abstract(self, max_length: int = 100) -> str:
+        return abstract(self.message, max_length)
+
+
+@frozen
+class NotificationDigest:
+    unread_count: int
+    latest: tuple[NotificationSummary, ...]
+
+
+class NotificationCache:
+    """`NotificationDigest` per user id, with a time-to-live."""
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[float, NotificationDigest]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, user_id: int, load: Callable[[], NotificationDigest]
+    ) -> NotificationDigest:
+        ttl = current_app.config.get("NOTIFICATION_CACHE_TTL", 30)
+        if ttl <= 0:
+            return load()
+
+        now = time.monotonic()
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        digest = load()
+        with self._lock:
+            if len(self._entries) >= MAX_ENTRIES:
+                self._sweep(now)
+            self._entries[user_id] = (now + ttl, digest)
+        return digest
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _sweep(self, now: float) -> None:
+        expired = [k for k, (deadline, _) in self._entries.items() if deadline <= now]
+        for user_id in expired:
+            del self._entries[user_id]
+        if len(self._entries) >= MAX_ENTRIES:
+            # Still full of live entries: start over rather than grow.
+            self._entries.clear()
+
+
+#: The cache of this process.
+notification_cache = NotificationCache()
@@ -39,9 +39,13 @@ class Notification(IdMixin, Timestamped, Base):
     )
 
     def get_abstract(self, max_length: int = 100) -> str:
-        if len(self.message) < max_length:
-            return self.message
-        return self.message[: max_length - 3] + "..."
+        return abstract(self.message, max_length)
+
+
+def abstract(message: str, max_length: int = 100) -> str:
+    if len(message) < max_length:
+        return message
+    return message[: max_length - 3] + "..."
 
 
 @service
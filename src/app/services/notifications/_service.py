@@ -10,6 +10,7 @@ from svcs.flask import container
 
 from app.models.auth import User
 
+from ._cache import NotificationDigest, NotificationSummary, notification_cache
 from ._models import Notification, NotificationRepository
 
 
@@ -28,6 +29,7 @@ class NotificationService:
 
         repo = container.get(NotificationRepository)
         repo.add(notification)
+        notification_cache.invalidate(receiver.id)
 
         return notification
 
@@ -42,6 +44,30 @@ class NotificationService:
             .all()
         )
 
+    def get_digest(self, user: User) -> NotificationDigest:
+        """Unread count and latest notifications, for the page header.
+
+        Served from the per-process cache (see `_cache`); the other
+        getters always query.
+        """
+
+        def load() -> NotificationDigest:
+            latest = tuple(
+                NotificationSummary(
+                    id=n.id,
+                    message=n.message,
+                    url=n.url,
+                    is_read=n.is_read,
+                    timestamp=n.timestamp,
+                )
+                for n in self.get_notifications(user)
+            )
+            return NotificationDigest(
+                unread_count=self.get_unread_count(user), latest=latest
+            )
+
+        return notification_cache.get(user.id, load)
+
     def get_count(self, user: User) -> int:
         repo = container.get(NotificationRepository)
         return repo.count(receiver_id=user.id)
@@ -63,7 +89,7 @@ class NotificationService:
         Returns the number of rows flipped. Caller commits. Idempotent.
         """
         session = container.get(scoped_session)
-        return (
+        count = (
             session.query(Notification)
             .filter(
                 Notification.receiver_id == user.id,
@@ -71,6 +97,8 @@ class NotificationService:
             )
             .update({Notification.is_read: True}, synchronize_session=False)
         )
+        notification_cache.invalidate(user.id)
+        return count
 
     def mark_as_read(self, notification_id: int, user: User) -> bool:
         """Mark one notification as read, only if it belongs to user.
@@ -89,4 +117,5 @@ class NotificationService:
             )
             .update({Notification.is_read: True}, synchronize_session=False)
         )
+        notification_cache.invalidate(user.id)
         return bool(count)
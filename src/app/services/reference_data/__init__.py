@@ -0,0 +1,31 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+from __future__ import annotations
+
+from ._models import ReferenceDataVersion
+from ._store import (
+    COUNTRIES,
+    TAXONOMIES,
+    ZIP_CODES,
+    ReferenceDataStore,
+    bump_reference_data_version,
+    label_index,
+    reference_data,
+)
+from ._upsert import ImportCounts, delete_rows_not_in, upsert_rows
+
+__all__ = [
+    "COUNTRIES",
+    "TAXONOMIES",
+    "ZIP_CODES",
+    "ImportCounts",
+    "ReferenceDataStore",
+    "ReferenceDataVersion",
+    "bump_reference_data_version",
+    "delete_rows_not_in",
+    "label_index",
+    "reference_data",
+    "upsert_rows",
+]
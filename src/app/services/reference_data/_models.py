@@ -0,0 +1,22 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""
+Version counter of each reference dataset (taxonomies, zip codes...).
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ReferenceDataVersion(Base):
+    __tablename__ = "ref_data_version"
+
+    #: the dataset ("taxonomies", "zip_codes", "countries")
+    name: Mapped[str] = mapped_column(primary_key=True)
+    #: bumped on every re-import or edit of the dataset
+    version: Mapped[int] = mapped_column(default=0)
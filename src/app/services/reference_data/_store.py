@@ -0,0 +1,129 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Process-wide store of reference data, invalidated by version bumps.
+
+Taxonomies, countries and zip codes only change when they are
+re-imported (``flask bootstrap``, ``flask data upgrade-ontologies``) or
+edited in the ontology admin. Each process keeps what it has loaded,
+together with the hash indexes built from it, until the dataset's
+version in ``ref_data_version`` moves: whoever changes a dataset calls
+`bump_reference_data_version`, and every worker notices on its next
+version check (at most every ``REFERENCE_DATA_CHECK_INTERVAL`` seconds,
+one primary-key scan of a three-row table) and drops its copy.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from flask import current_app
+from sqlalchemy import select
+
+from app.flask.extensions import db
+from app.flask.sqla import dialect_insert
+
+from ._models import ReferenceDataVersion
+
+TAXONOMIES = "taxonomies"
+COUNTRIES = "countries"
+ZIP_CODES = "zip_codes"
+
+
+class ReferenceDataStore:
+    """Loaded reference data, keyed by ``(dataset, key)``."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], Any] = {}
+        self._versions: dict[str, int] | None = None
+        self._checked_at: float | None = None
+        self._lock = threading.Lock()
+
+    def get(self, dataset: str, key: str, load: Callable[[], Any]) -> Any:
+        """The value stored under ``(dataset, key)``, calling ``load()``
+        on a miss. Values are shared: callers must not mutate them."""
+        self._check_versions()
+        try:
+            return self._entries[dataset, key]
+        except KeyError:
+            pass
+        value = load()
+        with self._lock:
+            self._entries[dataset, key] = value
+        return value
+
+    def invalidate(self, *datasets: str) -> None:
+        """Drop everything loaded from ``datasets``."""
+        with self._lock:
+            for entry_key in list(self._entries):
+                if entry_key[0] in datasets:
+                    del self._entries[entry_key]
+
+    def clear(self) -> None:
+        """Drop everything, and forget the versions seen so far."""
+        with self._lock:
+            self._entries.clear()
+            self._versions = None
+            self._checked_at = None
+
+    def _check_versions(self) -> None:
+        interval = current_app.config.get("REFERENCE_DATA_CHECK_INTERVAL", 60)
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < interval:
+            return
+        self._checked_at = now
+
+        stmt = select(ReferenceDataVersion.name, ReferenceDataVersion.version)
+        versions: dict[str, int] = {}
+        for name, version in db.session.execute(stmt).tuples():
+            versions[name] = version
+        previous = self._versions
+        self._versions = versions
+        if previous is None:
+            return
+        changed = {
+            name
+            for name in previous.keys() | versions.keys()
+            if previous.get(name, 0) != versions.get(name, 0)
+        }
+        if changed:
+            self.invalidate(*changed)
+
+
+#: The store of this process.
+reference_data = ReferenceDataStore()
+
+
+def bump_reference_data_version(*datasets: str) -> None:
+    """Record that ``datasets`` changed (in the caller's transaction).
+
+    The counter is incremented in the database (``version + 1``), so
+    two concurrent bumps both count. The local copy is dropped right
+    away; other processes drop theirs on their next version check after
+    the caller commits.
+    """
+    if not datasets:
+        return
+    insert = dialect_insert()
+    stmt = insert(ReferenceDataVersion).values(
+        [{"name": name, "version": 1} for name in datasets]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ReferenceDataVersion.name],
+        set_={"version": ReferenceDataVersion.version + 1},
+    )
+    db.session.execute(stmt)
+    reference_data.invalidate(*datasets)
+
+
+def label_index(pairs: Iterable[tuple[str, str]]) -> dict[str, str]:
+    """Value -> label of ``(value, label)`` pairs; the first one wins,
+    as with a linear scan."""
+    index: dict[str, str] = {}
+    for value, label in pairs:
+        index.setdefault(value, label)
+    return index
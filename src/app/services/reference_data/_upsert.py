@@ -0,0 +1,134 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Bulk upsert for reference data imports.
+
+Rows are streamed in chunks; each chunk is one multi-row
+``INSERT … ON CONFLICT (key) DO UPDATE … WHERE <something changed>``,
+so unchanged rows are not rewritten. The conflict target must be
+backed by a unique constraint or index on the model (pass the
+``WHERE`` of a partial index as ``index_where``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from itertools import batched
+
+import sqlalchemy as sa
+from attr import frozen
+
+from app.flask.extensions import db
+from app.flask.sqla import dialect_insert
+from app.models.base import Base
+from app.models.mixins import IdMixin, id_generator
+
+# Chunk size: rows x columns stays well under the bind parameter
+# limits of both PostgreSQL (65535) and SQLite (32766).
+UPSERT_CHUNK_SIZE = 2000
+
+
+@frozen
+class ImportCounts:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+    def __add__(self, other: ImportCounts) -> ImportCounts:
+        return ImportCounts(
+            inserted=self.inserted + other.inserted,
+            updated=self.updated + other.updated,
+            unchanged=self.unchanged + other.unchanged,
+            deleted=self.deleted + other.deleted,
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.inserted} inserted, {self.updated} updated, "
+            f"{self.unchanged} unchanged, {self.deleted} deleted"
+        )
+
+
+def upsert_rows(
+    model: type[Base],
+    rows: Iterable[dict],
+    key: Sequence[str],
+    chunk_size: int = UPSERT_CHUNK_SIZE,
+    index_where: sa.ColumnElement[bool] | sa.TextClause | None = None,
+) -> ImportCounts:
+    """Insert ``rows`` into ``model``'s table, updating the rows whose
+    ``key`` columns already exist. Within a chunk, the last row for a
+    given key wins. New rows of an `IdMixin` model get a fresh id;
+    existing rows keep theirs."""
+    if issubclass(model, IdMixin):
+        rows = ({"id": id_generator.generate_as_int(), **row} for row in rows)
+    counts = ImportCounts()
+    for chunk in batched(rows, chunk_size):
+        unique = {tuple(row[k] for k in key): row for row in chunk}
+        counts += _upsert_chunk(
+            model.__table__, key, list(unique.values()), index_where
+        )
+    return counts
+
+
+def delete_rows_not_in(
+    model: type[Base],
+    where: sa.ColumnElement[bool],
+    key: Sequence[str],
+    keep: set[tuple],
+) -> int:
+    """Delete the rows matching ``where`` whose ``key`` is not in
+    ``keep`` (what the source no longer lists). Returns their number."""
+    table = model.__table__
+    (pk,) = table.primary_key.columns
+    stmt = sa.select(pk, *(table.c[k] for k in key)).where(where)
+    stale = [row[0] for row in db.session.execute(stmt) if tuple(row[1:]) not in keep]
+    for ids in batched(stale, UPSERT_CHUNK_SIZE):
+        db.session.execute(sa.delete(table).where(pk.in_(ids)))
+    return len(stale)
+
+
+def _upsert_chunk(
+    table: sa.Table,
+    key: Sequence[str],
+    rows: list[dict],
+    index_where: sa.ColumnElement[bool] | sa.TextClause | None,
+) -> ImportCounts:
+    key_columns = [table.c[k] for k in key]
+    keys = [tuple(row[k] for k in key) for row in rows]
+    existing = (
+        db.session.scalar(
+            sa.select(sa.func.count())
+            .select_from(table)
+            .where(sa.tuple_(*key_columns).in_(keys))
+        )
+        or 0
+    )
+
+    insert = dialect_insert()
+    stmt = insert(table).values(rows)
+    changed_columns = [
+        name for name in rows[0] if name not in key and not table.c[name].primary_key
+    ]
+    stmt = stmt.on_conflict_do_update(
+        index_elements=key_columns,
+        index_where=index_where,
+        set_={name: stmt.excluded[name] for name in changed_columns},
+        where=sa.or_(
+            *(
+                table.c[name].is_distinct_from(stmt.excluded[name])
+                for name in changed_columns
+            )
+        ),
+    ).returning(*key_columns)
+    # Only inserted and actually updated rows come back.
+    written = len(db.session.execute(stmt).all())
+
+    inserted = len(rows) - existing
+    return ImportCounts(
+        inserted=inserted,
+        updated=written - inserted,
+        unchanged=existing - (written - inserted),
+    )
@@ -13,6 +13,7 @@ A faire: les Devs et les étudiants
 
 from __future__ import annotations
 
+from ._bulk import compute_all_reputations
 from ._compute import compute_reputation
 
-__all__ = ["compute_reputation"]
+__all__ = ["compute_all_reputations", "compute_reputation"]
@@ -0,0 +1,105 @@
+# Copyright (c) 2021-2024, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Set-based `compute_reputation`, for every user at once.
+
+`compute_reputation` runs a query per metric per user. Here each
+metric is one grouped ``COUNT(*)`` over the whole table, and each
+user's weighted total is then combined in memory from those columns.
+Results are identical, key for key, to the per-user version.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+import sqlalchemy as sa
+
+from app.enums import RoleEnum
+from app.flask.extensions import db
+from app.models.auth import Role, User, roles_users
+
+from ._constants import REPUT_GENERIC_USER_SPEC, REPUT_JOURNALIST_SPEC
+from ._functions import GROUPED_COUNTS, export_functions
+from ._types import Real, Spec
+
+
+def compute_all_reputations(
+    user_ids: Iterable[int],
+) -> Iterator[tuple[int, dict[str, Real]]]:
+    """``(user_id, compute_reputation(user))`` for each of ``user_ids``."""
+    user_ids = list(user_ids)
+    roles = _role_names_by_user()
+    counts: dict[str, dict[int, int]] = {}
+    specs = {
+        spec_id: _weighted_columns(spec, counts, user_ids)
+        for spec_id, spec in (
+            ("journalist", REPUT_JOURNALIST_SPEC),
+            ("generic", REPUT_GENERIC_USER_SPEC),
+        )
+    }
+
+    for user_id in user_ids:
+        spec_id = _spec_id(roles.get(user_id, frozenset()))
+        if spec_id is None:
+            yield user_id, {"total": 0}
+            continue
+
+        total = 0.0
+        details: dict[str, Real] = {}
+        for key, ponderation, values in specs[spec_id]:
+            value = values.get(user_id, 0)
+            details[key] = value
+            total += ponderation * value
+        details["total"] = total
+        yield user_id, details
+
+
+def _spec_id(role_names: frozenset[str]) -> str | None:
+    # Same precedence as `compute_reputation_user`.
+    if RoleEnum.PRESS_MEDIA.name in role_names:
+        return "journalist"
+    if role_names & {RoleEnum.PRESS_RELATIONS.name, RoleEnum.EXPERT.name}:
+        return "generic"
+    return None
+
+
+def _weighted_columns(
+    spec: Spec, counts: dict[str, dict[int, int]], user_ids: list[int]
+) -> list[tuple[str, Real, dict[int, int]]]:
+    """The metrics of ``spec`` that have a function, with their weight
+    and their value for every user (absent = 0). ``counts`` memoises
+    the queries across specs."""
+    functions = export_functions()
+    result = []
+    for key, _tag, ponderation in spec:
+        if key not in functions:
+            continue
+        if key not in counts:
+            counts[key] = _grouped_count(key, user_ids)
+        result.append((key, ponderation, counts[key]))
+    return result
+
+
+def _grouped_count(key: str, user_ids: list[int]) -> dict[int, int]:
+    if key not in GROUPED_COUNTS:
+        # No set-based form declared: fall back to the per-user function.
+        function = export_functions()[key]
+        users = db.session.scalars(sa.select(User).where(User.id.in_(user_ids)))
+        return {user.id: function(user) for user in users}
+    column = GROUPED_COUNTS[key]
+    if column is None:
+        return {}
+    stmt = sa.select(column, sa.func.count()).group_by(column)
+    return dict(db.session.execute(stmt).tuples().all())
+
+
+def _role_names_by_user() -> dict[int, frozenset[str]]:
+    stmt = sa.select(roles_users.c.user_id, Role.name).join(
+        Role, Role.id == roles_users.c.role_id
+    )
+    names: dict[int, set[str]] = {}
+    for user_id, name in db.session.execute(stmt):
+        names.setdefault(user_id, set()).add(name)
+    return {user_id: frozenset(s) for user_id, s in names.items()}
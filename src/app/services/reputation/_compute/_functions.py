@@ -5,38 +5,59 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import TypeVar
 
 import sqlalchemy as sa
 
 from app.flask.extensions import db
 from app.models.auth import User
 from app.services.social_graph import adapt
-from app.services.social_graph.models import likes_table
+from app.services.social_graph.models import following_users_table, likes_table
+
+# Metric -> user id column of the table its function counts rows of,
+# or None for a constant 0. Lets `compute_all_reputations` compute the
+# metric for every user with one grouped query.
+GROUPED_COUNTS: dict[str, sa.Column | None] = {}
+
+F = TypeVar("F", bound=Callable)
+
+
+def _grouped_by(column: sa.Column | None) -> Callable[[F], F]:
+    def register(function: F) -> F:
+        GROUPED_COUNTS[function.__name__] = column
+        return function
+
+    return register
 
 
 # Social networking
+@_grouped_by(following_users_table.c.followee_id)
 def nb_foller_mbr(user: User, *, adapt_fn: Callable | None = None) -> int:
     """Nombre de followers membres."""
     adapt_fn = adapt_fn or adapt
     return adapt_fn(user).num_followers()
 
 
+@_grouped_by(following_users_table.c.follower_id)
 def nb_follg_mbr(user: User, *, adapt_fn: Callable | None = None) -> int:
     """Nombre de followings membres."""
     adapt_fn = adapt_fn or adapt
     return adapt_fn(user).num_followees()
 
 
+@_grouped_by(None)
 def nb_follg_org(user: User) -> int:
     """Nombre de followings organisations."""
     return 0
 
 
+@_grouped_by(None)
 def nb_follg_gr(user: User) -> int:
     """Nombre de followings groupes."""
     return 0
 
 
+@_grouped_by(likes_table.c.user_id)
 def nb_likes_art(user: User, *, session=None) -> int:
     """Nombre de likes articles."""
     session = session if session is not None else db.session
@@ -45,6 +66,7 @@ def nb_likes_art(user: User, *, session=None) -> int:
     return len(list(rows))
 
 
+@_grouped_by(None)
 def nb_ptage_art(user: User) -> int:
     """Nombre de partages articles."""
     return 0
@@ -54,6 +76,6 @@ def export_functions() -> dict[str, Callable]:
     function_type = type(lambda: None)
     namespace = {}
     for k, v in list(globals().items()):
-        if isinstance(v, function_type):
+        if isinstance(v, function_type) and not k.startswith("_"):
             namespace[k] = v
     return namespace
@@ -5,30 +5,55 @@
 from __future__ import annotations
 
 import random
-from datetime import date
 
 import arrow
 from rich import progress
-from sqlalchemy import select
-from sqlalchemy.engine.result import ScalarResult
+from sqlalchemy import select, update
 
 from app.flask.extensions import db
+from app.flask.sqla import dialect_insert
 from app.models.auth import User
 
-from ._compute import compute_reputation
+from ._compute import compute_all_reputations
 from ._models import ReputationRecord
 
 
 def update_reputations(show_progress: bool = False, add_noise: bool = False) -> None:
+    """Refresh today's `ReputationRecord` and `User.karma` of every user.
+
+    Set-based: one grouped query per metric (see `compute_all_reputations`),
+    then one upsert for the records and one bulk update for the karmas,
+    in a single transaction.
+    """
     today = arrow.now().date()
-    users = list(_get_all_users())
+    user_ids = _get_all_user_ids()
+    reputations = compute_all_reputations(user_ids)
     if show_progress:
-        tracker = progress.track(users, description="Updating reputations")
-    else:
-        tracker = users
-    for user in tracker:
-        _update_for_user(user, today, add_noise=add_noise)
-        db.session.commit()
+        reputations = progress.track(
+            reputations, total=len(user_ids), description="Updating reputations"
+        )
+
+    records = []
+    for user_id, reputation_details in reputations:
+        karma = reputation_details["total"]
+        if add_noise:
+            karma += _noise()
+        records.append(
+            {
+                "user_id": user_id,
+                "date": today,
+                "value": karma,
+                "details": reputation_details,
+            }
+        )
+
+    if records:
+        _upsert_records(records)
+        db.session.execute(
+            update(User),
+            [{"id": r["user_id"], "karma": r["value"]} for r in records],
+        )
+    db.session.commit()
 
 
 def get_reputation_history(user: User) -> list[ReputationRecord]:
@@ -40,31 +65,21 @@ def get_reputation_history(user: User) -> list[ReputationRecord]:
 #
 # Internal
 #
-def _get_all_users() -> ScalarResult:
+def _get_all_user_ids() -> list[int]:
     # FIXME: only active users
-    stmt = select(User)
-    return db.session.scalars(stmt)
-
-
-def _update_for_user(user: User, today: date, add_noise: bool = False) -> None:
-    reputation_details = compute_reputation(user)
-
-    # TODO: apply decay
-    karma = reputation_details["total"]
-    if add_noise:
-        karma += _noise()
-
-    # Delete today's value if it exists
-    R = ReputationRecord
-    stmt = select(R).where(R.user_id == user.id, R.date == today)
-    record = db.session.scalar(stmt)
+    stmt = select(User.id)
+    return list(db.session.scalars(stmt))
 
-    if not record:
-        record = ReputationRecord(user_id=user.id, date=today)
-        db.session.add(record)
 
-    user.karma = record.value = karma
-    record.details = reputation_details
+def _upsert_records(records: list[dict]) -> None:
+    """Insert today's records, overwriting the ones already there."""
+    insert = dialect_insert()
+    stmt = insert(ReputationRecord)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ReputationRecord.user_id, ReputationRecord.date],
+        set_={"value": stmt.excluded.value, "details": stmt.excluded.details},
+    )
+    db.session.execute(stmt, records)
 
 
 def _noise() -> float:
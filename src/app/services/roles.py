@@ -12,6 +12,7 @@ from svcs.flask import container
 from app.enums import RoleEnum
 from app.models.auth import Role, User
 from app.models.repositories import RoleRepository
+from app.services.capabilities import can_use_capabilities, get_capabilities
 
 
 def generate_roles_map() -> dict[str, Role]:
@@ -64,6 +65,9 @@ def has_role(
     if user.is_anonymous:
         return False
 
+    if can_use_capabilities(user):
+        return get_capabilities(user).has_role(role)
+
     match role:
         case Role():
             return user.has_role(role)
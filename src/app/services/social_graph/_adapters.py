@@ -11,6 +11,7 @@ import sqlalchemy as sa
 from attr import define
 
 from app.flask.extensions import db
+from app.flask.sqla import dialect_insert
 from app.lib import adapter
 from app.lib.adapter import Adapter
 from app.models.auth import User
@@ -203,26 +204,25 @@ class SocialUser(FollowableAdapter):
 
     def like(
         self, content: FrontendBaseContent | ContentBaseContent | SocialContent
-    ) -> None:
-        if self.is_liking(content):
-            return
-
+    ) -> bool:
+        """Like `content`; return False if it was already liked."""
         content_id = (
             content.id
             if isinstance(content, (FrontendBaseContent, ContentBaseContent))
             else content.content.id
         )
-        stmt = sa.insert(likes_table).values(
-            user_id=self.user.id, content_id=content_id
+        insert = dialect_insert()
+        stmt = (
+            insert(likes_table)
+            .values(user_id=self.user.id, content_id=content_id)
+            .on_conflict_do_nothing()
         )
-        db.session.execute(stmt)
+        return db.session.execute(stmt).rowcount == 1
 
     def unlike(
         self, content: FrontendBaseContent | ContentBaseContent | SocialContent
-    ) -> None:
-        if not self.is_liking(content):
-            return
-
+    ) -> bool:
+        """Unlike `content`; return False if it was not liked."""
         content_id = (
             content.id
             if isinstance(content, (FrontendBaseContent, ContentBaseContent))
@@ -232,7 +232,7 @@ class SocialUser(FollowableAdapter):
             likes_table.c.user_id == self.user.id,
             likes_table.c.content_id == content_id,
         )
-        db.session.execute(stmt)
+        return db.session.execute(stmt).rowcount == 1
 
 
 @define
@@ -4,7 +4,20 @@
 
 from __future__ import annotations
 
-from ._services import add_tag, get_tag_applications, get_tags
+from ._services import (
+    add_tag,
+    get_tag_applications,
+    get_tags,
+    get_tags_for,
+    tagged_with,
+)
 from .interfaces import Taggable
 
-__all__ = ["Taggable", "add_tag", "get_tag_applications", "get_tags"]
+__all__ = [
+    "Taggable",
+    "add_tag",
+    "get_tag_applications",
+    "get_tags",
+    "get_tags_for",
+    "tagged_with",
+]
@@ -32,5 +32,11 @@ class TagApplication(Timestamped, IdMixin, Base):
     )
     object: Mapped[Post] = relationship("Post")
 
+    # Query pattern: `EXISTS (… WHERE label IN (…) AND object_id = post.id)`
+    # when the wire wall is filtered by tag.
+    __table_args__ = (
+        sa.Index("ix_tag_application_label_object_id", "label", "object_id"),
+    )
+
     def __repr__(self) -> str:
         return f"<TagApplication {self.label!r} on {self.object_id}>"
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 import sqlalchemy as sa
 
 from app.flask.extensions import db
@@ -35,7 +37,44 @@ def get_tag_applications(obj) -> list[TagApplication]:
 
 
 def get_tags(obj) -> list:
-    tag_applications = get_tag_applications(obj)
+    return _merge_tags(get_tag_applications(obj))
+
+
+def get_tags_for(objects: Iterable) -> dict[int, list]:
+    """Bulk variant of :func:`get_tags`: one ``IN`` query for a whole
+    batch of objects, keyed by object id. Objects without tags map to
+    an empty list.
+    """
+    object_ids = {obj.id for obj in objects}
+    if not object_ids:
+        return {}
+
+    by_object: dict[int, list[TagApplication]] = {id_: [] for id_ in object_ids}
+
+    stmt = (
+        sa.select(TagApplication.object_id, TagApplication)
+        .where(TagApplication.object_id.in_(object_ids))
+        .order_by(TagApplication.label)
+    )
+    for object_id, ta in db.session.execute(stmt).tuples():
+        by_object[object_id].append(ta)
+    return {id_: _merge_tags(apps) for id_, apps in by_object.items()}
+
+
+def tagged_with(object_id: sa.ColumnElement[int], labels: Iterable[str]) -> sa.Exists:
+    """``EXISTS`` clause true when ``object_id`` carries one of ``labels``.
+
+    Lets callers filter on tags inside their own query (served by the
+    ``(label, object_id)`` index) instead of calling :func:`get_tags`
+    on each row.
+    """
+    return sa.exists().where(
+        TagApplication.object_id == object_id,
+        TagApplication.label.in_(set(labels)),
+    )
+
+
+def _merge_tags(tag_applications: Iterable[TagApplication]) -> list:
     d = {}
     for ta in tag_applications:
         if ta.label not in d:
@@ -8,14 +8,29 @@ Simple model for taxonomies.
 
 from __future__ import annotations
 
+import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
 from app.models.mixins import IdMixin
 
+# Entries created by hand may leave the value empty; the others are
+# unique within their taxonomy (the key of the imports).
+HAS_VALUE = sa.text("value <> ''")
+
 
 class TaxonomyEntry(IdMixin, Base):
     __tablename__ = "tax_taxonomy"
+    __table_args__ = (
+        sa.Index(
+            "uq_tax_taxonomy_value",
+            "taxonomy_name",
+            "value",
+            unique=True,
+            postgresql_where=HAS_VALUE,
+            sqlite_where=HAS_VALUE,
+        ),
+    )
 
     #: the name of this entity (i.e. entry)
     name: Mapped[str] = mapped_column()
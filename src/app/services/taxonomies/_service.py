@@ -6,14 +6,20 @@ from __future__ import annotations
 
 import io
 import sys
+from collections.abc import Iterable
 from typing import Any
 
 import pyexcel
 from sqlalchemy import distinct, select
 
 from app.flask.extensions import db
+from app.services.reference_data import (
+    ImportCounts,
+    delete_rows_not_in,
+    upsert_rows,
+)
 
-from ._models import TaxonomyEntry
+from ._models import HAS_VALUE, TaxonomyEntry
 
 
 def check_taxonomy_exists(taxonomy_name: str) -> bool:
@@ -120,6 +126,42 @@ def export_taxonomy_to_ods(taxonomy_name: str) -> io.BytesIO:
     return memory_buffer
 
 
+def import_taxonomy_entries(
+    taxonomy_name: str, entries: Iterable[dict[str, Any]]
+) -> ImportCounts:
+    """Bring a taxonomy in line with ``entries`` (dicts with ``name``,
+    ``category``, ``value`` and ``seq``): upsert them by value, and
+    delete the taxonomy's entries that are no longer listed. Entries
+    without a value have no key to be matched on: they are skipped. The
+    caller commits."""
+    seen: set[tuple[str, str]] = set()
+
+    def rows() -> Iterable[dict[str, Any]]:
+        for entry in entries:
+            # Same stripping as `create_entry` (bug #0095).
+            value = entry["value"].strip()
+            if not value:
+                continue
+            seen.add((taxonomy_name, value))
+            yield {
+                "taxonomy_name": taxonomy_name,
+                "name": entry["name"].strip(),
+                "category": entry["category"].strip(),
+                "value": value,
+                "seq": entry["seq"],
+            }
+
+    key = ["taxonomy_name", "value"]
+    counts = upsert_rows(TaxonomyEntry, rows(), key=key, index_where=HAS_VALUE)
+    deleted = delete_rows_not_in(
+        TaxonomyEntry,
+        TaxonomyEntry.taxonomy_name == taxonomy_name,
+        key=key,
+        keep=seen,
+    )
+    return counts + ImportCounts(deleted=deleted)
+
+
 def create_entry(
     taxonomy_name: str,
     name: str,
@@ -4,6 +4,21 @@
 
 from __future__ import annotations
 
-from ._service import get_unique_view_count, get_view_count, record_view
+from ._counters import increment_counter, recount_engagement_counters
+from ._service import (
+    flush_views,
+    get_unique_view_count,
+    get_view_count,
+    record_view,
+    toggle_like,
+)
 
-__all__ = ["get_unique_view_count", "get_view_count", "record_view"]
+__all__ = [
+    "flush_views",
+    "get_unique_view_count",
+    "get_view_count",
+    "increment_counter",
+    "record_view",
+    "recount_engagement_counters",
+    "toggle_like",
+]
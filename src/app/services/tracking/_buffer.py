@@ -0,0 +1,65 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Per-process buffer of the views not yet written.
+
+`record_view` only appends to the buffer. The request that finds it
+full (``VIEW_BUFFER_SIZE`` views, default 100) or old enough
+(``VIEW_BUFFER_SECONDS``, default 10) writes the whole batch. So that
+an idle process doesn't sit on its views, the first view of a batch
+also arms a timer that writes the buffer ``VIEW_BUFFER_SECONDS``
+later, and the buffer is written when the process exits. Only views of
+a process that is killed outright are lost; the daily
+`recount_engagement_counters` actor realigns the counters on what was
+written.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import arrow
+from attr import frozen
+
+
+@frozen
+class PendingView:
+    user_id: int
+    content_id: int
+    content_cls: type
+    timestamp: arrow.Arrow
+
+
+class ViewBuffer:
+    def __init__(self) -> None:
+        self._views: list[PendingView] = []
+        self._since = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def add(self, view: PendingView) -> bool:
+        """Buffer `view`. Returns whether it starts a new batch."""
+        with self._lock:
+            first = not self._views
+            if first:
+                self._since = time.monotonic()
+            self._views.append(view)
+        return first
+
+    def is_due(self, max_size: int, max_age: float) -> bool:
+        if not self._views:
+            return False
+        return len(self._views) >= max_size or time.monotonic() - self._since >= max_age
+
+    def drain(self) -> list[PendingView]:
+        with self._lock:
+            views, self._views = self._views, []
+        return views
+
+
+#: The buffer of this process.
+view_buffer = ViewBuffer()
@@ -0,0 +1,92 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Engagement counters of contents (`view_count`, `like_count`).
+
+The counters are denormalized on the content rows (`UserFeedbackMixin`)
+and only changed by atomic increments: nothing is recounted on the
+request path. `recount_engagement_counters` rebuilds them from the
+unique views and the likes (``flask job engagement-counters``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import sqlalchemy as sa
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.flask.extensions import db
+from app.models.base import Base
+from app.models.mixins import UserFeedbackMixin
+
+from ._models import UniqueView
+
+
+def counter_column(cls: type, counter: str) -> sa.Column:
+    """The column of `counter` for the content class `cls` (it may live
+    on a parent table)."""
+    return sa.inspect(cls).columns[counter]
+
+
+def increment_counter(content, counter: str, delta: int) -> int:
+    """Add `delta` to a counter of `content` in the database, and return
+    (and set on `content`) its new value."""
+    column = counter_column(type(content), counter)
+    table = column.table
+    # Pending ORM changes to the counter must not be overwritten below.
+    db.session.flush()
+    stmt = (
+        sa.update(table)
+        .where(table.c.id == content.id)
+        .values({column.name: column + delta})
+        .returning(column)
+    )
+    value = db.session.execute(stmt).scalar_one()
+    set_committed_value(content, counter, value)
+    return value
+
+
+def add_to_counter(column: sa.Column, deltas: Mapping[int, int]) -> None:
+    """Add `deltas` (content id -> delta) to `column`, in one executemany."""
+    if not deltas:
+        return
+    table = column.table
+    stmt = (
+        sa.update(table)
+        .where(table.c.id == sa.bindparam("b_id"))
+        .values({column.name: column + sa.bindparam("b_delta")})
+    )
+    db.session.execute(
+        stmt, [{"b_id": id_, "b_delta": delta} for id_, delta in deltas.items()]
+    )
+
+
+def recount_engagement_counters() -> None:
+    """Recompute `view_count` and `like_count` of every content."""
+    from app.services.social_graph.models import likes_table
+
+    for table in _counter_tables():
+        views = (
+            sa.select(sa.func.count())
+            .select_from(UniqueView)
+            .where(UniqueView.content_id == table.c.id)
+            .scalar_subquery()
+        )
+        likes = (
+            sa.select(sa.func.count())
+            .select_from(likes_table)
+            .where(likes_table.c.content_id == table.c.id)
+            .scalar_subquery()
+        )
+        db.session.execute(sa.update(table).values(view_count=views, like_count=likes))
+
+
+def _counter_tables() -> list[sa.Table]:
+    tables = {
+        counter_column(mapper.class_, "view_count").table
+        for mapper in Base.registry.mappers
+        if issubclass(mapper.class_, UserFeedbackMixin)
+    }
+    return sorted(tables, key=lambda table: table.name)
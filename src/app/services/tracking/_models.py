@@ -22,3 +22,19 @@ class ViewEvent(Timestamped, IdMixin, Base):
         sa.BigInteger,
         # sa.ForeignKey(ArticlePost.id, onupdate="CASCADE", ondelete="CASCADE"),
     )
+
+
+class UniqueView(Base):
+    """One row per (content, viewer): the unique views of a content.
+
+    Inserted with ON CONFLICT DO NOTHING, so the rows actually inserted
+    are the new unique views, added to `view_count`.
+    """
+
+    __tablename__ = "sta_unique_view"
+
+    content_id: Mapped[int] = mapped_column(sa.BigInteger, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        sa.ForeignKey(User.id, onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
@@ -4,23 +4,127 @@
 
 from __future__ import annotations
 
+import atexit
+import threading
+from collections import Counter, defaultdict
+
+import arrow
 import sqlalchemy as sa
+from flask import Flask, current_app
+from loguru import logger
+from sqlalchemy.orm.util import identity_key
 
 from app.flask.extensions import db
+from app.flask.lib.proxies import unproxy
+from app.flask.sqla import dialect_insert
 from app.models.auth import User
 from app.modules.wire.models import ArticlePost
 
-from ._models import ViewEvent
+from ._buffer import PendingView, view_buffer
+from ._counters import add_to_counter, counter_column, increment_counter
+from ._models import UniqueView, ViewEvent
 
 
 def record_view(user: User, content: ArticlePost) -> None:
-    view_event = ViewEvent(user_id=user.id, content_id=content.id)
-    db.session.add(view_event)
-    db.session.flush()
+    """Record that `user` viewed `content`.
+
+    The view is buffered, and written with the next batch (see `_buffer`).
+    """
+    view = PendingView(user.id, content.id, type(content), arrow.utcnow())
+    first = view_buffer.add(view)
+
+    config = current_app.config
+    max_size = config.get("VIEW_BUFFER_SIZE", 100)
+    max_age = config.get("VIEW_BUFFER_SECONDS", 10)
+    if view_buffer.is_due(max_size, max_age):
+        flush_views()
+    elif first:
+        _flush_later(unproxy(current_app), max_age)
 
-    content.view_count = get_unique_view_count(content)
+
+def flush_views() -> int:
+    """Write the buffered views, in the current transaction: the view
+    events, the new unique views, and `view_count` increments for them.
+
+    Returns the number of views written.
+    """
+    views = view_buffer.drain()
+    if not views:
+        return 0
 
     db.session.flush()
+    db.session.add_all(
+        ViewEvent(user_id=v.user_id, content_id=v.content_id, timestamp=v.timestamp)
+        for v in views
+    )
+
+    content_classes = {(v.content_id, v.user_id): v.content_cls for v in views}
+    table = UniqueView.__table__
+    insert = dialect_insert()
+    stmt = (
+        insert(table)
+        .values([{"content_id": c, "user_id": u} for c, u in content_classes])
+        .on_conflict_do_nothing()
+        .returning(table.c.content_id, table.c.user_id)
+    )
+    new_views = db.session.execute(stmt).all()
+
+    deltas: defaultdict[sa.Column, Counter[int]] = defaultdict(Counter)
+    for content_id, user_id in new_views:
+        cls = content_classes[content_id, user_id]
+        deltas[counter_column(cls, "view_count")][content_id] += 1
+    for column, column_deltas in deltas.items():
+        add_to_counter(column, column_deltas)
+
+    # The UPDATEs bypassed the ORM: reload the counters on next access.
+    for content_id, user_id in new_views:
+        cls = content_classes[content_id, user_id]
+        content = db.session.identity_map.get(identity_key(cls, content_id))
+        if content is not None:
+            db.session.expire(content, ["view_count"])
+
+    return len(views)
+
+
+def _flush_later(app: Flask, delay: float) -> None:
+    """Write the buffer in `delay` seconds, and at exit, even if no
+    request comes in to do it."""
+    timer = threading.Timer(delay, _flush_in_background, args=(app,))
+    timer.daemon = True
+    timer.start()
+    # Registered once per process, for the latest app.
+    atexit.unregister(_flush_in_background)
+    atexit.register(_flush_in_background, app)
+
+
+def _flush_in_background(app: Flask) -> None:
+    """Write the buffer in a session of its own, outside of any request."""
+    with app.app_context():
+        try:
+            if flush_views():
+                db.session.commit()
+        except Exception:
+            logger.exception("Could not write the buffered views")
+            db.session.rollback()
+
+
+def toggle_like(user: User, content) -> bool:
+    """Like `content` for `user`, or unlike it if they already do.
+
+    `content.like_count` follows with an atomic increment. Returns
+    whether `user` now likes `content`.
+    """
+    from app.services.social_graph import adapt
+
+    social_user = adapt(user)
+    if social_user.is_liking(content):
+        if social_user.unlike(content):
+            increment_counter(content, "like_count", -1)
+        return False
+
+    if social_user.like(content):
+        increment_counter(content, "like_count", 1)
+    return True
 
 
 def get_view_count(content: ArticlePost) -> int:
@@ -33,10 +137,9 @@ def get_view_count(content: ArticlePost) -> int:
 
 
 def get_unique_view_count(content: ArticlePost) -> int:
-    #  TODO: optimize this query
     stmt = (
-        sa.select(ViewEvent.user_id, ViewEvent.content_id)
-        .distinct()
-        .where(ViewEvent.content_id == content.id)
+        sa.select(sa.func.count())
+        .select_from(UniqueView)
+        .where(UniqueView.content_id == content.id)
     )
-    return len(db.session.execute(stmt).all())
+    return db.session.scalar(stmt) or 0
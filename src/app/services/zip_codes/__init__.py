@@ -18,6 +18,7 @@ from ._zip_code_service import (
     create_zip_code_entry,
     get_full_zip_code_country,
     get_zip_code_country,
+    import_zip_code_entries,
     update_zip_code_entry,
 )
 
@@ -34,6 +35,7 @@ __all__ = [
     "get_full_countries",
     "get_full_zip_code_country",
     "get_zip_code_country",
+    "import_zip_code_entries",
     "update_country_entry",
     "update_zip_code_entry",
 ]
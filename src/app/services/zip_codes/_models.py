@@ -8,6 +8,7 @@ Simple model for Countries and Zip Codes.
 
 from __future__ import annotations
 
+import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -25,6 +26,7 @@ class CountryEntry(IdMixin, Base):
 
 class ZipCodeEntry(IdMixin, Base):
     __tablename__ = "zip_code"
+    __table_args__ = (sa.UniqueConstraint("value", name="uq_zip_code_value"),)
 
     iso3: Mapped[str] = mapped_column()
     zip_code: Mapped[str] = mapped_column()
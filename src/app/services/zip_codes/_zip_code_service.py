@@ -10,6 +10,11 @@ from collections.abc import Iterable
 from sqlalchemy import select
 
 from app.flask.extensions import db
+from app.services.reference_data import (
+    ImportCounts,
+    delete_rows_not_in,
+    upsert_rows,
+)
 
 from ._models import ZipCodeEntry
 
@@ -80,6 +85,34 @@ def update_zip_code_entry(
     return True
 
 
+def import_zip_code_entries(
+    iso3: str, items: Iterable[tuple[str, str]]
+) -> ImportCounts:
+    """Bring the zip codes of a country in line with ``items``, an
+    iterable of ``(zip_code, name)`` (e.g. streamed from the source
+    file): upsert them by value, and delete the country's entries that
+    are no longer listed. The caller commits."""
+    seen: set[tuple[str]] = set()
+
+    def rows() -> Iterable[dict]:
+        for zip_code, name in items:
+            value = f"{iso3} / {zip_code} {name}"
+            seen.add((value,))
+            yield {
+                "iso3": iso3,
+                "zip_code": zip_code,
+                "name": name,
+                "value": value,
+                "label": f"{zip_code} {name}",
+            }
+
+    counts = upsert_rows(ZipCodeEntry, rows(), key=["value"])
+    deleted = delete_rows_not_in(
+        ZipCodeEntry, ZipCodeEntry.iso3 == iso3, key=["value"], keep=seen
+    )
+    return counts + ImportCounts(deleted=deleted)
+
+
 def create_zip_code_entry(
     iso3: str, zip_code: str, name: str, value: str, label: str
 ) -> None:
@@ -10,6 +10,7 @@ from markupsafe import Markup
 
 from app.enums import RoleEnum
 from app.flask.lib.macros import macro
+from app.lib.file_object_utils import is_content_addressed, media_variant_url
 from app.models.organisation import Organisation
 from app.modules.bw.bw_activation.user_utils import get_organisation_logo_url
 
@@ -43,7 +44,11 @@ def profile_image(user, size: int = 24, **kw) -> Markup:
     cls = kw.get("class", "").split(" ")
     # url = user.profile_image_url
     # quick fix to merge KYC images and faker images urls
-    url = user.photo_image_signed_url()
+    # Avatars are small on every page: fetch a thumbnail, not the upload.
+    if is_content_addressed(user.photo_image):
+        url = media_variant_url(user.photo_image, "avatar")
+    else:
+        url = user.photo_image_signed_url()
 
     cls += [f"h-{size}", f"w-{size}", "object-cover", "rounded-full"]
     # `first_community()` raises when the user has no community role
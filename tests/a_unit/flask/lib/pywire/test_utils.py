@@ -0,0 +1,95 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Unit tests for `app.flask.lib.pywire._utils.get_template`.
+
+Component templates are colocated with the component's module, so the
+fixture writes a tiny module + `.j2` pair to a temp dir and imports it.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from app.flask.lib.pywire._utils import get_template
+
+
+@pytest.fixture
+def component_cls(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> type:
+    module_file = tmp_path / "hello_mod.py"
+    module_file.write_text("class HelloBox:\n    pass\n")
+    (tmp_path / "hello_box.j2").write_text("Hello {{ name }}")
+    spec = importlib.util.spec_from_file_location("hello_mod", module_file)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "hello_mod", module)
+    spec.loader.exec_module(module)
+    return module.HelloBox
+
+
+def _touch(path: Path, text: str) -> None:
+    """Rewrite ``path`` and push its mtime forward, so the change is
+    visible even on filesystems with coarse timestamps."""
+    mtime = path.stat().st_mtime
+    path.write_text(text)
+    os.utime(path, (mtime + 10, mtime + 10))
+
+
+class TestGetTemplate:
+    def test_renders_colocated_template(self, component_cls: type) -> None:
+        app = Flask(__name__)
+        with app.app_context():
+            template = get_template(component_cls)
+            assert template.render(name="world") == "Hello world"
+
+    def test_compiled_once_per_app(self, component_cls: type) -> None:
+        app = Flask(__name__)
+        with app.app_context():
+            assert get_template(component_cls) is get_template(component_cls)
+
+    def test_sees_app_globals(self, component_cls: type, tmp_path: Path) -> None:
+        (tmp_path / "hello_box.j2").write_text("{{ greeting }} {{ name }}")
+        app = Flask(__name__)
+        # pyrefly: ignore [unsupported-operation]
+        app.jinja_env.globals["greeting"] = "Bonjour"
+        with app.app_context():
+            assert get_template(component_cls).render(name="x") == "Bonjour x"
+
+    def test_no_reload_outside_debug(self, component_cls: type, tmp_path: Path) -> None:
+        app = Flask(__name__)
+        with app.app_context():
+            get_template(component_cls)
+            _touch(tmp_path / "hello_box.j2", "Changed")
+            assert get_template(component_cls).render(name="x") == "Hello x"
+
+    def test_reloads_on_mtime_in_debug(
+        self, component_cls: type, tmp_path: Path
+    ) -> None:
+        app = Flask(__name__)
+        app.debug = True
+        with app.app_context():
+            get_template(component_cls)
+            _touch(tmp_path / "hello_box.j2", "Changed")
+            assert get_template(component_cls).render(name="x") == "Changed"
+
+    def test_imports_resolve_through_app_loader(
+        self, component_cls: type, tmp_path: Path
+    ) -> None:
+        templates = tmp_path / "templates"
+        (templates / "macros").mkdir(parents=True)
+        (templates / "macros" / "greet.j2").write_text(
+            "{% macro greet(n) %}Hi {{ n }}{% endmacro %}"
+        )
+        (tmp_path / "hello_box.j2").write_text(
+            '{% from "macros/greet.j2" import greet %}{{ greet(name) }}'
+        )
+        app = Flask(__name__, template_folder=str(templates))
+        with app.app_context():
+            assert get_template(component_cls).render(name="x") == "Hi x"
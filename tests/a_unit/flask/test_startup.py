@@ -0,0 +1,117 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Unit tests for flask/startup.py"""
+
+from __future__ import annotations
+
+import json
+import sys
+from functools import singledispatch
+from types import ModuleType
+
+import click
+import pytest
+from flask import Blueprint
+from flask_super.registry import registry
+
+from app.flask import startup
+from app.flask.cli.startup import _check_fingerprints
+
+
+def test_manifest_round_trip(tmp_path) -> None:
+    path = tmp_path / "manifest.json"
+    startup.write_manifest(path, ["app"], ["app.a", "app.b"])
+
+    assert startup.read_manifest(path, ["app"]) == ["app.a", "app.b"]
+
+
+def test_manifest_for_other_packages_is_ignored(tmp_path) -> None:
+    path = tmp_path / "manifest.json"
+    startup.write_manifest(path, ["app"], ["app.a"])
+
+    assert startup.read_manifest(path, ["app", "other"]) is None
+
+
+def test_missing_or_invalid_manifest_is_ignored(tmp_path) -> None:
+    path = tmp_path / "manifest.json"
+    assert startup.read_manifest(path, ["app"]) is None
+
+    path.write_text("{")
+    assert startup.read_manifest(path, ["app"]) is None
+
+
+def test_phase_is_a_noop_when_not_profiling() -> None:
+    with startup.phase("nothing"):
+        pass
+
+
+def test_profile_records_nested_phases() -> None:
+    profile = startup.start_profile()
+    try:
+        with startup.phase("outer"), startup.phase("inner"):
+            pass
+    finally:
+        assert startup.stop_profile() is profile
+
+    assert [(p.name, p.depth) for p in profile.phases] == [
+        ("outer", 0),
+        ("inner", 1),
+    ]
+    assert profile.phases[0].duration >= profile.phases[1].duration
+
+
+def test_profile_records_module_registrations() -> None:
+    class Dummy:
+        pass
+
+    profile = startup.start_profile()
+    try:
+        startup.import_module("json")
+        before = startup.count_registrations()
+        registry.register(Dummy)
+        assert startup.count_registrations() == before + 1
+    finally:
+        registry.registered.pop(Dummy, None)
+        startup.stop_profile()
+
+    assert profile.modules[0].name == "json"
+    assert profile.modules[0].registrations == 0
+    assert profile.registering_modules() == []
+
+
+def test_profile_serialization_round_trip() -> None:
+    profile = startup.StartupProfile(
+        modules=[startup.ModuleTiming("app.a", 0.5, 2)],
+        phases=[startup.PhaseTiming("scan", 0, 1.5)],
+    )
+
+    data = json.loads(json.dumps(profile.to_dict()))
+    restored = startup.StartupProfile.from_dict(data)
+
+    assert restored.modules == profile.modules
+    assert restored.phases == profile.phases
+    assert restored.registering_modules() == ["app.a"]
+
+
+def test_blueprint_routes_and_dispatch_implementations_count(monkeypatch) -> None:
+    module = ModuleType("app._startup_test")
+    module.blueprint = Blueprint("startup_test", __name__)
+    module.render = singledispatch(lambda obj: "")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    before = startup.count_registrations()
+    module.blueprint.route("/")(lambda: "")
+    module.render.register(int, lambda obj: "int")
+
+    assert startup.count_registrations() == before + 2
+
+
+def test_manifest_missing_routes_is_refused() -> None:
+    full = {"routes": ["/ public.home", "/about public.about"]}
+    partial = {"routes": ["/about public.about"]}
+
+    _check_fingerprints(full, full)
+    with pytest.raises(click.ClickException, match="public.home"):
+        _check_fingerprints(full, partial)
@@ -0,0 +1,105 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Unit tests for `app.lib.facets.FacetCache`.
+
+Invalidation is driven by SQLAlchemy session events ; these tests use
+a throwaway in-memory SQLite database with a local model so they don't
+depend on the app's schema.
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.lib.facets import FacetCache
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Watched(_Base):
+    __tablename__ = "facets_test_watched"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(default="")
+
+
+class _Other(_Base):
+    __tablename__ = "facets_test_other"
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class _Builder:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> int:
+        self.calls += 1
+        return self.calls
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    _Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def builder() -> _Builder:
+    return _Builder()
+
+
+@pytest.fixture
+def cache(builder: _Builder) -> FacetCache[int]:
+    return FacetCache(builder, watch=(_Watched,), ttl=3600)
+
+
+class TestFacetCache:
+    def test_builds_once(self, cache, builder):
+        assert cache.get() == 1
+        assert cache.get() == 1
+        assert builder.calls == 1
+
+    def test_expires_after_ttl(self, builder):
+        cache = FacetCache(builder, watch=(_Watched,), ttl=0)
+        cache.get()
+        cache.get()
+        assert builder.calls == 2
+
+    def test_invalidate(self, cache, builder):
+        cache.get()
+        cache.invalidate()
+        assert cache.get() == 2
+
+    def test_flush_of_watched_model_invalidates(self, cache, session):
+        cache.get()
+        session.add(_Watched(name="x"))
+        session.flush()
+        assert cache.get() == 2
+
+    def test_flush_of_other_model_keeps_cache(self, cache, session):
+        cache.get()
+        session.add(_Other())
+        session.flush()
+        assert cache.get() == 1
+
+    def test_rollback_invalidates_again(self, cache, session):
+        """A facet rebuilt from uncommitted rows is dropped on rollback."""
+        session.add(_Watched(name="x"))
+        session.flush()
+        assert cache.get() == 1  # sees the uncommitted row
+        session.rollback()
+        assert cache.get() == 2
+
+    def test_savepoint_end_defers_to_outer_transaction(self, cache, session):
+        with session.begin_nested():
+            session.add(_Watched(name="x"))
+        assert cache.get() == 1
+        session.rollback()
+        assert cache.get() == 2
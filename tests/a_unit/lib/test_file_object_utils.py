@@ -0,0 +1,86 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterator
+
+import fsspec
+import pytest
+from advanced_alchemy.types import FileObject
+from advanced_alchemy.types.file_object import storages
+from advanced_alchemy.types.file_object.backends.fsspec import FSSpecBackend
+
+from app.lib.file_object_utils import (
+    SPOOL_CHUNK_SIZE,
+    create_file_object,
+    is_content_addressed,
+    media_url,
+    media_variant_url,
+    save_file_object,
+    save_stream,
+)
+
+
+def test_media_variant_url() -> None:
+    file_obj = create_file_object(b"content", "photo.JPG")
+    sha256 = file_obj.path.split(".", 1)[0]
+
+    assert is_content_addressed(file_obj)
+    assert media_variant_url(file_obj, "avatar") == (
+        f"/media/{sha256}.jpg/192x192.webp"
+    )
+    assert media_variant_url(file_obj, "card", fmt="jpg") == (
+        f"/media/{sha256}.jpg/640x360.jpg"
+    )
+
+
+def test_media_variant_url_falls_back_for_legacy_names() -> None:
+    legacy = FileObject(backend="s3", filename="photo.jpg")
+
+    assert not is_content_addressed(legacy)
+    assert not is_content_addressed(None)
+    assert media_variant_url(legacy, "avatar") == media_url(legacy)
+    assert media_variant_url(None, "avatar") == media_url(None)
+
+
+@pytest.fixture
+def memory_backend() -> Iterator[FSSpecBackend]:
+    backend = FSSpecBackend(
+        fs=fsspec.filesystem("memory", skip_instance_cache=True),
+        key="test-memory",
+        prefix="bucket/files",
+    )
+    storages.register_backend(backend)
+    yield backend
+    storages.unregister_backend(backend.key)
+
+
+def test_save_stream_stores_under_content_hash(memory_backend) -> None:
+    content = b"x" * (3 * SPOOL_CHUNK_SIZE + 5)
+
+    file_obj = save_stream(io.BytesIO(content), "Doc.PDF", backend="test-memory")
+
+    assert file_obj.path == create_file_object(content, "Doc.PDF").path
+    assert file_obj.size == len(content)
+    assert memory_backend.get_content(file_obj.path) == content
+
+
+def test_existing_content_is_not_uploaded_again(memory_backend, monkeypatch) -> None:
+    content = b"same content"
+    save_stream(io.BytesIO(content), "a.txt", backend="test-memory")
+
+    def fail(*args, **kwargs):
+        msg = "uploaded again"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(memory_backend, "save_object", fail)
+    monkeypatch.setattr(memory_backend.fs, "put_file", fail)
+
+    file_obj = save_stream(io.BytesIO(content), "a.txt", backend="test-memory")
+    assert file_obj.size == len(content)
+
+    file_obj = create_file_object(content, "c.txt", backend="test-memory")
+    assert save_file_object(file_obj) is file_obj
@@ -348,3 +348,33 @@ class TestExtractImageFromRequest:
         )
         assert result is not None
         assert result.filename == "shot.png"
+
+    def test_data_url_too_large_is_not_decoded(self):
+        """With `max_size`, the size of a data-URL is known from its
+        length: an oversized crop is reported, not decoded."""
+        data_url = _png_data_url()
+        decoded = base64.b64decode(data_url.split(",", 1)[1])
+
+        result = extract_image_from_request(data_url=data_url, max_size=len(decoded))
+        assert result is not None
+        assert result.bytes == b""
+        assert result.size == len(decoded)
+
+        result = extract_image_from_request(
+            data_url=data_url, max_size=len(decoded) + 1
+        )
+        assert result is not None
+        assert result.bytes == decoded
+        assert result.size == len(decoded)
+
+    def test_file_too_large_is_not_read_entirely(self):
+        """With `max_size`, at most `max_size` bytes of a file are read."""
+        fs = io.BytesIO(b"0123456789")
+        fs.filename = "big.png"  # type: ignore[attr-defined]
+        fs.content_type = "image/png"  # type: ignore[attr-defined]
+
+        result = extract_image_from_request(file_storage=fs, max_size=4)  # type: ignore[arg-type]
+        assert result is not None
+        assert result.bytes == b""
+        assert result.size == 4
+        assert fs.tell() == 4
@@ -0,0 +1,35 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""The cursor is an opaque, URL-safe token carrying the sort key values
+of the last item shown; it must round-trip exactly."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.lib.pagination import decode_cursor, encode_cursor
+
+
+class TestCursor:
+    @pytest.mark.parametrize(
+        "values",
+        [
+            ("Dupont", "Jean", 42),
+            ("Élodie d'Artagnan", "", 7),
+            ("", "", 0),
+        ],
+    )
+    def test_round_trip(self, values):
+        cursor = encode_cursor(values)
+        assert decode_cursor(cursor) == values
+        assert "=" not in cursor
+        assert "/" not in cursor
+        assert "+" not in cursor
+
+    @pytest.mark.parametrize("cursor", ["", "!!!", "bm90IGpzb24", "e30", "W10"])
+    def test_malformed_cursor_raises(self, cursor):
+        """Empty, non-base64, non-JSON, a dict, an empty list."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
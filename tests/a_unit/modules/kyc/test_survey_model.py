@@ -8,18 +8,24 @@ from __future__ import annotations
 
 import pytest
 
+from app.modules.kyc import survey_model
 from app.modules.kyc.survey_model import (
+    _read_compiled,
+    _source_hash,
     get_survey_fields,
     get_survey_model,
     get_survey_profile,
     get_survey_profile_ids,
+    load_survey_model,
+    survey_model_from_dict,
+    survey_model_to_dict,
 )
 
 # `load_survey_model()` re-parses the XLS file on every call (~ 430 ms).
-# Production calls it exactly once at module import time and binds the
-# result to the module-level `survey` dict, which `get_survey_model()`
-# returns. The dict-shape contract is therefore tested below via the
-# cached path — `test_load_survey_model` was redundant + slow.
+# Production loads the compiled JSON instead, once, on the first call to
+# `get_survey_model()`. The dict-shape contract is therefore tested via
+# the cached path; the workbook is parsed once, to check that the
+# compiled file is up to date.
 
 
 def test_get_survey_model():
@@ -70,3 +76,49 @@ def test_get_survey_fields():
     assert isinstance(result, list)
     # Should have at least some fields
     assert len(result) > 0
+
+
+def test_compiled_survey_is_up_to_date():
+    """The committed compiled survey matches the workbook. If this
+    fails, run `flask data compile-kyc-survey` and commit the result."""
+    compiled = _read_compiled()
+
+    assert compiled is not None
+    assert compiled["source_sha256"] == _source_hash()
+    assert compiled["model"] == survey_model_to_dict(load_survey_model())
+
+
+def test_compiled_survey_round_trip():
+    """The compiled form rebuilds the same profiles, fields and
+    communities."""
+    model = get_survey_model()
+    rebuilt = survey_model_from_dict(survey_model_to_dict(model))
+
+    assert survey_model_to_dict(rebuilt) == survey_model_to_dict(model)
+    assert [(c.id, len(c.profiles)) for c in rebuilt["communities"]] == [
+        (c.id, len(c.profiles)) for c in model["communities"]
+    ]
+    profile = rebuilt["profiles"][0]
+    assert profile.organisation_field == model["profiles"][0].organisation_field
+
+
+def test_stale_compiled_survey_is_not_rewritten(monkeypatch: pytest.MonkeyPatch):
+    """A stale compiled file falls back on the workbook, without
+    writing to the package at runtime."""
+    writes = []
+    monkeypatch.setattr(
+        survey_model, "_read_compiled", lambda: {"source_sha256": "stale"}
+    )
+    monkeypatch.setattr(
+        survey_model,
+        "write_compiled_survey_model",
+        lambda *args: writes.append(args),
+    )
+    get_survey_model.cache_clear()
+    try:
+        model = get_survey_model()
+    finally:
+        get_survey_model.cache_clear()
+
+    assert writes == []
+    assert model["profiles"]
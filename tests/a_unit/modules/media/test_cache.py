@@ -0,0 +1,78 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Unit tests for the /media local disk cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from app.modules.media.cache import MediaCache
+
+
+def _age(path: Path, seconds: int) -> None:
+    stat = path.stat()
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+class TestMediaCache:
+    def test_miss_then_hit(self, tmp_path: Path) -> None:
+        cache = MediaCache(tmp_path, max_bytes=1000)
+        assert cache.get("a.png") is None
+
+        path = cache.put("a.png", b"hello")
+        assert path.read_bytes() == b"hello"
+        assert cache.get("a.png") == path
+
+    def test_fetch_loads_only_on_miss(self, tmp_path: Path) -> None:
+        cache = MediaCache(tmp_path, max_bytes=1000)
+        calls = []
+
+        def load() -> bytes:
+            calls.append(1)
+            return b"data"
+
+        assert cache.fetch("a", load).read_bytes() == b"data"
+        assert cache.fetch("a", load).read_bytes() == b"data"
+        assert len(calls) == 1
+
+    def test_failed_load_leaves_nothing_behind(self, tmp_path: Path) -> None:
+        cache = MediaCache(tmp_path, max_bytes=1000)
+
+        def load() -> bytes:
+            raise FileNotFoundError
+
+        with pytest.raises(FileNotFoundError):
+            cache.fetch("a", load)
+        assert not tmp_path.exists() or list(tmp_path.iterdir()) == []
+
+    def test_no_temp_file_left_after_write(self, tmp_path: Path) -> None:
+        cache = MediaCache(tmp_path, max_bytes=1000)
+        cache.put("a", b"x" * 10)
+        assert [p.name for p in tmp_path.iterdir()] == ["a"]
+
+    def test_evicts_least_recently_served(self, tmp_path: Path) -> None:
+        cache = MediaCache(tmp_path, max_bytes=250)
+        a = cache.put("a", b"a" * 100)
+        b = cache.put("b", b"b" * 100)
+        _age(a, 20)
+        _age(b, 10)
+        # Serving "a" makes "b" the oldest.
+        cache.get("a")
+
+        cache.put("c", b"c" * 100)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a", "c"]
+
+    def test_stays_under_cap(self, tmp_path: Path) -> None:
+        cache = MediaCache(tmp_path, max_bytes=1000)
+        for i in range(30):
+            path = cache.put(f"blob-{i}", b"x" * 100)
+            _age(path, 100 - i)
+        total = sum(p.stat().st_size for p in tmp_path.iterdir())
+        assert total <= 1000
+        assert (tmp_path / "blob-29").exists()
@@ -41,6 +41,7 @@ loader), it is exercised via a real stand-in callable, not a patch.
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 from typing import Any, ClassVar
 
 import pytest
@@ -54,6 +55,7 @@ from app.modules.search.adapters import (
     _to_datetime,
     doc_id,
     doc_type,
+    version,
 )
 from app.modules.wire.models import ArticlePost, PressReleasePost
 from app.services.tagging import get_tags as real_get_tags
@@ -318,6 +320,7 @@ class TestBuildDoc:
         "url",
         "timestamp",
         "tags",
+        "modified",
     }
 
     def test_keys_match_canonical_shape(self):
@@ -426,3 +429,45 @@ class TestDocId:
         strict TypeError guard is what we expect for a stray object."""
         with pytest.raises(TypeError, match="No doc_type adapter"):
             doc_id(object())
+
+
+# ---------------------------------------------------------------------
+# version
+# ---------------------------------------------------------------------
+
+
+class TestVersion:
+    """``version`` is what the reconciliation diffs: it must change
+    with ``modified_at`` and be stable otherwise."""
+
+    def test_modified_at_wins(self):
+        obj = SimpleNamespace(
+            modified_at=_FakeArrow(datetime(2026, 2, 1, tzinfo=UTC)),
+            created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        )
+        assert version(obj) == "2026-02-01T00:00:00+00:00"
+
+    def test_falls_back_to_created_at(self):
+        obj = SimpleNamespace(
+            modified_at=None, created_at=datetime(2026, 1, 1, tzinfo=UTC)
+        )
+        assert version(obj) == "2026-01-01T00:00:00+00:00"
+
+    def test_no_timestamps(self):
+        assert version(SimpleNamespace()) == ""
+
+    def test_tags_change_version(self):
+        obj = SimpleNamespace(modified_at=datetime(2026, 2, 1, tzinfo=UTC))
+        untagged = version(obj)
+        tagged = version(obj, [{"label": "climat", "type": "manual"}])
+        retagged = version(obj, [{"label": "énergie", "type": "manual"}])
+        assert tagged.startswith(untagged + "#")
+        assert len({untagged, tagged, retagged}) == 3
+        assert version(obj, []) == untagged
+
+    def test_stored_on_doc(self):
+        obj = _make_real_post(ArticlePost, pk=1)
+        obj.modified_at = datetime(2026, 3, 1, tzinfo=UTC)
+        assert _build_doc(obj, tags=[])["modified"] == version(obj)
+        tags = [{"label": "climat", "type": "manual"}]
+        assert _build_doc(obj, tags=tags)["modified"] == version(obj, tags)
@@ -63,6 +63,7 @@ EXPECTED_DOC_KEYS = {
     "url",
     "timestamp",
     "tags",
+    "modified",
 }
 
 
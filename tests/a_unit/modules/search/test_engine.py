@@ -125,6 +125,21 @@ class TestSearchEngineCRUD:
         # Should not raise.
         engine.delete("article:999")
 
+    def test_doc_versions_lists_live_docs(self, engine: SearchEngine) -> None:
+        engine.bulk_upsert(
+            [
+                _doc(type="article", pk=1, title="a", text="a") | {"modified": "v2"},
+                _doc(type="article", pk=2, title="b", text="b") | {"modified": "v1"},
+                _doc(type="event", pk=3, title="c", text="c"),
+            ]
+        )
+        engine.upsert(
+            _doc(type="article", pk=1, title="a", text="a") | {"modified": "v3"}
+        )
+        engine.delete("article:2")
+
+        assert engine.doc_versions() == {"article:1": "v3", "event:3": ""}
+
 
 class TestSearchEngineRanking:
     def test_bm25_orders_by_relevance(self, populated_engine: SearchEngine) -> None:
@@ -262,3 +277,187 @@ class TestSearchEngineEdgeCases:
         # Corpus has 3 docs total; asking for 100 should return at most 3.
         hits = populated_engine.search("python", limit=100)
         assert 1 <= len(hits) <= 3
+
+
+class TestSearchEngineFaceted:
+    def test_counts_match_per_type_count(self, populated_engine: SearchEngine) -> None:
+        results = populated_engine.search_faceted(
+            "python", {"articles": "article", "events": "event"}
+        )
+
+        assert results.counts == {
+            "articles": populated_engine.count("python", type="article"),
+            "events": populated_engine.count("python", type="event"),
+        }
+        assert results.total == 3
+
+    def test_hits_match_per_type_search(self, populated_engine: SearchEngine) -> None:
+        results = populated_engine.search_faceted(
+            "python", {"articles": "article", "events": "event"}
+        )
+
+        assert [h["id"] for h in results.hits["articles"]] == [
+            h["id"] for h in populated_engine.search("python", type="article")
+        ]
+        assert [h["id"] for h in results.hits["events"]] == ["event:10"]
+
+    def test_list_bucket_aggregates_several_types(
+        self, populated_engine: SearchEngine
+    ) -> None:
+        results = populated_engine.search_faceted(
+            "python", {"everything": ["article", "event"]}
+        )
+
+        assert results.counts == {"everything": 3}
+        assert {h["id"] for h in results.hits["everything"]} == {
+            "article:1",
+            "article:2",
+            "event:10",
+        }
+
+    def test_limit_per_type_caps_each_bucket(
+        self, populated_engine: SearchEngine
+    ) -> None:
+        results = populated_engine.search_faceted(
+            "python",
+            {"articles": "article", "events": "event"},
+            limit_per_type=1,
+        )
+
+        assert results.counts["articles"] == 2
+        assert [h["id"] for h in results.hits["articles"]] == ["article:1"]
+        assert len(results.hits["events"]) == 1
+
+    def test_hits_for_restricts_materialised_buckets(
+        self, populated_engine: SearchEngine
+    ) -> None:
+        results = populated_engine.search_faceted(
+            "python",
+            {"articles": "article", "events": "event"},
+            hits_for=["events"],
+        )
+
+        assert set(results.hits) == {"events"}
+        assert results.counts == {"articles": 2, "events": 1}
+
+    def test_unmatched_bucket_has_zero_count(
+        self, populated_engine: SearchEngine
+    ) -> None:
+        results = populated_engine.search_faceted(
+            "python", {"articles": "article", "members": "user"}
+        )
+
+        assert results.counts["members"] == 0
+        assert results.hits["members"] == []
+
+
+class TestSearchEngineSearcherCache:
+    def test_searcher_is_reused_between_queries(
+        self, populated_engine: SearchEngine
+    ) -> None:
+        ix = populated_engine._get_index()
+        with populated_engine._searchers.searcher(ix) as first:
+            pass
+        with populated_engine._searchers.searcher(ix) as second:
+            pass
+
+        assert first is second
+
+    def test_local_write_is_visible_immediately(
+        self, populated_engine: SearchEngine
+    ) -> None:
+        assert populated_engine.search("kotlin") == []
+
+        populated_engine.upsert(
+            _doc(type="article", pk=3, title="Kotlin", text="jvm language")
+        )
+
+        assert [h["id"] for h in populated_engine.search("kotlin")] == ["article:3"]
+
+    def test_commit_from_another_engine_is_picked_up(self) -> None:
+        storage = RamStorage()
+        indexname = _unique_indexname()
+        reader = SearchEngine(storage, indexname=indexname)
+        writer = SearchEngine(storage, indexname=indexname)
+        writer.upsert(_doc(type="article", pk=1, title="alfa", text="bravo"))
+        assert [h["id"] for h in reader.search("bravo")] == ["article:1"]
+
+        # Simulates a commit made by another process (e.g. a Dramatiq
+        # worker): the reader's cache is not invalidated directly.
+        writer.upsert(_doc(type="article", pk=2, title="charlie", text="bravo"))
+
+        assert reader.count("bravo") == 2
+
+    def test_refresh_interval_defers_generation_poll(self) -> None:
+        storage = RamStorage()
+        indexname = _unique_indexname()
+        reader = SearchEngine(storage, indexname=indexname, refresh_interval=3600)
+        writer = SearchEngine(storage, indexname=indexname)
+        writer.upsert(_doc(type="article", pk=1, title="alfa", text="bravo"))
+        assert reader.count("bravo") == 1
+
+        writer.upsert(_doc(type="article", pk=2, title="charlie", text="bravo"))
+
+        # Still served from the cached generation…
+        assert reader.count("bravo") == 1
+        # …until something invalidates it.
+        reader._searchers.invalidate()
+        assert reader.count("bravo") == 2
+
+
+class TestSearchEngineBlueGreen:
+    def test_alias_defaults_to_indexname(self, engine: SearchEngine) -> None:
+        assert engine.active_indexname() == engine.indexname
+        assert engine.shadow_indexname() == f"{engine.indexname}_a"
+
+    def test_promote_switches_reads_and_writes(
+        self, populated_engine: SearchEngine
+    ) -> None:
+        target = populated_engine.shadow_indexname()
+        shadow = populated_engine.sibling(target)
+        shadow.upsert(_doc(type="article", pk=7, title="Kotlin", text="jvm"))
+        # Not live yet.
+        assert populated_engine.search("kotlin") == []
+
+        populated_engine.promote(target)
+
+        assert [h["id"] for h in populated_engine.search("kotlin")] == ["article:7"]
+        assert populated_engine.search("python") == []
+        populated_engine.upsert(_doc(type="event", pk=8, title="KotlinConf", text=""))
+        assert shadow.count("kotlinconf") == 1
+
+    def test_shadow_alternates_between_slots(self, engine: SearchEngine) -> None:
+        first = engine.shadow_indexname()
+        engine.promote(first)
+        second = engine.shadow_indexname()
+        engine.promote(second)
+
+        assert {first, second} == {
+            f"{engine.indexname}_a",
+            f"{engine.indexname}_b",
+        }
+        assert engine.shadow_indexname() == first
+
+    def test_promotion_is_seen_by_other_engines(self) -> None:
+        storage = RamStorage()
+        indexname = _unique_indexname()
+        reader = SearchEngine(storage, indexname=indexname)
+        writer = SearchEngine(storage, indexname=indexname)
+        target = writer.shadow_indexname()
+        writer.sibling(target).upsert(
+            _doc(type="article", pk=1, title="alfa", text="bravo")
+        )
+
+        writer.promote(target)
+
+        assert reader.active_indexname() == target
+        assert reader.count("bravo") == 1
+
+    def test_checkpoint_roundtrip(self, engine: SearchEngine) -> None:
+        assert engine.load_checkpoint("rebuild") is None
+
+        engine.save_checkpoint("rebuild", {"done": ["article:1-10"]})
+        assert engine.load_checkpoint("rebuild") == {"done": ["article:1-10"]}
+
+        engine.drop_checkpoint("rebuild")
+        assert engine.load_checkpoint("rebuild") is None
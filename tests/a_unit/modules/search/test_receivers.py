@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: AGPL-3.0-only
 
 """Verify that the receivers translate signal payloads to the right
-``reindex_from_source.send(source_type, source_id)`` call.
+``enqueue_reindex(source_type, source_id)`` call.
 
 We call the receiver functions directly rather than firing the signals
 through blinker, because firing the real signals would also invoke the
@@ -28,7 +28,7 @@ def captured_sends(monkeypatch) -> list[tuple]:
     def _capture(*args, **kwargs):
         calls.append((args, kwargs))
 
-    monkeypatch.setattr(receivers.reindex_from_source, "send", _capture)
+    monkeypatch.setattr(receivers, "enqueue_reindex", _capture)
     return calls
 
 
@@ -43,6 +43,7 @@ from sqlalchemy import select
 
 from app.models.organisation import Organisation
 from app.modules.swork.components.base import (
+    Facet,
     Filter,
     FilterByCity,
     FilterByDept,
@@ -423,3 +424,61 @@ class TestFilterByCityFromObjects:
         ]
         f = FilterByCity(users)
         assert f.options == ["Paris"]
+
+
+# ── Facets : precomputed options + counts ────────────────────────────
+
+
+class _ListSelectorFilter(Filter):
+    """Multi-valued selector, built like the KYC list filters of the
+    members directory."""
+
+    id = "tags"
+    label = "Tags"
+
+    def __init__(self, objects: list | None = None) -> None:
+        self.options = []
+        if not objects:
+            return
+        options = sorted({value for obj in objects for value in self.selector(obj)})
+        self.options = [opt for opt in options if opt]
+
+    @staticmethod
+    def selector(obj: Any) -> list[str]:
+        return obj.tags
+
+
+class _TaggedObj:
+    def __init__(self, *tags: str) -> None:
+        self.tags = list(tags)
+
+
+class TestFilterFacet:
+    def test_facet_options_match_constructor(self):
+        objs = [_StrSelectorObj("b"), _StrSelectorObj("a"), _StrSelectorObj("b")]
+        facet = _CallableSelectorFilter.facet(objs)
+        assert list(facet.options) == _CallableSelectorFilter(objs).options
+        assert facet.counts == {"a": 1, "b": 2}
+
+    def test_string_selector_counts(self):
+        objs = [_StrSelectorObj("x"), _StrSelectorObj("x")]
+        facet = _StringSelectorFilter.facet(objs)
+        assert facet.options == ("x",)
+        assert facet.counts == {"x": 2}
+
+    def test_list_selector_counts_each_object_once(self):
+        objs = [_TaggedObj("a", "a", "b"), _TaggedObj("b"), _TaggedObj()]
+        facet = _ListSelectorFilter.facet(objs)
+        assert facet.options == ("a", "b")
+        assert facet.counts == {"a": 1, "b": 2}
+
+    def test_from_facet_builds_filter_without_objects(self):
+        facet = Facet(options=("a", "b"), counts={"a": 3, "b": 1})
+        f = _ListSelectorFilter.from_facet(facet)
+        assert isinstance(f, _ListSelectorFilter)
+        assert f.options == ["a", "b"]
+        assert f.counts == {"a": 3, "b": 1}
+        # Each filter gets its own options list: the component mutates
+        # filter state per request, the cached facet must not change.
+        f.options.append("c")
+        assert facet.options == ("a", "b")
@@ -0,0 +1,61 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Unit tests for the keyset pagination helpers of `BaseList`.
+
+The query args carry search + active filters to the follow-up page
+requests; they must round-trip exactly (the cursor itself is tested in
+``tests/a_unit/lib/test_pagination.py``).
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+import pytest
+
+from app.modules.swork.components.base import BaseList, Filter
+
+
+class _ColorFilter(Filter):
+    id = "color"
+    label = "Couleur"
+    options: ClassVar[list[str]] = ["blue", "green", "red"]  # ty:ignore[invalid-attribute-override]
+
+    def apply(self, stmt, state):
+        return stmt
+
+
+class _List(BaseList):
+    def get_filters(self):
+        return [_ColorFilter()]
+
+    def search_clause(self, search):
+        raise NotImplementedError
+
+
+class TestQueryArgs:
+    def test_empty_state_gives_no_args(self):
+        assert _List().query_args() == {}
+
+    def test_round_trip(self):
+        source = _List()
+        source.search = "dupont"
+        source.filter_states["color"]["2"] = True
+        source.filter_states["color"]["0"] = True
+
+        target = _List()
+        target.restore_query_args(source.query_args())
+
+        assert target.search == "dupont"
+        assert target.filter_states == source.filter_states
+
+    @pytest.mark.parametrize(
+        "filters",
+        ["not json", "[1, 2]", '{"color": "0"}', '{"color": [9]}', '{"x": [0]}'],
+    )
+    def test_garbage_filters_are_ignored(self, filters):
+        target = _List()
+        target.restore_query_args({"filters": filters})
+        assert not any(target.filter_states["color"].values())
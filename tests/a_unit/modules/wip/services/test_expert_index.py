@@ -0,0 +1,198 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Unit tests for `wip/services/newsroom/expert_index`.
+
+The index must be a drop-in for the list-based code it replaces in
+`ExpertFilterService`: same counts, same held values, same pipeline
+result, same Avis pre-scoping. Every test below checks the bitset
+path against the list path on the same duck-typed experts — no Flask
+app, no DB.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.wip.services.newsroom.avis_matching import (
+    match_avis_mask,
+    match_experts_to_avis,
+)
+from app.modules.wip.services.newsroom.expert_filter import apply_filter_pipeline
+from app.modules.wip.services.newsroom.expert_index import (
+    ExpertIndex,
+    filter_expert_ids,
+)
+from app.modules.wip.services.newsroom.expert_selectors import (
+    DepartementSelector,
+    LanguesSelector,
+    PaysSelector,
+    SecteurSelector,
+    VilleSelector,
+)
+
+NOW = datetime.now(UTC)
+
+
+def _expert(
+    id: int,
+    last_name: str,
+    *,
+    langues: list[str] | None = None,
+    secteurs: list[str] | None = None,
+    country: str = "FR",
+    departement: str = "75",
+    ville: str = "Paris",
+    last_login: datetime | None = NOW,
+) -> SimpleNamespace:
+    profile = SimpleNamespace(
+        langues=langues or [],
+        secteurs_activite=secteurs or [],
+        country=country,
+        departement=departement,
+        ville=ville,
+    )
+    return SimpleNamespace(
+        id=id,
+        last_name=last_name,
+        first_name="A",
+        last_login_at=last_login,
+        profile=profile,
+    )
+
+
+EXPERTS = [
+    _expert(1, "Martin", langues=["fr", "en"], secteurs=["Tech"]),
+    _expert(2, "Bernard", langues=["fr"], secteurs=["Tech"], departement="69"),
+    _expert(3, "Dubois", langues=["de"], country="DE", departement="", ville=""),
+    _expert(4, "Albert", langues=["en"], secteurs=["Santé"], ville="Lyon"),
+    _expert(5, "Petit", secteurs=["Tech"], last_login=NOW - timedelta(days=400)),
+]
+
+SELECTOR_CLASSES = (
+    SecteurSelector,
+    LanguesSelector,
+    PaysSelector,
+    DepartementSelector,
+    VilleSelector,
+)
+
+
+def _no_taxonomy(_name: str) -> list[str]:
+    return []
+
+
+def _selectors(state, experts=(), **kwargs):
+    return [
+        cls(state, list(experts), taxonomy_loader=_no_taxonomy, **kwargs)
+        for cls in SELECTOR_CLASSES
+    ]
+
+
+@pytest.fixture
+def index() -> ExpertIndex:
+    return ExpertIndex(EXPERTS, _selectors({}))
+
+
+class TestExpertIndex:
+    def test_positions_follow_alphabetical_order(self, index) -> None:
+        assert index.ids == [4, 2, 3, 1, 5]
+        assert index.ids_of(index.all) == [4, 2, 3, 1, 5]
+        assert len(index) == 5
+
+    def test_union_is_or_within_a_selector(self, index) -> None:
+        assert sorted(index.ids_of(index.union("langues", ["de", "en"]))) == [1, 3, 4]
+        assert index.union("langues", ["xx"]) == 0
+        assert index.union("unknown", ["fr"]) == 0
+
+    def test_mask_ignores_unknown_ids(self, index) -> None:
+        assert sorted(index.ids_of(index.mask([1, 2, 999]))) == [1, 2]
+
+    def test_counts_restricted_to_pool(self, index) -> None:
+        assert index.counts("langues", index.all) == {"fr": 2, "en": 2, "de": 1}
+        assert index.counts("langues", index.mask([1])) == {"fr": 1, "en": 1}
+
+    def test_empty_index(self) -> None:
+        empty = ExpertIndex([], _selectors({}))
+        assert empty.all == 0
+        assert empty.ids_of(empty.all) == []
+        assert empty.counts("langues", empty.all) == {}
+
+
+class TestSelectorsOnIndex:
+    """Selectors given an index report what they report on a list."""
+
+    @pytest.mark.parametrize(
+        "state",
+        [
+            {},
+            {"pays": ["FR"]},
+            {"pays": ["FR", "DE"], "departement": ["75"]},
+        ],
+    )
+    def test_same_options_as_list_path(self, index, state) -> None:
+        on_list = _selectors(state, EXPERTS)
+        on_index = _selectors(state, index=index)
+        for a, b in zip(on_list, on_index, strict=True):
+            assert a._count_by_value == b._count_by_value
+            assert a.get_values() == b.get_values()
+
+    def test_pool_scopes_counts(self, index) -> None:
+        pool = index.mask([1, 2])
+        (langues,) = [
+            s for s in _selectors({}, index=index, pool=pool) if s.id == "langues"
+        ]
+        assert langues._count_by_value == {"fr": 2, "en": 1}
+
+
+class TestFilterExpertIds:
+    @pytest.mark.parametrize(
+        "state",
+        [
+            {"langues": ["fr"]},
+            {"langues": ["fr", "de"]},
+            {"langues": ["fr", "en"], "secteur": ["Tech"]},
+            {"pays": ["FR"], "ville": ["Paris"]},
+            {"secteur": ["Tech"], "selected_experts": [1]},
+            {"langues": ["xx"]},
+        ],
+    )
+    def test_matches_list_pipeline(self, index, state) -> None:
+        selectors = _selectors(state, EXPERTS)
+        expected = [
+            e.id for e in apply_filter_pipeline(EXPERTS, state, selectors, max_count=50)
+        ]
+        assert (
+            filter_expert_ids(index, index.all, state, selectors, max_count=50)
+            == expected
+        )
+
+    def test_no_criteria_returns_pool_head(self, index) -> None:
+        state = {"selected_experts": [4]}
+        selectors = _selectors(state)
+        assert filter_expert_ids(index, index.all, state, selectors, max_count=2) == [
+            4,
+            2,
+        ]
+
+    def test_capped_and_scoped_to_pool(self, index) -> None:
+        state = {"secteur": ["Tech"]}
+        selectors = _selectors(state)
+        pool = index.mask([1, 2, 5])
+        assert filter_expert_ids(index, pool, state, selectors, max_count=2) == [2, 1]
+
+
+class TestMatchAvisMask:
+    @pytest.mark.parametrize(
+        ("sector", "min_candidates"),
+        [("Tech", 1), ("Tech", 5), ("Santé", 1), ("", 1)],
+    )
+    def test_matches_list_matching(self, index, sector, min_candidates) -> None:
+        avis = SimpleNamespace(sector=sector, ciblage_secteur_detailles="")
+        expected = match_experts_to_avis(EXPERTS, avis, min_candidates=min_candidates)
+        mask = match_avis_mask(index, avis, min_candidates=min_candidates)
+        assert sorted(index.ids_of(mask)) == sorted(e.id for e in expected)
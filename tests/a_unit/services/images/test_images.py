@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+from io import BytesIO
 from pathlib import Path
 
 from PIL import Image
@@ -22,3 +23,29 @@ def test_make_square() -> None:
 
     new_img = image_service.make_square(img, 256)
     assert new_img.size == (256, 256)
+
+
+def test_make_variant_fits_within_size() -> None:
+    content = IMAGE_PATH.read_bytes()
+    image_service = ImageService()
+
+    data = image_service.make_variant(content, (64, 64), "WEBP")
+
+    variant = Image.open(BytesIO(data))
+    assert variant.format == "WEBP"
+    assert max(variant.size) == 64
+    assert variant.size[0] <= 64
+    assert variant.size[1] <= 64
+
+
+def test_make_variant_never_upscales() -> None:
+    buf = BytesIO()
+    Image.new("RGBA", (10, 20), (255, 0, 0, 128)).save(buf, "PNG")
+    image_service = ImageService()
+
+    data = image_service.make_variant(buf.getvalue(), (640, 360), "JPEG")
+
+    variant = Image.open(BytesIO(data))
+    assert variant.format == "JPEG"
+    assert variant.mode == "RGB"
+    assert variant.size == (10, 20)
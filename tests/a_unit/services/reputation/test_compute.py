@@ -49,6 +49,7 @@ from app.services.reputation._compute._constants import (
     REPUT_MEMBER_SPEC,
 )
 from app.services.reputation._compute._functions import (
+    GROUPED_COUNTS,
     export_functions,
     nb_foller_mbr,
     nb_follg_gr,
@@ -383,3 +384,20 @@ class TestComputeReputationWithMemberSpec:
         assert result["total"] == 0.0
         for name, _tag, _weight in pure_only_spec:
             assert result[name] == 0
+
+
+class TestBulkMetricsCoverage:
+    def test_every_metric_has_a_set_based_counterpart(self) -> None:
+        """Every counter the user specs use declares its grouped form
+        with `@_grouped_by`, so `compute_all_reputations` never falls
+        back to one query per user."""
+        functions = export_functions()
+        used = {
+            key
+            for key, _tag, _weight in REPUT_JOURNALIST_SPEC + REPUT_GENERIC_USER_SPEC
+            if key in functions
+        }
+        assert used == set(GROUPED_COUNTS)
+
+    def test_private_helpers_are_not_counters(self) -> None:
+        assert "_grouped_by" not in export_functions()
@@ -6,9 +6,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import sqlalchemy as sa
+
 from app.models.auth import User
 from app.modules.wire.models import ArticlePost
-from app.services.tagging import add_tag, get_tag_applications, get_tags
+from app.services.tagging import (
+    add_tag,
+    get_tag_applications,
+    get_tags,
+    get_tags_for,
+    tagged_with,
+)
 
 if TYPE_CHECKING:
     from flask_sqlalchemy import SQLAlchemy
@@ -141,3 +149,65 @@ def test_get_tags_with_multiple_auto_duplicates(db: SQLAlchemy) -> None:
     tags = get_tags(article)
     assert len(tags) == 1
     assert tags[0] == {"label": "auto-tag", "type": "auto"}
+
+
+def test_get_tags_for_batches_objects(db: SQLAlchemy) -> None:
+    """get_tags_for returns the same per-object result as get_tags."""
+    joe = User(id=907, email="joe907@example.com")
+    db.session.add(joe)
+    db.session.flush()
+
+    tagged = ArticlePost(owner=joe)
+    untagged = ArticlePost(owner=joe)
+    db.session.add_all([tagged, untagged])
+    db.session.flush()
+
+    db.session.add_all(
+        [
+            add_tag(tagged, "beta", type="auto"),
+            add_tag(tagged, "alpha", type="auto"),
+            add_tag(tagged, "alpha", type="manual"),
+        ]
+    )
+    db.session.flush()
+
+    tagged_id: int = tagged.id
+    tags_by_id = get_tags_for([tagged, untagged])
+    assert tags_by_id == {
+        tagged_id: get_tags(tagged),
+        untagged.id: [],
+    }
+    assert tags_by_id[tagged_id] == [
+        {"label": "alpha", "type": "manual"},
+        {"label": "beta", "type": "auto"},
+    ]
+
+
+def test_get_tags_for_empty_batch(db: SQLAlchemy) -> None:
+    assert get_tags_for([]) == {}
+
+
+def test_tagged_with(db: SQLAlchemy) -> None:
+    joe = User(id=908, email="joe908@example.com")
+    db.session.add(joe)
+    db.session.flush()
+
+    python = ArticlePost(owner=joe)
+    rust = ArticlePost(owner=joe)
+    untagged = ArticlePost(owner=joe)
+    db.session.add_all([python, rust, untagged])
+    db.session.flush()
+
+    db.session.add_all([add_tag(python, "python"), add_tag(rust, "rust")])
+    db.session.flush()
+
+    def ids(labels: list[str]) -> set[int]:
+        stmt = sa.select(ArticlePost.id).where(
+            ArticlePost.id.in_([python.id, rust.id, untagged.id]),
+            tagged_with(ArticlePost.id, labels),
+        )
+        return set(db.session.scalars(stmt))
+
+    assert ids(["python"]) == {python.id}
+    assert ids(["python", "rust"]) == {python.id, rust.id}
+    assert ids(["go"]) == set()
@@ -0,0 +1,108 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Unit tests for `app.services.capabilities` (the pure parts)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.enums import RoleEnum
+from app.models.auth import Role
+from app.modules.bw.bw_activation.user_utils import get_user_rights_on_bw
+from app.services.capabilities import NO_CAPABILITIES, Capabilities, CapabilityCache
+from app.services.menus import _user_has_role
+
+BW_ID = uuid4()
+OTHER_BW_ID = uuid4()
+
+
+class TestHasRole:
+    caps = Capabilities(roles=frozenset({"ADMIN", "PRESS_MEDIA"}))
+
+    def test_role_enum_matches_by_name(self) -> None:
+        assert self.caps.has_role(RoleEnum.ADMIN) is True
+        assert self.caps.has_role(RoleEnum.EXPERT) is False
+
+    def test_role_name(self) -> None:
+        assert self.caps.has_role("ADMIN") is True
+        assert self.caps.has_role("admin") is False
+
+    def test_role_object(self) -> None:
+        assert self.caps.has_role(Role(name="PRESS_MEDIA")) is True
+
+    def test_any_of_a_collection(self) -> None:
+        assert self.caps.has_role(["EXPERT", "ADMIN"]) is True
+        assert self.caps.has_role({"EXPERT"}) is False
+
+    def test_invalid_role_raises(self) -> None:
+        with pytest.raises(ValueError):
+            self.caps.has_role(42)  # type: ignore[arg-type]
+
+    def test_no_capabilities(self) -> None:
+        assert NO_CAPABILITIES.has_role(RoleEnum.ADMIN) is False
+
+    def test_menus_compare_folded_names(self) -> None:
+        assert _user_has_role(self.caps, "admin") is True
+        assert _user_has_role(self.caps, "ADMIN") is False
+
+
+class TestBusinessWallRights:
+    caps = Capabilities(
+        owned_bws=frozenset({BW_ID}),
+        bw_roles=frozenset({(BW_ID, "BWPRi"), (OTHER_BW_ID, "BWMi")}),
+        bw_missions=frozenset({(BW_ID, "events"), (BW_ID, "press_release")}),
+    )
+
+    def test_lookups_are_per_bw(self) -> None:
+        assert self.caps.has_bw_role(BW_ID, "BWPRi") is True
+        assert self.caps.has_bw_role(BW_ID, "BWMi") is False
+        assert self.caps.has_bw_mission(BW_ID, "events") is True
+        assert self.caps.has_bw_mission(OTHER_BW_ID, "events") is False
+        assert self.caps.bw_role_types(OTHER_BW_ID) == {"BWMi"}
+
+    def test_rights_from_capabilities_match_rights_from_assignments(self) -> None:
+        user = SimpleNamespace(id=7)
+        assignment = SimpleNamespace(
+            user_id=7,
+            role_type="BWPRi",
+            invitation_status="accepted",
+            permissions=[
+                SimpleNamespace(permission_type="press_release", is_granted=True),
+                SimpleNamespace(permission_type="events", is_granted=True),
+            ],
+        )
+        bw = SimpleNamespace(id=BW_ID, owner_id=7, role_assignments=[assignment])
+
+        rights = get_user_rights_on_bw(user, bw, self.caps)  # type: ignore[arg-type]
+
+        assert rights == get_user_rights_on_bw(user, bw)  # type: ignore[arg-type]
+        assert rights == [
+            "Propriétaire (Business Wall Owner)",
+            "Rôle : PR Manager (internal)",
+            "Mission : Publier des communiqués de presse",
+            "Mission : Publier des événements",
+        ]
+
+
+class TestCapabilityCache:
+    def test_entry_is_kept_for_one_version(self) -> None:
+        cache = CapabilityCache()
+        v0 = Capabilities(roles=frozenset({"ADMIN"}))
+        v1 = Capabilities()
+
+        assert cache.get(1, 0, lambda: v0) is v0
+        assert cache.get(1, 0, lambda: v1) is v0
+        assert cache.get(1, 1, lambda: v1) is v1
+
+    def test_invalidate(self) -> None:
+        cache = CapabilityCache()
+        cache.get(1, 0, Capabilities)
+        cache.invalidate(1)
+        fresh = Capabilities(roles=frozenset({"ADMIN"}))
+
+        assert cache.get(1, 0, lambda: fresh) is fresh
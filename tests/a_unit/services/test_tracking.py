@@ -8,9 +8,18 @@ from typing import TYPE_CHECKING
 
 from app.models.auth import User
 from app.modules.wire.models import ArticlePost
-from app.services.tracking import get_unique_view_count, get_view_count, record_view
+from app.services.tracking import (
+    _service,
+    flush_views,
+    get_unique_view_count,
+    get_view_count,
+    record_view,
+)
+from app.services.tracking._buffer import view_buffer
 
 if TYPE_CHECKING:
+    import pytest
+    from flask import Flask
     from flask_sqlalchemy import SQLAlchemy
 
 
@@ -34,3 +43,30 @@ def test_view_counter(db: SQLAlchemy) -> None:
     db.session.flush()
     assert get_view_count(article) == 2
     assert get_unique_view_count(article) == 1
+
+
+def test_buffered_view_arms_a_flush(
+    app: Flask, db: SQLAlchemy, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    joe = User(email="joe@example.com")
+    article = ArticlePost(owner=joe)
+    article.newsroom_id = 42
+    db.session.add_all([article, joe])
+    db.session.flush()
+
+    scheduled: list[float] = []
+    monkeypatch.setattr(
+        _service, "_flush_later", lambda app, delay: scheduled.append(delay)
+    )
+    monkeypatch.setitem(app.config, "VIEW_BUFFER_SIZE", 100)
+    monkeypatch.setitem(app.config, "VIEW_BUFFER_SECONDS", 30)
+
+    record_view(joe, article)
+    record_view(joe, article)
+
+    assert scheduled == [30]
+    assert len(view_buffer) == 2
+    assert get_view_count(article) == 0
+
+    assert flush_views() == 2
+    assert get_view_count(article) == 2
@@ -0,0 +1,49 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Unit tests for the view buffer of `app.services.tracking`."""
+
+from __future__ import annotations
+
+import arrow
+
+from app.services.tracking._buffer import PendingView, ViewBuffer
+
+
+def _view(user_id: int = 1) -> PendingView:
+    return PendingView(user_id, 10, object, arrow.utcnow())
+
+
+def test_empty_buffer_is_never_due() -> None:
+    buffer = ViewBuffer()
+
+    assert buffer.is_due(0, 0) is False
+
+
+def test_due_when_full() -> None:
+    buffer = ViewBuffer()
+    buffer.add(_view(1))
+
+    assert buffer.is_due(2, 3600) is False
+    buffer.add(_view(2))
+    assert buffer.is_due(2, 3600) is True
+
+
+def test_due_when_old_enough() -> None:
+    buffer = ViewBuffer()
+    buffer.add(_view())
+
+    assert buffer.is_due(100, 3600) is False
+    assert buffer.is_due(100, 0) is True
+
+
+def test_drain_empties_the_buffer() -> None:
+    buffer = ViewBuffer()
+    views = [_view(1), _view(2)]
+    for view in views:
+        buffer.add(view)
+
+    assert buffer.drain() == views
+    assert len(buffer) == 0
+    assert buffer.drain() == []
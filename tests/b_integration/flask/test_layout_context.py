@@ -0,0 +1,131 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Integration tests for the layout context injected in every template.
+
+Menus, the bell badge and the app version are made available to every
+render, htmx partials included. A partial that shows none of them must
+not query the DB; the notification digest is served from cache until
+`NotificationService` posts or marks something as read.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import pytest
+from flask import g, render_template_string
+from sqlalchemy import event
+from svcs.flask import container
+
+from app.flask.extensions import db
+from app.flask.lib.nav.request import NavRequest
+from app.models.auth import User
+from app.services.notifications import NotificationService, notification_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from flask import Flask
+    from sqlalchemy.orm import Session
+
+
+@pytest.fixture(autouse=True)
+def _digest_cache(app: Flask):
+    """Cache the digest (the test config disables it)."""
+    ttl = app.config["NOTIFICATION_CACHE_TTL"]
+    app.config["NOTIFICATION_CACHE_TTL"] = 60
+    notification_cache.clear()
+    yield
+    notification_cache.clear()
+    app.config["NOTIFICATION_CACHE_TTL"] = ttl
+
+
+@contextmanager
+def _capture_queries() -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def _capture(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _capture)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _capture)
+
+
+def _make_user(db_session: Session) -> User:
+    user = User(email="layout@example.com")
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+def test_partial_render_runs_no_query(app: Flask, db_session: Session):
+    user = _make_user(db_session)
+
+    with app.test_request_context("/wire/"):
+        g.user = user
+        g.nav = NavRequest("wire.wire", {})
+        with _capture_queries() as statements:
+            html = render_template_string("<p>{{ app_version }}</p>")
+
+    assert html.startswith("<p>")
+    assert statements == []
+
+
+def test_menus_are_built_once(app: Flask, db_session: Session):
+    user = _make_user(db_session)
+    template = "{% for item in nav_user_menu %}{{ item.label }};{% endfor %}"
+
+    with app.test_request_context("/wire/"):
+        g.user = user
+        g.nav = NavRequest("wire.wire", {})
+        first = render_template_string(template)
+
+    with app.test_request_context("/wire/"):
+        g.user = db_session.get(User, user.id)
+        g.nav = NavRequest("wire.wire", {})
+        with _capture_queries() as statements:
+            second = render_template_string(template)
+
+    assert "Mon profil;" in first
+    assert second == first
+    # Only the user's roles, to find the cached menu.
+    assert len(statements) <= 1
+
+
+class TestNotificationDigest:
+    def test_digest_is_cached(self, app: Flask, db_session: Session):
+        user = _make_user(db_session)
+        service = container.get(NotificationService)
+        service.post(user, "Hello")
+        db_session.flush()
+
+        assert service.get_digest(user).unread_count == 1
+        with _capture_queries() as statements:
+            digest = service.get_digest(user)
+
+        assert statements == []
+        assert [n.get_abstract() for n in digest.latest] == ["Hello"]
+
+    def test_post_and_mark_as_read_refresh_it(self, app: Flask, db_session: Session):
+        user = _make_user(db_session)
+        service = container.get(NotificationService)
+        assert service.get_digest(user).unread_count == 0
+
+        notification = service.post(user, "Hello")
+        db_session.flush()
+        assert service.get_digest(user).unread_count == 1
+
+        service.mark_as_read(notification.id, user)
+        assert service.get_digest(user).unread_count == 0
+
+        service.post(user, "Again")
+        db_session.flush()
+        assert service.get_digest(user).unread_count == 1
+
+        service.mark_all_as_read(user)
+        assert service.get_digest(user).unread_count == 0
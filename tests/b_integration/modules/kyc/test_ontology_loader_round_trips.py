@@ -20,8 +20,8 @@ What we cover here that a_unit cannot:
   ordered by `seq`.
 - The default `get_taxonomy_dual_select` branch for taxonomies NOT in
   `ONTOLOGY_DB_LIST` (the `{"field1": ..., "field2": ...}` shape).
-- The `cachetools.TTLCache` attached to `get_ontology_content`: we must
-  invalidate it between tests (the cache is process-global and would
+- The reference data store behind `get_ontology_content`: we must
+  clear it between tests (the store is process-global and would
   otherwise leak rows across savepoint-rolled-back transactions).
 
 No mocks, no monkeypatch, no MagicMock — per CLAUDE.md.
@@ -41,6 +41,11 @@ from app.modules.kyc.ontology_loader import (
     get_choices,
     get_ontology_content,
 )
+from app.services.reference_data import (
+    TAXONOMIES,
+    bump_reference_data_version,
+    reference_data,
+)
 from app.services.taxonomies import TaxonomyEntry
 
 if TYPE_CHECKING:
@@ -49,14 +54,14 @@ if TYPE_CHECKING:
 
 @pytest.fixture(autouse=True)
 def _clear_ontology_cache() -> None:
-    """Clear the TTLCache on `get_ontology_content` before each test.
+    """Clear the process-wide reference data store before each test.
 
-    `@cached(cache=TTLCache(...))` from cachetools attaches the cache
-    object as `func.cache`. Because tests run inside savepoints that
-    roll back, a cached return from a previous test would silently mask
-    the fact that the current test's DB rows aren't being read.
+    `get_ontology_content` keeps what it loads until the dataset's
+    version is bumped. Because tests run inside savepoints that roll
+    back, a cached return from a previous test would silently mask the
+    fact that the current test's DB rows aren't being read.
     """
-    get_ontology_content.cache.clear()
+    reference_data.clear()
 
 
 def _seed(
@@ -197,7 +202,7 @@ class TestGetChoicesRouting:
 
 
 class TestGetOntologyContentCacheInvalidation:
-    """The TTLCache must be cleared to observe fresh DB state."""
+    """The store must be invalidated to observe fresh DB state."""
 
     def test_cache_returns_stale_result_without_clear(
         self, db_session: Session
@@ -208,16 +213,16 @@ class TestGetOntologyContentCacheInvalidation:
         # Seed new rows.
         _seed(db_session, "langue", [("Français", "", "fr", 1)])
 
-        # WITHOUT clearing the cache, the loader returns the cached empty
-        # list — this is the documented behavior of `@cached`.
+        # WITHOUT a version bump, the loader returns the cached empty
+        # list — this is the documented behavior of the store.
         assert get_ontology_content("langue") == []
 
-    def test_cache_clear_exposes_fresh_db_state(self, db_session: Session) -> None:
-        # Same scenario, but invalidate the cache after seeding.
+    def test_version_bump_exposes_fresh_db_state(self, db_session: Session) -> None:
+        # Same scenario, but bump the taxonomies' version after seeding.
         assert get_ontology_content("langue") == []
         _seed(db_session, "langue", [("Français", "", "fr", 1)])
 
-        get_ontology_content.cache.clear()
+        bump_reference_data_version(TAXONOMIES)
 
         assert get_ontology_content("langue") == [("fr", "Français")]
 
@@ -249,7 +254,3 @@ class TestOntologyCacheSizing:
             event.remove(db.engine, "before_cursor_execute", _capture)
 
         assert seen == [], "civilite was evicted — cache too small (thrashing)"
-
-    def test_cache_maxsize_covers_the_working_set(self) -> None:
-        # ONTOLOGY_MAP + the KYC label map reference ~40 distinct ontologies.
-        assert get_ontology_content.cache.maxsize >= 64
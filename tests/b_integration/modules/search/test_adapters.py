@@ -21,8 +21,15 @@ from app.modules.biz.models import (
     ProjectOffer,
 )
 from app.modules.events.models import EventPost
-from app.modules.search.adapters import doc_id, doc_type, is_public, to_doc
+from app.modules.search.adapters import (
+    doc_id,
+    doc_type,
+    is_public,
+    to_doc,
+    to_docs,
+)
 from app.modules.wire.models import ArticlePost, PressReleasePost
+from app.services.tagging import add_tag
 
 # ── is_public: pure unit tests (no DB) ─────────────────────────────────
 
@@ -204,6 +211,52 @@ class TestToDocArticle:
             assert doc["timestamp"] is None
 
 
+class TestToDocPrefetchedTags:
+    def test_prefetched_tags_are_used_as_is(self, db_session, app):
+        with app.test_request_context():
+            user = User(email="tags-prefetch@example.com")
+            db_session.add(user)
+            db_session.flush()
+
+            article = ArticlePost(owner=user, title="Tagged")
+            db_session.add(article)
+            db_session.flush()
+            db_session.add(add_tag(article, "stored"))
+            db_session.flush()
+
+            doc = to_doc(article, tags=[{"label": "given", "type": "manual"}])
+
+            assert doc["tags"] == "given"
+
+    def test_to_docs_loads_tags_per_batch(self, db_session, app):
+        with app.test_request_context():
+            user = User(email="tags-batch@example.com")
+            db_session.add(user)
+            db_session.flush()
+
+            first = ArticlePost(owner=user, title="First")
+            second = ArticlePost(owner=user, title="Second")
+            db_session.add_all([first, second])
+            db_session.flush()
+            db_session.add_all(
+                [
+                    add_tag(first, "python"),
+                    add_tag(first, "flask"),
+                    add_tag(second, "search"),
+                ]
+            )
+            db_session.flush()
+
+            docs = to_docs([first, second])
+
+            assert [d["tags"] for d in docs] == [
+                to_doc(first)["tags"],
+                to_doc(second)["tags"],
+            ]
+            assert docs[0]["tags"] == "flask,python"
+            assert docs[1]["tags"] == "search"
+
+
 class TestToDocPressRelease:
     def test_doc_uses_press_release_type(self, db_session, app):
         with app.test_request_context():
@@ -89,12 +89,15 @@ def _dispatch(broker: StubBroker, message: Message) -> None:
 
 class TestSignalToEngineLoop:
     def test_article_signal_enqueues_and_indexes(
-        self, app, db_session, stub_broker, test_engine
+        self, app, db_session, stub_broker, test_engine, monkeypatch
     ):
         """The full chain: domain signal fires → search receiver
-        enqueues → message is on the broker → dispatching it indexes
-        the post in the engine.
+        queues the change and schedules a delayed flush → the flush
+        message is on the broker → dispatching it indexes the post in
+        the engine.
         """
+        # The flush commits; keep it inside the test transaction.
+        monkeypatch.setattr(db_session, "commit", db_session.flush)
         with app.test_request_context():
             # Set up the wire-side mirror that the actor will look up.
             owner = User(email="loop_owner@example.com")
@@ -117,11 +120,11 @@ class TestSignalToEngineLoop:
             # testing here.
             _on_article_published(SimpleNamespace(id=12345))
 
-            # Message should now be on the broker.
-            message = _drain_one(stub_broker)
-            assert message.actor_name == "reindex_from_source"
-            assert tuple(message.args) == ("article", 12345)
-            assert message.kwargs == {}
+            # The debounced flush should now be on the delay queue.
+            message = _drain_one(stub_broker, "default.DQ")
+            assert message.actor_name == "flush_pending_reindex"
+            assert tuple(message.args) == ()
+            assert message.options["eta"]
 
             # Dispatch the message: this should reach the engine.
             _dispatch(stub_broker, message)
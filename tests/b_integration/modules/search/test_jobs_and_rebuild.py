@@ -11,6 +11,8 @@ Exercises three end-to-end flows:
   being public (covers the unpublish path).
 * ``flask search rebuild`` walks the database and produces an index
   that contains exactly the currently-public posts.
+* ``reconcile_index`` converges the index to the same result while
+  only rewriting the docs that drifted.
 
 These tests skip Dramatiq's broker entirely — we call the wrapped
 function directly. The receiver-to-job wiring is covered by a unit
@@ -32,10 +34,17 @@ from app.models.auth import User
 from app.models.lifecycle import PublicationStatus
 from app.models.organisation import Organisation
 from app.modules.biz.models import JobOffer, MissionOffer
-from app.modules.search.cli import rebuild
+from app.modules.search.adapters import doc_id, to_docs, version
+from app.modules.search.cli import rebuild, reconcile_index
 from app.modules.search.engine import SearchEngine
-from app.modules.search.jobs import reindex_from_source
+from app.modules.search.jobs import (
+    enqueue_reindex,
+    flush_pending_reindex,
+    reindex_from_source,
+)
+from app.modules.search.models import PendingReindex
 from app.modules.wire.models import ArticlePost, PressReleasePost
+from app.services.tagging import add_tag
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -350,6 +359,77 @@ class TestReindexFromSourceOrganisation:
             assert test_engine.search("LifecycleCorp") == []
 
 
+@pytest.fixture
+def no_commit(db_session, monkeypatch) -> None:
+    """Turn the job's ``db.session.commit()`` into a flush.
+
+    A real commit would end the test transaction, and the rows created
+    by the test would survive its rollback.
+    """
+    monkeypatch.setattr(db_session, "commit", db_session.flush)
+
+
+@pytest.fixture
+def sent_flushes(monkeypatch) -> list[dict]:
+    """Record the delayed flush messages instead of sending them."""
+    sent: list[dict] = []
+    monkeypatch.setattr(
+        flush_pending_reindex, "send_with_options", lambda **kw: sent.append(kw)
+    )
+    return sent
+
+
+@pytest.mark.usefixtures("no_commit")
+class TestCoalescedIndexing:
+    def test_enqueue_schedules_one_flush_per_burst(self, app, db_session, sent_flushes):
+        with app.test_request_context():
+            for source_id in range(5):
+                enqueue_reindex("article", source_id)
+
+        assert len(sent_flushes) == 1
+        assert db_session.query(PendingReindex).count() == 5
+
+    def test_flush_collapses_duplicates_into_one_commit(
+        self, app, db_session, test_engine, sent_flushes
+    ):
+        with app.test_request_context():
+            public = _make_article_post(
+                db_session,
+                status=PublicationStatus.PUBLIC,
+                newsroom_id=321,
+                title="Coalesced article",
+                content="Batched body.",
+            )
+            draft = _make_article_post(
+                db_session,
+                status=PublicationStatus.DRAFT,
+                newsroom_id=322,
+                title="Coalesced draft",
+                content="Never indexed.",
+            )
+            for _ in range(3):
+                enqueue_reindex("article", public.newsroom_id)
+            enqueue_reindex("article", draft.newsroom_id)
+            db_session.flush()
+            generation = test_engine._get_index().latest_generation()
+
+            flush_pending_reindex.fn()
+
+            assert test_engine._get_index().latest_generation() == generation + 1
+            assert len(test_engine.search("Batched")) == 1
+            assert test_engine.search("Never") == []
+            assert db_session.query(PendingReindex).count() == 0
+
+    def test_flush_with_nothing_pending_does_not_commit(
+        self, app, db_session, test_engine
+    ):
+        generation = test_engine._get_index().latest_generation()
+
+        flush_pending_reindex.fn()
+
+        assert test_engine._get_index().latest_generation() == generation
+
+
 class TestRebuildCli:
     def test_rebuild_indexes_only_public_posts(self, app, db_session, test_engine):
         """``flask search rebuild`` should clear the index and then
@@ -401,3 +481,149 @@ class TestRebuildCli:
             assert len(test_engine.search("Findable")) == 1
             assert test_engine.search("Hidden") == []  # draft excluded
             assert len(test_engine.search("PR body")) == 1
+
+    def test_shadow_rebuild_swaps_in_fresh_index(self, app, db_session, test_engine):
+        """``rebuild --shadow`` builds the other blue/green slot and
+        only then makes it live; the previous index is left untouched.
+        """
+        with app.test_request_context():
+            _make_article_post(
+                db_session,
+                status=PublicationStatus.PUBLIC,
+                newsroom_id=311,
+                title="Shadow article",
+                content="Shadowed body.",
+            )
+            test_engine.upsert(
+                {
+                    "type": "article",
+                    "id": "article:9999",
+                    "title": "Stale",
+                    "text": "stale stale stale",
+                    "summary": "",
+                    "url": "/x",
+                    "timestamp": datetime(2020, 1, 1, tzinfo=UTC),
+                    "tags": "",
+                }
+            )
+            live_before = test_engine.active_indexname()
+
+            runner = app.test_cli_runner()
+            result = runner.invoke(rebuild, ["--shadow", "--chunk-size", "1"])
+            assert result.exit_code == 0, result.output
+
+            assert test_engine.active_indexname() != live_before
+            assert test_engine.search("Stale") == []
+            assert len(test_engine.search("Shadowed")) == 1
+            assert test_engine.sibling(live_before).search("Stale")
+            assert test_engine.load_checkpoint("rebuild") is None
+
+
+class TestReconcile:
+    def test_reconcile_fixes_only_what_drifted(self, app, db_session, test_engine):
+        """``reconcile_index`` re-indexes missing or stale rows, drops
+        unpublished and orphaned docs, and leaves in-sync docs alone.
+        """
+        with app.test_request_context():
+            in_sync = _make_article_post(
+                db_session,
+                status=PublicationStatus.PUBLIC,
+                newsroom_id=321,
+                title="In sync",
+                content="Synced body.",
+            )
+            edited = _make_article_post(
+                db_session,
+                status=PublicationStatus.PUBLIC,
+                newsroom_id=322,
+                title="Edited",
+                content="Old body.",
+            )
+            unpublished = _make_article_post(
+                db_session,
+                status=PublicationStatus.PUBLIC,
+                newsroom_id=323,
+                title="Unpublished",
+                content="Withdrawn body.",
+            )
+            _make_article_post(
+                db_session,
+                status=PublicationStatus.PUBLIC,
+                newsroom_id=324,
+                title="Missing",
+                content="Missed body.",
+            )
+            test_engine.bulk_upsert(to_docs([in_sync, edited, unpublished]))
+            test_engine.upsert(
+                {
+                    "type": "article",
+                    "id": "article:9999",
+                    "title": "Orphan",
+                    "text": "orphan orphan",
+                    "summary": "",
+                    "url": "/x",
+                    "timestamp": datetime(2020, 1, 1, tzinfo=UTC),
+                    "tags": "",
+                    "modified": "",
+                }
+            )
+
+            edited.content = "New body."
+            unpublished.status = PublicationStatus.DRAFT
+            db_session.flush()
+            assert version(edited) != test_engine.doc_versions()[doc_id(edited)]
+
+            stats = reconcile_index()
+
+            assert stats["article"].upserted == 2  # edited + missing
+            assert stats["article"].deleted == 2  # unpublished + orphan
+            assert len(test_engine.search("Synced")) == 1
+            assert len(test_engine.search("New")) == 1
+            assert test_engine.search("Old") == []
+            assert test_engine.search("Withdrawn") == []
+            assert len(test_engine.search("Missed")) == 1
+            assert test_engine.search("Orphan") == []
+
+    def test_reconcile_picks_up_tag_only_changes(self, app, db_session, test_engine):
+        """Tagging doesn't touch ``modified_at``; the tag digest in the
+        version still marks the doc as stale."""
+        with app.test_request_context():
+            post = _make_article_post(
+                db_session,
+                status=PublicationStatus.PUBLIC,
+                newsroom_id=325,
+                title="Tagged later",
+                content="Tagged body.",
+            )
+            test_engine.bulk_upsert(to_docs([post]))
+            db_session.add(add_tag(post, "climat"))
+            db_session.flush()
+
+            stats = reconcile_index()
+
+            assert stats["article"].upserted == 1
+            hit = test_engine.search("Tagged")[0]
+            assert hit["tags"] == "climat"
+
+    def test_reconcile_in_sync_index_does_not_commit(
+        self, app, db_session, test_engine
+    ):
+        """A second pass over an unchanged database writes nothing."""
+        with app.test_request_context():
+            post = _make_article_post(
+                db_session,
+                status=PublicationStatus.PUBLIC,
+                newsroom_id=331,
+                title="Steady",
+                content="Steady body.",
+            )
+            reconcile_index()
+            assert doc_id(post) in test_engine.doc_versions()
+            generation = test_engine._get_index().latest_generation()
+
+            stats = reconcile_index()
+
+            assert all(s.upserted == 0 and s.deleted == 0 for s in stats.values()), (
+                stats
+            )
+            assert test_engine._get_index().latest_generation() == generation
@@ -407,6 +407,130 @@ class TestMembersListPerformance:
         )
 
 
+class TestMembersListFacets:
+    """Filter options come from the in-process facet cache : rendering
+    the filter bar again doesn't rescan the members, and a profile
+    change is picked up on the next render."""
+
+    def test_filters_served_from_cache(self, app: Flask, db_session: Session):
+        role = db_session.query(Role).filter_by(
+            name=RoleEnum.PRESS_MEDIA.name
+        ).first() or Role(name=RoleEnum.PRESS_MEDIA.name, description="press")
+        db_session.add(role)
+        db_session.flush()
+        TestMembersListPerformance._make_member(db_session, role, 0)
+
+        statements: list[str] = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.test_request_context():
+            MembersList().get_filters()
+            event.listen(db.engine, "before_cursor_execute", _capture)
+            try:
+                MembersList().get_filters()
+            finally:
+                event.remove(db.engine, "before_cursor_execute", _capture)
+
+        assert statements == []
+
+    def test_profile_change_refreshes_options(
+        self, app: Flask, db_session: Session, test_user_with_profile: User
+    ):
+        with app.test_request_context():
+            before = {f.id: f for f in MembersList().get_filters()}
+            assert "Rédacteur en chef" not in before["job_title"].options
+
+            test_user_with_profile.active = True
+            test_user_with_profile.profile.profile_label = "Rédacteur en chef"
+            db_session.flush()
+
+            after = {f.id: f for f in MembersList().get_filters()}
+            assert "Rédacteur en chef" in after["job_title"].options
+            assert after["job_title"].counts["Rédacteur en chef"] >= 1
+
+
+class TestMembersListPagination:
+    """Keyset pagination : pages follow each other without gaps or
+    repeats, and the total comes from a separate count."""
+
+    @staticmethod
+    def _make_members(db_session: Session, last_names: list[str]) -> None:
+        for i, last_name in enumerate(last_names):
+            user = User(
+                email=f"pager_{i}@example.com",
+                first_name="Pager",
+                last_name=last_name,
+                active=True,
+            )
+            db_session.add(user)
+        db_session.flush()
+
+    def test_pages_cover_all_members_once(
+        self, app: Flask, db_session: Session, monkeypatch: pytest.MonkeyPatch
+    ):
+        last_names = ["Pagec", "Pagea", "Pagee", "Pageb", "Paged"]
+        self._make_members(db_session, last_names)
+        monkeypatch.setattr(MembersList, "page_size", 2)
+
+        with app.test_request_context():
+            members = MembersList()
+            members.search = "Page"
+            assert members.count_items() == 5
+
+            seen: list[str] = []
+            pages = 0
+            while True:
+                page = members.fetch_page()
+                pages += 1
+                assert len(page.items) <= 2
+                seen += [u.last_name for u in page.items]
+                if not page.next_cursor:
+                    break
+                members.page_cursor = page.next_cursor
+
+        assert seen == sorted(last_names)
+        assert pages == 3
+
+    def test_context_links_to_next_page(
+        self, app: Flask, db_session: Session, monkeypatch: pytest.MonkeyPatch
+    ):
+        self._make_members(db_session, ["Pagex", "Pagey", "Pagez"])
+        monkeypatch.setattr(MembersList, "page_size", 2)
+
+        with app.test_request_context():
+            members = MembersList()
+            members.search = "Page"
+            ctx = members.context()
+
+        assert ctx["count"] == 3
+        assert len(list(ctx["directory"].objects)) == 2
+        assert "/swork/lists/members-list/page?" in ctx["next_page_url"]
+        assert "search=Page" in ctx["next_page_url"]
+
+    def test_render_page_is_a_fragment(
+        self, app: Flask, db_session: Session, monkeypatch: pytest.MonkeyPatch
+    ):
+        self._make_members(db_session, ["Pagex", "Pagey", "Pagez"])
+        monkeypatch.setattr(MembersList, "page_size", 2)
+
+        with app.test_request_context():
+            members = MembersList()
+            members.search = "Page"
+            cursor = members.fetch_page().next_cursor
+            html = MembersList()
+            html.search = "Page"
+            fragment = html.render_page(cursor, letter="P")
+
+        assert "wire:id" not in fragment
+        assert "Pagez" in fragment
+        assert "Pagex" not in fragment
+        # Same letter as the previous page : no repeated heading.
+        assert "<h3>" not in fragment
+        assert "hx-get" not in fragment
+
+
 class TestOrganisationsListPerformance:
     """The org list re-fetched each org's active BusinessWall twice (display
     name + logo) → 2 queries per org (66× bw_business_wall on
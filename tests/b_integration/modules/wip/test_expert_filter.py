@@ -208,7 +208,6 @@ class TestSelectorSections:
         one section. No orphan selectors, no duplicates."""
         with app.test_request_context():
             service = ExpertFilterService()
-            service._all_experts = experts
             flat_ids = {s.id for s in service.selectors}
             section_ids = [
                 sel.id for section in service.sections for sel in section.selectors
@@ -228,7 +227,6 @@ class TestSelectorSections:
         (1- Secteurs, 2- Géo, 3- Fonctions, 4- Métiers)."""
         with app.test_request_context():
             service = ExpertFilterService()
-            service._all_experts = experts
             titles = [section.title for section in service.sections]
             assert titles == [
                 "Secteurs d'activité et types d'organisation",
@@ -243,7 +241,6 @@ class TestSelectorSections:
         type_presse, taille_organisation."""
         with app.test_request_context():
             service = ExpertFilterService()
-            service._all_experts = experts
             section_1 = service.sections[0]
             ids = [s.id for s in section_1.selectors]
             assert ids == [
@@ -261,7 +258,6 @@ class TestSelectorSections:
         so the visual order must match the data flow."""
         with app.test_request_context():
             service = ExpertFilterService()
-            service._all_experts = experts
             section_2 = service.sections[1]
             ids = [s.id for s in section_2.selectors]
             assert ids == ["pays", "departement", "ville"]
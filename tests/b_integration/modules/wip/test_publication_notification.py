@@ -106,7 +106,7 @@ def avis(db_session: Session, journalist: User) -> AvisEnquete:
 
 @pytest.fixture
 def no_mail():
-    with patch("app.services.emails.mailers.EmailTemplate.send") as mock_send:
+    with patch("app.services.emails.mailers.EmailTemplate.queue") as mock_send:
         yield mock_send
 
 
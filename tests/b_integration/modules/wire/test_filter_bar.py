@@ -18,13 +18,12 @@ from app.enums import RoleEnum
 from app.models.auth import KYCProfile, Role, User
 from app.models.lifecycle import PublicationStatus
 from app.models.organisation import Organisation
-from app.modules.kyc.field_label import country_code_to_country_name
-from app.modules.kyc.ontology_loader import get_ontology_content
 from app.modules.wire.models import ArticlePost, PressReleasePost
 from app.modules.wire.views._filters import (
     FILTER_SPECS,
     FilterBar,
 )
+from app.services.reference_data import reference_data
 from app.services.zip_codes import CountryEntry
 
 if TYPE_CHECKING:
@@ -130,9 +129,8 @@ def test_press_releases(
 @pytest.fixture
 def france_country(db_session: Session) -> CountryEntry:
     """Create France country entry for label_function tests."""
-    # Clear caches on both country lookup functions
-    country_code_to_country_name.cache_clear()
-    get_ontology_content.cache.clear()
+    # Clear the cached country list and its label index
+    reference_data.clear()
 
     country = CountryEntry(iso3="FR", name="France", seq=1)
     db_session.add(country)
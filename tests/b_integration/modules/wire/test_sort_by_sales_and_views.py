@@ -4,7 +4,7 @@
 
 """Ticket #0193 — the « Trier > Popularité (vues) » and « Trier > Ventes »
 options on the NEWS portal are now driven by PAID `ArticlePurchase` rows,
-not by the raw `Post.view_count`."""
+not by the raw `Post.view_count` (through counters on the posts)."""
 
 from __future__ import annotations
 
@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING
 import arrow
 import pytest
 from flask import g, session
+from sqlalchemy import select, update
 
 from app.models.auth import User
 from app.models.lifecycle import PublicationStatus
@@ -25,6 +26,7 @@ from app.modules.wire.models import (
     PurchaseProduct,
     PurchaseStatus,
 )
+from app.modules.wire.services.purchase_aggregates import refresh_purchase_counters
 from app.modules.wire.views._filters import FilterBar
 from app.modules.wire.views._tabs import WallTab
 
@@ -195,3 +197,55 @@ class TestWallSortBySales:
             p.title for p in posts if p.title in {"1 viewer", "2 viewers", "3 viewers"}
         ]
         assert titles_in_order == ["3 viewers", "2 viewers", "1 viewer"]
+
+
+class TestPurchaseCounters:
+    """The sorts read `Post.paid_consultation_count` and
+    `Post.sales_amount_cents`, kept in step with the purchases."""
+
+    def test_counters_follow_flushed_purchases(
+        self, db_session: Session, author: User, buyer: User
+    ):
+        post = _public_post(db_session, owner=author, title="Counted")
+        _paid(db_session, buyer=buyer, post=post, amount_cents=300)
+        _paid(
+            db_session,
+            buyer=buyer,
+            post=post,
+            amount_cents=700,
+            product=PurchaseProduct.JUSTIFICATIF,
+        )
+
+        assert post.paid_consultation_count == 1
+        assert post.sales_amount_cents == 1000
+
+        purchase = db_session.scalars(
+            select(ArticlePurchase).where(
+                ArticlePurchase.post_id == post.id,
+                ArticlePurchase.product_type == PurchaseProduct.CONSULTATION,
+            )
+        ).one()
+        purchase.status = PurchaseStatus.REFUNDED
+        db_session.flush()
+
+        assert post.paid_consultation_count == 0
+        assert post.sales_amount_cents == 700
+
+    def test_refresh_drops_expired_consultations(
+        self, db_session: Session, author: User, buyer: User
+    ):
+        post = _public_post(db_session, owner=author, title="Expired")
+        _paid(db_session, buyer=buyer, post=post, amount_cents=300)
+        assert post.paid_consultation_count == 1
+
+        # Backdate the purchase past the consultation duration.
+        db_session.execute(
+            update(ArticlePurchase)
+            .where(ArticlePurchase.post_id == post.id)
+            .values(paid_at=arrow.utcnow().shift(days=-10_000))
+        )
+        refresh_purchase_counters()
+        db_session.expire(post)
+
+        assert post.paid_consultation_count == 0
+        assert post.sales_amount_cents == 300
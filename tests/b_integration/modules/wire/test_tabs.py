@@ -19,6 +19,7 @@ from app.models.organisation import Organisation
 from app.modules.wire.models import ArticlePost, PressReleasePost
 from app.modules.wire.views._filters import FilterBar
 from app.modules.wire.views._tabs import (
+    DEFAULT_POSTS_LIMIT,
     AgenciesTab,
     ComTab,
     JournalistsTab,
@@ -27,6 +28,7 @@ from app.modules.wire.views._tabs import (
     get_tabs,
 )
 from app.services.social_graph import adapt
+from app.services.tagging import add_tag
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -392,10 +394,19 @@ class TestTabGetStmt:
             # Statement should include the filter
             assert stmt is not None
 
-    def test_get_stmt_ignores_tag_filter(
-        self, app: Flask, db_session: Session, test_user: User
+    def test_get_stmt_filters_by_tag(
+        self,
+        app: Flask,
+        db_session: Session,
+        test_user: User,
+        test_articles: list[ArticlePost],
     ):
-        """Test get_stmt ignores tag filter in ORM query."""
+        """Tag filters are applied in the query, before the LIMIT."""
+        for article in test_articles[:2]:
+            db_session.add(add_tag(article, "python"))
+        db_session.add(add_tag(test_articles[2], "rust"))
+        db_session.flush()
+
         with app.test_request_context():
             session["wire:tab"] = "wall"
             g.user = test_user
@@ -404,9 +415,9 @@ class TestTabGetStmt:
             bar = FilterBar("wall")
             bar.state = {"filters": [{"id": "tag", "value": "python"}]}
 
-            # Should not raise - tag filters are handled separately
-            stmt = tab.get_stmt(bar)
-            assert stmt is not None
+            posts = tab.get_posts(bar)
+
+            assert {p.id for p in posts} == {a.id for a in test_articles[:2]}
 
     def test_get_stmt_ignores_unknown_filters(
         self, app: Flask, db_session: Session, test_user: User
@@ -424,3 +435,58 @@ class TestTabGetStmt:
             # Should not raise
             stmt = tab.get_stmt(bar)
             assert stmt is not None
+
+
+class TestTabPagination:
+    """The wall is paginated by keyset on (sort key, id)."""
+
+    @pytest.mark.parametrize("sort_by", ["date", "views", "sales", "likes"])
+    def test_pages_cover_every_post_once(
+        self,
+        app: Flask,
+        db_session: Session,
+        test_user: User,
+        test_org: Organisation,
+        sort_by: str,
+    ):
+        now = arrow.now()
+        for i in range(DEFAULT_POSTS_LIMIT + 5):
+            db_session.add(
+                ArticlePost(
+                    title=f"Paged {i}",
+                    status=PublicationStatus.PUBLIC,
+                    publisher=test_org,
+                    owner=test_user,
+                    # Ties on the sort key, broken by the id.
+                    published_at=now.shift(hours=-(i % 3)),
+                    like_count=i % 2,
+                )
+            )
+        db_session.flush()
+
+        with app.test_request_context():
+            session["wire:tab"] = "wall"
+            g.user = test_user
+            bar = FilterBar("wall")
+            bar.state = {"sort-by": sort_by}
+
+            first = WallTab().get_page(bar)
+            second = WallTab().get_page(bar, first.next_cursor)
+
+        assert len(first.items) == DEFAULT_POSTS_LIMIT
+        assert first.next_cursor
+        assert len(second.items) == 5
+        assert not second.next_cursor
+        ids = [p.id for p in first.items + second.items]
+        assert len(set(ids)) == DEFAULT_POSTS_LIMIT + 5
+
+    def test_malformed_cursor_is_rejected(
+        self, app: Flask, db_session: Session, test_user: User
+    ):
+        with app.test_request_context():
+            session["wire:tab"] = "wall"
+            g.user = test_user
+            bar = FilterBar("wall")
+
+            with pytest.raises(ValueError):
+                WallTab().get_page(bar, "not-a-cursor")
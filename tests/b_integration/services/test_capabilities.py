@@ -0,0 +1,112 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+#
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Integration tests for `app.services.capabilities.get_capabilities`.
+
+The test app keeps one app context (hence one `g`) for all requests,
+like a worker that reuses it: the memo must not outlive a request.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from app.models.auth import User
+from app.modules.bw.bw_activation.models import (
+    BusinessWall,
+    BWRoleType,
+    InvitationStatus,
+    PermissionType,
+    RoleAssignment,
+    RolePermission,
+)
+from app.services.capabilities import _cache, get_capabilities, load_capabilities
+
+if TYPE_CHECKING:
+    import pytest
+    from flask import Flask
+    from sqlalchemy.orm import Session
+
+
+def test_capabilities_are_memoized_per_request(
+    app: Flask, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    user = User(email="caps@example.com")
+    db_session.add(user)
+    db_session.flush()
+    db_session.info.pop(_cache.PENDING_KEY, None)
+    loads = []
+    load = _cache.load_capabilities
+
+    def counting_load(user: User):
+        loads.append(user.id)
+        return load(user)
+
+    monkeypatch.setattr(_cache, "load_capabilities", counting_load)
+
+    with app.test_request_context("/"):
+        get_capabilities(user)
+        get_capabilities(user)
+    assert loads == [user.id]
+
+    with app.test_request_context("/"):
+        get_capabilities(user)
+    assert loads == [user.id, user.id]
+
+
+def test_load_capabilities_reads_the_business_walls(db_session: Session) -> None:
+    user = User(email="caps-bw@example.com")
+    db_session.add(user)
+    db_session.flush()
+    owned = BusinessWall(
+        bw_type="media",
+        status="active",
+        is_free=True,
+        owner_id=user.id,
+        payer_id=user.id,
+    )
+    other = BusinessWall(
+        bw_type="media",
+        status="active",
+        is_free=True,
+        owner_id=user.id,
+        payer_id=user.id,
+    )
+    db_session.add_all([owned, other])
+    db_session.flush()
+    assignment = RoleAssignment(
+        business_wall_id=owned.id,
+        user_id=user.id,
+        role_type=BWRoleType.BWPRI.value,
+        invitation_status=InvitationStatus.ACCEPTED.value,
+    )
+    pending = RoleAssignment(
+        business_wall_id=other.id,
+        user_id=user.id,
+        role_type=BWRoleType.BWMI.value,
+        invitation_status=InvitationStatus.PENDING.value,
+    )
+    db_session.add_all([assignment, pending])
+    db_session.flush()
+    db_session.add_all(
+        [
+            RolePermission(
+                role_assignment_id=assignment.id,
+                permission_type=PermissionType.PRESS_RELEASE.value,
+                is_granted=True,
+            ),
+            RolePermission(
+                role_assignment_id=assignment.id,
+                permission_type=PermissionType.EVENTS.value,
+                is_granted=False,
+            ),
+        ]
+    )
+    db_session.flush()
+
+    caps = load_capabilities(user)
+
+    assert caps.owned_bws == {owned.id, other.id}
+    assert caps.bw_roles == {(owned.id, BWRoleType.BWPRI.value)}
+    assert caps.bw_missions == {(owned.id, PermissionType.PRESS_RELEASE.value)}
@@ -0,0 +1,162 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Integration tests for `app.services.emails.outbox`.
+
+Mails are queued with `enqueue` (what `EmailTemplate.queue` calls) and
+drained with `send_outbox_batch`, the body of the Dramatiq job. The
+SMTP connection is replaced by a recorder, so the tests can check that
+a batch goes out over a single connection.
+"""
+
+from __future__ import annotations
+
+from smtplib import SMTPRecipientsRefused
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from app.flask.extensions import mail
+from app.models.email_log import OutboxEmail
+from app.services.emails.outbox import enqueue, flush_email_outbox, send_outbox_batch
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+
+class RecordingConnection:
+    """Stands in for flask-mailman's SMTP backend."""
+
+    def __init__(
+        self,
+        fail_for: frozenset[str] = frozenset(),
+        drop_at: frozenset[str] = frozenset(),
+    ) -> None:
+        self.fail_for = fail_for
+        self.drop_at = drop_at
+        self.opened = 0
+        self.closed = 0
+        self.sent: list[str] = []
+
+    def __enter__(self):
+        self.opened += 1
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.closed += 1
+
+    def send_messages(self, messages) -> int:
+        for message in messages:
+            (recipient,) = message.to
+            if recipient in self.fail_for:
+                raise SMTPRecipientsRefused({recipient: (550, b"no such user")})
+            if recipient in self.drop_at:
+                raise ConnectionResetError(104, "Connection reset by peer")
+            self.sent.append(recipient)
+        return len(messages)
+
+
+def _queue(*recipients: str, bypass_quota: bool = False) -> None:
+    for recipient in recipients:
+        enqueue(
+            mail_class="TestMail",
+            sender="contact@aipress24.com",
+            recipient=recipient,
+            subject="Hello",
+            body="<p>Hello</p>",
+            bypass_quota=bypass_quota,
+        )
+
+
+def _drain(connection: RecordingConnection) -> int:
+    with patch.object(mail, "get_connection", return_value=connection):
+        return send_outbox_batch()
+
+
+class TestEnqueue:
+    def test_one_burst_schedules_one_flush(
+        self, app, db_session: Session, monkeypatch: pytest.MonkeyPatch
+    ):
+        sent: list[dict] = []
+        monkeypatch.setattr(
+            flush_email_outbox, "send_with_options", lambda **kw: sent.append(kw)
+        )
+        with app.test_request_context():
+            _queue(*(f"expert{i}@example.com" for i in range(5)))
+
+        assert len(sent) == 1
+        assert db_session.query(OutboxEmail).count() == 5
+
+
+class TestSendOutboxBatch:
+    def test_batch_goes_out_over_one_connection(self, app, db_session: Session):
+        with app.test_request_context():
+            _queue("a@example.com", "b@example.com", "c@example.com")
+            db_session.flush()
+            connection = RecordingConnection()
+
+            assert _drain(connection) == 3
+
+            assert connection.opened == 1
+            assert connection.sent == [
+                "a@example.com",
+                "b@example.com",
+                "c@example.com",
+            ]
+            assert db_session.query(OutboxEmail).count() == 0
+
+    def test_empty_outbox_is_a_no_op(self, app, db_session: Session):
+        connection = RecordingConnection()
+        assert _drain(connection) == 0
+        assert connection.opened == 0
+
+    def test_smtp_error_does_not_stop_the_batch(self, app, db_session: Session):
+        with app.test_request_context():
+            _queue("a@example.com", "bad@example.com", "c@example.com")
+            db_session.flush()
+            connection = RecordingConnection(fail_for=frozenset({"bad@example.com"}))
+
+            _drain(connection)
+
+            assert connection.sent == ["a@example.com", "c@example.com"]
+            assert db_session.query(OutboxEmail).count() == 0
+
+    def test_lost_connection_requeues_the_rest(self, app, db_session: Session):
+        with app.test_request_context():
+            _queue("a@example.com", "b@example.com", "c@example.com")
+            db_session.flush()
+            connection = RecordingConnection(drop_at=frozenset({"b@example.com"}))
+
+            with pytest.raises(ConnectionResetError):
+                _drain(connection)
+
+            assert connection.sent == ["a@example.com"]
+            queued = db_session.query(OutboxEmail).order_by(OutboxEmail.id)
+            assert [mail.recipient for mail in queued] == [
+                "b@example.com",
+                "c@example.com",
+            ]
+
+            retry = RecordingConnection()
+            assert _drain(retry) == 2
+            assert retry.sent == ["b@example.com", "c@example.com"]
+
+    def test_quota_is_checked_per_batch(self, app, db_session: Session):
+        with app.test_request_context():
+            _queue("a@example.com", "a@example.com", "b@example.com")
+            _queue("b@example.com", bypass_quota=True)
+            db_session.flush()
+            connection = RecordingConnection()
+
+            with patch(
+                "app.services.emails.outbox.remaining_quotas",
+                return_value={"a@example.com": 1, "b@example.com": 0},
+            ) as quotas:
+                _drain(connection)
+
+            quotas.assert_called_once()
+            assert connection.sent == ["a@example.com", "b@example.com"]
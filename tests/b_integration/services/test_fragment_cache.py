@@ -0,0 +1,136 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Integration tests for `app.services.fragments`.
+
+The cache is exercised with stand-in objects (an id and a version) and
+then through `render_post_cards`, what the wire wall renders its cards
+with. The test config disables the cache; these tests turn the memory
+backend on.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import arrow
+import pytest
+from attr import frozen
+from markupsafe import Markup
+
+from app.models.auth import User
+from app.modules.common.components.post_card import (
+    POST_CARD,
+    post_card_version,
+    render_post_cards,
+)
+from app.modules.wire.models import ArticlePost
+from app.services.fragments import fragment_cache
+
+if TYPE_CHECKING:
+    from flask import Flask
+    from sqlalchemy.orm import Session
+
+
+@frozen
+class Thing:
+    id: int
+    version: str
+
+
+class Renderer:
+    def __init__(self) -> None:
+        self.rendered: list[int] = []
+
+    def __call__(self, thing: Thing) -> str:
+        self.rendered.append(thing.id)
+        return f"<p>{thing.id}@{thing.version}</p>"
+
+
+@pytest.fixture(autouse=True)
+def _memory_backend(app: Flask):
+    backend = app.config["FRAGMENT_CACHE_BACKEND"]
+    app.config["FRAGMENT_CACHE_BACKEND"] = "memory"
+    yield
+    fragment_cache.clear()
+    app.config["FRAGMENT_CACHE_BACKEND"] = backend
+
+
+def _render(things: list[Thing], render: Renderer, variant: str = "") -> list[Markup]:
+    return fragment_cache.render_many(
+        "thing",
+        things,
+        version=lambda thing: thing.version,
+        render=render,
+        variant=variant,
+    )
+
+
+class TestRenderMany:
+    def test_fragments_are_reused(self, app: Flask):
+        render = Renderer()
+        things = [Thing(1, "a"), Thing(2, "a")]
+
+        first = _render(things, render)
+        second = _render(things, render)
+
+        assert first == second == ["<p>1@a</p>", "<p>2@a</p>"]
+        assert render.rendered == [1, 2]
+
+    def test_new_version_is_rendered_again(self, app: Flask):
+        render = Renderer()
+        _render([Thing(1, "a"), Thing(2, "a")], render)
+
+        html = _render([Thing(1, "b"), Thing(2, "a")], render)
+
+        assert html == ["<p>1@b</p>", "<p>2@a</p>"]
+        assert render.rendered == [1, 2, 1]
+
+    def test_invalidate_drops_every_variant(self, app: Flask):
+        render = Renderer()
+        _render([Thing(1, "a")], render)
+        _render([Thing(1, "a")], render, variant="compact")
+
+        fragment_cache.invalidate("thing", 1)
+        _render([Thing(1, "a")], render)
+        _render([Thing(1, "a")], render, variant="compact")
+
+        assert render.rendered == [1, 1, 1, 1]
+
+    def test_disabled_cache_always_renders(self, app: Flask):
+        app.config["FRAGMENT_CACHE_BACKEND"] = "none"
+        render = Renderer()
+
+        _render([Thing(1, "a")], render)
+        _render([Thing(1, "a")], render)
+
+        assert render.rendered == [1, 1]
+
+
+class TestPostCards:
+    def test_like_changes_the_card(self, app: Flask, db_session: Session):
+        with app.test_request_context():
+            user = User(email="author@example.com")
+            db_session.add(user)
+            db_session.flush()
+            post = ArticlePost(
+                owner=user, title="Cached card", published_at=arrow.utcnow()
+            )
+            db_session.add(post)
+            db_session.flush()
+            version = post_card_version(post)
+
+            (first,) = render_post_cards([post])
+            assert "Cached card" in first
+            assert render_post_cards([post]) == [first]
+
+            post.like_count = 7
+            db_session.flush()
+
+            assert post_card_version(post) != version
+            (second,) = render_post_cards([post])
+            assert second != first
+            assert 'id="likes-' in second
+
+            fragment_cache.invalidate(POST_CARD, post.id)
+            assert render_post_cards([post]) == [second]
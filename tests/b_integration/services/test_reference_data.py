@@ -0,0 +1,230 @@
+# Copyright (c) 2021-2026, Abilian SAS & TCA
+# SPDX-License-Identifier: AGPL-3.0-only
+
+"""Integration tests for `app.services.reference_data`.
+
+The store keeps loaded reference data until the dataset's row in
+``ref_data_version`` moves. The tests drive it through the KYC label
+helpers (what the event cards and profile pages call) and check that a
+version bump — local, or from "another worker" editing the table —
+makes the next lookup read the DB again. The bulk importers are
+checked for their inserted / updated / unchanged / deleted counts.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import select
+
+from app.modules.kyc.field_label import (
+    country_code_to_country_name,
+    country_zip_code_to_city,
+    label_from_values_dual_second,
+)
+from app.services.reference_data import (
+    COUNTRIES,
+    TAXONOMIES,
+    ZIP_CODES,
+    ImportCounts,
+    ReferenceDataVersion,
+    bump_reference_data_version,
+    label_index,
+    reference_data,
+)
+from app.services.taxonomies import TaxonomyEntry, import_taxonomy_entries
+from app.services.zip_codes import (
+    CountryEntry,
+    ZipCodeEntry,
+    import_zip_code_entries,
+)
+
+if TYPE_CHECKING:
+    from flask import Flask
+    from sqlalchemy.orm import Session
+
+
+@pytest.fixture(autouse=True)
+def _fresh_store(app: Flask):
+    """Empty store, and a version check on every lookup."""
+    app.config["REFERENCE_DATA_CHECK_INTERVAL"] = 0
+    reference_data.clear()
+    yield
+    reference_data.clear()
+    app.config.pop("REFERENCE_DATA_CHECK_INTERVAL")
+
+
+def test_label_index_keeps_the_first_label() -> None:
+    assert label_index([("a", "A"), ("b", "B"), ("a", "other")]) == {
+        "a": "A",
+        "b": "B",
+    }
+
+
+def test_zip_code_label_lookup(db_session: Session) -> None:
+    db_session.add(
+        ZipCodeEntry(
+            iso3="FRA",
+            zip_code="75001",
+            name="Paris",
+            value="FRA / 75001 Paris",
+            label="75001 Paris",
+        )
+    )
+    db_session.flush()
+
+    assert country_zip_code_to_city("FRA / 75001 Paris") == "75001 Paris"
+    assert country_zip_code_to_city("FRA / 99999 Nowhere") == "FRA / 99999 Nowhere"
+    assert country_zip_code_to_city("garbage") == ""
+
+
+def test_dual_select_label_lookup(db_session: Session) -> None:
+    db_session.add_all(
+        [
+            TaxonomyEntry(
+                taxonomy_name="metier",
+                category="Presse",
+                value="Presse / Reporter",
+                name="Reporter",
+                seq=1,
+            ),
+            TaxonomyEntry(
+                taxonomy_name="metier",
+                category="Presse",
+                value="Presse / Editeur",
+                name="Editeur",
+                seq=2,
+            ),
+        ]
+    )
+    db_session.flush()
+
+    label = label_from_values_dual_second(
+        ["Presse / Editeur", "Presse / Reporter"], "metier_detail", "metier"
+    )
+    assert label == "Editeur, Reporter"
+
+
+class TestInvalidation:
+    def test_data_is_kept_until_the_version_moves(self, db_session: Session):
+        country = CountryEntry(iso3="FRA", name="France", seq=1)
+        db_session.add(country)
+        db_session.flush()
+        assert country_code_to_country_name("FRA") == "France"
+
+        country.name = "République française"
+        db_session.flush()
+        assert country_code_to_country_name("FRA") == "France"
+
+        bump_reference_data_version(COUNTRIES)
+        assert country_code_to_country_name("FRA") == "République française"
+
+    def test_bump_from_another_process(self, db_session: Session):
+        """Another worker bumps the row: this one notices on its next
+        version check and reloads."""
+        country = CountryEntry(iso3="FRA", name="France", seq=1)
+        db_session.add(country)
+        db_session.flush()
+        assert country_code_to_country_name("FRA") == "France"
+
+        country.name = "République française"
+        db_session.add(ReferenceDataVersion(name=COUNTRIES, version=7))
+        db_session.flush()
+
+        assert country_code_to_country_name("FRA") == "République française"
+
+    def test_bump_increments_the_stored_version(self, db_session: Session):
+        bump_reference_data_version(COUNTRIES, ZIP_CODES)
+        bump_reference_data_version(COUNTRIES)
+
+        stmt = select(ReferenceDataVersion.name, ReferenceDataVersion.version)
+        versions = dict(db_session.execute(stmt).tuples().all())
+        assert versions[COUNTRIES] == 2
+        assert versions[ZIP_CODES] == 1
+
+    def test_bump_only_drops_its_dataset(self, db_session: Session):
+        db_session.add(CountryEntry(iso3="FRA", name="France", seq=1))
+        db_session.flush()
+        loads = []
+
+        def load() -> str:
+            loads.append(1)
+            return "taxonomy"
+
+        reference_data.get(TAXONOMIES, "civilite", load)
+        assert country_code_to_country_name("FRA") == "France"
+
+        bump_reference_data_version(COUNTRIES)
+        reference_data.get(TAXONOMIES, "civilite", load)
+
+        assert len(loads) == 1
+
+
+class TestImports:
+    def test_zip_code_reimport_reports_counts(self, db_session: Session):
+        items = [("75001", "Paris"), ("69001", "Lyon"), ("13001", "Marseille")]
+        counts = import_zip_code_entries("FRA", iter(items))
+        assert (counts.inserted, counts.updated, counts.unchanged) == (3, 0, 0)
+
+        # Lyon dropped from the source, Lille added.
+        items = [("75001", "Paris"), ("13001", "Marseille"), ("59000", "Lille")]
+        counts = import_zip_code_entries("FRA", iter(items))
+
+        assert counts == ImportCounts(inserted=1, unchanged=2, deleted=1)
+        values = set(
+            db_session.scalars(
+                select(ZipCodeEntry.value).where(ZipCodeEntry.iso3 == "FRA")
+            )
+        )
+        assert values == {
+            "FRA / 75001 Paris",
+            "FRA / 13001 Marseille",
+            "FRA / 59000 Lille",
+        }
+
+    def test_zip_code_import_leaves_other_countries_alone(self, db_session: Session):
+        import_zip_code_entries("BEL", iter([("1000", "Bruxelles")]))
+        import_zip_code_entries("FRA", iter([("75001", "Paris")]))
+
+        assert country_zip_code_to_city("BEL / 1000 Bruxelles") == "1000 Bruxelles"
+
+    def test_taxonomy_reimport_updates_in_place(self, db_session: Session):
+        entries = [
+            {"name": "Monsieur", "category": "", "value": "M", "seq": 10},
+            {"name": "Madame", "category": "", "value": "F", "seq": 20},
+        ]
+        import_taxonomy_entries("civilite_test", entries)
+        before = db_session.scalar(
+            select(TaxonomyEntry.id).where(TaxonomyEntry.value == "M")
+        )
+
+        entries[0] = {"name": "Monsieur ", "category": "", "value": "M", "seq": 30}
+        counts = import_taxonomy_entries("civilite_test", entries)
+
+        assert counts == ImportCounts(updated=1, unchanged=1)
+        entry = db_session.scalars(
+            select(TaxonomyEntry).where(
+                TaxonomyEntry.taxonomy_name == "civilite_test",
+                TaxonomyEntry.value == "M",
+            )
+        ).one()
+        # Updated in place (same id), whitespace stripped.
+        assert entry.id == before
+        assert (entry.name, entry.seq) == ("Monsieur", 30)
+
+    def test_taxonomy_reimport_skips_entries_without_value(self, db_session: Session):
+        entries = [
+            {"name": "Monsieur", "category": "", "value": "M", "seq": 10},
+            {"name": "Sans valeur", "category": "", "value": " ", "seq": 20},
+        ]
+        import_taxonomy_entries("civilite_test", entries)
+        counts = import_taxonomy_entries("civilite_test", entries)
+
+        assert counts == ImportCounts(unchanged=1)
+        values = db_session.scalars(
+            select(TaxonomyEntry.value).where(
+                TaxonomyEntry.taxonomy_name == "civilite_test"
+            )
+        ).all()
+        assert values == ["M"]
@@ -12,9 +12,8 @@ upsert + history behaviour at b_integration.
 
 Pattern : seed users via `db_session`, call the real entry point,
 inspect the resulting `ReputationRecord` rows. Because
-`update_reputations()` commits per user (cron-friendly, no batch
-rollback), we purge any rows we created in a teardown step so
-nothing leaks across tests.
+`update_reputations()` commits, we purge any rows we created in a
+teardown step so nothing leaks across tests.
 """
 
 from __future__ import annotations
@@ -25,21 +24,31 @@ from typing import TYPE_CHECKING
 
 import arrow
 import pytest
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 
-from app.models.auth import User
+from app.enums import RoleEnum
+from app.models.auth import Role, User
+from app.services.reputation._compute import (
+    compute_all_reputations,
+    compute_reputation,
+)
+from app.services.reputation._compute._functions import GROUPED_COUNTS
 from app.services.reputation._history import (
     _noise,
-    _update_for_user,
     get_reputation_history,
     update_reputations,
 )
 from app.services.reputation._models import ReputationRecord
+from app.services.social_graph.models import following_users_table, likes_table
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
 
+def _record(db_session: Session, user: User, day: date) -> None:
+    db_session.add(ReputationRecord(user_id=user.id, date=day, value=0, details={}))
+
+
 def _fresh_user(db_session: Session, *, label: str = "u") -> User:
     """Minimum-viable user. Email uniqueness is enforced ; mint a
     fresh slug per call so several users co-exist in one test."""
@@ -59,12 +68,13 @@ _TEST_EMAIL_PREFIX = "rep-"
 
 @pytest.fixture(autouse=True)
 def _purge_test_artifacts(db_session: Session):
-    """`update_reputations` commits per user (mirrors cron semantics),
-    so the surrounding savepoint can't roll back any of the rows our
+    """`update_reputations` commits (mirrors cron semantics), so the
+    surrounding savepoint can't roll back any of the rows our
     tests created. Sweep them in teardown :
 
     * Every `ReputationRecord` whose owning user's email starts with
       our test prefix.
+    * Every like / follow row of those users.
     * Every `User` whose email starts with our test prefix.
 
     The prefix scoping leaves any unrelated row alone — a parallel
@@ -92,6 +102,13 @@ def _purge_test_artifacts(db_session: Session):
     )
     for record in test_records:
         db_session.delete(record)
+    db_session.execute(delete(likes_table).where(likes_table.c.user_id.in_(user_ids)))
+    db_session.execute(
+        delete(following_users_table).where(
+            following_users_table.c.follower_id.in_(user_ids)
+            | following_users_table.c.followee_id.in_(user_ids)
+        )
+    )
     for u in test_users:
         db_session.delete(u)
     db_session.commit()
@@ -113,136 +130,6 @@ class TestNoise:
             assert isinstance(value, float)
 
 
-# ---------------------------------------------------------------------------
-# _update_for_user — single-row upsert behaviour
-# ---------------------------------------------------------------------------
-
-
-class TestUpdateForUser:
-    def test_creates_record_for_first_call(self, db_session: Session) -> None:
-        user = _fresh_user(db_session, label="create")
-        today = arrow.now().date()
-
-        _update_for_user(user, today)
-        db_session.flush()
-
-        stmt = (
-            select(ReputationRecord)
-            .where(ReputationRecord.user_id == user.id)
-            .where(ReputationRecord.date == today)
-        )
-        record = db_session.execute(stmt).scalar_one_or_none()
-        assert record is not None
-
-    def test_idempotent_on_same_day(self, db_session: Session) -> None:
-        """The composite PK is (user_id, date) — a second call on the
-        same date must UPDATE the existing row, not create a duplicate."""
-        user = _fresh_user(db_session, label="idemp")
-        today = arrow.now().date()
-
-        _update_for_user(user, today)
-        _update_for_user(user, today)
-        db_session.flush()
-
-        count = db_session.execute(
-            select(ReputationRecord)
-            .where(ReputationRecord.user_id == user.id)
-            .where(ReputationRecord.date == today)
-        ).all()
-        assert len(count) == 1
-
-    def test_writes_zero_karma_for_fresh_user(self, db_session: Session) -> None:
-        """A user with no follows / articles has compute_reputation == 0.
-        Pin so a refactor that loses the « total » key (or returns
-        None) doesn't silently write None to the value column."""
-        user = _fresh_user(db_session, label="zero")
-        today = arrow.now().date()
-
-        _update_for_user(user, today)
-        db_session.flush()
-
-        record = db_session.execute(
-            select(ReputationRecord)
-            .where(ReputationRecord.user_id == user.id)
-            .where(ReputationRecord.date == today)
-        ).scalar_one()
-        assert record.value == 0
-
-    def test_mirrors_value_onto_user_karma(self, db_session: Session) -> None:
-        """`user.karma = record.value = karma` — both columns are kept
-        in sync. The user-side denormalisation lets the dashboard show
-        karma without a JOIN ; pin so a refactor that drops the
-        denorm doesn't silently break the display."""
-        user = _fresh_user(db_session, label="karma-mirror")
-        today = arrow.now().date()
-
-        _update_for_user(user, today)
-        db_session.flush()
-
-        record = db_session.execute(
-            select(ReputationRecord).where(ReputationRecord.user_id == user.id)
-        ).scalar_one()
-        assert user.karma == record.value
-
-    def test_stores_full_reputation_details_dict(self, db_session: Session) -> None:
-        """The `details` JSON column carries the full breakdown
-        compute_reputation returned — used by the history endpoint
-        to render per-source contribution. Pin so a refactor that
-        only stores `{"total": ...}` doesn't strip the breakdown."""
-        user = _fresh_user(db_session, label="details")
-        today = arrow.now().date()
-
-        _update_for_user(user, today)
-        db_session.flush()
-
-        record = db_session.execute(
-            select(ReputationRecord).where(ReputationRecord.user_id == user.id)
-        ).scalar_one()
-        assert isinstance(record.details, dict)
-        # `total` is always present in compute_reputation's return shape.
-        assert "total" in record.details
-
-    def test_add_noise_perturbs_karma_within_bound(self, db_session: Session) -> None:
-        """When the cron actor passes add_noise=True, the stored
-        karma deviates from compute_reputation's raw total by
-        at most ±0.1 (the _noise spread)."""
-        user = _fresh_user(db_session, label="noisy")
-        today = arrow.now().date()
-
-        _update_for_user(user, today, add_noise=True)
-        db_session.flush()
-
-        record = db_session.execute(
-            select(ReputationRecord).where(ReputationRecord.user_id == user.id)
-        ).scalar_one()
-        # Raw fresh-user reputation is 0 ; noise puts us in [-0.1, 0.1].
-        assert -0.1 <= record.value <= 0.1
-        # And the user-side denormalised karma matches the record.
-        assert user.karma == record.value
-
-    def test_distinct_dates_yield_distinct_records(self, db_session: Session) -> None:
-        """The composite PK lets one user have many records (one per
-        day). Pin so a refactor that switches to a single-row
-        latest-only schema is conscious."""
-        user = _fresh_user(db_session, label="multi-day")
-        today = arrow.now().date()
-        yesterday = today - timedelta(days=1)
-
-        _update_for_user(user, today)
-        _update_for_user(user, yesterday)
-        db_session.flush()
-
-        records = (
-            db_session.execute(
-                select(ReputationRecord).where(ReputationRecord.user_id == user.id)
-            )
-            .scalars()
-            .all()
-        )
-        dates = sorted(r.date for r in records)
-        assert dates == [yesterday, today]
-
-
 # ---------------------------------------------------------------------------
 # update_reputations — the cron orchestrator
 # ---------------------------------------------------------------------------
@@ -261,6 +148,20 @@ class TestUpdateReputations:
         assert len(history) == 1
         assert history[0].user_id == user.id
 
+    def test_stores_details_and_mirrors_karma(self, db_session: Session) -> None:
+        """The `details` JSON column carries the full breakdown (read
+        by the history endpoint) and `User.karma` mirrors the value."""
+        user = _fresh_user(db_session, label="cron-details")
+        db_session.commit()
+
+        update_reputations()
+
+        [record] = get_reputation_history(user)
+        assert "total" in record.details
+        assert record.value == 0
+        db_session.refresh(user)
+        assert user.karma == record.value
+
     def test_idempotent_re_run_on_same_day(self, db_session: Session) -> None:
         """The actor schedule fires hourly ; re-running on the same
         day must update, not duplicate."""
@@ -274,8 +175,7 @@ class TestUpdateReputations:
         assert len(history) == 1
 
     def test_processes_multiple_users_independently(self, db_session: Session) -> None:
-        """The loop must not abort on per-user failures (it commits
-        per user). For two fresh users, both should get records."""
+        """Every user gets their own record from the single upsert."""
         alice = _fresh_user(db_session, label="alice")
         bob = _fresh_user(db_session, label="bob")
         db_session.commit()
@@ -300,6 +200,76 @@ class TestUpdateReputations:
         assert -0.1 <= history[0].value <= 0.1
 
 
+# ---------------------------------------------------------------------------
+# compute_all_reputations — set-based twin of compute_reputation
+# ---------------------------------------------------------------------------
+
+
+def _role(db_session: Session, role: RoleEnum) -> Role:
+    existing = db_session.query(Role).filter_by(name=role.name).first()
+    if existing:
+        return existing
+    new_role = Role(name=role.name, description=role.name.lower())
+    db_session.add(new_role)
+    db_session.flush()
+    return new_role
+
+
+class TestComputeAllReputations:
+    def test_matches_per_user_computation(self, db_session: Session) -> None:
+        """Same details, key for key, as `compute_reputation` on each
+        user: journalist spec, generic spec, and no spec at all."""
+        journalist = _fresh_user(db_session, label="bulk-journalist")
+        journalist.add_role(_role(db_session, RoleEnum.PRESS_MEDIA))
+        expert = _fresh_user(db_session, label="bulk-expert")
+        expert.add_role(_role(db_session, RoleEnum.EXPERT))
+        other = _fresh_user(db_session, label="bulk-other")
+        db_session.flush()
+
+        db_session.execute(
+            insert(following_users_table),
+            [
+                {"follower_id": expert.id, "followee_id": journalist.id},
+                {"follower_id": other.id, "followee_id": journalist.id},
+                {"follower_id": journalist.id, "followee_id": expert.id},
+            ],
+        )
+        db_session.execute(
+            insert(likes_table),
+            [
+                {"user_id": journalist.id, "content_id": 1},
+                {"user_id": journalist.id, "content_id": 2},
+            ],
+        )
+
+        users = [journalist, expert, other]
+        bulk = dict(compute_all_reputations([u.id for u in users]))
+
+        for user in users:
+            user_id: int = user.id
+            assert bulk[user_id] == compute_reputation(user)
+        journalist_id: int = journalist.id
+        other_id: int = other.id
+        assert bulk[journalist_id]["nb_foller_mbr"] == 2
+        assert bulk[other_id] == {"total": 0}
+
+    def test_counter_without_grouped_form_falls_back_per_user(
+        self, db_session: Session, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        journalist = _fresh_user(db_session, label="bulk-fallback")
+        journalist.add_role(_role(db_session, RoleEnum.PRESS_MEDIA))
+        db_session.flush()
+        db_session.execute(
+            insert(likes_table), [{"user_id": journalist.id, "content_id": 1}]
+        )
+        monkeypatch.delitem(GROUPED_COUNTS, "nb_likes_art")
+
+        [(_, details)] = compute_all_reputations([journalist.id])
+
+        assert details["nb_likes_art"] == 1
+        assert details == compute_reputation(journalist)
+
+
 # ---------------------------------------------------------------------------
 # get_reputation_history — read path
 # ---------------------------------------------------------------------------
@@ -319,7 +289,7 @@ class TestGetReputationHistory:
 
         for d in days_back:
             stamp = date.today() - timedelta(days=d)  # noqa: DTZ011
-            _update_for_user(user, stamp)
+            _record(db_session, user, stamp)
         db_session.flush()
 
         history = get_reputation_history(user)
@@ -331,8 +301,8 @@ class TestGetReputationHistory:
         alice = _fresh_user(db_session, label="alice-isolated")
         bob = _fresh_user(db_session, label="bob-isolated")
         today = arrow.now().date()
-        _update_for_user(alice, today)
-        _update_for_user(bob, today)
+        _record(db_session, alice, today)
+        _record(db_session, bob, today)
         db_session.flush()
 
         alice_history = get_reputation_history(alice)
@@ -22,8 +22,8 @@ from app.modules.biz.models import (
     MissionStatus,
     OfferApplication,
 )
-from app.modules.kyc.ontology_loader import get_ontology_content
 from app.services.notifications._models import Notification
+from app.services.reference_data import reference_data
 from app.services.taxonomies._models import TaxonomyEntry
 from tests.c_e2e.conftest import make_authenticated_client
 
@@ -132,7 +132,7 @@ def test_new_form_renders_sector_optgroups(
         ]
     )
     db_session.commit()
-    get_ontology_content.cache_clear()
+    reference_data.clear()
 
     client = make_authenticated_client(app, emitter)
     response = client.get("/biz/jobs/new")
@@ -26,9 +26,9 @@ from app.modules.biz.models import (
     MissionStatus,
     OfferApplication,
 )
-from app.modules.kyc.ontology_loader import get_ontology_content
 from app.services.notifications import NotificationService
 from app.services.notifications._models import Notification
+from app.services.reference_data import reference_data
 from app.services.taxonomies._models import TaxonomyEntry
 from tests.c_e2e.conftest import make_authenticated_client
 
@@ -150,7 +150,7 @@ class TestMissionDeposit:
             ]
         )
         db_session.commit()
-        get_ontology_content.cache_clear()
+        reference_data.clear()
 
         client = make_authenticated_client(app, emitter)
         response = client.get("/biz/missions/new")
@@ -12,6 +12,7 @@ MinIO.
 from __future__ import annotations
 
 import hashlib
+from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -21,8 +22,10 @@ from advanced_alchemy.types.file_object import storages
 from advanced_alchemy.types.file_object.backends.fsspec import FSSpecBackend
 from flask import session
 from flask_security import login_user
+from PIL import Image
 
 from app.models.auth import User
+from app.modules.media.cache import MediaCache
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -63,19 +66,25 @@ def client(app: Flask, db_session: Session) -> FlaskClient:
 
 
 @pytest.fixture
-def local_media_backend(tmp_path: Path) -> Iterator[Path]:
+def local_media_backend(app: Flask, tmp_path: Path) -> Iterator[Path]:
     """Swap the "s3" backend for a local-fs one rooted at tmp_path.
 
     Restores the original backend on teardown. Files dropped into
     tmp_path are then fetchable via backend.get_content(<filename>).
+    The local disk cache gets its own per-test directory too.
     """
+    storage_dir = tmp_path / "storage"
+    storage_dir.mkdir()
     original = storages.get_backend("s3")
+    original_cache_dir = app.config.get("MEDIA_CACHE_DIR")
     local_fs = fsspec.filesystem("file")
     storages.register_backend(
-        FSSpecBackend(fs=local_fs, key="s3", prefix=str(tmp_path))
+        FSSpecBackend(fs=local_fs, key="s3", prefix=str(storage_dir))
     )
-    yield tmp_path
+    app.config["MEDIA_CACHE_DIR"] = str(tmp_path / "cache")
+    yield storage_dir
     storages.register_backend(original)
+    app.config["MEDIA_CACHE_DIR"] = original_cache_dir
 
 
 def _put(storage_dir: Path, content: bytes, ext: str = "png") -> str:
@@ -172,3 +181,100 @@ class TestCaching:
         second = client.get(f"/media/{storage_name}", headers={"If-None-Match": etag})
         assert second.status_code == 304
         assert second.data == b""
+
+    def test_conditional_get_does_not_touch_storage(
+        self, client: FlaskClient, local_media_backend: Path
+    ):
+        # The ETag is the hash in the URL: a revalidation is answered
+        # without reading the blob from anywhere.
+        storage_name = _put(local_media_backend, TINY_PNG)
+        sha256 = storage_name.split(".", 1)[0]
+        (local_media_backend / storage_name).unlink()
+        response = client.get(
+            f"/media/{storage_name}", headers={"If-None-Match": f'"{sha256}"'}
+        )
+        assert response.status_code == 304
+        assert sha256 in response.headers["ETag"]
+        assert "immutable" in response.headers["Cache-Control"]
+
+
+class TestDiskCache:
+    def test_second_request_is_served_from_disk_cache(
+        self, client: FlaskClient, local_media_backend: Path
+    ):
+        storage_name = _put(local_media_backend, TINY_PNG)
+        assert client.get(f"/media/{storage_name}").status_code == 200
+        (local_media_backend / storage_name).unlink()
+
+        response = client.get(f"/media/{storage_name}")
+        assert response.status_code == 200
+        assert response.data == TINY_PNG
+
+    def test_range_request_returns_partial_content(
+        self, client: FlaskClient, local_media_backend: Path
+    ):
+        storage_name = _put(local_media_backend, TINY_PNG)
+        response = client.get(f"/media/{storage_name}", headers={"Range": "bytes=0-7"})
+        assert response.status_code == 206
+        assert response.data == TINY_PNG[:8]
+        assert response.headers["Content-Range"] == f"bytes 0-7/{len(TINY_PNG)}"
+
+    def test_evicted_before_send_falls_back_to_storage(
+        self,
+        client: FlaskClient,
+        local_media_backend: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        # Another request evicts the blob between `fetch` and `send_file`.
+        fetch = MediaCache.fetch
+
+        def fetch_then_evict(self, name, load):
+            path = fetch(self, name, load)
+            path.unlink()
+            return path
+
+        monkeypatch.setattr(MediaCache, "fetch", fetch_then_evict)
+        storage_name = _put(local_media_backend, TINY_PNG)
+        response = client.get(f"/media/{storage_name}", headers={"Range": "bytes=0-7"})
+        assert response.status_code == 206
+        assert response.data == TINY_PNG[:8]
+
+
+def _png(width: int, height: int) -> bytes:
+    buf = BytesIO()
+    Image.new("RGB", (width, height), (200, 10, 10)).save(buf, "PNG")
+    return buf.getvalue()
+
+
+class TestVariants:
+    def test_renders_resized_webp(self, client: FlaskClient, local_media_backend: Path):
+        storage_name = _put(local_media_backend, _png(1280, 720))
+        response = client.get(f"/media/{storage_name}/640x360.webp")
+        assert response.status_code == 200
+        assert response.mimetype == "image/webp"
+        assert "immutable" in response.headers["Cache-Control"]
+        assert Image.open(BytesIO(response.data)).size == (640, 360)
+
+    def test_variant_is_stored_next_to_original(
+        self, client: FlaskClient, local_media_backend: Path
+    ):
+        storage_name = _put(local_media_backend, _png(300, 300))
+        sha256 = storage_name.split(".", 1)[0]
+        client.get(f"/media/{storage_name}/192x192.webp")
+        stored = local_media_backend / f"{sha256}-192x192.webp"
+        assert Image.open(stored).size == (192, 192)
+
+    @pytest.mark.parametrize("suffix", ["100x100.webp", "192x192.gif", "192x192"])
+    def test_rejects_unknown_size_or_format(
+        self, client: FlaskClient, local_media_backend: Path, suffix: str
+    ):
+        storage_name = _put(local_media_backend, _png(300, 300))
+        response = client.get(f"/media/{storage_name}/{suffix}")
+        assert response.status_code == 404
+
+    def test_not_an_image_returns_404(
+        self, client: FlaskClient, local_media_backend: Path
+    ):
+        storage_name = _put(local_media_backend, b"hello", ext="txt")
+        response = client.get(f"/media/{storage_name}/192x192.webp")
+        assert response.status_code == 404
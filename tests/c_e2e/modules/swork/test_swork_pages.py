@@ -11,9 +11,12 @@ from typing import TYPE_CHECKING
 import pytest
 from flask import Flask, g
 
-from app.models.auth import KYCProfile, User
+from app.enums import RoleEnum
+from app.lib.pagination import encode_cursor
+from app.models.auth import KYCProfile, Role, User
 from app.modules.swork.models import Group
 from app.modules.swork.views._common import MEMBER_TABS, UserVM
+from tests.c_e2e.conftest import make_authenticated_client
 
 if TYPE_CHECKING:
     from flask.testing import FlaskClient
@@ -76,6 +79,21 @@ def authenticated_client(
     return client
 
 
+@pytest.fixture
+def logged_in_client(
+    app: Flask, db_session: Session, test_user_with_profile: User
+) -> FlaskClient:
+    """Provide a Flask test client really logged in, as an active
+    press member (``authenticated_client`` ends up on the login page).
+    """
+    role = Role(name=RoleEnum.PRESS_MEDIA.name, description=RoleEnum.PRESS_MEDIA.value)
+    db_session.add(role)
+    test_user_with_profile.active = True
+    test_user_with_profile.roles.append(role)
+    db_session.flush()
+    return make_authenticated_client(app, test_user_with_profile)
+
+
 @pytest.fixture
 def sample_group(db_session: Session, test_user_with_profile: User) -> Group:
     """Create a sample group for testing."""
@@ -224,6 +242,42 @@ class TestSworkPostHtmlEscape:
         response = authenticated_client.get("/swork/organisations/")
         assert response.status_code in (200, 302)
 
+    def test_list_page_rejects_bad_cursor(
+        self, logged_in_client: FlaskClient, db_session: Session
+    ):
+        response = logged_in_client.get(
+            "/swork/lists/members-list/page?cursor=not-a-cursor"
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("values", [(1,), ("Doe", "John", {"id": 1})])
+    def test_list_page_rejects_cursor_not_matching_the_sort_keys(
+        self, logged_in_client: FlaskClient, db_session: Session, values: tuple
+    ):
+        cursor = encode_cursor(values)
+        response = logged_in_client.get(
+            f"/swork/lists/members-list/page?cursor={cursor}"
+        )
+        assert response.status_code == 400
+
+    def test_list_page_unknown_component(
+        self, logged_in_client: FlaskClient, db_session: Session
+    ):
+        response = logged_in_client.get("/swork/lists/nope/page?cursor=W10")
+        assert response.status_code == 404
+
+    def test_list_page_renders_fragment(
+        self, logged_in_client: FlaskClient, db_session: Session
+    ):
+        """A follow-up page is a bare fragment : no component root, so
+        htmx can swap it in place of the sentinel."""
+        cursor = encode_cursor(("", "", 0))
+        response = logged_in_client.get(
+            f"/swork/lists/members-list/page?cursor={cursor}"
+        )
+        assert response.status_code == 200
+        assert b"wire:id" not in response.data
+
     def test_profile_redirect(
         self, authenticated_client: FlaskClient, db_session: Session
     ):
@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+import re
+from html import unescape
 from typing import TYPE_CHECKING
 
 import arrow
@@ -16,6 +18,7 @@ from app.models.auth import KYCProfile, Role, User
 from app.models.lifecycle import PublicationStatus
 from app.models.organisation import Organisation
 from app.modules.wire.models import ArticlePost
+from app.modules.wire.views._tabs import DEFAULT_POSTS_LIMIT
 from tests.c_e2e.conftest import make_authenticated_client
 
 if TYPE_CHECKING:
@@ -207,6 +210,53 @@ class TestWireTabView:
         assert b"Test Article" in response.data
 
 
+class TestWireTabPagination:
+    """Test the infinite scroll of the wall."""
+
+    def test_next_page_is_loaded_by_a_sentinel(
+        self,
+        authenticated_client: FlaskClient,
+        db_session: Session,
+        test_user: User,
+        test_org: Organisation,
+    ):
+        """A full first page ends with a sentinel fetching the next one."""
+        for i in range(DEFAULT_POSTS_LIMIT + 2):
+            db_session.add(
+                ArticlePost(
+                    title=f"Scrolled Article {i:02d}",
+                    status=PublicationStatus.PUBLIC,
+                    publisher=test_org,
+                    owner=test_user,
+                    published_at=arrow.now().shift(minutes=-i),
+                )
+            )
+        db_session.commit()
+
+        response = authenticated_client.get("/wire/tab/wall")
+        html = response.get_data(as_text=True)
+        match = re.search(r'hx-get="([^"]*after=[^"]*)"', html)
+        assert match
+        assert "Scrolled Article 00" in html
+
+        response = authenticated_client.get(unescape(match.group(1)))
+        html = response.get_data(as_text=True)
+
+        assert response.status_code == 200
+        assert f"Scrolled Article {DEFAULT_POSTS_LIMIT + 1}" in html
+        assert "Scrolled Article 00" not in html
+        assert "hx-get" not in html
+
+    def test_malformed_cursor_returns_400(
+        self,
+        authenticated_client: FlaskClient,
+        db_session: Session,
+    ):
+        response = authenticated_client.get("/wire/tab/wall?after=garbage")
+
+        assert response.status_code == 400
+
+
 class TestWireTabTagFilter:
     """Test tag filtering via query parameter."""
 
@@ -58,6 +58,18 @@ class TestConfig:
     # which the test client can follow.
     SERVER_NAME: str | None = None
 
+    # Notification badge counts are cached per user and process; tests
+    # roll back their notifications, so always read them from the DB.
+    NOTIFICATION_CACHE_TTL = 0
+    # Same for rendered cards: tests edit authors and organisations,
+    # which the card versions don't cover.
+    FRAGMENT_CACHE_BACKEND = "none"
+    # Capabilities are cached by user id and permissions version; tests
+    # roll back their users, so ids and versions get reused.
+    CAPABILITY_CACHE = False
+    # Views are buffered per process; tests expect them written at once.
+    VIEW_BUFFER_SIZE = 0
+
     # Note: Talisman is disabled when app.testing is True (see extensions.py)
 
     # N+1 detection (disabled by default, enable with --n-plus-one flag)